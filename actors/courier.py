@@ -1,10 +1,8 @@
-import random
-import time
 from dataclasses import dataclass, field
+from random import Random
 from typing import List, Optional, Any, Dict
 
-from simpy import Interrupt, Event
-from simpy.events import NORMAL
+from simpy import Interrupt
 
 from actors.actor import Actor
 from objects.location import Location
@@ -21,8 +19,10 @@ from policies.courier.movement.osrm import OSRMMovementPolicy
 from policies.courier.movement_evaluation.courier_movement_evaluation_policy import CourierMovementEvaluationPolicy
 from policies.courier.movement_evaluation.geohash_neighbors import NeighborsMoveEvalPolicy
 from policies.courier.movement_evaluation.still import StillMoveEvalPolicy
+from services.deadline_service import DeadlineService
 from settings import settings
-from utils.datetime_utils import sec_to_time, time_diff, sec_to_hour
+from utils.datetime_utils import sec_to_time, sec_to_hour
+from utils.random_utils import random_stream
 
 COURIER_ACCEPTANCE_POLICIES_MAP = {
     'uniform': UniformAcceptancePolicy(),
@@ -46,7 +46,8 @@ class Courier(Actor):
     movement_evaluation_policy: Optional[CourierMovementEvaluationPolicy] = NeighborsMoveEvalPolicy()
     movement_policy: Optional[CourierMovementPolicy] = OSRMMovementPolicy()
 
-    acceptance_rate: float = random.uniform(settings.COURIER_MIN_ACCEPTANCE_RATE, 1)
+    acceptance_rate: Optional[float] = None
+    acceptance_stream: Optional[Random] = None
     accepted_notifications: List[Notification] = field(default_factory=lambda: list())
     active_route: Optional[Route] = None
     active_stop: Optional[Stop] = None
@@ -56,8 +57,9 @@ class Courier(Actor):
     guaranteed_compensation: Optional[bool] = None
     location: Optional[Location] = None
     log_off_scheduled: Optional[bool] = False
-    on_time: time = None
-    off_time: time = None
+    movement_evaluation_stream: Optional[Random] = None
+    on_time: int = None
+    off_time: int = None
     rejected_orders: List[int] = field(default_factory=lambda: list())
     utilization_time: float = 0
     vehicle: Optional[Vehicle] = Vehicle.MOTORCYCLE
@@ -67,6 +69,21 @@ class Courier(Actor):
 
         self._log(f'Actor {self.courier_id} logged on')
 
+        self.acceptance_stream = (
+            random_stream('courier', self.courier_id, 'acceptance')
+            if self.acceptance_stream is None
+            else self.acceptance_stream
+        )
+        self.movement_evaluation_stream = (
+            random_stream('courier', self.courier_id, 'movement_evaluation')
+            if self.movement_evaluation_stream is None
+            else self.movement_evaluation_stream
+        )
+        self.acceptance_rate = (
+            self.acceptance_stream.uniform(settings.COURIER_MIN_ACCEPTANCE_RATE, 1)
+            if self.acceptance_rate is None
+            else self.acceptance_rate
+        )
         self._schedule_log_off_event()
         self.state = self.env.process(self._idle_state())
 
@@ -95,7 +112,7 @@ class Courier(Actor):
         """State detailing how a courier moves to a destination"""
 
         self.condition = 'moving'
-        state_start = sec_to_time(self.env.now)
+        state_start = self.env.now
         self.dispatcher.courier_moving_event(courier=self)
         yield self.env.process(
             self.movement_policy.execute(
@@ -105,7 +122,7 @@ class Courier(Actor):
                 courier=self
             )
         )
-        self.utilization_time += time_diff(sec_to_time(self.env.now), state_start)
+        self.utilization_time += self.env.now - state_start
 
     def _picking_up_state(self, orders: Dict[int, Order]):
         """State that simulates a courier picking up stuff at the pick up location"""
@@ -114,7 +131,7 @@ class Courier(Actor):
 
         self._log(f'Courier {self.courier_id} begins pick up state')
 
-        state_start = sec_to_time(self.env.now)
+        state_start = self.env.now
 
         try:
             self.dispatcher.courier_picking_up_event(courier=self)
@@ -126,13 +143,13 @@ class Courier(Actor):
         try:
             service_time = max(order.pick_up_service_time for order in orders.values())
             latest_ready_time = max(order.ready_time for order in orders.values())
-            waiting_time = time_diff(latest_ready_time, sec_to_time(self.env.now))
+            waiting_time = latest_ready_time - self.env.now
             yield self.env.timeout(delay=service_time + max(0, waiting_time))
 
         except Interrupt:
             pass
 
-        self.utilization_time += time_diff(sec_to_time(self.env.now), state_start)
+        self.utilization_time += self.env.now - state_start
 
         self._log(f'Courier {self.courier_id} finishes pick up state')
 
@@ -145,11 +162,11 @@ class Courier(Actor):
 
         self._log(f'Courier {self.courier_id} begins drop off state of orders {list(orders.keys())}')
 
-        state_start = sec_to_time(self.env.now)
+        state_start = self.env.now
         self.dispatcher.courier_dropping_off_event(courier=self)
         service_time = max(order.drop_off_service_time for order in orders.values())
         yield self.env.timeout(delay=service_time)
-        self.utilization_time += time_diff(sec_to_time(self.env.now), state_start)
+        self.utilization_time += self.env.now - state_start
 
         self._log(f'Courier {self.courier_id} finishes drop off state of orders {list(orders.keys())}')
 
@@ -158,7 +175,10 @@ class Courier(Actor):
     def _evaluate_movement_event(self):
         """Event detailing how a courier evaluates to move about the city"""
 
-        destination = self.movement_evaluation_policy.execute(current_location=self.location)
+        destination = self.movement_evaluation_policy.execute(
+            current_location=self.location,
+            stream=self.movement_evaluation_stream
+        )
 
         if destination is not None:
 
@@ -187,7 +207,7 @@ class Courier(Actor):
                 pass
 
         accepts_notification = yield self.env.process(
-            self.acceptance_policy.execute(self.acceptance_rate, self.env)
+            self.acceptance_policy.execute(self.acceptance_rate, self.env, self.acceptance_stream)
         )
 
         if accepts_notification:
@@ -279,26 +299,19 @@ class Courier(Actor):
         else:
             self.state = self.env.process(self._idle_state())
 
-    def _log_off_callback(self, event: Event):
-        """Callback to activate the log off event"""
-
-        self.log_off_event()
-        event.succeed()
-        event.callbacks = []
-
     def _schedule_log_off_event(self):
         """Method that allows the courier to schedule the log off time"""
 
-        log_off_event = Event(env=self.env)
-        log_off_event.callbacks.append(self._log_off_callback)
-        log_off_delay = time_diff(self.off_time, self.on_time)
-        self.env.schedule(event=log_off_event, priority=NORMAL, delay=log_off_delay)
+        DeadlineService.of(self.env).schedule(
+            deadline=self.env.now + self.off_time - self.on_time,
+            callback=self.log_off_event
+        )
 
     def _calculate_earnings(self) -> float:
         """Method to calculate earnings after the shift ends"""
 
         delivery_earnings = len(self.fulfilled_orders) * settings.COURIER_EARNINGS_PER_ORDER
-        guaranteed_earnings = sec_to_hour(time_diff(self.off_time, self.on_time)) * settings.COURIER_EARNINGS_PER_HOUR
+        guaranteed_earnings = sec_to_hour(self.off_time - self.on_time) * settings.COURIER_EARNINGS_PER_HOUR
 
         if guaranteed_earnings > delivery_earnings > 0:
             self.guaranteed_compensation = True
@@ -318,29 +331,53 @@ class Courier(Actor):
     def calculate_metrics(self) -> Dict[str, Any]:
         """Method to calculate the metrics of a courier"""
 
-        courier_delivery_earnings = len(self.fulfilled_orders) * settings.COURIER_EARNINGS_PER_ORDER
-        shift_duration = time_diff(self.off_time, self.on_time)
+        return self.metrics(
+            courier_id=self.courier_id,
+            on_time=self.on_time,
+            off_time=self.off_time,
+            fulfilled_orders=len(self.fulfilled_orders),
+            earnings=self.earnings,
+            utilization_time=self.utilization_time,
+            accepted_notifications=len(self.accepted_notifications),
+            guaranteed_compensation=self.guaranteed_compensation
+        )
+
+    @staticmethod
+    def metrics(
+            courier_id: int,
+            on_time: int,
+            off_time: int,
+            fulfilled_orders: int,
+            earnings: Optional[float],
+            utilization_time: float,
+            accepted_notifications: int,
+            guaranteed_compensation: Optional[bool]
+    ) -> Dict[str, Any]:
+        """Method to calculate the metrics of a courier from its shift totals, whether it is alive or archived"""
+
+        courier_delivery_earnings = fulfilled_orders * settings.COURIER_EARNINGS_PER_ORDER
+        shift_duration = off_time - on_time
 
         if shift_duration > 0:
-            courier_utilization = self.utilization_time / shift_duration
-            courier_orders_delivered_per_hour = len(self.fulfilled_orders) / sec_to_hour(shift_duration)
-            courier_bundles_picked_per_hour = len(self.accepted_notifications) / sec_to_hour(shift_duration)
+            courier_utilization = utilization_time / shift_duration
+            courier_orders_delivered_per_hour = fulfilled_orders / sec_to_hour(shift_duration)
+            courier_bundles_picked_per_hour = accepted_notifications / sec_to_hour(shift_duration)
 
         else:
             courier_utilization, courier_orders_delivered_per_hour, courier_bundles_picked_per_hour = 0, 0, 0
 
         return {
-            'courier_id': self.courier_id,
-            'on_time': self.on_time,
-            'off_time': self.off_time,
-            'fulfilled_orders': len(self.fulfilled_orders),
-            'earnings': self.earnings,
-            'utilization_time': self.utilization_time,
-            'accepted_notifications': len(self.accepted_notifications),
-            'guaranteed_compensation': self.guaranteed_compensation,
+            'courier_id': courier_id,
+            'on_time': sec_to_time(on_time),
+            'off_time': sec_to_time(off_time),
+            'fulfilled_orders': fulfilled_orders,
+            'earnings': earnings,
+            'utilization_time': utilization_time,
+            'accepted_notifications': accepted_notifications,
+            'guaranteed_compensation': guaranteed_compensation,
             'courier_utilization': courier_utilization,
             'courier_delivery_earnings': courier_delivery_earnings,
-            'courier_compensation': self.earnings,
+            'courier_compensation': earnings,
             'courier_orders_delivered_per_hour': courier_orders_delivered_per_hour,
             'courier_bundles_picked_per_hour': courier_bundles_picked_per_hour
         }
@@ -1,17 +1,20 @@
 from dataclasses import dataclass, field
-from datetime import time
-from typing import Dict, Optional, List, Tuple
+from functools import partial
+from typing import Dict, Optional, List, Tuple, Mapping, MutableMapping
 
-from simpy import Interrupt, Event
-from simpy.events import NORMAL
+from simpy import Interrupt
 
 from actors.actor import Actor
 from actors.courier import Courier
+from objects.courier_registry import CourierRegistry
+from objects.fleet_store import FleetStore
 from objects.matching_metric import MatchingMetric
+from objects.metrics_archive import MetricsArchive
 from objects.notification import Notification, NotificationType
 from objects.order import Order
+from objects.order_index import OrderIndex, OrderState
+from objects.order_table import OrderTable
 from objects.route import Route
-from objects.stop import Stop
 from policies.dispatcher.buffering.dispatcher_buffering_policy import DispatcherBufferingPolicy
 from policies.dispatcher.buffering.rolling_horizon import RollingBufferingPolicy
 from policies.dispatcher.cancellation.dispatcher_cancellation_policy import DispatcherCancellationPolicy
@@ -24,8 +27,8 @@ from policies.dispatcher.prepositioning.naive import NaivePrepositioningPolicy
 from policies.dispatcher.prepositioning_evaluation.dispatcher_prepositioning_evaluation_policy import \
     DispatcherPrepositioningEvaluationPolicy
 from policies.dispatcher.prepositioning_evaluation.fixed import FixedPrepositioningEvaluationPolicy
+from services.deadline_service import DeadlineService
 from settings import settings
-from utils.datetime_utils import sec_to_time, time_diff, time_add
 
 DISPATCHER_CANCELLATION_POLICIES_MAP = {
     'static': StaticCancellationPolicy()
@@ -59,6 +62,41 @@ DISPATCHER_MATCHING_POLICIES_MAP = {
         notification_filtering=True,
         mip_matcher=False
     ),
+    'mdrp_incremental': MyopicMatchingPolicy(
+        assignment_updates=False,
+        prospects=False,
+        notification_filtering=True,
+        mip_matcher=True,
+        incremental=True
+    ),
+    'modified_mdrp_incremental': MyopicMatchingPolicy(
+        assignment_updates=True,
+        prospects=True,
+        notification_filtering=True,
+        mip_matcher=False,
+        incremental=True
+    ),
+    'mdrp_auction': MyopicMatchingPolicy(
+        assignment_updates=False,
+        prospects=False,
+        notification_filtering=True,
+        mip_matcher=False,
+        auction_matcher=True
+    ),
+    'modified_mdrp_auction': MyopicMatchingPolicy(
+        assignment_updates=True,
+        prospects=True,
+        notification_filtering=True,
+        mip_matcher=False,
+        auction_matcher=True
+    ),
+    'modified_mdrp_sweep': MyopicMatchingPolicy(
+        assignment_updates=True,
+        prospects=True,
+        notification_filtering=True,
+        mip_matcher=False,
+        sweep_routing=True
+    ),
 }
 DISPATCHER_PREPOSITIONING_POLICIES_MAP = {
     'naive': NaivePrepositioningPolicy()
@@ -80,24 +118,80 @@ class Dispatcher(Actor):
         DispatcherPrepositioningEvaluationPolicy
     ] = FixedPrepositioningEvaluationPolicy()
 
-    assigned_orders: Dict[int, Order] = field(default_factory=lambda: dict())
-    canceled_orders: Dict[int, Order] = field(default_factory=lambda: dict())
-    fulfilled_orders: Dict[int, Order] = field(default_factory=lambda: dict())
-    placed_orders: Dict[int, Tuple[time, Order]] = field(default_factory=lambda: dict())
-    scheduled_cancellation_evaluation_orders: Dict[int, Tuple[time, Order]] = field(default_factory=lambda: dict())
-    unassigned_orders: Dict[int, Order] = field(default_factory=lambda: dict())
+    order_index: OrderIndex = field(default_factory=lambda: OrderIndex())
+    order_table: Optional[OrderTable] = None
+    scheduled_cancellation_evaluation_orders: Dict[int, Tuple[int, Order]] = field(default_factory=lambda: dict())
+    order_deadlines: Dict[int, int] = field(default_factory=lambda: dict())
 
-    dropping_off_couriers: Dict[int, Courier] = field(default_factory=lambda: dict())
-    idle_couriers: Dict[int, Courier] = field(default_factory=lambda: dict())
-    logged_off_couriers: Dict[int, Courier] = field(default_factory=lambda: dict())
-    moving_couriers: Dict[int, Courier] = field(default_factory=lambda: dict())
-    picking_up_couriers: Dict[int, Courier] = field(default_factory=lambda: dict())
+    courier_registry: CourierRegistry = field(default_factory=lambda: CourierRegistry())
+    fleet_store: FleetStore = field(default_factory=lambda: FleetStore())
 
     matching_metrics: List[MatchingMetric] = field(default_factory=lambda: list())
+    metrics_archive: Optional[MetricsArchive] = None
     notifications: List[Notification] = field(default_factory=lambda: list())
 
+    @property
+    def assigned_orders(self) -> MutableMapping[int, Order]:
+        """Property with a view of the orders assigned to couriers"""
+
+        return self.order_index.orders(OrderState.ASSIGNED)
+
+    @property
+    def canceled_orders(self) -> MutableMapping[int, Order]:
+        """Property with a view of the canceled orders"""
+
+        return self.order_index.orders(OrderState.CANCELED)
+
+    @property
+    def fulfilled_orders(self) -> MutableMapping[int, Order]:
+        """Property with a view of the fulfilled orders"""
+
+        return self.order_index.orders(OrderState.FULFILLED)
+
+    @property
+    def placed_orders(self) -> MutableMapping[int, Order]:
+        """Property with a view of the placed orders, waiting for their preparation time"""
+
+        return self.order_index.orders(OrderState.PLACED)
+
+    @property
+    def unassigned_orders(self) -> MutableMapping[int, Order]:
+        """Property with a view of the buffered orders, waiting to be assigned"""
+
+        return self.order_index.orders(OrderState.UNASSIGNED)
+
+    @property
+    def dropping_off_couriers(self) -> Mapping[int, Courier]:
+        """Property with a read-only view of the couriers dropping off orders"""
+
+        return self.courier_registry.couriers('dropping_off')
+
+    @property
+    def idle_couriers(self) -> Mapping[int, Courier]:
+        """Property with a read-only view of the idle couriers"""
+
+        return self.courier_registry.couriers('idle')
+
+    @property
+    def logged_off_couriers(self) -> Mapping[int, Courier]:
+        """Property with a read-only view of the couriers that logged off"""
+
+        return self.courier_registry.couriers('logged_off')
+
+    @property
+    def moving_couriers(self) -> Mapping[int, Courier]:
+        """Property with a read-only view of the moving couriers"""
+
+        return self.courier_registry.couriers('moving')
+
+    @property
+    def picking_up_couriers(self) -> Mapping[int, Courier]:
+        """Property with a read-only view of the couriers picking up orders"""
+
+        return self.courier_registry.couriers('picking_up')
+
     def _idle_state(self):
-        """State that simulates the dispatcher listening for events"""
+        """State that simulates the dispatcher listening for events, waking up when a policy must be evaluated"""
 
         self.condition = 'listening'
 
@@ -107,83 +201,70 @@ class Dispatcher(Actor):
             try:
                 self._evaluate_buffering_event()
                 self._evaluate_prepositioning_event()
-                yield self.env.timeout(delay=1)
+                next_evaluation_time = min(
+                    self.buffering_policy.next_execution_time(env_time=self.env.now),
+                    self.prepositioning_evaluation_policy.next_execution_time(env_time=self.env.now)
+                )
+                yield self.env.timeout(delay=next_evaluation_time - self.env.now)
 
             except Interrupt:
                 break
 
-    def order_submitted_event(self, order: Order, preparation_time: time, ready_time: time):
+    def order_submitted_event(self, order: Order, preparation_time: int, ready_time: int):
         """Event detailing how the dispatcher handles the submission of a new order"""
 
         self._log(f'Dispatcher received the order {order.order_id} and moved it to the placed orders')
 
         order.preparation_time = preparation_time
         order.ready_time = ready_time
-        self.placed_orders[order.order_id] = (preparation_time, order)
+        self.order_index.transition(order, OrderState.PLACED)
         self.scheduled_cancellation_evaluation_orders[order.order_id] = (
-            time_add(preparation_time, settings.DISPATCHER_WAIT_TO_CANCEL),
+            preparation_time + settings.DISPATCHER_WAIT_TO_CANCEL,
             order
         )
         self._schedule_buffer_order_event(order)
 
-    def _buffer_order_event(self):
-        """Event detailing how the dispatcher buffers an order"""
+    def _buffer_order_event(self, order: Order):
+        """Event detailing how the dispatcher buffers an order once its preparation time is due"""
 
-        orders_for_buffering = [
-            order
-            for order_id, (scheduled_time, order) in self.placed_orders.items()
-            if sec_to_time(self.env.now) >= scheduled_time
-        ]
+        del self.order_deadlines[order.order_id]
 
-        for order in orders_for_buffering:
-            del self.placed_orders[order.order_id]
-            self.unassigned_orders[order.order_id] = order
+        if self.order_index.state(order.order_id) == OrderState.PLACED:
+            self.order_index.transition(order, OrderState.UNASSIGNED)
 
             self._log(f'Dispatcher has moved the order {order.order_id} to the unassigned buffer')
 
-    def _evaluate_cancellation_event(self):
-        """Event detailing how the dispatcher evaluates if it should cancel an order"""
+        self._schedule_evaluate_cancellation_event(order)
 
-        orders_for_evaluation = [
-            order
-            for order_id, (scheduled_time, order) in self.scheduled_cancellation_evaluation_orders.items()
-            if sec_to_time(self.env.now) >= scheduled_time
-        ]
+    def _evaluate_cancellation_event(self, order: Order):
+        """Event detailing how the dispatcher evaluates if it should cancel an order"""
 
-        for order in orders_for_evaluation:
-            should_cancel = self.cancellation_policy.execute(courier_id=order.courier_id)
+        del self.order_deadlines[order.order_id]
+        del self.scheduled_cancellation_evaluation_orders[order.order_id]
+        should_cancel = self.cancellation_policy.execute(courier_id=order.courier_id)
 
-            if should_cancel:
-                self._log(f'Dispatcher decided to cancel the order {order.order_id}')
-                self.cancel_order_event(order)
+        if should_cancel:
+            self._log(f'Dispatcher decided to cancel the order {order.order_id}')
+            self.cancel_order_event(order)
 
-            else:
-                self._log(f'Dispatcher decided not to cancel the order {order.order_id}')
+        else:
+            self._log(f'Dispatcher decided not to cancel the order {order.order_id}')
 
     def cancel_order_event(self, order: Order):
         """Event detailing how the dispatcher handles a user canceling an order"""
 
-        if (
-                order.state != 'canceled' and
-                (
-                        order.order_id in self.placed_orders.keys() or
-                        order.order_id in self.unassigned_orders.keys()
-
-                ) and
-                order.order_id not in self.canceled_orders.keys() and
-                order.order_id not in self.assigned_orders.keys() and
-                order.order_id not in self.fulfilled_orders.keys()
-        ):
-            if order.order_id in self.placed_orders.keys():
-                del self.placed_orders[order.order_id]
+        if self.order_index.state(order.order_id) in (OrderState.PLACED, OrderState.UNASSIGNED):
+            if order.order_id in self.order_deadlines.keys():
+                DeadlineService.of(self.env).cancel(self.order_deadlines.pop(order.order_id))
 
-            if order.order_id in self.unassigned_orders.keys():
-                del self.unassigned_orders[order.order_id]
+            if order.order_id in self.scheduled_cancellation_evaluation_orders.keys():
+                del self.scheduled_cancellation_evaluation_orders[order.order_id]
 
-            order.cancellation_time = sec_to_time(self.env.now)
+            order.cancellation_time = self.env.now
             order.state = 'canceled'
             order.user.condition = 'canceled'
-            self.canceled_orders[order.order_id] = order
+            self.order_index.transition(order, OrderState.CANCELED)
+            self._archive_order(order)
 
         self._log(f'Dispatcher canceled the order {order.order_id}')
 
@@ -199,25 +280,29 @@ class Dispatcher(Actor):
         """Event detailing how the dispatcher executes the dispatch instructions: routing & matching"""
 
         orders = self.unassigned_orders.values()
-        couriers = {
-            courier.courier_id: courier
-            for courier in {**self.idle_couriers, **self.picking_up_couriers}.values()
-            if (
-                len(courier.active_route.orders) < settings.DISPATCHER_PROSPECTS_MAX_ORDERS
-                if courier.active_route is not None
-                else True
-            )
-        }
+        couriers = list(self.courier_registry.dispatchable_couriers().values())
         self._log(f'Attempting dispatch of {len(orders)} orders and {len(couriers)} couriers.')
 
         if bool(orders) and bool(couriers):
             notifications, matching_metric = self.matching_policy.execute(
                 orders=list(orders),
-                couriers=list(couriers.values()),
-                env_time=self.env.now
+                couriers=couriers,
+                env_time=self.env.now,
+                fleet=self.fleet_store.view(couriers),
+                order_view=self.order_table.view(orders) if self.order_table is not None else None
             )
+
+            for courier in couriers:
+                self.courier_registry.refresh(courier)
+                self.fleet_store.update(courier)
+
             notifications_log = [
-                ([order_id for order_id in notification.instruction.orders.keys()], notification.courier.courier_id)
+                (
+                    [order_id for stop in notification.instruction for order_id in stop.orders.keys()]
+                    if isinstance(notification.instruction, list)
+                    else list(notification.instruction.orders.keys()),
+                    notification.courier.courier_id
+                )
                 for notification in notifications
             ]
             self._log(
@@ -227,9 +312,9 @@ class Dispatcher(Actor):
 
             for notification in notifications:
                 if notification.instruction is not None and notification.courier is not None:
-                    self.notifications.append(notification)
+                    self._keep_notification(notification)
                     self.matching_metrics.append(matching_metric)
-                    self.env.process(couriers[notification.courier.courier_id].notification_event(notification))
+                    self.env.process(notification.courier.notification_event(notification))
 
     def _prepositioning_event(self):
         """Event detailing how the dispatcher executes the preposition instructions, sending them to couriers"""
@@ -237,7 +322,7 @@ class Dispatcher(Actor):
         self._log(f'Prepositioning time fulfilled, attempting prepositioning of {len(self.idle_couriers)} couriers')
 
         notifications = self.prepositioning_policy.execute(
-            orders=[order for _, order in self.placed_orders.values()],
+            orders=list(self.placed_orders.values()),
             couriers=self.idle_couriers.values()
         )
         if bool(notifications):
@@ -246,7 +331,7 @@ class Dispatcher(Actor):
             for notification in notifications:
                 if notification.instruction is not None and notification.courier is not None:
                     notification.type = NotificationType.PREPOSITIONING
-                    self.notifications.append(notification)
+                    self._keep_notification(notification)
                     self.env.process(
                         self.idle_couriers[notification.courier.courier_id].notification_event(notification)
                     )
@@ -277,20 +362,12 @@ class Dispatcher(Actor):
                 if isinstance(notification.instruction, Route)
                 else [order_id for stop in notification.instruction for order_id in stop.orders.keys()]
             )
-            processed_order_ids = [
-                order_id
-                for order_id in order_ids
-                if (
-                        order_id in self.canceled_orders.keys() or
-                        order_id in self.assigned_orders.keys() or
-                        order_id in self.fulfilled_orders.keys()
-                )
-            ]
+            processed_order_ids = {order_id for order_id in order_ids if self.order_index.is_processed(order_id)}
 
             if bool(processed_order_ids):
                 self._log(
                     f'Dispatcher will update the notification to courier {courier.courier_id} '
-                    f'based on these orders being already processed: {processed_order_ids}'
+                    f'based on these orders being already processed: {sorted(processed_order_ids)}'
                 )
                 notification.update(processed_order_ids)
 
@@ -326,11 +403,10 @@ class Dispatcher(Actor):
                     ]
                 )
                 for order_id, order in instruction_orders:
-                    del self.unassigned_orders[order_id]
-                    order.acceptance_time = sec_to_time(self.env.now)
+                    order.acceptance_time = self.env.now
                     order.state = 'in_progress'
                     order.courier_id = courier.courier_id
-                    self.assigned_orders[order_id] = order
+                    self.order_index.transition(order, OrderState.ASSIGNED)
 
                 if courier.condition == 'idle' and isinstance(notification.instruction, Route):
                     courier.active_route = notification.instruction
@@ -341,22 +417,22 @@ class Dispatcher(Actor):
                             courier.active_route.orders[order_id] = order
                             courier.active_stop.orders[order_id] = order
 
-                        courier.active_route.stops.append(
-                            Stop(
-                                location=stop.location,
-                                position=len(courier.active_route.stops),
-                                orders=stop.orders,
-                                type=stop.type
-                            )
-                        )
+                        courier.active_route.add_stop(location=stop.location, orders=stop.orders, type=stop.type)
+
+                if self.metrics_archive is not None:
+                    self.metrics_archive.accept_notification(courier.courier_id)
 
-                courier.accepted_notifications.append(notification)
+                else:
+                    courier.accepted_notifications.append(notification)
 
             else:
                 self._log(
                     f'Dispatcher will nullify notification to courier {courier.courier_id}. All orders canceled.'
                 )
 
+        self.courier_registry.refresh(courier)
+        self.fleet_store.update(courier)
+
     def notification_rejected_event(self, notification: Notification, courier: Courier):
         """Event detailing how the dispatcher handles the rejection of a notification"""
 
@@ -366,13 +442,18 @@ class Dispatcher(Actor):
         )
 
         if notification.type == NotificationType.PICK_UP_DROP_OFF:
+            instruction_orders = (
+                {order_id: order for stop in notification.instruction for order_id, order in stop.orders.items()}
+                if isinstance(notification.instruction, list)
+                else notification.instruction.orders
+            )
             self._log(
-                f'Dispatcher will handle rejection of orders {list(notification.instruction.orders.keys())} '
+                f'Dispatcher will handle rejection of orders {list(instruction_orders.keys())} '
                 f'from courier {courier.courier_id} (condition = {courier.condition}). '
                 f'Instruction is a {"Route" if isinstance(notification.instruction, Route) else "Stop"}'
             )
 
-            for order_id, order in notification.instruction.orders.items():
+            for order_id, order in instruction_orders.items():
                 order.rejected_by.append(courier.courier_id)
                 courier.rejected_orders.append(order_id)
 
@@ -382,7 +463,7 @@ class Dispatcher(Actor):
         self._log(f'Dispatcher will set these orders to be in store: {list(orders.keys())}')
 
         for order_id, order in orders.items():
-            order.in_store_time = sec_to_time(self.env.now)
+            order.in_store_time = self.env.now
             order.state = 'in_store'
 
     def orders_picked_up_event(self, orders: Dict[int, Order]):
@@ -391,7 +472,7 @@ class Dispatcher(Actor):
         self._log(f'Dispatcher will set these orders to be picked up: {list(orders.keys())}')
 
         for order_id, order in orders.items():
-            order.pick_up_time = sec_to_time(self.env.now)
+            order.pick_up_time = self.env.now
             order.state = 'picked_up'
 
     def orders_dropped_off_event(self, orders: Dict[int, Order], courier: Courier):
@@ -403,128 +484,83 @@ class Dispatcher(Actor):
         )
 
         for order_id, order in orders.items():
-            if order_id not in self.fulfilled_orders.keys() and order_id in self.assigned_orders.keys():
-                del self.assigned_orders[order_id]
-                order.drop_off_time = sec_to_time(self.env.now)
+            if self.order_index.state(order_id) == OrderState.ASSIGNED:
+                order.drop_off_time = self.env.now
                 order.state = 'dropped_off'
-                self.fulfilled_orders[order_id] = order
+                self.order_index.transition(order, OrderState.FULFILLED)
                 courier.fulfilled_orders.append(order_id)
                 order.user.order_dropped_off_event(order_id)
+                self._archive_order(order)
 
     def courier_idle_event(self, courier: Courier):
         """Event detailing how the dispatcher handles setting a courier to idle"""
 
         self._log(f'Dispatcher will set courier {courier.courier_id} to idle')
 
-        if courier.courier_id in self.dropping_off_couriers.keys():
-            del self.dropping_off_couriers[courier.courier_id]
-
-        elif courier.courier_id in self.moving_couriers.keys():
-            del self.moving_couriers[courier.courier_id]
-
-        elif courier.courier_id in self.picking_up_couriers.keys():
-            del self.picking_up_couriers[courier.courier_id]
-
-        self.idle_couriers[courier.courier_id] = courier
+        self.courier_registry.transition(courier, 'idle')
+        self.fleet_store.update(courier, state='idle')
 
     def courier_moving_event(self, courier: Courier):
         """Event detailing how the dispatcher handles setting a courier to dropping off"""
 
         self._log(f'Dispatcher will set courier {courier.courier_id} to moving')
 
-        if courier.courier_id in self.idle_couriers.keys():
-            del self.idle_couriers[courier.courier_id]
-
-        elif courier.courier_id in self.dropping_off_couriers.keys():
-            del self.dropping_off_couriers[courier.courier_id]
-
-        elif courier.courier_id in self.picking_up_couriers.keys():
-            del self.picking_up_couriers[courier.courier_id]
-
-        self.moving_couriers[courier.courier_id] = courier
+        self.courier_registry.transition(courier, 'moving')
+        self.fleet_store.update(courier, state='moving')
 
     def courier_picking_up_event(self, courier: Courier):
         """Event detailing how the dispatcher handles setting a courier to picking up"""
 
         self._log(f'Dispatcher will set courier {courier.courier_id} to picking up')
 
-        if courier.courier_id in self.idle_couriers.keys():
-            del self.idle_couriers[courier.courier_id]
-
-        elif courier.courier_id in self.dropping_off_couriers.keys():
-            del self.dropping_off_couriers[courier.courier_id]
-
-        elif courier.courier_id in self.moving_couriers.keys():
-            del self.moving_couriers[courier.courier_id]
-
-        self.picking_up_couriers[courier.courier_id] = courier
+        self.courier_registry.transition(courier, 'picking_up')
+        self.fleet_store.update(courier, state='picking_up')
 
     def courier_dropping_off_event(self, courier: Courier):
         """Event detailing how the dispatcher handles setting a courier to dropping off"""
 
         self._log(f'Dispatcher will set courier {courier.courier_id} to dropping off')
 
-        if courier.courier_id in self.idle_couriers.keys():
-            del self.idle_couriers[courier.courier_id]
-
-        elif courier.courier_id in self.moving_couriers.keys():
-            del self.moving_couriers[courier.courier_id]
-
-        elif courier.courier_id in self.picking_up_couriers.keys():
-            del self.picking_up_couriers[courier.courier_id]
-
-        self.dropping_off_couriers[courier.courier_id] = courier
+        self.courier_registry.transition(courier, 'dropping_off')
+        self.fleet_store.update(courier, state='dropping_off')
 
     def courier_log_off_event(self, courier: Courier):
         """Event detailing how the dispatcher handles when a courier wants to log off"""
 
         self._log(f'Dispatcher will set courier {courier.courier_id} to logged off')
 
-        if courier.courier_id in self.idle_couriers.keys():
-            del self.idle_couriers[courier.courier_id]
+        self.courier_registry.log_off(courier)
+        self.fleet_store.update(courier, state='logged_off')
+
+        if self.metrics_archive is not None:
+            self.metrics_archive.add_courier(courier)
+            self.courier_registry.release(courier.courier_id)
 
-        elif courier.courier_id in self.dropping_off_couriers.keys():
-            del self.dropping_off_couriers[courier.courier_id]
+    def _archive_order(self, order: Order):
+        """Method to archive the metric fields of an order in a final state, releasing the order in archival mode"""
 
-        elif courier.courier_id in self.moving_couriers.keys():
-            del self.moving_couriers[courier.courier_id]
+        if self.metrics_archive is not None:
+            self.metrics_archive.add_order(order)
+            self.order_index.release(order.order_id)
 
-        elif courier.courier_id in self.picking_up_couriers.keys():
-            del self.picking_up_couriers[courier.courier_id]
+    def _keep_notification(self, notification: Notification):
+        """Method to keep a sent notification, unless the finished objects are being archived"""
 
-        self.logged_off_couriers[courier.courier_id] = courier
+        if self.metrics_archive is None:
+            self.notifications.append(notification)
 
-    def _schedule_evaluate_cancellation_event(self):
-        """Method that allows the dispatcher to schedule the cancellation evaluation event"""
+    def _schedule_evaluate_cancellation_event(self, order: Order):
+        """Method that allows the dispatcher to schedule the cancellation evaluation event of an order"""
 
-        evaluate_cancellation_event = Event(env=self.env)
-        evaluate_cancellation_event.callbacks.append(self._evaluate_cancellation_callback)
-        self.env.schedule(event=evaluate_cancellation_event, priority=NORMAL, delay=settings.DISPATCHER_WAIT_TO_CANCEL)
+        self.order_deadlines[order.order_id] = DeadlineService.of(self.env).schedule(
+            deadline=self.env.now + settings.DISPATCHER_WAIT_TO_CANCEL,
+            callback=partial(self._evaluate_cancellation_event, order)
+        )
 
     def _schedule_buffer_order_event(self, order: Order):
         """Method that allows the dispatcher to schedule the order buffering event"""
 
-        buffering_event = Event(env=self.env)
-        buffering_event.callbacks.append(self._buffer_order_callback)
-        self.env.schedule(
-            event=buffering_event,
-            priority=NORMAL,
-            delay=time_diff(order.preparation_time, order.placement_time)
+        self.order_deadlines[order.order_id] = DeadlineService.of(self.env).schedule(
+            deadline=self.env.now + order.preparation_time - order.placement_time,
+            callback=partial(self._buffer_order_event, order)
         )
-
-    def _evaluate_cancellation_callback(self, event: Event):
-        """Callback detailing how the dispatcher evaluates canceling an order"""
-
-        self._evaluate_cancellation_event()
-
-        event.succeed()
-        event.callbacks = []
-
-    def _buffer_order_callback(self, event: Event):
-        """Callback detailing how the dispatcher buffers an order once it's placed"""
-
-        self._buffer_order_event()
-        self._schedule_evaluate_cancellation_event()
-
-        event.succeed()
-        event.callbacks = []
@@ -1,9 +1,8 @@
 from dataclasses import dataclass
-from datetime import time
+from random import Random
 from typing import Optional
 
 from simpy import Interrupt, Event
-from simpy.events import NORMAL
 
 from actors.actor import Actor
 from actors.dispatcher import Dispatcher
@@ -11,7 +10,9 @@ from objects.location import Location
 from objects.order import Order
 from policies.user.cancellation.random import RandomCancellationPolicy
 from policies.user.cancellation.user_cancellation_policy import UserCancellationPolicy
+from services.deadline_service import DeadlineService
 from settings import settings
+from utils.random_utils import random_stream
 
 USER_CANCELLATION_POLICIES_MAP = {
     'random': RandomCancellationPolicy()
@@ -25,53 +26,64 @@ class User(Actor):
     dispatcher: Optional[Dispatcher] = None
     cancellation_policy: Optional[UserCancellationPolicy] = RandomCancellationPolicy()
 
+    cancellation_stream: Optional[Random] = None
     order: Optional[Order] = None
     user_id: Optional[int] = None
+    order_submitted: Optional[Event] = None
+    order_completed: Optional[Event] = None
 
     def __post_init__(self):
         """Immediately after the actor is created, it starts idling"""
 
         self._log(f'Actor {self.user_id} logged on')
 
+        self.cancellation_stream = (
+            random_stream('user', self.user_id, 'cancellation')
+            if self.cancellation_stream is None
+            else self.cancellation_stream
+        )
+        self.order_submitted = Event(env=self.env)
+        self.order_completed = Event(env=self.env)
         self.state = self.env.process(self._idle_state())
 
     def _idle_state(self):
-        """State that simulates a user being idle"""
+        """State that simulates a user being idle, passively waiting until the order is submitted"""
 
         self.condition = 'idle'
 
         self._log(f'New user begins idling')
 
-        while True:
-            try:
-                yield self.env.timeout(delay=1)
+        try:
+            yield self.order_submitted
 
-            except Interrupt:
-                break
+        except Interrupt:
+            pass
 
     def _waiting_state(self):
-        """State simulating the user is waiting for the order"""
+        """State simulating the user is waiting for the order, passively until it is dropped off or canceled"""
 
         self.condition = 'waiting'
 
         self._log(f'User with order {self.order.order_id} begins waiting')
 
-        while True:
-            try:
-                yield self.env.timeout(delay=1)
+        try:
+            yield self.order_completed
 
-            except Interrupt:
-                break
+        except Interrupt:
+            pass
 
     def submit_order_event(
             self,
             order_id: int,
             pick_up_at: Location,
             drop_off_at: Location,
-            placement_time: time,
-            expected_drop_off_time: time,
-            preparation_time: time,
-            ready_time: time
+            placement_time: int,
+            expected_drop_off_time: int,
+            preparation_time: int,
+            ready_time: int,
+            pick_up_service_time: Optional[int] = None,
+            drop_off_service_time: Optional[int] = None,
+            geohash: Optional[str] = None
     ):
         """Event detailing how a user submits an order"""
 
@@ -81,13 +93,16 @@ class User(Actor):
             drop_off_at=drop_off_at,
             placement_time=placement_time,
             expected_drop_off_time=expected_drop_off_time,
+            pick_up_service_time=pick_up_service_time,
+            drop_off_service_time=drop_off_service_time,
+            geohash=geohash,
             user=self
         )
         self.order = order
 
         self._log(f'The user submitted the order {order.order_id}')
 
-        self.state.interrupt()
+        self.order_submitted.succeed()
         self.state = self.env.process(self._waiting_state())
         self.dispatcher.order_submitted_event(order, preparation_time, ready_time)
         self._schedule_evaluate_cancellation_event()
@@ -95,7 +110,10 @@ class User(Actor):
     def _evaluate_cancellation_event(self):
         """Event detailing how a user decides to cancel an order"""
 
-        should_cancel = self.cancellation_policy.execute(courier_id=self.order.courier_id)
+        should_cancel = self.cancellation_policy.execute(
+            courier_id=self.order.courier_id,
+            stream=self.cancellation_stream
+        )
 
         if should_cancel:
             self._cancel_order_event()
@@ -109,26 +127,26 @@ class User(Actor):
         self._log(f'The user decided to cancel the order {self.order.order_id}')
 
         self.dispatcher.cancel_order_event(order=self.order)
-        self.state.interrupt()
+        self._complete_order()
 
     def order_dropped_off_event(self, order_id: int):
         """Event detailing how the user gets the order delivered"""
 
         self._log(f'The user has the order {order_id} dropped off.')
 
-        self.state.interrupt()
+        self._complete_order()
         self.condition = 'dropped_off'
 
-    def _schedule_evaluate_cancellation_event(self):
-        """Method that allows the user to schedule the cancellation evaluation event"""
+    def _complete_order(self):
+        """Method to stop the user from waiting for the order"""
 
-        cancellation_event = Event(env=self.env)
-        cancellation_event.callbacks.append(self._evaluate_cancellation_callback)
-        self.env.schedule(event=cancellation_event, priority=NORMAL, delay=settings.USER_WAIT_TO_CANCEL)
+        if not self.order_completed.triggered:
+            self.order_completed.succeed()
 
-    def _evaluate_cancellation_callback(self, event: Event):
-        """Callback dto activate de cancellation evaluation eventr"""
+    def _schedule_evaluate_cancellation_event(self):
+        """Method that allows the user to schedule the cancellation evaluation event"""
 
-        self._evaluate_cancellation_event()
-        event.succeed()
-        event.callbacks = []
+        DeadlineService.of(self.env).schedule(
+            deadline=self.env.now + settings.USER_WAIT_TO_CANCEL,
+            callback=self._evaluate_cancellation_event
+        )
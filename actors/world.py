@@ -1,9 +1,11 @@
 import logging
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import time
 from os import system
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from simpy import Environment, Process
 from sqlalchemy import create_engine
@@ -19,9 +21,16 @@ from ddbb.config import get_db_url
 from ddbb.queries.couriers_instance_data_query import couriers_query
 from ddbb.queries.orders_instance_data_query import orders_query
 from objects.location import Location
+from objects.metrics_archive import MetricsArchive
+from objects.order_table import OrderTable
+from objects.route import reset_route_ids
 from objects.vehicle import Vehicle
+from services.checkpoint_service import CHECKPOINT_SERVICE
+from services.instance_data_service import InstanceDataService
+from services.optimization_service.model.solver_session import SOLVER_SESSION
 from settings import settings
-from utils.datetime_utils import sec_to_time, time_to_query_format, time_add
+from utils.datetime_utils import sec_to_time, time_to_query_format, time_to_sec, time_to_sim_sec, time_in_window, \
+    day_sec_to_sim_sec
 from utils.logging_utils import world_log
 
 
@@ -45,18 +54,43 @@ class World:
 
         logging.info(f'Instance {self.instance} | Simulation started at sim time = {sec_to_time(self.env.now)}.')
 
-        self.connection = create_engine(get_db_url(), pool_size=20, max_overflow=0, pool_pre_ping=True)
+        reset_route_ids()
+        SOLVER_SESSION.open(optimizer=settings.OPTIMIZER)
         self.dispatcher = Dispatcher(
             env=self.env,
-            cancellation_policy=DISPATCHER_CANCELLATION_POLICIES_MAP[settings.DISPATCHER_CANCELLATION_POLICY],
-            buffering_policy=DISPATCHER_BUFFERING_POLICIES_MAP[settings.DISPATCHER_BUFFERING_POLICY],
-            matching_policy=DISPATCHER_MATCHING_POLICIES_MAP[settings.DISPATCHER_MATCHING_POLICY],
-            prepositioning_policy=DISPATCHER_PREPOSITIONING_POLICIES_MAP[settings.DISPATCHER_PREPOSITIONING_POLICY],
-            prepositioning_evaluation_policy=DISPATCHER_PREPOSITIONING_EVALUATION_POLICIES_MAP[
+            metrics_archive=MetricsArchive() if settings.ARCHIVAL_MODE else None,
+            **self._dispatcher_policies()
+        )
+
+        if settings.INSTANCE_INGESTION == 'polling':
+            self.connection = create_engine(get_db_url(), pool_size=20, max_overflow=0, pool_pre_ping=True)
+            self.process = self.env.process(self._simulate())
+
+        else:
+            self.process = self.env.process(self._simulate_arrivals())
+
+        if CHECKPOINT_SERVICE.is_open and settings.CHECKPOINT_INTERVAL is not None:
+            self.env.process(self._checkpoint())
+
+    def switch_dispatcher_policies(self):
+        """Method to set the dispatcher policies from the settings, to continue the simulation with other policies"""
+
+        for name, policy in self._dispatcher_policies().items():
+            setattr(self.dispatcher, name, policy)
+
+    @staticmethod
+    def _dispatcher_policies() -> Dict[str, Any]:
+        """Method to obtain the dispatcher policies established in the settings"""
+
+        return {
+            'cancellation_policy': DISPATCHER_CANCELLATION_POLICIES_MAP[settings.DISPATCHER_CANCELLATION_POLICY],
+            'buffering_policy': DISPATCHER_BUFFERING_POLICIES_MAP[settings.DISPATCHER_BUFFERING_POLICY],
+            'matching_policy': DISPATCHER_MATCHING_POLICIES_MAP[settings.DISPATCHER_MATCHING_POLICY],
+            'prepositioning_policy': DISPATCHER_PREPOSITIONING_POLICIES_MAP[settings.DISPATCHER_PREPOSITIONING_POLICY],
+            'prepositioning_evaluation_policy': DISPATCHER_PREPOSITIONING_EVALUATION_POLICIES_MAP[
                 settings.DISPATCHER_PREPOSITIONING_EVALUATION_POLICY
             ]
-        )
-        self.process = self.env.process(self._simulate())
+        }
 
     def _simulate(self):
         """
@@ -81,10 +115,113 @@ class World:
 
             yield self.env.timeout(delay=1)
 
+    def _simulate_arrivals(self):
+        """
+        State that simulates the ongoing World using the instance data loaded at once.
+        The World sleeps until the next second in which users place orders or couriers log on.
+        """
+
+        if settings.INSTANCE_INGESTION == 'memmap':
+            arrivals = self._load_column_arrivals()
+            new_users, new_couriers = self._new_table_users_procedure, self._new_column_couriers_procedure
+
+        else:
+            arrivals = self._load_arrivals()
+            new_users, new_couriers = self._new_users_procedure, self._new_couriers_procedure
+
+        for arrival_time, orders_info, couriers_info in arrivals:
+            yield self.env.timeout(delay=arrival_time - self.env.now)
+
+            if len(orders_info):
+                new_users(orders_info)
+
+            if len(couriers_info):
+                new_couriers(couriers_info)
+
+            logging.info(
+                f'Instance {self.instance} | sim time = {sec_to_time(self.env.now)} '
+                f'{world_log(self.dispatcher)}'
+            )
+
+    def _checkpoint(self):
+        """State that marks a checkpoint of the simulation journal at regular simulated intervals"""
+
+        while True:
+            yield self.env.timeout(delay=settings.CHECKPOINT_INTERVAL)
+            CHECKPOINT_SERVICE.checkpoint(sim_time=self.env.now, state=world_log(self.dispatcher))
+
+    def _load_arrivals(self) -> List[Tuple[int, List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """Method to load the instance data and group the new orders and couriers by arrival second"""
+
+        instance_data_service = InstanceDataService(instance=self.instance, ingestion=settings.INSTANCE_INGESTION)
+        arrivals = defaultdict(lambda: ([], []))
+
+        orders_info = instance_data_service.get_orders_info()
+        self.dispatcher.order_table = OrderTable.from_orders_info(
+            orders_info,
+            start_time=settings.SIMULATE_FROM,
+            seed=settings.SEED
+        )
+
+        for order_info, placement_time in zip(orders_info, self.dispatcher.order_table.placement_times.tolist()):
+            arrivals[placement_time][0].append(order_info)
+
+        for courier_info in instance_data_service.get_couriers_info():
+            arrivals[self._sim_sec(courier_info['on_time'])][1].append(courier_info)
+
+        return [
+            (arrival_time, orders_info, couriers_info)
+            for arrival_time, (orders_info, couriers_info) in sorted(arrivals.items())
+            if arrival_time >= self.env.now
+        ]
+
+    def _load_column_arrivals(self) -> List[Tuple[int, np.ndarray, Dict[str, np.ndarray]]]:
+        """
+        Method to load the memory-mapped instance columns and group them by arrival second, as the rows of the new
+        orders in the order table and the columns of the new couriers
+        """
+
+        instance_data_service = InstanceDataService(instance=self.instance, ingestion=settings.INSTANCE_INGESTION)
+        arrivals = defaultdict(lambda: [np.empty(0, dtype=np.int64), {}])
+
+        self.dispatcher.order_table = OrderTable(
+            instance_data_service.get_orders_columns(),
+            start_time=settings.SIMULATE_FROM,
+            seed=settings.SEED
+        )
+
+        for arrival_time, rows in self._group_rows(self.dispatcher.order_table.placement_times):
+            arrivals[arrival_time][0] = rows
+
+        couriers_columns = instance_data_service.get_couriers_columns()
+        on_times = day_sec_to_sim_sec(couriers_columns['on_time'], start_time=settings.SIMULATE_FROM)
+
+        for arrival_time, rows in self._group_rows(on_times):
+            arrivals[arrival_time][1] = {name: column[rows] for name, column in couriers_columns.items()}
+
+        return [
+            (arrival_time, orders_rows, couriers_columns)
+            for arrival_time, (orders_rows, couriers_columns) in sorted(arrivals.items())
+            if arrival_time >= self.env.now
+        ]
+
+    @staticmethod
+    def _group_rows(arrival_times: np.ndarray) -> List[Tuple[int, np.ndarray]]:
+        """Method to group the rows of a column of arrival times by arrival second, keeping the order of the rows"""
+
+        rows = np.argsort(arrival_times, kind='stable')
+        seconds, starts = np.unique(arrival_times[rows], return_index=True)
+
+        return list(zip(seconds.tolist(), np.split(rows, starts[1:])))
+
     def _new_orders_info(self, current_time: time) -> Optional[List[Dict[str, Any]]]:
         """Method that returns the list of new users that log on at a given time"""
 
-        if settings.CREATE_USERS_FROM <= current_time <= settings.CREATE_USERS_UNTIL:
+        if time_in_window(
+                current_time,
+                window_from=settings.CREATE_USERS_FROM,
+                window_until=settings.CREATE_USERS_UNTIL
+        ):
             query = orders_query.format(
                 placement_time=time_to_query_format(current_time),
                 instance_id=self.instance
@@ -98,7 +235,11 @@ class World:
     def _new_couriers_info(self, current_time: time) -> Optional[List[Dict[str, Any]]]:
         """Method that returns the list of new couriers that log on at a given time"""
 
-        if settings.CREATE_COURIERS_FROM <= current_time <= settings.CREATE_COURIERS_UNTIL:
+        if time_in_window(
+                current_time,
+                window_from=settings.CREATE_COURIERS_FROM,
+                window_until=settings.CREATE_COURIERS_UNTIL
+        ):
             query = couriers_query.format(
                 on_time=time_to_query_format(current_time),
                 instance_id=self.instance
@@ -113,53 +254,113 @@ class World:
         """Method to establish how a new user is created in the World"""
 
         for order_info in orders_info:
-            user = User(
-                env=self.env,
-                dispatcher=self.dispatcher,
-                cancellation_policy=USER_CANCELLATION_POLICIES_MAP[settings.USER_CANCELLATION_POLICY],
-                user_id=order_info['order_id']
-            )
-            user.submit_order_event(
-                order_id=order_info['order_id'],
-                pick_up_at=Location(lat=order_info['pick_up_lat'], lng=order_info['pick_up_lng']),
-                drop_off_at=Location(lat=order_info['drop_off_lat'], lng=order_info['drop_off_lng']),
-                placement_time=order_info['placement_time'],
-                expected_drop_off_time=order_info['expected_drop_off_time'],
-                preparation_time=order_info['preparation_time'],
-                ready_time=order_info['ready_time']
-            )
+            user = self._new_user(order_info['order_id'])
+
+            if self.dispatcher.order_table is not None:
+                user.submit_order_event(**self.dispatcher.order_table.submission_info(order_info['order_id']))
+
+            else:
+                user.submit_order_event(
+                    order_id=order_info['order_id'],
+                    pick_up_at=Location(lat=order_info['pick_up_lat'], lng=order_info['pick_up_lng']),
+                    drop_off_at=Location(lat=order_info['drop_off_lat'], lng=order_info['drop_off_lng']),
+                    placement_time=self._sim_sec(order_info['placement_time']),
+                    expected_drop_off_time=self._sim_sec(order_info['expected_drop_off_time']),
+                    preparation_time=self._sim_sec(order_info['preparation_time']),
+                    ready_time=self._sim_sec(order_info['ready_time'])
+                )
+
+    def _new_table_users_procedure(self, rows: np.ndarray):
+        """Method to create the new users of the order table's rows, each submitting the order of its row"""
+
+        for order_id in self.dispatcher.order_table.order_ids[rows].tolist():
+            user = self._new_user(order_id)
+            user.submit_order_event(**self.dispatcher.order_table.submission_info(order_id))
+
+    def _new_user(self, user_id: int) -> User:
+        """Method to create a user in the World"""
+
+        user = User(
+            env=self.env,
+            dispatcher=self.dispatcher,
+            cancellation_policy=USER_CANCELLATION_POLICIES_MAP[settings.USER_CANCELLATION_POLICY],
+            user_id=user_id
+        )
+
+        if not settings.ARCHIVAL_MODE:
             self.users.append(user)
 
+        return user
+
     def _new_couriers_procedure(self, couriers_info: List[Dict[str, Any]]):
         """Method to establish how a new courier is created in the World"""
 
         for courier_info in couriers_info:
-            courier = Courier(
-                env=self.env,
-                dispatcher=self.dispatcher,
-                acceptance_policy=COURIER_ACCEPTANCE_POLICIES_MAP[settings.COURIER_ACCEPTANCE_POLICY],
-                movement_evaluation_policy=COURIER_MOVEMENT_EVALUATION_POLICIES_MAP[
-                    settings.COURIER_MOVEMENT_EVALUATION_POLICY
-                ],
-                movement_policy=COURIER_MOVEMENT_POLICIES_MAP[settings.COURIER_MOVEMENT_POLICY],
+            self._new_courier(
                 courier_id=courier_info['courier_id'],
-                vehicle=Vehicle.from_label(label=courier_info['vehicle']),
+                vehicle=courier_info['vehicle'],
                 location=Location(lat=courier_info['on_lat'], lng=courier_info['on_lng']),
-                on_time=courier_info['on_time'],
-                off_time=courier_info['off_time']
+                on_time=self._sim_sec(courier_info['on_time']),
+                off_time=self._sim_sec(courier_info['off_time'])
+            )
+
+    def _new_column_couriers_procedure(self, couriers_columns: Dict[str, np.ndarray]):
+        """Method to create the new couriers of the instance columns, with times as seconds of the day"""
+
+        for courier_id, vehicle, on_lat, on_lng, on_time, off_time in zip(
+                couriers_columns['courier_id'].tolist(),
+                couriers_columns['vehicle'].tolist(),
+                couriers_columns['on_lat'].tolist(),
+                couriers_columns['on_lng'].tolist(),
+                day_sec_to_sim_sec(couriers_columns['on_time'], start_time=settings.SIMULATE_FROM).tolist(),
+                day_sec_to_sim_sec(couriers_columns['off_time'], start_time=settings.SIMULATE_FROM).tolist()
+        ):
+            self._new_courier(
+                courier_id=courier_id,
+                vehicle=vehicle,
+                location=Location(lat=on_lat, lng=on_lng),
+                on_time=on_time,
+                off_time=off_time
             )
+
+    def _new_courier(self, courier_id: int, vehicle: str, location: Location, on_time: int, off_time: int):
+        """Method to create a courier in the World"""
+
+        courier = Courier(
+            env=self.env,
+            dispatcher=self.dispatcher,
+            acceptance_policy=COURIER_ACCEPTANCE_POLICIES_MAP[settings.COURIER_ACCEPTANCE_POLICY],
+            movement_evaluation_policy=COURIER_MOVEMENT_EVALUATION_POLICIES_MAP[
+                settings.COURIER_MOVEMENT_EVALUATION_POLICY
+            ],
+            movement_policy=COURIER_MOVEMENT_POLICIES_MAP[settings.COURIER_MOVEMENT_POLICY],
+            courier_id=courier_id,
+            vehicle=Vehicle.from_label(label=vehicle),
+            location=location,
+            on_time=on_time,
+            off_time=off_time
+        )
+
+        if not settings.ARCHIVAL_MODE:
             self.couriers.append(courier)
 
+    @staticmethod
+    def _sim_sec(instance_time: time) -> int:
+        """Method to convert a time of the instance data to the seconds of the simulation clock"""
+
+        return time_to_sim_sec(instance_time, start_time=settings.SIMULATE_FROM)
+
     def post_process(self):
         """Post process what happened in the World before calculating metrics for the Courier and the Order"""
 
         logging.info(f'Instance {self.instance} | Simulation finished at sim time = {sec_to_time(self.env.now)}.')
+        SOLVER_SESSION.close()
 
         for courier_id, courier in self.dispatcher.idle_couriers.copy().items():
-            courier.off_time = sec_to_time(self.env.now)
+            courier.off_time = self.env.now
             courier.log_off_event()
 
-        warm_up_time_start = time_add(settings.SIMULATE_FROM, settings.WARM_UP_TIME)
+        warm_up_time_start = time_to_sec(settings.SIMULATE_FROM) + settings.WARM_UP_TIME
 
         for order_id, order in self.dispatcher.canceled_orders.copy().items():
             if order.cancellation_time < warm_up_time_start:
@@ -169,6 +370,9 @@ class World:
             if order.drop_off_time < warm_up_time_start:
                 del self.dispatcher.fulfilled_orders[order_id]
 
+        if self.dispatcher.metrics_archive is not None:
+            self.dispatcher.metrics_archive.discard_orders_finished_before(warm_up_time_start)
+
         logging.info(f'Instance {self.instance} | Post processed the simulation.')
         system(
             f'say The simulation process for instance {self.instance}, '
@@ -0,0 +1,75 @@
+import random
+import sys
+import time
+import tracemalloc
+from typing import List, Dict, Any
+from unittest.mock import patch
+
+from objects.location import Location
+from objects.notification import Notification
+from objects.order import Order
+from objects.route import Route
+from services.osrm_service import OSRMService
+
+NUM_ROUTES = 10000
+SEED = 8795
+
+
+def straight_route(cls, origin: Location, destination: Location) -> Route:
+    """Function to replace OSRM with a straight line, so that only the object model is measured"""
+
+    return Route.from_locations([origin, destination])
+
+
+def build_routes(num_routes: int) -> List[Notification]:
+    """Function to create the objects of an epoch's routing: orders, two-order routes and their notifications"""
+
+    rng = random.Random(SEED)
+    notifications = []
+
+    for ix in range(num_routes):
+        orders = [
+            Order(
+                order_id=2 * ix + offset,
+                pick_up_at=Location(lat=4.6 + rng.random() / 10, lng=-74.1 + rng.random() / 10),
+                drop_off_at=Location(lat=4.6 + rng.random() / 10, lng=-74.1 + rng.random() / 10),
+                ready_time=rng.randint(0, 3600),
+                expected_drop_off_time=rng.randint(3600, 7200)
+            )
+            for offset in range(2)
+        ]
+        route = Route.from_order(orders[0])
+        route.add_order(orders[1])
+        notifications.append(Notification(courier=None, instruction=route))
+
+    return notifications
+
+
+def measure(num_routes: int) -> Dict[str, Any]:
+    """Function to measure the memory, allocations and time of building the routes"""
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    notifications = build_routes(num_routes)
+    elapsed_time = time.perf_counter() - start_time
+    snapshot = tracemalloc.take_snapshot()
+    current_memory, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'routes': len(notifications),
+        'retained_memory_mb': current_memory / 1024 ** 2,
+        'peak_memory_mb': peak_memory / 1024 ** 2,
+        'retained_blocks': sum(stat.count for stat in snapshot.statistics('filename')),
+        'build_time_sec': elapsed_time
+    }
+
+
+if __name__ == '__main__':
+    num_routes = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_ROUTES
+
+    with patch.object(OSRMService, 'get_route', classmethod(straight_route)):
+        results = measure(num_routes)
+
+    for metric, value in results.items():
+        print(f'{metric}: {value:.3f}' if isinstance(value, float) else f'{metric}: {value}')
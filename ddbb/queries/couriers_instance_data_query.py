@@ -8,4 +8,17 @@ couriers_query = """
         off_time
     FROM couriers_instance_data
     WHERE on_time = {on_time} AND instance_id = {instance_id}
-"""
\ No newline at end of file
+"""
+
+couriers_bulk_query = """
+    SELECT
+        courier_id,
+        vehicle,
+        on_lat,
+        on_lng,
+        on_time,
+        off_time
+    FROM couriers_instance_data
+    WHERE {on_window} AND instance_id = {instance_id}
+    ORDER BY on_time < {on_from}, on_time, courier_id
+"""
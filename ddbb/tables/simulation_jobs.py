@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+
+from ddbb.tables.base import Base, TableModel
+
+
+class SimulationJobsTable(Base, TableModel):
+    """Table of the queued simulation jobs, which workers on any node claim, heartbeat and report back"""
+
+    __tablename__ = 'simulation_jobs'
+
+    parameters = [
+        'id',
+        'run_id',
+        'job_key',
+        'instance_id',
+        'status',
+        'attempts',
+        'worker',
+        'heartbeat_at',
+        'error',
+        'created_at',
+        'updated_at'
+    ]
+
+    id = Column(Integer, primary_key=True)
+    run_id = Column(String, nullable=True, index=True)
+    job_key = Column(Text, nullable=False)
+    instance_id = Column(Integer, nullable=False)
+    status = Column(String, nullable=False, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    worker = Column(String, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
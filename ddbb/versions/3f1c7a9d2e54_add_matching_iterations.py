@@ -0,0 +1,23 @@
+"""add matching iterations
+
+Revision ID: 3f1c7a9d2e54
+Revises: b2388948ee69
+Create Date: 2026-10-19 10:12:41.508317
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '3f1c7a9d2e54'
+down_revision = 'b2388948ee69'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('matching_optimization_metrics', sa.Column('iterations', sa.Integer(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('matching_optimization_metrics', 'iterations')
@@ -0,0 +1,26 @@
+"""add matching relaxation integral
+
+Revision ID: 8c2e4b61f0a7
+Revises: 3f1c7a9d2e54
+Create Date: 2026-10-19 11:03:27.194652
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8c2e4b61f0a7'
+down_revision = '3f1c7a9d2e54'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'matching_optimization_metrics',
+        sa.Column('relaxation_integral', sa.Boolean(), nullable=True)
+    )
+
+
+def downgrade():
+    op.drop_column('matching_optimization_metrics', 'relaxation_integral')
@@ -0,0 +1,29 @@
+"""add metrics run id
+
+Revision ID: c4d9e1a7b305
+Revises: 8c2e4b61f0a7
+Create Date: 2026-10-19 11:42:08.361920
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'c4d9e1a7b305'
+down_revision = '8c2e4b61f0a7'
+branch_labels = None
+depends_on = None
+
+METRICS_TABLES = ['order_metrics', 'courier_metrics', 'matching_optimization_metrics']
+
+
+def upgrade():
+    for table in METRICS_TABLES:
+        op.add_column(table, sa.Column('run_id', sa.String(), nullable=True))
+        op.create_index(f'ix_{table}_run_id', table, ['run_id'], unique=False)
+
+
+def downgrade():
+    for table in METRICS_TABLES:
+        op.drop_index(f'ix_{table}_run_id', table_name=table)
+        op.drop_column(table, 'run_id')
@@ -0,0 +1,38 @@
+"""create simulation jobs table
+
+Revision ID: e7b3f0c92d18
+Revises: c4d9e1a7b305
+Create Date: 2026-10-19 16:05:31.742815
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e7b3f0c92d18'
+down_revision = 'c4d9e1a7b305'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'simulation_jobs',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('run_id', sa.String(), nullable=True),
+        sa.Column('job_key', sa.Text(), nullable=False),
+        sa.Column('instance_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('worker', sa.String(), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_simulation_jobs_run_id', 'simulation_jobs', ['run_id'], unique=False)
+    op.create_index('ix_simulation_jobs_status', 'simulation_jobs', ['status'], unique=False)
+
+
+def downgrade():
+    op.drop_table('simulation_jobs')
@@ -0,0 +1,101 @@
+from types import MappingProxyType
+from typing import Dict, Optional, Mapping, Any
+
+from settings import settings
+
+COURIER_STATES = ['idle', 'moving', 'picking_up', 'dropping_off']
+DISPATCHABLE_STATES = ['idle', 'picking_up']
+LOGGED_OFF_STATE = 'logged_off'
+
+
+class CourierRegistry:
+    """Class that keeps the couriers by state, updating the counts and the dispatchable couriers on transitions"""
+
+    def __init__(self):
+        """Instantiates the registry without couriers"""
+
+        self._states: Dict[int, str] = {}
+        self._couriers: Dict[str, Dict[int, Any]] = {
+            state: {} for state in COURIER_STATES + [LOGGED_OFF_STATE]
+        }
+        self._dispatchable: Dict[int, Any] = {}
+        self._views: Dict[str, Mapping[int, Any]] = {
+            state: MappingProxyType(couriers) for state, couriers in self._couriers.items()
+        }
+        self._dispatchable_view: Mapping[int, Any] = MappingProxyType(self._dispatchable)
+        self._released = 0
+
+    def state(self, courier_id: int) -> Optional[str]:
+        """Method to obtain the current state of a courier, which is None if it is logged off or unknown"""
+
+        return self._states.get(courier_id)
+
+    def couriers(self, state: str) -> Mapping[int, Any]:
+        """Method to obtain a read-only view of the couriers in a state"""
+
+        return self._views[state]
+
+    def count(self, state: str) -> int:
+        """Method to obtain the number of couriers in a state, including the logged off couriers released"""
+
+        return len(self._couriers[state]) + (self._released if state == LOGGED_OFF_STATE else 0)
+
+    def transition(self, courier: Any, state: str):
+        """Method to move a courier to a state, keeping its position if it already is in that state"""
+
+        previous_state = self._states.get(courier.courier_id)
+
+        if previous_state != state:
+            self._remove(courier.courier_id, previous_state)
+            self._states[courier.courier_id] = state
+
+        self._couriers[state][courier.courier_id] = courier
+        self.refresh(courier)
+
+    def log_off(self, courier: Any):
+        """Method to take a courier out of its state and register it as logged off"""
+
+        self._remove(courier.courier_id, self._states.pop(courier.courier_id, None))
+        self._couriers[LOGGED_OFF_STATE][courier.courier_id] = courier
+
+    def release(self, courier_id: int):
+        """Method to stop holding a logged off courier, counting it as logged off"""
+
+        del self._couriers[LOGGED_OFF_STATE][courier_id]
+        self._released += 1
+
+    def refresh(self, courier: Any):
+        """Method to re-evaluate if a courier may be dispatched, after its active route changed"""
+
+        state = self._states.get(courier.courier_id)
+
+        if state not in DISPATCHABLE_STATES:
+            return
+
+        num_orders = (
+            len(courier.active_route.orders)
+            if courier.active_route is not None and courier.active_route.orders is not None
+            else 0
+        )
+
+        if num_orders < settings.DISPATCHER_PROSPECTS_MAX_ORDERS:
+            self._dispatchable[courier.courier_id] = courier
+
+        elif courier.courier_id in self._dispatchable.keys():
+            del self._dispatchable[courier.courier_id]
+
+    def dispatchable_couriers(self) -> Mapping[int, Any]:
+        """Method to obtain a read-only view of the idle and picking up couriers that have room for more orders"""
+
+        return self._dispatchable_view
+
+    def _remove(self, courier_id: int, state: Optional[str]):
+        """Method to remove a courier from a state and from the dispatchable couriers"""
+
+        if state is None:
+            return
+
+        del self._couriers[state][courier_id]
+
+        if courier_id in self._dispatchable.keys():
+            del self._dispatchable[courier_id]
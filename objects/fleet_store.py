@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple, Any
+
+import numpy as np
+
+from objects.courier_registry import COURIER_STATES, LOGGED_OFF_STATE
+
+STATE_CODES = {state: code for code, state in enumerate(COURIER_STATES + [LOGGED_OFF_STATE])}
+UNKNOWN_STATE_CODE = -1
+
+
+@dataclass
+class FleetView:
+    """Class that holds the columns of a set of couriers, aligned with the order in which they were requested"""
+
+    courier_ids: np.ndarray
+    coordinates: np.ndarray
+    vehicles: np.ndarray
+    states: np.ndarray
+    loads: np.ndarray
+    routed: np.ndarray
+
+    def __len__(self) -> int:
+        """Method to obtain the number of couriers in the view"""
+
+        return len(self.courier_ids)
+
+    @classmethod
+    def from_couriers(cls, couriers: Iterable[Any]) -> 'FleetView':
+        """Method to build the columns directly from the couriers' attributes"""
+
+        couriers = list(couriers)
+
+        return cls(
+            courier_ids=np.array([courier.courier_id for courier in couriers]),
+            coordinates=np.array(
+                [FleetStore.coordinates(courier) for courier in couriers],
+                dtype=np.float64
+            ).reshape(len(couriers), 2),
+            vehicles=np.array([courier.vehicle for courier in couriers], dtype=np.int8),
+            states=np.array(
+                [STATE_CODES.get(courier.condition, UNKNOWN_STATE_CODE) for courier in couriers],
+                dtype=np.int8
+            ),
+            loads=np.array([FleetStore.load(courier) for courier in couriers], dtype=np.int32),
+            routed=np.array([courier.active_route is not None for courier in couriers], dtype=bool)
+        )
+
+    def in_state(self, state: str) -> np.ndarray:
+        """Method to obtain a mask of the couriers in a state"""
+
+        return self.states == STATE_CODES[state]
+
+
+class FleetStore:
+    """Class that keeps the couriers' positions, vehicles, states and loads as columns, one row per courier"""
+
+    def __init__(self, capacity: int = 64):
+        """Instantiates the store with empty columns"""
+
+        self._rows: Dict[int, int] = {}
+        self._courier_ids = np.zeros(capacity, dtype=np.int64)
+        self._coordinates = np.zeros((capacity, 2), dtype=np.float64)
+        self._vehicles = np.zeros(capacity, dtype=np.int8)
+        self._states = np.full(capacity, UNKNOWN_STATE_CODE, dtype=np.int8)
+        self._loads = np.zeros(capacity, dtype=np.int32)
+        self._routed = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        """Method to obtain the number of couriers in the store"""
+
+        return len(self._rows)
+
+    @staticmethod
+    def coordinates(courier: Any) -> Tuple[float, float]:
+        """Method to obtain the courier's coordinates, which are unknown if it has no location"""
+
+        return courier.location.coordinates if courier.location is not None else (np.nan, np.nan)
+
+    @staticmethod
+    def load(courier: Any) -> int:
+        """Method to obtain the number of orders in the courier's active route"""
+
+        if courier.active_route is None or courier.active_route.orders is None:
+            return 0
+
+        return len(courier.active_route.orders)
+
+    def update(self, courier: Any, state: Optional[str] = None):
+        """Method to write the courier's current position, vehicle and load, and its state if it changed"""
+
+        row = self._rows.get(courier.courier_id)
+
+        if row is None:
+            row = self._add(courier.courier_id)
+
+        self._coordinates[row] = self.coordinates(courier)
+        self._vehicles[row] = courier.vehicle
+        self._loads[row] = self.load(courier)
+        self._routed[row] = courier.active_route is not None
+
+        if state is not None:
+            self._states[row] = STATE_CODES[state]
+
+    def view(self, couriers: Iterable[Any]) -> FleetView:
+        """Method to obtain the columns of the couriers, in the order they are given"""
+
+        rows = np.fromiter((self._rows[courier.courier_id] for courier in couriers), dtype=np.int64)
+
+        return FleetView(
+            courier_ids=self._courier_ids[rows],
+            coordinates=self._coordinates[rows],
+            vehicles=self._vehicles[rows],
+            states=self._states[rows],
+            loads=self._loads[rows],
+            routed=self._routed[rows]
+        )
+
+    def _add(self, courier_id: int) -> int:
+        """Method to assign a row to a new courier, doubling the columns' capacity when they are full"""
+
+        row = len(self._rows)
+
+        if row == len(self._courier_ids):
+            self._courier_ids = np.concatenate((self._courier_ids, np.zeros_like(self._courier_ids)))
+            self._coordinates = np.concatenate((self._coordinates, np.zeros_like(self._coordinates)))
+            self._vehicles = np.concatenate((self._vehicles, np.zeros_like(self._vehicles)))
+            self._states = np.concatenate((self._states, np.full_like(self._states, UNKNOWN_STATE_CODE)))
+            self._loads = np.concatenate((self._loads, np.zeros_like(self._loads)))
+            self._routed = np.concatenate((self._routed, np.zeros_like(self._routed)))
+
+        self._rows[courier_id] = row
+        self._courier_ids[row] = courier_id
+
+        return row
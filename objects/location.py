@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from typing import Tuple
 
+from utils.dataclass_utils import add_slots
 
+
+@add_slots
 @dataclass
 class Location:
     lat: float
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from numpy import int64
 
@@ -16,6 +16,8 @@ class MatchingMetric:
     routes: int
     routing_time: float
     variables: int64
+    iterations: int = 0
+    relaxation_integral: Optional[bool] = None
 
     def calculate_metrics(self) -> Dict[str, Any]:
         """Method to calculate metrics of a dispatch event"""
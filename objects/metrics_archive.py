@@ -0,0 +1,165 @@
+from typing import Dict, List, Any, Optional, Callable
+
+import numpy as np
+
+from objects.order import Order, METRIC_TIMES
+
+COURIER_TOTALS = ['on_time', 'off_time', 'fulfilled_orders', 'accepted_notifications']
+
+
+class MetricsArchive:
+    """Class that keeps the metric fields of finished orders and logged off couriers as columns, one row each"""
+
+    def __init__(self, capacity: int = 1024):
+        """Instantiates the archive with empty columns"""
+
+        self._order_rows: Dict[int, int] = {}
+        self._order_ids = np.zeros(capacity, dtype=np.int64)
+        self._order_times = np.full((capacity, len(METRIC_TIMES)), np.nan, dtype=np.float64)
+
+        self._courier_rows: Dict[int, int] = {}
+        self._courier_ids = np.zeros(capacity, dtype=np.int64)
+        self._courier_totals = np.zeros((capacity, len(COURIER_TOTALS)), dtype=np.int64)
+        self._earnings = np.zeros(capacity, dtype=np.float64)
+        self._utilization_times = np.zeros(capacity, dtype=np.float64)
+        self._guaranteed_compensations = np.zeros(capacity, dtype=bool)
+        self._accepted_notifications: Dict[int, int] = {}
+
+    @property
+    def num_orders(self) -> int:
+        """Property indicating the number of archived orders"""
+
+        return len(self._order_rows)
+
+    @property
+    def num_couriers(self) -> int:
+        """Property indicating the number of archived couriers"""
+
+        return len(self._courier_rows)
+
+    def add_order(self, order: Order):
+        """Method to write the times of a fulfilled or canceled order, overwriting its row if it was archived"""
+
+        row = self._order_rows.get(order.order_id)
+
+        if row is None:
+            row = self._add_order(order.order_id)
+
+        self._order_times[row] = [
+            time if time is not None else np.nan
+            for time in (getattr(order, column) for column in METRIC_TIMES)
+        ]
+
+    def accept_notification(self, courier_id: int):
+        """Method to count a notification accepted by a courier, instead of keeping the notification"""
+
+        self._accepted_notifications[courier_id] = self._accepted_notifications.get(courier_id, 0) + 1
+
+    def add_courier(self, courier: Any):
+        """Method to write the shift totals of a logged off courier, overwriting its row if it was archived"""
+
+        row = self._courier_rows.get(courier.courier_id)
+
+        if row is None:
+            row = self._add_courier(courier.courier_id)
+
+        self._courier_totals[row] = [
+            courier.on_time,
+            courier.off_time,
+            len(courier.fulfilled_orders),
+            len(courier.accepted_notifications) + self._accepted_notifications.get(courier.courier_id, 0)
+        ]
+        self._earnings[row] = courier.earnings
+        self._utilization_times[row] = courier.utilization_time
+        self._guaranteed_compensations[row] = courier.guaranteed_compensation
+
+    def discard_orders_finished_before(self, finish_time: int):
+        """Method to remove the orders dropped off or canceled before a time, such as the end of the warm up"""
+
+        times = self._order_times[:self.num_orders]
+        finish_times = np.where(
+            np.isnan(times[:, METRIC_TIMES.index('drop_off_time')]),
+            times[:, METRIC_TIMES.index('cancellation_time')],
+            times[:, METRIC_TIMES.index('drop_off_time')]
+        )
+        kept = np.flatnonzero(~(finish_times < finish_time))
+
+        self._order_ids[:len(kept)] = self._order_ids[kept]
+        self._order_times[:len(kept)] = self._order_times[kept]
+        self._order_times[len(kept):] = np.nan
+        self._order_rows = {order_id: row for row, order_id in enumerate(self._order_ids[:len(kept)].tolist())}
+
+    def order_metrics(self) -> List[Dict[str, Any]]:
+        """Method to calculate the metrics of the archived orders"""
+
+        return [
+            Order.metrics(
+                order_id=order_id,
+                **{column: self._value(time) for column, time in zip(METRIC_TIMES, times)}
+            )
+            for order_id, times in zip(
+                self._order_ids[:self.num_orders].tolist(),
+                self._order_times[:self.num_orders].tolist()
+            )
+        ]
+
+    def courier_metrics(self, metrics: Callable[..., Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Method to calculate the metrics of the archived couriers, with the couriers' metrics function"""
+
+        return [
+            metrics(
+                courier_id=courier_id,
+                earnings=earnings,
+                utilization_time=utilization_time,
+                guaranteed_compensation=guaranteed_compensation,
+                **dict(zip(COURIER_TOTALS, totals))
+            )
+            for courier_id, totals, earnings, utilization_time, guaranteed_compensation in zip(
+                self._courier_ids[:self.num_couriers].tolist(),
+                self._courier_totals[:self.num_couriers].tolist(),
+                self._earnings[:self.num_couriers].tolist(),
+                self._utilization_times[:self.num_couriers].tolist(),
+                self._guaranteed_compensations[:self.num_couriers].tolist()
+            )
+        ]
+
+    @staticmethod
+    def _value(time: float) -> Optional[int]:
+        """Method to convert an archived time back to the simulation's integer seconds"""
+
+        return int(time) if not np.isnan(time) else None
+
+    def _add_order(self, order_id: int) -> int:
+        """Method to assign a row to a new order, doubling the columns' capacity when they are full"""
+
+        row = len(self._order_rows)
+
+        if row == len(self._order_ids):
+            self._order_ids = np.concatenate((self._order_ids, np.zeros_like(self._order_ids)))
+            self._order_times = np.concatenate((self._order_times, np.full_like(self._order_times, np.nan)))
+
+        self._order_rows[order_id] = row
+        self._order_ids[row] = order_id
+
+        return row
+
+    def _add_courier(self, courier_id: int) -> int:
+        """Method to assign a row to a new courier, doubling the columns' capacity when they are full"""
+
+        row = len(self._courier_rows)
+
+        if row == len(self._courier_ids):
+            self._courier_ids = np.concatenate((self._courier_ids, np.zeros_like(self._courier_ids)))
+            self._courier_totals = np.concatenate((self._courier_totals, np.zeros_like(self._courier_totals)))
+            self._earnings = np.concatenate((self._earnings, np.zeros_like(self._earnings)))
+            self._utilization_times = np.concatenate(
+                (self._utilization_times, np.zeros_like(self._utilization_times))
+            )
+            self._guaranteed_compensations = np.concatenate(
+                (self._guaranteed_compensations, np.zeros_like(self._guaranteed_compensations))
+            )
+
+        self._courier_rows[courier_id] = row
+        self._courier_ids[row] = courier_id
+
+        return row
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Union, Optional, Any, List
+from typing import Union, Optional, Any, List, Iterable
 
 from objects.route import Route
 from objects.stop import Stop
+from utils.dataclass_utils import add_slots
 
 LABELS = {
     0: 'pick_and_drop',
@@ -24,6 +25,7 @@ class NotificationType(IntEnum):
         return LABELS[self]
 
 
+@add_slots
 @dataclass
 class Notification:
     """Class that represents a notification of a new Route or Stop"""
@@ -32,9 +34,11 @@ class Notification:
     instruction: Optional[Union[Route, List[Stop]]]
     type: NotificationType = NotificationType.PICK_UP_DROP_OFF
 
-    def update(self, processed_order_ids: List[int]):
+    def update(self, processed_order_ids: Iterable[int]):
         """Method to update a notification if some of its orders have been processed"""
 
+        processed_order_ids = set(processed_order_ids)
+
         if isinstance(self.instruction, Route):
             self.instruction.update(processed_order_ids)
 
@@ -1,15 +1,39 @@
-import random
 from dataclasses import dataclass, field
 from datetime import time
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Tuple
 
 from geohash import encode
 
 from objects.location import Location
 from settings import settings
-from utils.datetime_utils import time_diff
+from utils.dataclass_utils import add_slots
+from utils.datetime_utils import sec_to_time
+from utils.random_utils import random_stream
 
+METRIC_TIMES = [
+    'placement_time',
+    'preparation_time',
+    'acceptance_time',
+    'in_store_time',
+    'ready_time',
+    'pick_up_time',
+    'drop_off_time',
+    'expected_drop_off_time',
+    'cancellation_time'
+]
 
+
+def draw_service_times(order_id: int, seed: Optional[int] = None) -> Tuple[int, int]:
+    """Draw the pick up and drop off service times of an order from its own random stream"""
+
+    stream = random_stream('order', order_id, 'service_times', seed=seed)
+    pick_up_service_time = stream.randint(settings.ORDER_MIN_SERVICE_TIME, settings.ORDER_MAX_PICK_UP_SERVICE_TIME)
+    drop_off_service_time = stream.randint(settings.ORDER_MIN_SERVICE_TIME, settings.ORDER_MAX_DROP_OFF_SERVICE_TIME)
+
+    return pick_up_service_time, drop_off_service_time
+
+
+@add_slots
 @dataclass
 class Order:
     """A class used to handle an order's state and events"""
@@ -22,49 +46,68 @@ class Order:
     state: Optional[str] = ''
     user: Optional[Any] = None
 
-    acceptance_time: Optional[time] = None
-    cancellation_time: Optional[time] = None
+    acceptance_time: Optional[int] = None
+    cancellation_time: Optional[int] = None
     drop_off_service_time: Optional[float] = None
-    drop_off_time: Optional[time] = None
-    expected_drop_off_time: Optional[time] = None
+    drop_off_time: Optional[int] = None
+    expected_drop_off_time: Optional[int] = None
     geohash: Optional[str] = None
-    in_store_time: Optional[time] = None
-    pick_up_time: Optional[time] = None
+    in_store_time: Optional[int] = None
+    pick_up_time: Optional[int] = None
     pick_up_service_time: Optional[float] = None
-    placement_time: Optional[time] = None
-    preparation_time: Optional[time] = None
-    ready_time: Optional[time] = None
+    placement_time: Optional[int] = None
+    preparation_time: Optional[int] = None
+    ready_time: Optional[int] = None
 
     def __post_init__(self):
         """Randomly assigns missing properties immediately after the order is created and other initializations"""
 
-        self.pick_up_service_time = random.randint(
-            settings.ORDER_MIN_SERVICE_TIME,
-            settings.ORDER_MAX_PICK_UP_SERVICE_TIME
-        ) if self.pick_up_service_time is None else self.pick_up_service_time
-        self.drop_off_service_time = random.randint(
-            settings.ORDER_MIN_SERVICE_TIME,
-            settings.ORDER_MAX_DROP_OFF_SERVICE_TIME
-        ) if self.drop_off_service_time is None else self.drop_off_service_time
+        if self.pick_up_service_time is None or self.drop_off_service_time is None:
+            pick_up_service_time, drop_off_service_time = draw_service_times(self.order_id)
+            self.pick_up_service_time = (
+                pick_up_service_time if self.pick_up_service_time is None else self.pick_up_service_time
+            )
+            self.drop_off_service_time = (
+                drop_off_service_time if self.drop_off_service_time is None else self.drop_off_service_time
+            )
+
         self.state = 'unassigned'
         self.geohash = (
             encode(self.pick_up_at.lat, self.pick_up_at.lng, settings.DISPATCHER_GEOHASH_PRECISION_GROUPING)
             if self.pick_up_at is not None
             else ''
-        )
+        ) if self.geohash is None else self.geohash
 
     def calculate_metrics(self) -> Dict[str, Any]:
         """Method to calculate the metrics of an order"""
 
-        dropped_off = bool(self.drop_off_time)
+        return self.metrics(order_id=self.order_id, **{column: getattr(self, column) for column in METRIC_TIMES})
+
+    @classmethod
+    def metrics(
+            cls,
+            order_id: int,
+            placement_time: Optional[int],
+            preparation_time: Optional[int],
+            acceptance_time: Optional[int],
+            in_store_time: Optional[int],
+            ready_time: Optional[int],
+            pick_up_time: Optional[int],
+            drop_off_time: Optional[int],
+            expected_drop_off_time: Optional[int],
+            cancellation_time: Optional[int]
+    ) -> Dict[str, Any]:
+        """Method to calculate the metrics of an order from its times, whether it is alive or archived"""
+
+        dropped_off = drop_off_time is not None
 
         if dropped_off:
-            click_to_door_time = time_diff(self.drop_off_time, self.placement_time)
-            click_to_taken_time = time_diff(self.acceptance_time, self.placement_time)
-            ready_to_door_time = time_diff(self.drop_off_time, self.ready_time)
-            ready_to_pickup_time = time_diff(self.pick_up_time, self.ready_time)
-            in_store_to_pickup_time = time_diff(self.pick_up_time, self.in_store_time)
-            drop_off_lateness_time = time_diff(self.drop_off_time, self.expected_drop_off_time)
+            click_to_door_time = drop_off_time - placement_time
+            click_to_taken_time = acceptance_time - placement_time
+            ready_to_door_time = drop_off_time - ready_time
+            ready_to_pickup_time = pick_up_time - ready_time
+            in_store_to_pickup_time = pick_up_time - in_store_time
+            drop_off_lateness_time = drop_off_time - expected_drop_off_time
             click_to_cancel_time = None
 
         else:
@@ -74,19 +117,19 @@ class Order:
             ready_to_pickup_time = None
             in_store_to_pickup_time = None
             drop_off_lateness_time = None
-            click_to_cancel_time = time_diff(self.cancellation_time, self.preparation_time)
+            click_to_cancel_time = cancellation_time - preparation_time
 
         return {
-            'order_id': self.order_id,
-            'placement_time': self.placement_time,
-            'preparation_time': self.preparation_time,
-            'acceptance_time': self.acceptance_time,
-            'in_store_time': self.in_store_time,
-            'ready_time': self.ready_time,
-            'pick_up_time': self.pick_up_time,
-            'drop_off_time': self.drop_off_time,
-            'expected_drop_off_time': self.expected_drop_off_time,
-            'cancellation_time': self.cancellation_time,
+            'order_id': order_id,
+            'placement_time': cls._metric_time(placement_time),
+            'preparation_time': cls._metric_time(preparation_time),
+            'acceptance_time': cls._metric_time(acceptance_time),
+            'in_store_time': cls._metric_time(in_store_time),
+            'ready_time': cls._metric_time(ready_time),
+            'pick_up_time': cls._metric_time(pick_up_time),
+            'drop_off_time': cls._metric_time(drop_off_time),
+            'expected_drop_off_time': cls._metric_time(expected_drop_off_time),
+            'cancellation_time': cls._metric_time(cancellation_time),
             'dropped_off': dropped_off,
             'click_to_door_time': click_to_door_time,
             'click_to_taken_time': click_to_taken_time,
@@ -96,3 +139,9 @@ class Order:
             'drop_off_lateness_time': drop_off_lateness_time,
             'click_to_cancel_time': click_to_cancel_time
         }
+
+    @staticmethod
+    def _metric_time(seconds: Optional[int]) -> Optional[time]:
+        """Method to convert a simulation time to the time object stored in the metrics"""
+
+        return sec_to_time(seconds) if seconds is not None else None
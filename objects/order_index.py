@@ -0,0 +1,138 @@
+from enum import IntEnum
+from typing import Dict, Optional, Iterator, MutableMapping
+
+from objects.order import Order
+
+LABELS = {
+    0: 'placed',
+    1: 'unassigned',
+    2: 'assigned',
+    3: 'fulfilled',
+    4: 'canceled'
+}
+
+
+class OrderState(IntEnum):
+    """Class that defines the possible values of an order's state in the dispatcher"""
+
+    PLACED = 0
+    UNASSIGNED = 1
+    ASSIGNED = 2
+    FULFILLED = 3
+    CANCELED = 4
+
+    @property
+    def label(self):
+        """Property that returns the order state's label"""
+
+        return LABELS[self]
+
+
+PROCESSED_STATES = frozenset({OrderState.ASSIGNED, OrderState.FULFILLED, OrderState.CANCELED})
+
+
+class OrderIndex:
+    """Class that keeps the orders by state, moving them between states in constant time"""
+
+    def __init__(self):
+        """Instantiates the index without orders"""
+
+        self._states: Dict[int, OrderState] = {}
+        self._orders: Dict[OrderState, Dict[int, Order]] = {state: {} for state in OrderState}
+        self._views: Dict[OrderState, OrderStateView] = {state: OrderStateView(self, state) for state in OrderState}
+        self._released: Dict[OrderState, int] = {state: 0 for state in OrderState}
+
+    def state(self, order_id: int) -> Optional[OrderState]:
+        """Method to obtain the current state of an order, which is None if it is unknown"""
+
+        return self._states.get(order_id)
+
+    def orders(self, state: OrderState) -> 'OrderStateView':
+        """Method to obtain a view of the orders in a state"""
+
+        return self._views[state]
+
+    def count(self, state: OrderState) -> int:
+        """Method to obtain the number of orders in a state, including those released from it"""
+
+        return len(self._orders[state]) + self._released[state]
+
+    def is_processed(self, order_id: int) -> bool:
+        """Method to establish if an order was already assigned, fulfilled or canceled"""
+
+        return self._states.get(order_id) in PROCESSED_STATES
+
+    def transition(self, order: Order, state: OrderState):
+        """Method to move an order to a state, keeping its position if it already is in that state"""
+
+        previous_state = self._states.get(order.order_id)
+
+        if previous_state is not None and previous_state != state:
+            del self._orders[previous_state][order.order_id]
+
+        self._states[order.order_id] = state
+        self._orders[state][order.order_id] = order
+
+    def release(self, order_id: int):
+        """Method to stop holding an order that reached a final state, remembering its state and counting it"""
+
+        state = self._states[order_id]
+        del self._orders[state][order_id]
+        self._released[state] += 1
+
+    def remove(self, order_id: int):
+        """Method to take an order out of the index"""
+
+        state = self._states.pop(order_id, None)
+
+        if state is not None:
+            del self._orders[state][order_id]
+
+
+class OrderStateView(MutableMapping[int, Order]):
+    """Class that exposes the orders in a state as a dictionary, writing every change through the index"""
+
+    def __init__(self, index: OrderIndex, state: OrderState):
+        """Instantiates the view of a state of the index"""
+
+        self._index = index
+        self._state = state
+        self._orders = index._orders[state]
+
+    def __getitem__(self, order_id: int) -> Order:
+        """Method to obtain an order in the state"""
+
+        return self._orders[order_id]
+
+    def __setitem__(self, order_id: int, order: Order):
+        """Method to move an order to the state"""
+
+        self._index.transition(order, self._state)
+
+    def __delitem__(self, order_id: int):
+        """Method to take an order in the state out of the index"""
+
+        if order_id not in self._orders:
+            raise KeyError(order_id)
+
+        self._index.remove(order_id)
+
+    def __iter__(self) -> Iterator[int]:
+        """Method to iterate over the ids of the orders in the state"""
+
+        return iter(self._orders)
+
+    def __len__(self) -> int:
+        """Method to obtain the number of orders in the state"""
+
+        return len(self._orders)
+
+    def __repr__(self) -> str:
+        """Method to represent the view as the dictionary of orders in the state"""
+
+        return repr(self._orders)
+
+    def copy(self) -> Dict[int, Order]:
+        """Method to obtain a dictionary with the orders in the state"""
+
+        return self._orders.copy()
@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from datetime import time
+from typing import List, Dict, Any, Iterable, Optional
+
+import numpy as np
+
+from objects.location import Location
+from objects.order import Order, draw_service_times
+from settings import settings
+from utils.datetime_utils import time_to_sec, day_sec_to_sim_sec
+from utils.geohash_utils import encode_vector
+
+COORDINATE_COLUMNS = ['pick_up_lat', 'pick_up_lng', 'drop_off_lat', 'drop_off_lng']
+TIME_COLUMNS = ['placement_time', 'preparation_time', 'ready_time', 'expected_drop_off_time']
+
+
+@dataclass
+class OrderTableView:
+    """Class that holds the columns of a set of orders, aligned with the order in which they were requested"""
+
+    order_ids: np.ndarray
+    ready_times: np.ndarray
+    geohashes: np.ndarray
+
+    def __len__(self) -> int:
+        """Method to obtain the number of orders in the view"""
+
+        return len(self.order_ids)
+
+    @classmethod
+    def from_orders(cls, orders: Iterable[Order]) -> 'OrderTableView':
+        """Method to build the columns directly from the orders' attributes"""
+
+        orders = list(orders)
+
+        return cls(
+            order_ids=np.array([order.order_id for order in orders]),
+            ready_times=np.array(
+                [order.ready_time if order.ready_time is not None else np.nan for order in orders],
+                dtype=np.float64
+            ),
+            geohashes=np.array([order.geohash for order in orders], dtype=str)
+        )
+
+
+class OrderTable:
+    """Class that holds the orders of an instance as columns, one row per order"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], start_time: time, seed: Optional[int] = None):
+        """
+        Instantiates the table from the instance columns, with times as seconds of the day, encoding geohashes in bulk
+        and drawing the service times of each order from its own stream, the same one an Order draws them from
+        """
+
+        num_orders = len(columns['order_id'])
+
+        self.order_ids = np.asarray(columns['order_id'], dtype=np.int64)
+        self.pick_up_coordinates = np.column_stack(
+            (columns['pick_up_lat'], columns['pick_up_lng'])
+        ).astype(np.float64).reshape(num_orders, 2)
+        self.drop_off_coordinates = np.column_stack(
+            (columns['drop_off_lat'], columns['drop_off_lng'])
+        ).astype(np.float64).reshape(num_orders, 2)
+        self.placement_times = day_sec_to_sim_sec(columns['placement_time'], start_time)
+        self.preparation_times = day_sec_to_sim_sec(columns['preparation_time'], start_time)
+        self.ready_times = day_sec_to_sim_sec(columns['ready_time'], start_time)
+        self.expected_drop_off_times = day_sec_to_sim_sec(columns['expected_drop_off_time'], start_time)
+        self.geohashes = encode_vector(
+            lats=self.pick_up_coordinates[:, 0],
+            lngs=self.pick_up_coordinates[:, 1],
+            precision=settings.DISPATCHER_GEOHASH_PRECISION_GROUPING
+        )
+        self.pick_up_service_times, self.drop_off_service_times = np.array(
+            [draw_service_times(order_id, seed=seed) for order_id in self.order_ids.tolist()],
+            dtype=np.int64
+        ).reshape(num_orders, 2).T
+        self._rows: Dict[int, int] = {order_id: row for row, order_id in enumerate(self.order_ids.tolist())}
+
+    @classmethod
+    def from_orders_info(
+            cls,
+            orders_info: List[Dict[str, Any]],
+            start_time: time,
+            seed: Optional[int] = None
+    ) -> 'OrderTable':
+        """Method to build the table from the instance rows, converting their times to seconds of the day"""
+
+        return cls(
+            columns={
+                'order_id': np.array([order_info['order_id'] for order_info in orders_info], dtype=np.int64),
+                **{
+                    column: np.array([order_info[column] for order_info in orders_info], dtype=np.float64)
+                    for column in COORDINATE_COLUMNS
+                },
+                **{
+                    column: np.array([time_to_sec(order_info[column]) for order_info in orders_info], dtype=np.int64)
+                    for column in TIME_COLUMNS
+                }
+            },
+            start_time=start_time,
+            seed=seed
+        )
+
+    def __len__(self) -> int:
+        """Method to obtain the number of orders in the table"""
+
+        return len(self.order_ids)
+
+    def submission_info(self, order_id: int) -> Dict[str, Any]:
+        """Method to obtain the arguments with which a user submits the order of a row"""
+
+        row = self._rows[order_id]
+        pick_up_lat, pick_up_lng = self.pick_up_coordinates[row].tolist()
+        drop_off_lat, drop_off_lng = self.drop_off_coordinates[row].tolist()
+
+        return {
+            'order_id': order_id,
+            'pick_up_at': Location(lat=pick_up_lat, lng=pick_up_lng),
+            'drop_off_at': Location(lat=drop_off_lat, lng=drop_off_lng),
+            'placement_time': int(self.placement_times[row]),
+            'expected_drop_off_time': int(self.expected_drop_off_times[row]),
+            'preparation_time': int(self.preparation_times[row]),
+            'ready_time': int(self.ready_times[row]),
+            'pick_up_service_time': int(self.pick_up_service_times[row]),
+            'drop_off_service_time': int(self.drop_off_service_times[row]),
+            'geohash': str(self.geohashes[row])
+        }
+
+    def view(self, orders: Iterable[Order]) -> OrderTableView:
+        """Method to obtain the columns of the orders, in the order they are given"""
+
+        rows = np.fromiter((self._rows[order.order_id] for order in orders), dtype=np.int64)
+
+        return OrderTableView(
+            order_ids=self.order_ids[rows],
+            ready_times=self.ready_times[rows],
+            geohashes=self.geohashes[rows]
+        )
@@ -1,189 +1,382 @@
-import copy
-import uuid
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from array import array
+from collections.abc import MutableSequence
+from itertools import count
+from typing import List, Optional, Dict, Iterable, Union
+
+import numpy as np
 
 from objects.location import Location
 from objects.order import Order
 from objects.stop import Stop, StopType
-from objects.vehicle import Vehicle
-from utils.datetime_utils import time_to_sec
+from objects.vehicle import VehicleTimes, NUM_VEHICLES
 
+ROUTE_IDS = count()
+STOP_TYPES = tuple(StopType)
+NO_COORDINATES = array('d', Stop.coordinates(None))
+NO_ARRIVALS = array('d', [0.]) * NUM_VEHICLES
 
-@dataclass
-class Route:
-    """Class describing a route for either moving or fulfilling"""
 
-    initial_prospect: int = None
-    num_stops: Optional[int] = 0
-    orders: Optional[Dict[int, Order]] = field(default_factory=lambda: dict())
-    route_id: Optional[str] = ''
-    stops: Optional[List[Stop]] = field(default_factory=lambda: list())
-    time: Optional[Dict[Any, float]] = field(default_factory=lambda: dict())
+def reset_route_ids():
+    """Function to number the routes from zero again, so that a simulation names its routes alike every time it runs"""
+
+    global ROUTE_IDS
+    ROUTE_IDS = count()
+
+
+class RouteStops(MutableSequence):
+    """Class that exposes the stops of a route as a list of stop views, writing changes through to the route"""
+
+    __slots__ = ('_route',)
+
+    def __init__(self, route: 'Route'):
+        """Instantiates the list over the route's stops"""
+
+        self._route = route
+
+    def __len__(self) -> int:
+        """Method to obtain the number of stops in the route"""
+
+        return self._route.num_stops
+
+    def __getitem__(self, ix: Union[int, slice]) -> Union[Stop, List[Stop]]:
+        """Method to obtain the view of a stop, or a list of views for a slice"""
+
+        if isinstance(ix, slice):
+            return [self._route.stop(position) for position in range(*ix.indices(len(self)))]
+
+        return self._route.stop(self._position(ix))
+
+    def __setitem__(self, ix: int, stop: Stop):
+        """Method to replace the stop at a position"""
+
+        self._route.set_stop(self._position(ix), stop)
+
+    def __delitem__(self, ix: int):
+        """Method to remove the stop at a position"""
+
+        self._route.remove_stop(self._position(ix))
+
+    def insert(self, ix: int, stop: Stop):
+        """Method to insert a stop before a position"""
+
+        self._route.insert_stop(min(max(ix if ix >= 0 else len(self) + ix, 0), len(self)), stop)
+
+    def __eq__(self, other) -> bool:
+        """Method to compare the stops with another list of stops"""
+
+        if not isinstance(other, (list, RouteStops)):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        """Method to represent the stops as a list"""
 
-    def __post_init__(self):
-        """Post process of the route creation"""
-        self.stops = [Stop()] * self.num_stops if self.num_stops else self.stops
-        self.num_stops = len(self.stops)
-        self.time = {v: 0 for v in Vehicle}
+        return repr(list(self))
+
+    def _position(self, ix: int) -> int:
+        """Method to convert an index, possibly negative, into a position of the route"""
+
+        position = ix if ix >= 0 else len(self) + ix
+
+        if not 0 <= position < len(self):
+            raise IndexError('Route stop index out of range')
+
+        return position
+
+
+class Route:
+    """Class describing a route for either moving or fulfilling, keeping its stops as columns"""
+
+    __slots__ = (
+        'initial_prospect',
+        'orders',
+        'route_id',
+        'time',
+        '_coordinates',
+        '_types',
+        '_visits',
+        '_arrivals',
+        '_stop_orders',
+        '_views'
+    )
+
+    def __init__(
+            self,
+            initial_prospect: int = None,
+            num_stops: Optional[int] = 0,
+            orders: Optional[Dict[int, Order]] = None,
+            stops: Optional[List[Stop]] = None
+    ):
+        """Instantiates the route with the given stops, or with a number of empty stops preallocated"""
+
+        self.initial_prospect = initial_prospect
+        self.orders = {} if orders is None else orders
+        self.time = VehicleTimes()
+        self.route_id = str(next(ROUTE_IDS))
+
+        if num_stops:
+            self._coordinates = NO_COORDINATES * num_stops
+            self._types = array('b', bytes(num_stops))
+            self._visits = array('b', bytes(num_stops))
+            self._arrivals = NO_ARRIVALS * num_stops
+            self._stop_orders: List[Optional[Dict[int, Order]]] = [None] * num_stops
+            self._views: List[Optional[Stop]] = [None] * num_stops
+
+        elif stops:
+            self._coordinates = array('d', [value for stop in stops for value in Stop.coordinates(stop.location)])
+            self._types = array('b', [stop.type for stop in stops])
+            self._visits = array('b', [stop.visited for stop in stops])
+            self._arrivals = array('d', [time for stop in stops for time in stop.arrive_at])
+            self._stop_orders = [stop.orders for stop in stops]
+            self._views = [None] * len(stops)
+
+            for position, stop in enumerate(stops):
+                if stop.route is None:
+                    stop.attach(self, position)
+                    self._views[position] = stop
+
+        else:
+            self._coordinates, self._types, self._visits = array('d'), array('b'), array('b')
+            self._arrivals, self._stop_orders, self._views = array('d'), [], []
 
         if bool(self.orders):
             self.time = self._calculate_time()
 
-        self.route_id = str(uuid.uuid4())[0:8]
+    def __repr__(self) -> str:
+        """Method to represent the route by its id, orders and stops"""
+
+        return f'Route(route_id={self.route_id!r}, orders={list(self.orders.keys())!r}, stops={self.stops!r})'
+
+    @property
+    def num_stops(self) -> int:
+        """Property indicating the number of stops in the route"""
+
+        return len(self._types)
+
+    @property
+    def stops(self) -> RouteStops:
+        """Property that returns the route's stops as views of its columns"""
+
+        return RouteStops(self)
+
+    @property
+    def stop_orders(self) -> List[Optional[Dict[int, Order]]]:
+        """Property that returns the orders served at each of the route's stops"""
+
+        return self._stop_orders
+
+    @property
+    def stop_coordinates(self) -> np.ndarray:
+        """Property that returns a copy of the coordinates of the route's stops, NaN for stops without a location"""
+
+        return np.array(self._coordinates, dtype=np.float64).reshape(self.num_stops, 2)
+
+    @property
+    def stop_types(self) -> np.ndarray:
+        """Property that returns a copy of the types of the route's stops"""
+
+        return np.array(self._types, dtype=np.int8)
+
+    @property
+    def stop_arrivals(self) -> np.ndarray:
+        """Property that returns a copy of the cumulative arrival times per vehicle at the route's stops"""
+
+        return np.array(self._arrivals, dtype=np.float64).reshape(self.num_stops, NUM_VEHICLES)
+
+    def stop(self, position: int) -> Stop:
+        """Method to obtain the view of the stop at a position, which is the same object while the stop exists"""
+
+        view = self._views[position]
+
+        if view is None:
+            view = Stop.view(self, position)
+            self._views[position] = view
+
+        return view
+
+    def stop_location(self, position: int) -> Optional[Location]:
+        """Method to obtain the location of the stop at a position"""
+
+        lat, lng = self._coordinates[2 * position], self._coordinates[2 * position + 1]
+
+        return Location(lat=lat, lng=lng) if lat == lat else None
+
+    def stop_arrive_at(self, position: int) -> VehicleTimes:
+        """Method to obtain the arrival times per vehicle at the stop at a position"""
+
+        return VehicleTimes(self._arrivals[position * NUM_VEHICLES:(position + 1) * NUM_VEHICLES])
+
+    def stop_type(self, position: int) -> StopType:
+        """Method to obtain the type of the stop at a position"""
+
+        return STOP_TYPES[self._types[position]]
+
+    def stop_visited(self, position: int) -> bool:
+        """Method to establish if the stop at a position was visited"""
+
+        return bool(self._visits[position])
+
+    def set_stop_location(self, position: int, location: Optional[Location]):
+        """Method to change the location of the stop at a position"""
+
+        self._coordinates[2 * position], self._coordinates[2 * position + 1] = Stop.coordinates(location)
+
+    def set_stop_arrive_at(self, position: int, arrive_at: VehicleTimes):
+        """Method to change the arrival times per vehicle at the stop at a position"""
+
+        self._arrivals[position * NUM_VEHICLES:(position + 1) * NUM_VEHICLES] = (
+            arrive_at if isinstance(arrive_at, array) else array('d', arrive_at)
+        )
+
+    def set_stop_type(self, position: int, stop_type: StopType):
+        """Method to change the type of the stop at a position"""
+
+        self._types[position] = stop_type
+
+    def set_stop_visited(self, position: int, visited: bool):
+        """Method to mark whether the stop at a position was visited"""
+
+        self._visits[position] = visited
 
     def time_since_ready(self, env_time: int) -> float:
         """Property to calculate how much time has passed since the route is ready to be picked up"""
 
-        return max(max(env_time - time_to_sec(order.ready_time), 0) for order in self.orders.values())
+        return max(max(env_time - order.ready_time, 0) for order in self.orders.values())
+
+    @classmethod
+    def from_locations(cls, locations: List[Location]) -> 'Route':
+        """Method to instantiate a movement route through some locations, writing its columns at once"""
+
+        num_stops = len(locations)
+        route = cls()
+        route._coordinates = array('d', [value for location in locations for value in Stop.coordinates(location)])
+        route._types = array('b', bytes(num_stops))
+        route._visits = array('b', bytes(num_stops))
+        route._arrivals = NO_ARRIVALS * num_stops
+        route._stop_orders = [None] * num_stops
+        route._views = [None] * num_stops
+
+        return route
 
     @classmethod
     def from_order(cls, order: Order):
         """Method to instantiate a route from an order"""
 
         orders = {order.order_id: order}
-        pick_up_stop = Stop(
-            location=order.pick_up_at,
-            orders=orders,
-            position=0,
-            type=StopType.PICK_UP,
-            visited=False
-        )
-        drop_off_stop = Stop(
-            location=order.drop_off_at,
-            orders=orders,
-            position=1,
-            type=StopType.DROP_OFF,
-            visited=False
-        )
+        route = cls(orders=orders)
+        route._append(location=order.pick_up_at, orders=orders, type=StopType.PICK_UP)
+        route._append(location=order.drop_off_at, orders=orders, type=StopType.DROP_OFF)
+        route.time = route._calculate_time()
 
-        return cls(
-            orders=orders,
-            stops=[pick_up_stop, drop_off_stop]
-        )
+        return route
+
+    def update(self, processed_order_ids: Iterable[int]):
+        """Method to update a route if some of its orders have been processed, compacting its stops in place"""
 
-    def update(self, processed_order_ids: List[int]):
-        """Method to update a route if some of its orders have been processed"""
+        processed_order_ids = set(processed_order_ids)
 
-        updated_stops, num_stops = [], 0
-        for stop in self.stops:
+        positions, updated_stop_orders = [], []
+        for position, stop_orders in enumerate(self._stop_orders):
             updated_orders = {
                 order_id: order
-                for order_id, order in stop.orders.items()
+                for order_id, order in stop_orders.items()
                 if order_id not in processed_order_ids
             }
 
             if bool(updated_orders):
-                updated_stops.append(
-                    Stop(
-                        arrive_at=stop.arrive_at,
-                        location=stop.location,
-                        orders=updated_orders,
-                        position=num_stops,
-                        type=stop.type,
-                        visited=stop.visited
-                    )
-                )
-                num_stops += 1
+                positions.append(position)
+                updated_stop_orders.append(updated_orders)
 
-        self.stops = updated_stops
+        self._compact(positions)
+        self._stop_orders[:] = updated_stop_orders
         self.orders = {
             order_id: order
             for order_id, order in self.orders.items()
             if order_id not in processed_order_ids
         }
-        self.num_stops = len(self.stops)
         self.time = self._calculate_time()
 
     def add_order(self, order: Order, route_position: Optional[int] = 1):
         """Method to add an order to the route"""
 
         if not bool(self.orders):
-            pick_up_stop = Stop(
-                location=order.pick_up_at,
-                orders={order.order_id: order},
-                position=0,
-                type=StopType.PICK_UP,
-                visited=False
-            )
-            drop_off_stop = Stop(
-                location=order.drop_off_at,
-                orders={order.order_id: order},
-                position=1,
-                type=StopType.DROP_OFF,
-                visited=False
-            )
             self.orders[order.order_id] = order
-            self.stops[0] = pick_up_stop
-            self.stops[1] = drop_off_stop
+            self._write(0, location=order.pick_up_at, orders={order.order_id: order}, type=StopType.PICK_UP)
+            self._write(1, location=order.drop_off_at, orders={order.order_id: order}, type=StopType.DROP_OFF)
             time = self._calculate_time()
 
         else:
             self.orders[order.order_id] = order
-            self.stops[0].orders[order.order_id] = order
-            stop = Stop(
-                location=order.drop_off_at,
-                orders={order.order_id: order},
-                position=route_position,
-                type=StopType.DROP_OFF,
-                visited=False
-            )
-
-            position = max(route_position, len(self.stops) - 1)
-
-            if position <= len(self.stops) - 1 and not bool(self.stops[position].orders):
-                self.stops[position] = stop
+            self._stop_orders[0][order.order_id] = order
+            position = max(route_position, self.num_stops - 1)
+
+            if position <= self.num_stops - 1 and not bool(self._stop_orders[position]):
+                self._write(
+                    position,
+                    location=order.drop_off_at,
+                    orders={order.order_id: order},
+                    type=StopType.DROP_OFF
+                )
 
             else:
-                position = len(self.stops)
-                stop.position = position
-                self.stops.append(stop)
+                position = self.num_stops
+                self._append(location=order.drop_off_at, orders={order.order_id: order}, type=StopType.DROP_OFF)
 
             time = self.calculate_time_update(
-                destination=stop.location,
-                origin=self.stops[position - 1].location,
-                service_time=stop.calculate_service_time()
+                destination=order.drop_off_at,
+                origin=self.stop_location(position - 1),
+                service_time=Stop.service_time(self._stop_orders[position])
             )
-            stop.arrive_at = copy.deepcopy(time)
+            self.set_stop_arrive_at(position, time)
 
         self.time = time
-        self.num_stops = len(self.stops)
 
     def add_stops(self, target_size: int):
         """Method to add empty stops to the route based on a target size"""
 
-        while len(self.stops) - 1 < target_size:
-            self.stops.append(Stop())
+        while self.num_stops - 1 < target_size:
+            self._append(location=None, orders=None, type=StopType.PICK_UP)
+
+    def add_stop(self, location: Optional[Location], orders: Optional[Dict[int, Order]], type: StopType):
+        """Method to add a stop at the end of the route, without instantiating it"""
 
-        self.num_stops = len(self.stops)
+        self._append(location=location, orders=orders, type=type)
 
     def update_stops(self):
-        """Method to remove empty stops from the route"""
-
-        stops, counter = [], 0
-        for stop in self.stops:
-            if bool(stop.orders):
-                stops.append(
-                    Stop(
-                        arrive_at=stop.arrive_at,
-                        location=stop.location,
-                        orders=stop.orders,
-                        position=counter,
-                        type=stop.type,
-                        visited=stop.visited
-                    )
-                )
-                counter += 1
+        """Method to remove empty stops from the route, compacting its stops in place"""
+
+        self._compact([position for position, stop_orders in enumerate(self._stop_orders) if bool(stop_orders)])
+
+    def set_stop(self, position: int, stop: Stop):
+        """Method to replace the stop at a position, which becomes a view of the route if it belonged to none"""
 
-        self.stops = stops
-        self.num_stops = len(self.stops)
+        self._write(position, location=stop.location, orders=stop.orders, type=stop.type)
+        self._adopt(position, stop)
 
-    def calculate_time_update(self, destination: Location, origin: Location, service_time: float) -> Dict[Any, float]:
+    def insert_stop(self, position: int, stop: Stop):
+        """Method to insert a stop before a position, shifting the following stops in place"""
+
+        self._detach_views(position)
+        self._coordinates[2 * position:2 * position] = NO_COORDINATES
+        self._types.insert(position, StopType.PICK_UP)
+        self._visits.insert(position, False)
+        self._arrivals[position * NUM_VEHICLES:position * NUM_VEHICLES] = NO_ARRIVALS
+        self._stop_orders.insert(position, None)
+        self._views.insert(position, None)
+        self.set_stop(position, stop)
+
+    def remove_stop(self, position: int):
+        """Method to remove the stop at a position, shifting the following stops in place"""
+
+        self._compact([ix for ix in range(self.num_stops) if ix != position])
+
+    def calculate_time_update(self, destination: Location, origin: Location, service_time: float) -> VehicleTimes:
         """Method to update the route time based on a new stop"""
 
         from services.osrm_service import OSRMService
 
-        time = {v: t for v, t in self.time.items()}
+        time = self.time.copy()
         OSRMService.update_estimate_time_for_vehicles(
             origin=origin,
             destination=destination,
@@ -193,23 +386,87 @@ class Route:
 
         return time
 
-    def _calculate_time(self) -> Dict[Any, float]:
-        """Method to calculate the route time based on the available stops"""
+    def _calculate_time(self) -> VehicleTimes:
+        """Method to calculate the route time based on the available stops, writing their arrival times"""
 
         from services.osrm_service import OSRMService
 
-        stops = [stop for stop in self.stops if bool(stop.orders)]
-        time = {v: t for v, t in self.time.items()}
+        positions = [position for position, stop_orders in enumerate(self._stop_orders) if bool(stop_orders)]
+        time = self.time.copy()
 
-        for ix in range(len(stops) - 1):
-            origin = stops[ix]
-            destination = stops[ix + 1]
+        for origin, destination in zip(positions, positions[1:]):
             OSRMService.update_estimate_time_for_vehicles(
-                origin=origin.location,
-                destination=destination.location,
+                origin=self.stop_location(origin),
+                destination=self.stop_location(destination),
                 time=time,
-                service_time=destination.calculate_service_time()
+                service_time=Stop.service_time(self._stop_orders[destination])
             )
-            destination.arrive_at = copy.deepcopy(time)
+            self.set_stop_arrive_at(destination, time)
 
         return time
+
+    def _append(self, location: Optional[Location], orders: Optional[Dict[int, Order]], type: StopType):
+        """Method to add a new, unvisited stop at the end of the columns"""
+
+        self._coordinates.extend(Stop.coordinates(location))
+        self._types.append(type)
+        self._visits.append(False)
+        self._arrivals.extend(NO_ARRIVALS)
+        self._stop_orders.append(orders)
+        self._views.append(None)
+
+    def _write(self, position: int, location: Optional[Location], orders: Optional[Dict[int, Order]], type: StopType):
+        """Method to write a new, unvisited stop at a position, detaching the view of the stop it replaces"""
+
+        view = self._views[position]
+
+        if view is not None:
+            view.detach()
+            self._views[position] = None
+
+        self.set_stop_location(position, location)
+        self.set_stop_type(position, type)
+        self.set_stop_visited(position, False)
+        self.set_stop_arrive_at(position, NO_ARRIVALS)
+        self._stop_orders[position] = orders
+
+    def _adopt(self, position: int, stop: Stop):
+        """Method to copy the progress of a stop written at a position, making it a view if it belonged to no route"""
+
+        self.set_stop_visited(position, stop.visited)
+        self.set_stop_arrive_at(position, stop.arrive_at)
+
+        if stop.route is None:
+            stop.attach(self, position)
+            self._views[position] = stop
+
+    def _compact(self, positions: List[int]):
+        """Method to keep only the stops at the given positions, moving them to the front of the columns in place"""
+
+        self._detach_views(0)
+
+        for target, position in enumerate(positions):
+            if target != position:
+                self._coordinates[2 * target:2 * target + 2] = self._coordinates[2 * position:2 * position + 2]
+                self._types[target] = self._types[position]
+                self._visits[target] = self._visits[position]
+                self._arrivals[target * NUM_VEHICLES:(target + 1) * NUM_VEHICLES] = self._arrivals[
+                    position * NUM_VEHICLES:(position + 1) * NUM_VEHICLES
+                ]
+                self._stop_orders[target] = self._stop_orders[position]
+
+        num_stops = len(positions)
+        del self._coordinates[2 * num_stops:]
+        del self._types[num_stops:]
+        del self._visits[num_stops:]
+        del self._arrivals[num_stops * NUM_VEHICLES:]
+        del self._stop_orders[num_stops:]
+        del self._views[num_stops:]
+
+    def _detach_views(self, position: int):
+        """Method to detach the views of the stops from a position onwards, since those stops will move"""
+
+        for ix in range(position, self.num_stops):
+            if self._views[ix] is not None:
+                self._views[ix].detach()
+                self._views[ix] = None
@@ -1,11 +1,9 @@
-from dataclasses import dataclass, field
-from datetime import time
 from enum import IntEnum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from objects.location import Location
 from objects.order import Order
-from objects.vehicle import Vehicle
+from objects.vehicle import VehicleTimes
 
 LABELS = {
     0: 'pick_up',
@@ -27,32 +25,194 @@ class StopType(IntEnum):
         return LABELS[self]
 
 
-@dataclass
 class Stop:
-    """Class describing the stop of a route"""
+    """Class describing the stop of a route, either on its own or as a view of a route's columns"""
+
+    __slots__ = ('_arrive_at', '_location', '_orders', '_type', '_visited', '_route', 'position')
+
+    def __init__(
+            self,
+            arrive_at: Optional[VehicleTimes] = None,
+            location: Optional[Location] = None,
+            orders: Optional[Dict[int, Order]] = None,
+            position: Optional[int] = 0,
+            type: Optional[StopType] = StopType.PICK_UP,
+            visited: Optional[bool] = False
+    ):
+        """Instantiates a stop that does not belong to a route yet"""
+
+        self._arrive_at = VehicleTimes() if arrive_at is None else arrive_at
+        self._location = location
+        self._orders = orders
+        self._type = type
+        self._visited = visited
+        self._route = None
+        self.position = position
+
+    @classmethod
+    def view(cls, route: Any, position: int) -> 'Stop':
+        """Method to instantiate a stop that reads and writes the columns of a route's position"""
+
+        stop = cls.__new__(cls)
+        stop._route = None
+        stop.attach(route, position)
+
+        return stop
 
-    arrive_at: Optional[Dict[Any, float]] = field(default_factory=lambda: dict())
-    location: Optional[Location] = None
-    orders: Optional[Dict[int, Order]] = None
-    position: Optional[int] = 0
-    type: Optional[StopType] = StopType.PICK_UP
-    visited: Optional[bool] = False
+    @property
+    def arrive_at(self) -> VehicleTimes:
+        """Property that returns the arrival times per vehicle at the stop"""
+
+        return self._arrive_at if self._route is None else self._route.stop_arrive_at(self.position)
+
+    @arrive_at.setter
+    def arrive_at(self, arrive_at: VehicleTimes):
+        """Setter of the arrival times per vehicle at the stop"""
+
+        if self._route is None:
+            self._arrive_at = arrive_at
+
+        else:
+            self._route.set_stop_arrive_at(self.position, arrive_at)
+
+    @property
+    def location(self) -> Optional[Location]:
+        """Property that returns the stop's location"""
+
+        return self._location if self._route is None else self._route.stop_location(self.position)
+
+    @location.setter
+    def location(self, location: Optional[Location]):
+        """Setter of the stop's location"""
+
+        if self._route is None:
+            self._location = location
+
+        else:
+            self._route.set_stop_location(self.position, location)
+
+    @property
+    def orders(self) -> Optional[Dict[int, Order]]:
+        """Property that returns the orders served at the stop"""
+
+        return self._orders if self._route is None else self._route.stop_orders[self.position]
+
+    @orders.setter
+    def orders(self, orders: Optional[Dict[int, Order]]):
+        """Setter of the orders served at the stop"""
+
+        if self._route is None:
+            self._orders = orders
+
+        else:
+            self._route.stop_orders[self.position] = orders
+
+    @property
+    def type(self) -> StopType:
+        """Property that returns the stop's type"""
+
+        return self._type if self._route is None else self._route.stop_type(self.position)
+
+    @type.setter
+    def type(self, type: StopType):
+        """Setter of the stop's type"""
+
+        if self._route is None:
+            self._type = type
+
+        else:
+            self._route.set_stop_type(self.position, type)
+
+    @property
+    def visited(self) -> bool:
+        """Property that returns whether the stop was visited"""
 
-    def __post_init__(self):
-        """Immediate instantiation of some properties"""
+        return self._visited if self._route is None else self._route.stop_visited(self.position)
 
-        self.arrive_at = {v: 0 for v in Vehicle} if not bool(self.arrive_at) else self.arrive_at
+    @visited.setter
+    def visited(self, visited: bool):
+        """Setter of whether the stop was visited"""
+
+        if self._route is None:
+            self._visited = visited
+
+        else:
+            self._route.set_stop_visited(self.position, visited)
+
+    @staticmethod
+    def coordinates(location: Optional[Location]) -> Tuple[float, float]:
+        """Method to obtain the coordinates with which a location is kept in a route's columns"""
+
+        return location.coordinates if location is not None else (float('nan'), float('nan'))
+
+    @property
+    def route(self) -> Optional[Any]:
+        """Property that returns the route of which the stop is a view, if any"""
+
+        return self._route
+
+    def attach(self, route: Any, position: int):
+        """Method to make the stop a view of a route's position"""
+
+        self._route = route
+        self.position = position
+
+    def detach(self):
+        """Method to keep the stop's current values on its own, stopping it from following the route"""
+
+        if self._route is not None:
+            self._arrive_at, self._location, self._orders, self._type, self._visited = (
+                self.arrive_at, self.location, self.orders, self.type, self.visited
+            )
+            self._route = None
 
     def calculate_service_time(self) -> float:
         """Method to calculate the service time at a stop"""
 
-        return max(order.drop_off_service_time for order in self.orders.values())
+        return self.service_time(self.orders)
 
-    def calculate_latest_expected_time(self) -> time:
+    def calculate_latest_expected_time(self) -> int:
         """Method to calculate the latest expected time for a stop based on its type"""
 
-        if self.type == StopType.PICK_UP:
-            return max(order.ready_time for order in self.orders.values())
+        return self.latest_expected_time(self.orders, self.type)
+
+    @staticmethod
+    def service_time(orders: Dict[int, Order]) -> float:
+        """Method to calculate the service time at a stop with the given orders"""
+
+        return max(order.drop_off_service_time for order in orders.values())
+
+    @staticmethod
+    def latest_expected_time(orders: Dict[int, Order], stop_type: StopType) -> int:
+        """Method to calculate the latest expected time for a stop with the given orders, based on its type"""
+
+        if stop_type == StopType.PICK_UP:
+            return max(order.ready_time for order in orders.values())
+
+        elif stop_type == StopType.DROP_OFF:
+            return max(order.expected_drop_off_time for order in orders.values())
+
+    def _fields(self) -> Tuple:
+        """Method to obtain the stop's values, in the order they are compared and represented"""
+
+        return self.arrive_at, self.location, self.orders, self.position, self.type, self.visited
+
+    def __eq__(self, other: Any) -> bool:
+        """Method to compare stops by their values"""
+
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Method to represent the stop by its values"""
+
+        arrive_at, location, orders, position, type, visited = self._fields()
 
-        elif self.type == StopType.DROP_OFF:
-            return max(order.expected_drop_off_time for order in self.orders.values())
+        return (
+            f'Stop(arrive_at={arrive_at!r}, location={location!r}, orders={orders!r}, '
+            f'position={position!r}, type={type!r}, visited={visited!r})'
+        )
@@ -1,4 +1,6 @@
+from array import array
 from enum import IntEnum
+from typing import Iterable, Optional
 
 from utils.datetime_utils import hour_to_sec
 
@@ -50,3 +52,30 @@ class Vehicle(IntEnum):
         """Method to create a vehicle from a label"""
 
         return cls(LABELS_MAP[label])
+
+
+NUM_VEHICLES = len(Vehicle)
+NO_TIMES = array('d', [0.]) * NUM_VEHICLES
+
+
+class VehicleTimes(array):
+    """A class that holds one time per vehicle in a fixed array, indexed by the vehicle"""
+
+    __slots__ = ()
+
+    def __new__(cls, times: Optional[Iterable[float]] = None):
+        """Instantiates the times, starting every vehicle at zero if none are given"""
+
+        return super().__new__(cls, 'd', times if times is not None else NO_TIMES)
+
+    def copy(self) -> 'VehicleTimes':
+        """Method to copy the times without losing their class"""
+
+        return VehicleTimes(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo) -> 'VehicleTimes':
+        """Method to deep copy the times, which hold no references"""
+
+        return self.copy()
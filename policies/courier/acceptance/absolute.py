@@ -1,3 +1,4 @@
+from random import Random
 from typing import Generator, Any
 
 from simpy import Environment
@@ -12,7 +13,7 @@ class AbsoluteAcceptancePolicy(CourierAcceptancePolicy):
     The courier accepts every notification
     """
 
-    def execute(self, acceptance_rate: float, env: Environment) -> Generator[Any, Any, bool]:
+    def execute(self, acceptance_rate: float, env: Environment, stream: Random) -> Generator[Any, Any, bool]:
         """Execution of the Acceptance Policy"""
 
         yield env.timeout(delay=settings.COURIER_WAIT_TO_ACCEPT)
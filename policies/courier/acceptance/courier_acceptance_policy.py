@@ -1,3 +1,4 @@
+from random import Random
 from typing import Generator, Any
 
 from simpy import Environment
@@ -10,7 +11,7 @@ class CourierAcceptancePolicy(Policy):
 
     ACCEPTANCE_CHOICES = [True, False]
 
-    def execute(self, acceptance_rate: float, env: Environment) -> Generator[Any, Any, bool]:
+    def execute(self, acceptance_rate: float, env: Environment, stream: Random) -> Generator[Any, Any, bool]:
         """Implementation of the policy"""
 
         pass
@@ -1,4 +1,4 @@
-import random
+from random import Random
 from typing import Generator, Any
 
 from simpy import Environment
@@ -13,9 +13,9 @@ class UniformAcceptancePolicy(CourierAcceptancePolicy):
     It uses a Uniform Distribution to obtain the acceptance rate and a weighted probability to decide.
     """
 
-    def execute(self, acceptance_rate: float, env: Environment) -> Generator[Any, Any, bool]:
+    def execute(self, acceptance_rate: float, env: Environment, stream: Random) -> Generator[Any, Any, bool]:
         """Execution of the Acceptance Policy"""
 
         yield env.timeout(delay=settings.COURIER_WAIT_TO_ACCEPT)
 
-        return random.choices(self.ACCEPTANCE_CHOICES, weights=(acceptance_rate, 1 - acceptance_rate))[0]
+        return stream.choices(self.ACCEPTANCE_CHOICES, weights=(acceptance_rate, 1 - acceptance_rate))[0]
@@ -17,13 +17,12 @@ class OSRMMovementPolicy(CourierMovementPolicy):
 
         route = OSRMService.get_route(origin, destination)
 
-        for ix in range(len(route.stops) - 1):
-            stop = route.stops[ix]
-            next_stop = route.stops[ix + 1]
+        coordinates = route.stop_coordinates.tolist()
 
-            distance = haversine(stop.location.coordinates, next_stop.location.coordinates)
+        for ix in range(len(coordinates) - 1):
+            distance = haversine(coordinates[ix], coordinates[ix + 1])
             time = int(distance / courier.vehicle.average_velocity)
 
             yield env.timeout(delay=time)
 
-            courier.location = next_stop.location
+            courier.location = route.stop_location(ix + 1)
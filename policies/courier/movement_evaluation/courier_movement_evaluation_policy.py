@@ -1,3 +1,4 @@
+from random import Random
 from typing import Optional
 
 from objects.location import Location
@@ -7,7 +8,7 @@ from policies.policy import Policy
 class CourierMovementEvaluationPolicy(Policy):
     """Class that establishes how a courier decides to change his / her location and the corresponding destination"""
 
-    def execute(self, current_location: Location) -> Optional[Location]:
+    def execute(self, current_location: Location, stream: Random) -> Optional[Location]:
         """Implementation of the policy"""
 
         pass
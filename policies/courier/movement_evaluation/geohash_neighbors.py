@@ -1,4 +1,4 @@
-import random
+from random import Random
 from typing import Optional
 
 import geohash
@@ -15,13 +15,13 @@ class NeighborsMoveEvalPolicy(CourierMovementEvaluationPolicy):
     The destination is the center of the chosen geohash.
     """
 
-    def execute(self, current_location: Location) -> Optional[Location]:
+    def execute(self, current_location: Location, stream: Random) -> Optional[Location]:
         """Execution of the Movement Evaluation Policy"""
 
-        if random.random() <= settings.COURIER_MOVEMENT_PROBABILITY:
+        if stream.random() <= settings.COURIER_MOVEMENT_PROBABILITY:
             current_geohash = geohash.encode(*current_location.coordinates, precision=6)
             geohash_neighbors = geohash.neighbors(current_geohash)
-            destination_geohash = random.choice(geohash_neighbors)
+            destination_geohash = stream.choice(geohash_neighbors)
             destination_coordinates = geohash.decode(destination_geohash)
 
             return Location(lat=destination_coordinates[0], lng=destination_coordinates[1])
@@ -1,3 +1,4 @@
+from random import Random
 from typing import Optional
 
 from objects.location import Location
@@ -10,7 +11,7 @@ class StillMoveEvalPolicy(CourierMovementEvaluationPolicy):
     The courier never moves, remaining still.
     """
 
-    def execute(self, current_location: Location) -> Optional[Location]:
+    def execute(self, current_location: Location, stream: Random) -> Optional[Location]:
         """Execution of the Movement Evaluation Policy"""
 
         return None
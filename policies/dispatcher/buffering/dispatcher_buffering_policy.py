@@ -8,3 +8,8 @@ class DispatcherBufferingPolicy(Policy):
         """Implementation of the policy"""
 
         pass
+
+    def next_execution_time(self, env_time: int) -> int:
+        """Method to establish the next time [sec] at which the policy must be executed. By default, every second"""
+
+        return env_time + 1
@@ -9,3 +9,8 @@ class RollingBufferingPolicy(DispatcherBufferingPolicy):
         """Execution of the order buffering policy"""
 
         return env_time % settings.DISPATCHER_ROLLING_HORIZON_TIME == 0
+
+    def next_execution_time(self, env_time: int) -> int:
+        """Method to establish the next time [sec] at which the buffer is flushed"""
+
+        return (env_time // settings.DISPATCHER_ROLLING_HORIZON_TIME + 1) * settings.DISPATCHER_ROLLING_HORIZON_TIME
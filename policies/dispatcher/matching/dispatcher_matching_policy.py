@@ -1,9 +1,11 @@
-from typing import List, Iterable, Tuple
+from typing import List, Iterable, Tuple, Optional
 
 from actors.courier import Courier
+from objects.fleet_store import FleetView
 from objects.matching_metric import MatchingMetric
 from objects.notification import Notification
 from objects.order import Order
+from objects.order_table import OrderTableView
 from policies.policy import Policy
 
 
@@ -14,7 +16,9 @@ class DispatcherMatchingPolicy(Policy):
             self,
             orders: Iterable[Order],
             couriers: Iterable[Courier],
-            env_time: int
+            env_time: int,
+            fleet: Optional[FleetView] = None,
+            order_view: Optional[OrderTableView] = None
     ) -> Tuple[List[Notification], MatchingMetric]:
         """Implementation of the policy"""
 
@@ -1,13 +1,15 @@
 import time
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 
 import numpy as np
-from haversine import haversine
+from haversine import haversine_vector
 
 from actors.courier import Courier
+from objects.fleet_store import FleetView
 from objects.matching_metric import MatchingMetric
 from objects.notification import Notification, NotificationType
 from objects.order import Order
+from objects.order_table import OrderTableView
 from objects.route import Route
 from objects.stop import Stop, StopType
 from policies.dispatcher.matching.dispatcher_matching_policy import DispatcherMatchingPolicy
@@ -22,18 +24,20 @@ class GreedyMatchingPolicy(DispatcherMatchingPolicy):
             self,
             orders: List[Order],
             couriers: List[Courier],
-            env_time: int
+            env_time: int,
+            fleet: Optional[FleetView] = None,
+            order_view: Optional[OrderTableView] = None
     ) -> Tuple[List[Notification], MatchingMetric]:
         """Implementation of the policy"""
 
         matching_start_time = time.time()
 
-        idle_couriers = [
-            courier
-            for courier in couriers
-            if courier.condition == 'idle' and courier.active_route is None
-        ]
-        prospects = self._get_prospects(orders, idle_couriers)
+        if fleet is None:
+            fleet = FleetView.from_couriers(couriers)
+
+        idle_mask = fleet.in_state('idle') & ~fleet.routed
+        idle_couriers = [couriers[courier_ix] for courier_ix in np.flatnonzero(idle_mask)]
+        prospects = self._get_prospects(orders, idle_couriers, coordinates=fleet.coordinates[idle_mask])
         estimations = self._get_estimations(orders, idle_couriers, prospects)
 
         notifications, notified_couriers = [], np.array([])
@@ -94,17 +98,26 @@ class GreedyMatchingPolicy(DispatcherMatchingPolicy):
         return notifications, matching_metric
 
     @staticmethod
-    def _get_prospects(orders: List[Order], couriers: List[Courier]) -> np.ndarray:
-        """Method to obtain the matching prospects between orders and couriers"""
+    def _get_prospects(
+            orders: List[Order],
+            couriers: List[Courier],
+            coordinates: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Method to obtain the matching prospects between orders and couriers, as (order_ix, courier_ix) pairs"""
 
-        prospects = []
-        for order_ix, order in enumerate(orders):
-            for courier_ix, courier in enumerate(couriers):
-                distance_to_pick_up = haversine(courier.location.coordinates, order.pick_up_at.coordinates)
-                if distance_to_pick_up <= settings.DISPATCHER_PROSPECTS_MAX_DISTANCE:
-                    prospects.append((order_ix, courier_ix))
+        if not orders or not couriers:
+            return np.array([])
+
+        if coordinates is None:
+            coordinates = FleetView.from_couriers(couriers).coordinates
+
+        distances_to_pick_up = haversine_vector(
+            coordinates,
+            np.array([order.pick_up_at.coordinates for order in orders]),
+            comb=True
+        )
 
-        return np.array(prospects)
+        return np.argwhere(distances_to_pick_up <= settings.DISPATCHER_PROSPECTS_MAX_DISTANCE)
 
     @staticmethod
     def _get_estimations(orders: List[Order], couriers: List[Courier], prospects: np.ndarray) -> np.ndarray:
@@ -1,20 +1,22 @@
 import math
 import time
-from collections import defaultdict
 from typing import List, Iterable, Optional, Dict, Tuple
 
 import numpy as np
 from geohash import encode
-from haversine import haversine
+from haversine import haversine_vector
 
 from actors.courier import Courier
+from objects.fleet_store import FleetView
 from objects.matching_metric import MatchingMetric
 from objects.notification import Notification, NotificationType
 from objects.order import Order
+from objects.order_table import OrderTableView
 from objects.route import Route
 from objects.stop import Stop, StopType
 from objects.vehicle import Vehicle
 from policies.dispatcher.matching.dispatcher_matching_policy import DispatcherMatchingPolicy
+from services.optimization_service.auction.auction_solver import AuctionSolver
 from services.optimization_service.graph.graph_builder import GraphBuilder
 from services.optimization_service.model.constraints.balance_constraint import BalanceConstraint
 from services.optimization_service.model.constraints.courier_assignment_constraint import CourierAssignmentConstraint
@@ -22,161 +24,262 @@ from services.optimization_service.model.constraints.route_assignment_constraint
 from services.optimization_service.model.graph_model_builder import GraphOptimizationModelBuilder
 from services.optimization_service.model.mip_model_builder import MIPOptimizationModelBuilder
 from services.optimization_service.model.optimization_model import SOLUTION_VALUE, OptimizationModel
+from services.optimization_service.model.solver_session import SOLVER_SESSION
 from services.optimization_service.problem.matching_problem import MatchingProblem
 from services.optimization_service.problem.matching_problem_builder import MatchingProblemBuilder
 from services.osrm_service import OSRMService
 from settings import settings
-from utils.datetime_utils import time_to_sec, sec_to_time, time_diff
 
 GRAPH_MODEL_BUILDER = GraphOptimizationModelBuilder(
     sense='max',
-    model_constraints=[BalanceConstraint()],
-    optimizer=settings.OPTIMIZER
+    model_constraints=[BalanceConstraint()]
 )
 MIP_MODEL_BUILDER = MIPOptimizationModelBuilder(
+    sense='max',
+    model_constraints=[CourierAssignmentConstraint(), RouteAssignmentConstraint()]
+)
+MIP_RELAXATION_MODEL_BUILDER = MIPOptimizationModelBuilder(
     sense='max',
     model_constraints=[CourierAssignmentConstraint(), RouteAssignmentConstraint()],
-    optimizer=settings.OPTIMIZER
+    relaxation=True
 )
 
 
 class MyopicMatchingPolicy(DispatcherMatchingPolicy):
     """Class containing the policy for the dispatcher to execute routing and matching of orders and couriers"""
 
-    def __init__(self, assignment_updates: bool, prospects: bool, notification_filtering: bool, mip_matcher: bool):
+    def __init__(
+            self,
+            assignment_updates: bool,
+            prospects: bool,
+            notification_filtering: bool,
+            mip_matcher: bool,
+            incremental: bool = False,
+            auction_matcher: bool = False,
+            sweep_routing: bool = False
+    ):
         """Initialize the Matching Policy with desired options"""
 
         self._assignment_updates = assignment_updates
         self._prospects = prospects
         self._notification_filtering = notification_filtering
         self._mip_matcher = mip_matcher
+        self._incremental = incremental
+        self._auction_matcher = auction_matcher
+        self._sweep_routing = sweep_routing
+        self._auction_solver = AuctionSolver()
+        self._last_auction_time: Optional[int] = None
+
+        self._last_env_time: Optional[int] = None
+        self._group_routes: Dict[str, Tuple[Tuple, List[Route]]] = {}
+        self._previous_group_routes: Dict[str, Tuple[Tuple, List[Route]]] = {}
+        self._single_routes: Dict[int, Route] = {}
+        self._previous_single_routes: Dict[int, Route] = {}
+        self._travelling_properties: Dict[Tuple[int, str], Tuple[Tuple, Tuple[float, float]]] = {}
+        self._previous_travelling_properties: Dict[Tuple[int, str], Tuple[Tuple, Tuple[float, float]]] = {}
 
     def execute(
             self,
             orders: List[Order],
             couriers: List[Courier],
-            env_time: int
+            env_time: int,
+            fleet: Optional[FleetView] = None,
+            order_view: Optional[OrderTableView] = None
     ) -> Tuple[List[Notification], MatchingMetric]:
         """Implementation of the policy where routes are first calculated and later assigned"""
 
+        if fleet is None:
+            fleet = FleetView.from_couriers(couriers)
+
+        if order_view is None:
+            order_view = OrderTableView.from_orders(orders)
+
+        if self._incremental:
+            self._start_incremental_epoch(env_time)
+
         routing_start_time = time.time()
-        routes = self._generate_routes(orders, couriers, env_time)
+        routes = self._generate_routes(orders, couriers, env_time, fleet, order_view)
         routing_time = time.time() - routing_start_time
 
         matching_start_time = time.time()
-        prospects = self._generate_matching_prospects(routes, couriers, env_time)
+        prospects = self._generate_matching_prospects(routes, couriers, env_time, fleet)
 
         if bool(prospects.tolist()):
             costs = self._generate_matching_costs(routes, couriers, prospects, env_time)
             problem = MatchingProblemBuilder.build(routes, couriers, prospects, costs)
 
-            if self._mip_matcher:
-                model = MIP_MODEL_BUILDER.build(problem)
+            relaxation_integral = None
+
+            if self._auction_matcher:
+                solution, iterations = self._solve_auction(problem, env_time)
+                constraints, variables = 0, len(prospects)
 
             else:
-                graph = GraphBuilder.build(problem)
-                model = GRAPH_MODEL_BUILDER.build(graph)
+                if self._mip_matcher:
+                    model, solution, relaxation_integral = self._solve_mip(problem)
+
+                else:
+                    graph = GraphBuilder.build(problem)
+                    model = GRAPH_MODEL_BUILDER.build(graph, session=SOLVER_SESSION)
+                    solution = model.solve()
+
+                constraints, variables, iterations = len(model.constraints), len(model.variable_set), 0
 
-            solution = model.solve()
             notifications = self._process_solution(solution, problem, env_time)
 
+            if self._incremental:
+                self._evict_notified_routes(notifications)
+
         else:
-            model = OptimizationModel(
-                variable_set=np.array([]),
-                objective=np.array([]),
-                constraints=[],
-                sense=0,
-                optimizer='',
-                engine_model=None
-            )
+            constraints, variables, iterations, relaxation_integral = 0, 0, 0, None
             notifications = []
 
         matching_time = time.time() - matching_start_time
 
         matching_metric = MatchingMetric(
-            constraints=len(model.constraints),
+            constraints=constraints,
             couriers=len(couriers),
             matches=len(notifications),
             matching_time=matching_time,
             orders=len(orders),
             routes=len(routes),
             routing_time=routing_time,
-            variables=len(model.variable_set)
+            variables=variables,
+            iterations=iterations,
+            relaxation_integral=relaxation_integral
         )
 
         return notifications, matching_metric
 
-    def _generate_routes(self, orders: Iterable[Order], couriers: Iterable[Courier], env_time: int) -> List[Route]:
+    def _generate_routes(
+            self,
+            orders: Iterable[Order],
+            couriers: Iterable[Courier],
+            env_time: int,
+            fleet: Optional[FleetView] = None,
+            order_view: Optional[OrderTableView] = None
+    ) -> List[Route]:
         """Method to generate routes, also known as bundles"""
 
-        target_size = self._calculate_target_bundle_size(orders, couriers, env_time)
-        groups = self._group_by_geohash(orders)
+        orders, couriers = list(orders), list(couriers)
+
+        if fleet is None:
+            fleet = FleetView.from_couriers(couriers)
+
+        if order_view is None:
+            order_view = OrderTableView.from_orders(orders)
+
+        target_size = self._calculate_target_bundle_size(orders, couriers, env_time, fleet, order_view)
+        groups = self._group_by_geohash(orders, order_view)
         routes, processes, single_ods = [], [], []
 
         for ods in groups.values():
             if len(ods) > 1:
-                routes += self._execute_group_routing(ods, couriers, target_size)
+                routes += self._execute_group_routing(ods, couriers, target_size, fleet)
 
             else:
                 single_ods += ods
 
-        single_routes = [Route.from_order(od) for od in single_ods]
+        single_routes = [
+            self._get_single_route(od) if self._incremental else Route.from_order(od)
+            for od in single_ods
+        ]
 
         return routes + single_routes
 
-    def _execute_group_routing(self, orders: List[Order], couriers: Iterable[Courier], target_size: int):
+    def _execute_group_routing(
+            self,
+            orders: List[Order],
+            couriers: List[Courier],
+            target_size: int,
+            fleet: Optional[FleetView] = None
+    ):
         """Method to orchestrate routing orders for a group"""
 
+        if fleet is None:
+            fleet = FleetView.from_couriers(couriers)
+
         courier_routes, courier_ids, num_idle_couriers = [], [], 0
-        for courier in couriers:
-            if (
-                    courier.condition == 'idle' and
-                    haversine(courier.location.coordinates, orders[0].pick_up_at.coordinates) <=
-                    settings.DISPATCHER_PROSPECTS_MAX_DISTANCE
-            ):
-                num_idle_couriers += 1
-
-            elif self._assignment_updates and (
-                    courier.condition == 'picking_up' and
-                    encode(
-                        courier.location.lat,
-                        courier.location.lng,
-                        settings.DISPATCHER_GEOHASH_PRECISION_GROUPING
-                    ) == orders[0].geohash
-            ):
-                courier_routes.append(courier.active_route)
-                courier_ids.append(courier.courier_id)
-
-        routes = self._generate_group_routes(
-            orders=orders,
-            target_size=target_size,
-            courier_routes=courier_routes,
-            num_idle_couriers=num_idle_couriers,
-            max_orders=settings.DISPATCHER_PROSPECTS_MAX_ORDERS,
-            courier_ids=courier_ids
+
+        if len(fleet):
+            distances_to_pick_up = haversine_vector(
+                fleet.coordinates,
+                np.array([orders[0].pick_up_at.coordinates]),
+                comb=True
+            )[0]
+            num_idle_couriers = int(np.count_nonzero(
+                fleet.in_state('idle') & (distances_to_pick_up <= settings.DISPATCHER_PROSPECTS_MAX_DISTANCE)
+            ))
+
+        if self._assignment_updates:
+            for courier_ix in np.flatnonzero(fleet.in_state('picking_up')):
+                lat, lng = fleet.coordinates[courier_ix]
+
+                if encode(lat, lng, settings.DISPATCHER_GEOHASH_PRECISION_GROUPING) == orders[0].geohash:
+                    courier_routes.append(couriers[courier_ix].active_route)
+                    courier_ids.append(couriers[courier_ix].courier_id)
+
+        cache_key = (
+            frozenset(order.order_id for order in orders),
+            num_idle_couriers,
+            target_size,
+            settings.DISPATCHER_PROSPECTS_MAX_ORDERS
+        )
+        cached_routes = (
+            self._get_cached_group_routes(orders[0].geohash, cache_key)
+            if self._incremental and not bool(courier_routes)
+            else None
         )
 
+        if cached_routes is not None:
+            return cached_routes
+
+        if self._sweep_routing and not bool(courier_routes):
+            routes = self._generate_sweep_group_routes(
+                orders=orders,
+                target_size=target_size,
+                max_orders=settings.DISPATCHER_PROSPECTS_MAX_ORDERS
+            )
+
+        else:
+            routes = self._generate_group_routes(
+                orders=orders,
+                target_size=target_size,
+                courier_routes=courier_routes,
+                num_idle_couriers=num_idle_couriers,
+                max_orders=settings.DISPATCHER_PROSPECTS_MAX_ORDERS,
+                courier_ids=courier_ids
+            )
+
+        if self._incremental and not bool(courier_routes):
+            self._group_routes[orders[0].geohash] = (cache_key, routes)
+
         return routes
 
-    def _generate_matching_prospects(self, routes: List[Route], couriers: List[Courier], env_time: int) -> np.ndarray:
+    def _generate_matching_prospects(
+            self,
+            routes: List[Route],
+            couriers: List[Courier],
+            env_time: int,
+            fleet: Optional[FleetView] = None
+    ) -> np.ndarray:
         """Method to generate the possible matching prospects"""
 
+        if fleet is None:
+            fleet = FleetView.from_couriers(couriers)
+
         if self._prospects:
-            return np.array(
-                [
-                    (courier_ix, route_ix)
-                    for route_ix, route in enumerate(routes)
-                    for courier_ix, courier in enumerate(couriers)
-                    if self._is_prospect(route, courier, env_time)
-                ],
-                dtype=np.int64
-            )
+            if not routes or not couriers:
+                return np.array([], dtype=np.int64)
+
+            routes_ix, couriers_ix = np.nonzero(self._is_prospect(routes, couriers, env_time, fleet))
+
+            return np.array(list(zip(couriers_ix, routes_ix)), dtype=np.int64)
 
         else:
-            couriers = [courier for courier in couriers if courier.condition == 'idle']
-            num_couriers = len(couriers)
+            couriers_indices = np.flatnonzero(fleet.in_state('idle'))
+            num_couriers = len(couriers_indices)
             num_routes = len(routes)
-            couriers_indices = np.arange(num_couriers)
             routes_indices = np.arange(num_routes)
 
             return np.array(
@@ -223,13 +326,12 @@ class MyopicMatchingPolicy(DispatcherMatchingPolicy):
 
                     else:
                         for position in range(1, route.num_stops):
-                            origin = route.stops[position - 1]
-                            destination = route.stops[position]
+                            origin_orders, destination_orders = route.stop_orders[position - 1:position + 1]
 
-                            if bool(origin.orders) and not bool(destination.orders):
+                            if bool(origin_orders) and not bool(destination_orders):
                                 cost = route.calculate_time_update(
                                     destination=order.drop_off_at,
-                                    origin=origin.location,
+                                    origin=route.stop_location(position - 1),
                                     service_time=order.drop_off_service_time
                                 )[Vehicle.MOTORCYCLE]
                                 route_ix_position_time.append((route_ix, position, cost))
@@ -258,62 +360,193 @@ class MyopicMatchingPolicy(DispatcherMatchingPolicy):
         return group_routes + single_routes
 
     @staticmethod
-    def _calculate_target_bundle_size(orders: Iterable[Order], couriers: Iterable[Courier], env_time: int) -> int:
+    def _generate_sweep_group_routes(
+            orders: List[Order],
+            target_size: int,
+            max_orders: Optional[int] = settings.DISPATCHER_PROSPECTS_MAX_ORDERS
+    ) -> List[Route]:
+        """Method to generate routes for a specific group by sweeping the drop offs by ready window and bearing"""
+
+        route_size = min(target_size, max_orders)
+        number_of_routes = math.ceil(len(orders) / route_size)
+        pick_up = np.array(orders[0].pick_up_at.coordinates)
+        drop_offs = np.array([order.drop_off_at.coordinates for order in orders])
+
+        bearings = np.arctan2(
+            (drop_offs[:, 1] - pick_up[1]) * np.cos(np.radians(pick_up[0])),
+            drop_offs[:, 0] - pick_up[0]
+        ) % (2 * np.pi)
+        sorted_bearings = np.sort(bearings)
+        gaps = np.diff(np.append(sorted_bearings, sorted_bearings[0] + 2 * np.pi))
+        sweep_start = sorted_bearings[(np.argmax(gaps) + 1) % len(orders)]
+        sweep_bearings = (bearings - sweep_start) % (2 * np.pi)
+        ready_windows = np.array([order.ready_time for order in orders]) // settings.DISPATCHER_SWEEP_READY_WINDOW
+
+        sweep = np.lexsort((sweep_bearings, ready_windows))
+        routes = []
+
+        for bundle in np.array_split(sweep, number_of_routes):
+            bundle_orders = {orders[ix].order_id: orders[ix] for ix in bundle}
+            stops = [
+                Stop(
+                    location=orders[0].pick_up_at,
+                    orders=bundle_orders,
+                    position=0,
+                    type=StopType.PICK_UP,
+                    visited=False
+                )
+            ]
+            pending, current = list(bundle), pick_up
+
+            while pending:
+                distances = haversine_vector(np.array([current]), drop_offs[pending], comb=True)
+                ix = pending.pop(int(np.argmin(distances)))
+                stops.append(
+                    Stop(
+                        location=orders[ix].drop_off_at,
+                        orders={orders[ix].order_id: orders[ix]},
+                        position=len(stops),
+                        type=StopType.DROP_OFF,
+                        visited=False
+                    )
+                )
+                current = drop_offs[ix]
+
+            routes.append(Route(orders=bundle_orders, stops=stops))
+
+        return routes
+
+    @staticmethod
+    def _calculate_target_bundle_size(
+            orders: Iterable[Order],
+            couriers: Iterable[Courier],
+            env_time: int,
+            fleet: Optional[FleetView] = None,
+            order_view: Optional[OrderTableView] = None
+    ) -> int:
         """Method to calculate the target bundle size based on system intensity"""
 
-        num_orders = len([
-            order
-            for order in orders
-            if time_to_sec(order.ready_time) <= env_time + settings.DISPATCHER_MYOPIC_READY_TIME_SLACK
-        ])
-        num_couriers = len([courier for courier in couriers if courier.condition == 'idle'])
+        if fleet is None:
+            fleet = FleetView.from_couriers(couriers)
+
+        if order_view is None:
+            order_view = OrderTableView.from_orders(orders)
+
+        num_orders = int(np.count_nonzero(
+            order_view.ready_times <= env_time + settings.DISPATCHER_MYOPIC_READY_TIME_SLACK
+        ))
+        num_couriers = int(np.count_nonzero(fleet.in_state('idle')))
 
         return max(math.ceil(num_orders / num_couriers), 1) if num_couriers > 0 else 1
 
     @staticmethod
-    def _group_by_geohash(orders: Iterable[Order]) -> Dict[str, List[Order]]:
-        """Method to group orders by geohash, an alternate way to group into stores"""
+    def _group_by_geohash(
+            orders: Iterable[Order],
+            order_view: Optional[OrderTableView] = None
+    ) -> Dict[str, List[Order]]:
+        """Method to group orders by geohash, an alternate way to group into stores, keeping the orders' order"""
 
-        groups = defaultdict(list)
-        for order in orders:
-            groups[order.geohash] += [order]
+        orders = list(orders)
 
-        return groups
+        if order_view is None:
+            order_view = OrderTableView.from_orders(orders)
 
-    @staticmethod
-    def _is_prospect(route: Route, courier: Courier, env_time: int) -> bool:
-        """Method to establish if a courier and route are matching prospects"""
+        if not orders:
+            return {}
 
-        _, time_to_first_stop = OSRMService.estimate_travelling_properties(
-            origin=courier.location,
-            destination=route.stops[0].location,
-            vehicle=courier.vehicle
-        )
-        stops_time_offset = sum(
-            abs(time_diff(
-                time_1=sec_to_time(int(env_time + time_to_first_stop + stop.arrive_at[courier.vehicle])),
-                time_2=stop.calculate_latest_expected_time()
-            ))
-            for stop in route.stops
+        geohashes, first_indices, group_indices = np.unique(
+            order_view.geohashes,
+            return_index=True,
+            return_inverse=True
         )
-        distance_condition = (
-                haversine(courier.location.coordinates, route.stops[0].location.coordinates) <=
-                settings.DISPATCHER_PROSPECTS_MAX_DISTANCE
+        group_orders = np.split(
+            np.argsort(group_indices, kind='stable'),
+            np.cumsum(np.bincount(group_indices))[:-1]
         )
-        stop_offset_condition = (
-            stops_time_offset <= settings.DISPATCHER_PROSPECTS_MAX_STOP_OFFSET * route.num_stops
-            if route.time_since_ready(env_time) <= settings.DISPATCHER_PROSPECTS_MAX_READY_TIME
-            else True
+
+        return {
+            str(geohashes[group_ix]): [orders[order_ix] for order_ix in group_orders[group_ix]]
+            for group_ix in np.argsort(first_indices)
+        }
+
+    def _is_prospect(
+            self,
+            routes: List[Route],
+            couriers: List[Courier],
+            env_time: int,
+            fleet: Optional[FleetView] = None
+    ) -> np.ndarray:
+        """Method to establish which couriers and routes are matching prospects, as a routes x couriers mask"""
+
+        if fleet is None:
+            fleet = FleetView.from_couriers(couriers)
+
+        initial_prospects = np.array(
+            [route.initial_prospect if route.initial_prospect is not None else -1 for route in routes]
         )
+        distance_condition = haversine_vector(
+            fleet.coordinates,
+            np.array([route.stop_location(0).coordinates for route in routes]),
+            comb=True
+        ) <= settings.DISPATCHER_PROSPECTS_MAX_DISTANCE
         courier_state_condition = (
-                courier.condition == 'idle' or
-                (courier.condition == 'picking_up' and route.initial_prospect == courier.courier_id)
+                fleet.in_state('idle')[np.newaxis, :] |
+                (
+                        fleet.in_state('picking_up')[np.newaxis, :] &
+                        (initial_prospects[:, np.newaxis] == fleet.courier_ids)
+                )
         )
+        is_prospect = distance_condition & courier_state_condition
+        routes_ix, couriers_ix = np.nonzero(is_prospect)
+
+        if not len(routes_ix):
+            return is_prospect
+
+        arrivals, latest_expected_times, stops_mask, min_ready_times = self._build_stops_arrays(routes)
+        times_to_first_stop = np.array(
+            [
+                self._estimate_travelling_properties(couriers[courier_ix], routes[route_ix])[1]
+                for route_ix, courier_ix in zip(routes_ix, couriers_ix)
+            ]
+        )
+        vehicles = fleet.vehicles[couriers_ix]
+        arrival_times = np.floor(env_time + times_to_first_stop[:, np.newaxis] + arrivals[routes_ix, :, vehicles])
+        stops_time_offset = np.where(
+            stops_mask[routes_ix],
+            np.abs(arrival_times - latest_expected_times[routes_ix]),
+            0
+        ).sum(axis=1)
+        stop_offset_condition = (
+                (np.maximum(env_time - min_ready_times[routes_ix], 0) > settings.DISPATCHER_PROSPECTS_MAX_READY_TIME) |
+                (stops_time_offset <= settings.DISPATCHER_PROSPECTS_MAX_STOP_OFFSET * stops_mask[routes_ix].sum(axis=1))
+        )
+        is_prospect[routes_ix, couriers_ix] = stop_offset_condition
 
-        return distance_condition and stop_offset_condition and courier_state_condition
+        return is_prospect
 
     @staticmethod
+    def _build_stops_arrays(routes: List[Route]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Method to build the arrival offsets per vehicle and latest expected times [sec] of the routes' stops"""
+
+        max_stops = max(route.num_stops for route in routes)
+        arrivals = np.zeros((len(routes), max_stops, len(Vehicle)))
+        latest_expected_times = np.zeros((len(routes), max_stops))
+        stops_mask = np.zeros((len(routes), max_stops), dtype=bool)
+        min_ready_times = np.zeros(len(routes))
+
+        for route_ix, route in enumerate(routes):
+            arrivals[route_ix, :route.num_stops] = route.stop_arrivals
+            stops_mask[route_ix, :route.num_stops] = True
+
+            for stop_ix, (stop_orders, stop_type) in enumerate(zip(route.stop_orders, route.stop_types)):
+                latest_expected_times[route_ix, stop_ix] = Stop.latest_expected_time(stop_orders, stop_type)
+
+            min_ready_times[route_ix] = min(order.ready_time for order in route.orders.values())
+
+        return arrivals, latest_expected_times, stops_mask, min_ready_times
+
     def _generate_matching_costs(
+            self,
             routes: List[Route],
             couriers: List[Courier],
             prospects: np.ndarray,
@@ -325,18 +558,12 @@ class MyopicMatchingPolicy(DispatcherMatchingPolicy):
 
         for ix, (courier_ix, route_ix) in enumerate(prospects):
             route, courier = routes[route_ix], couriers[courier_ix]
-            distance_to_first_stop, time_to_first_stop = OSRMService.estimate_travelling_properties(
-                origin=courier.location,
-                destination=route.stops[0].location,
-                vehicle=courier.vehicle
-            )
+            distance_to_first_stop, time_to_first_stop = self._estimate_travelling_properties(courier, route)
             costs[ix] = (
                     len(route.orders) / (time_to_first_stop + route.time[courier.vehicle]) -
-                    time_diff(
-                        time_1=sec_to_time(
-                            int(env_time + time_to_first_stop + route.stops[0].arrive_at[courier.vehicle])
-                        ),
-                        time_2=max(order.ready_time for order in route.stops[0].orders.values())
+                    (
+                            int(env_time + time_to_first_stop + route.stop_arrive_at(0)[courier.vehicle]) -
+                            max(order.ready_time for order in route.stop_orders[0].values())
                     ) * settings.DISPATCHER_DELAY_PENALTY
             )
 
@@ -378,11 +605,7 @@ class MyopicMatchingPolicy(DispatcherMatchingPolicy):
                     instruction=instruction,
                     type=NotificationType.PICK_UP_DROP_OFF
                 )
-                _, time_to_first_stop = OSRMService.estimate_travelling_properties(
-                    origin=courier.location,
-                    destination=route.stops[0].location,
-                    vehicle=courier.vehicle
-                )
+                _, time_to_first_stop = self._estimate_travelling_properties(courier, route)
 
                 if isinstance(instruction, list) and courier.condition == 'picking_up':
                     notifications.append(notification)
@@ -393,7 +616,7 @@ class MyopicMatchingPolicy(DispatcherMatchingPolicy):
 
                     elif (
                             time_to_first_stop <= settings.DISPATCHER_PROSPECTS_MAX_STOP_OFFSET and
-                            time_to_sec(min(order.ready_time for order in route.orders.values())) <=
+                            min(order.ready_time for order in route.orders.values()) <=
                             env_time + settings.DISPATCHER_PROSPECTS_MAX_STOP_OFFSET
                     ):
                         notifications.append(notification)
@@ -403,10 +626,128 @@ class MyopicMatchingPolicy(DispatcherMatchingPolicy):
                             Notification(
                                 courier=courier,
                                 instruction=Route(
-                                    stops=[Stop(location=route.stops[0].location, type=StopType.PREPOSITION)]
+                                    stops=[Stop(location=route.stop_location(0), type=StopType.PREPOSITION)]
                                 ),
                                 type=NotificationType.PREPOSITIONING
                             )
                         )
 
         return notifications
+
+    @staticmethod
+    def _solve_mip(problem: MatchingProblem) -> Tuple[OptimizationModel, np.ndarray, Optional[bool]]:
+        """Method to solve the MIP, trying its linear relaxation first if desired since the model is unimodular"""
+
+        if not settings.DISPATCHER_MIP_LP_RELAXATION:
+            model = MIP_MODEL_BUILDER.build(problem, session=SOLVER_SESSION)
+
+            return model, model.solve(), None
+
+        model = MIP_RELAXATION_MODEL_BUILDER.build(problem, session=SOLVER_SESSION)
+        solution = model.solve()
+        relaxation_integral = model.is_integral(solution)
+
+        if not relaxation_integral:
+            model = MIP_MODEL_BUILDER.build(problem, session=SOLVER_SESSION)
+            solution = model.solve()
+
+        return model, solution, relaxation_integral
+
+    def _solve_auction(self, problem: MatchingProblem, env_time: int) -> Tuple[np.ndarray, int]:
+        """Method to solve the matching problem with the auction, warm-started from the previous epoch's prices"""
+
+        if self._last_auction_time is not None and env_time <= self._last_auction_time:
+            self._auction_solver.reset()
+
+        self._last_auction_time = env_time
+
+        return self._auction_solver.solve(problem)
+
+    def _estimate_travelling_properties(self, courier: Courier, route: Route) -> Tuple[float, float]:
+        """Method to estimate the distance and time from a courier to the first stop of a route"""
+
+        if not self._incremental:
+            return OSRMService.estimate_travelling_properties(
+                origin=courier.location,
+                destination=route.stop_location(0),
+                vehicle=courier.vehicle
+            )
+
+        key = (courier.courier_id, route.route_id)
+        signature = (courier.location.coordinates, courier.vehicle, route.stop_location(0).coordinates)
+        cached = self._travelling_properties.get(key, self._previous_travelling_properties.get(key))
+
+        if cached is not None and cached[0] == signature:
+            properties = cached[1]
+
+        else:
+            properties = OSRMService.estimate_travelling_properties(
+                origin=courier.location,
+                destination=route.stop_location(0),
+                vehicle=courier.vehicle
+            )
+
+        self._travelling_properties[key] = (signature, properties)
+
+        return properties
+
+    def _start_incremental_epoch(self, env_time: int):
+        """
+        Method to roll the incremental caches into a new epoch. Only the routes and travelling properties are reused,
+        since the prospects, costs and notifications depend on the time of the epoch too
+        """
+
+        if self._last_env_time is not None and env_time <= self._last_env_time:
+            self._group_routes, self._single_routes, self._travelling_properties = {}, {}, {}
+
+        self._last_env_time = env_time
+        self._previous_group_routes, self._group_routes = self._group_routes, {}
+        self._previous_single_routes, self._single_routes = self._single_routes, {}
+        self._previous_travelling_properties, self._travelling_properties = self._travelling_properties, {}
+
+    def _get_cached_group_routes(self, geohash: str, cache_key: Tuple) -> Optional[List[Route]]:
+        """Method to obtain the routes of a group from the previous epoch, if the group didn't change"""
+
+        cached = self._previous_group_routes.get(geohash)
+
+        if cached is not None and cached[0] == cache_key:
+            self._group_routes[geohash] = cached
+
+            return cached[1]
+
+        return None
+
+    def _get_single_route(self, order: Order) -> Route:
+        """Method to obtain the route of a single order, reusing the one from the previous epoch if possible"""
+
+        route = self._previous_single_routes.get(order.order_id)
+
+        if route is None or route.orders.get(order.order_id) is not order:
+            route = Route.from_order(order)
+
+        self._single_routes[order.order_id] = route
+
+        return route
+
+    def _evict_notified_routes(self, notifications: List[Notification]):
+        """Method to drop cached routes that were sent to couriers, since they may be modified from now on"""
+
+        notified_route_ids = {
+            notification.instruction.route_id
+            for notification in notifications
+            if isinstance(notification.instruction, Route)
+        }
+
+        if not bool(notified_route_ids):
+            return
+
+        self._group_routes = {
+            geohash: (cache_key, routes)
+            for geohash, (cache_key, routes) in self._group_routes.items()
+            if not any(route.route_id in notified_route_ids for route in routes)
+        }
+        self._single_routes = {
+            order_id: route
+            for order_id, route in self._single_routes.items()
+            if route.route_id not in notified_route_ids
+        }
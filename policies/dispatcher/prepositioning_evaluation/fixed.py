@@ -10,3 +10,8 @@ class FixedPrepositioningEvaluationPolicy(DispatcherPrepositioningEvaluationPoli
         """Execution of the Fixed Prepositioning Timing Policy"""
 
         return env_time % settings.DISPATCHER_PREPOSITIONING_TIME == 0
+
+    def next_execution_time(self, env_time: int) -> int:
+        """Method to establish the next time [sec] at which prepositioning is evaluated"""
+
+        return (env_time // settings.DISPATCHER_PREPOSITIONING_TIME + 1) * settings.DISPATCHER_PREPOSITIONING_TIME
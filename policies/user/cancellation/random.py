@@ -1,4 +1,4 @@
-import random
+from random import Random
 
 from settings import settings
 from policies.user.cancellation.user_cancellation_policy import UserCancellationPolicy
@@ -7,10 +7,10 @@ from policies.user.cancellation.user_cancellation_policy import UserCancellation
 class RandomCancellationPolicy(UserCancellationPolicy):
     """Class containing the policy that decides how a user evaluates canceling an order using a random probability"""
 
-    def execute(self, courier_id: int) -> bool:
+    def execute(self, courier_id: int, stream: Random) -> bool:
         """Execution of the Cancellation Policy"""
 
         if courier_id is None:
-            return random.random() <= settings.USER_CANCELLATION_PROBABILITY
+            return stream.random() <= settings.USER_CANCELLATION_PROBABILITY
 
         return False
@@ -1,10 +1,12 @@
+from random import Random
+
 from policies.policy import Policy
 
 
 class UserCancellationPolicy(Policy):
     """Class that establishes how the user decides to cancel an order"""
 
-    def execute(self, courier_id: int) -> bool:
+    def execute(self, courier_id: int, stream: Random) -> bool:
         """Implementation of the policy"""
 
         pass
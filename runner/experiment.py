@@ -0,0 +1,136 @@
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Dict, Any, List, Optional
+
+from ddbb.load_instances import INSTANCES_SUB_DIR_PATH, ORDERS_CSV_FILE
+from runner.simulation_job import SimulationJob, SimulationResult, BASE_SETTINGS, parse_setting
+from utils.datetime_utils import time_to_sec, time_to_sim_sec
+from utils.random_utils import replication_seeds
+
+EXPERIMENT_STATE_FILE = '{run_id}.state'
+
+# Rough cost of simulating with each matching policy, relative to the greedy one, since the policies solving a MIP every
+# epoch take far longer than the ones matching greedily or on a graph. Unknown policies cost as much as the MIP ones
+MATCHING_POLICY_COSTS = {
+    'greedy': 1,
+    'mdrp_graph': 4,
+    'mdrp_auction': 4,
+    'mdrp_graph_prospects': 6,
+    'modified_mdrp': 8,
+    'modified_mdrp_incremental': 6,
+    'modified_mdrp_auction': 6,
+    'modified_mdrp_sweep': 6,
+    'mdrp_incremental': 12,
+    'mdrp': 20
+}
+
+
+def estimated_duration(job: SimulationJob) -> float:
+    """
+    Function to estimate how long a job takes to simulate, relative to other jobs: the size of the instance's orders
+    file, proportional to its number of orders, times the length of the window in which orders are placed, times the
+    cost of its matching policy
+    """
+
+    configuration = {**BASE_SETTINGS, **job.configuration}
+    orders_file_path = f'{INSTANCES_SUB_DIR_PATH.format(instance_id=job.instance)}/{ORDERS_CSV_FILE}'
+    orders_size = os.path.getsize(orders_file_path) if os.path.exists(orders_file_path) else 0
+    placement_window = (
+            time_to_sim_sec(configuration['CREATE_USERS_UNTIL'], start_time=configuration['CREATE_USERS_FROM']) -
+            time_to_sec(configuration['CREATE_USERS_FROM'])
+    )
+
+    policy_cost = MATCHING_POLICY_COSTS.get(
+        configuration['DISPATCHER_MATCHING_POLICY'],
+        max(MATCHING_POLICY_COSTS.values())
+    )
+
+    return orders_size * placement_window * policy_cost
+
+
+@dataclass
+class Experiment:
+    """Class describing a sweep of settings over instances and seeds, whose metrics are tagged with a run id"""
+
+    run_id: str
+    instances: List[int]
+    seeds: List[Optional[int]] = field(default_factory=lambda: [None])
+    settings: Dict[str, Any] = field(default_factory=lambda: dict())
+    grid: Dict[str, List[Any]] = field(default_factory=lambda: dict())
+
+    @classmethod
+    def from_file(cls, file_path: str) -> 'Experiment':
+        """Method to read an experiment from a .json sweep specification, named after the file unless it has a run id"""
+
+        with open(file_path) as file:
+            specification = json.load(file)
+
+        return cls(
+            run_id=specification.get('run_id', os.path.splitext(os.path.basename(file_path))[0]),
+            instances=specification['instances'],
+            seeds=(
+                replication_seeds(specification['replications'])
+                if 'replications' in specification
+                else specification.get('seeds', [None])
+            ),
+            settings={key: parse_setting(key, value) for key, value in specification.get('settings', {}).items()},
+            grid={
+                key: [parse_setting(key, value) for value in values]
+                for key, values in specification.get('grid', {}).items()
+            }
+        )
+
+    def jobs(self) -> List[SimulationJob]:
+        """Method to expand the sweep into one job per combination, sorted so that the longest jobs run first"""
+
+        jobs = [
+            SimulationJob(
+                instance=instance,
+                seed=seed,
+                settings={**self.settings, **dict(zip(self.grid.keys(), values))},
+                run_id=self.run_id
+            )
+            for instance in self.instances
+            for values in product(*self.grid.values())
+            for seed in self.seeds
+        ]
+
+        return sorted(jobs, key=estimated_duration, reverse=True)
+
+
+class ExperimentState:
+    """Class that keeps track of the finished jobs of an experiment in a state file, to resume it after a failure"""
+
+    def __init__(self, file_path: str):
+        """Instantiates the state with the jobs already finished according to the state file, if it exists"""
+
+        self._file_path = file_path
+        self._finished_jobs = set()
+
+        if os.path.exists(file_path):
+            with open(file_path) as file:
+                self._finished_jobs = {line.rstrip('\n') for line in file if line.strip()}
+
+    def pending(self, jobs: List[SimulationJob]) -> List[SimulationJob]:
+        """Method to filter the jobs that have not finished yet, keeping their order"""
+
+        pending_jobs = [job for job in jobs if job.key not in self._finished_jobs]
+
+        if len(pending_jobs) < len(jobs):
+            logging.info(f'Resuming experiment: {len(jobs) - len(pending_jobs)} of {len(jobs)} jobs already finished.')
+
+        return pending_jobs
+
+    def __call__(self, result: SimulationResult):
+        """Method to record a job that finished successfully, after its metrics were saved"""
+
+        if result.error is not None:
+            return
+
+        with open(self._file_path, 'a') as file:
+            file.write(f'{result.job.key}\n')
+
+        self._finished_jobs.add(result.job.key)
@@ -0,0 +1,264 @@
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import create_engine, event, select, func, case, or_, and_, text, DateTime
+from sqlalchemy.engine import Engine, Connection
+
+from ddbb.config import get_db_url
+from ddbb.tables.simulation_jobs import SimulationJobsTable
+from runner.simulation_job import SimulationJob, SimulationResult
+
+PENDING, RUNNING, FINISHED, FAILED = 'pending', 'running', 'finished', 'failed'
+JOB_STATUSES = [PENDING, RUNNING, FINISHED, FAILED]
+
+HEARTBEAT_INTERVAL = 30
+HEARTBEAT_TIMEOUT = 5 * HEARTBEAT_INTERVAL
+MAX_ATTEMPTS = 3
+
+_TABLE = SimulationJobsTable.__table__
+
+
+def worker_name() -> str:
+    """Function to obtain the name a worker claims jobs with, unique among the nodes sharing the queue"""
+
+    return f'{socket.gethostname()}-{os.getpid()}'
+
+
+def _begin_immediate(engine: Engine):
+    """
+    Function to make every transaction of a SQLite engine take the write lock as it begins, so that only one worker at
+    a time selects and claims a job, since SQLite ignores the FOR UPDATE SKIP LOCKED clause
+    """
+
+    @event.listens_for(engine, 'connect')
+    def do_connect(dbapi_connection, connection_record):
+        """Disables the driver's own transaction handling"""
+
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def do_begin(connection):
+        """Begins the transaction taking the write lock"""
+
+        connection.execute(text('BEGIN IMMEDIATE'))
+
+
+def _now(connection: Connection) -> datetime:
+    """
+    Function to obtain the current UTC time from the DDBB clock, to stamp and compare the heartbeats of every node with
+    the same clock, regardless of how far apart the clocks of the nodes are
+    """
+
+    if connection.dialect.name == 'sqlite':
+        now = func.strftime('%Y-%m-%d %H:%M:%f000', 'now', type_=DateTime)
+
+    else:
+        now = func.timezone('utc', func.now(), type_=DateTime)
+
+    return connection.execute(select([now])).scalar()
+
+
+class JobQueue:
+    """
+    Class that queues simulation jobs in a DDBB table shared by workers on several nodes. Workers claim jobs with
+    SELECT ... FOR UPDATE SKIP LOCKED on Postgres, or with an immediate transaction on a SQLite file, and send
+    heartbeats while running them, stamped with the DDBB clock. A job whose worker stops sending heartbeats is claimed
+    again and failed jobs are retried until they run out of attempts.
+    """
+
+    def __init__(
+            self,
+            url: Optional[str] = None,
+            heartbeat_interval: float = HEARTBEAT_INTERVAL,
+            heartbeat_timeout: float = HEARTBEAT_TIMEOUT,
+            max_attempts: int = MAX_ATTEMPTS
+    ):
+        """Instantiates the queue on the DDBB, or on another URL such as a SQLite file, creating its table if needed"""
+
+        self.heartbeat_interval = heartbeat_interval
+        self._heartbeat_timeout = heartbeat_timeout
+        self._max_attempts = max_attempts
+
+        url = url or get_db_url()
+
+        if url.startswith('sqlite'):
+            self._engine = create_engine(url, connect_args={'timeout': 60})
+            _begin_immediate(self._engine)
+            _TABLE.create(self._engine, checkfirst=True)
+
+        else:
+            self._engine = create_engine(url, pool_size=5, max_overflow=0, pool_pre_ping=True)
+
+    def enqueue(self, jobs: List[SimulationJob]) -> int:
+        """Method to add the jobs to the queue in order, skipping the ones already queued for their run"""
+
+        run_ids = {job.run_id for job in jobs}
+        run_conditions = [_TABLE.c.run_id.in_([run_id for run_id in run_ids if run_id is not None])]
+
+        if None in run_ids:
+            run_conditions.append(_TABLE.c.run_id.is_(None))
+
+        with self._engine.begin() as connection:
+            now = _now(connection)
+            queued_jobs = {
+                (row.run_id, row.job_key)
+                for row in connection.execute(
+                    select([_TABLE.c.run_id, _TABLE.c.job_key]).where(or_(*run_conditions))
+                )
+            }
+            new_jobs = {}
+
+            for job in jobs:
+                new_jobs.setdefault((job.run_id, job.key), job)
+
+            rows = [
+                {
+                    'run_id': run_id,
+                    'job_key': job_key,
+                    'instance_id': job.instance,
+                    'status': PENDING,
+                    'attempts': 0,
+                    'created_at': now,
+                    'updated_at': now
+                }
+                for (run_id, job_key), job in new_jobs.items()
+                if (run_id, job_key) not in queued_jobs
+            ]
+
+            if bool(rows):
+                connection.execute(_TABLE.insert(), rows)
+
+        logging.info(f'Queued {len(rows)} jobs, {len(jobs) - len(rows)} were already queued.')
+
+        return len(rows)
+
+    def claim(self, worker: str) -> Optional[Tuple[int, SimulationJob]]:
+        """
+        Method to claim the first pending job, or a running one whose worker stopped sending heartbeats, returning its
+        id and the job. A job claimed again resumes if its journal is in the checkpoints directory of this node, as the
+        journals are not shared, and starts over otherwise.
+        """
+
+        with self._engine.begin() as connection:
+            now = _now(connection)
+            stale_heartbeat = now - timedelta(seconds=self._heartbeat_timeout)
+            connection.execute(
+                _TABLE.update()
+                .where(
+                    and_(
+                        _TABLE.c.status == RUNNING,
+                        _TABLE.c.heartbeat_at < stale_heartbeat,
+                        _TABLE.c.attempts >= self._max_attempts
+                    )
+                )
+                .values(status=FAILED, error='The worker stopped sending heartbeats', updated_at=now)
+            )
+            row = connection.execute(
+                select([_TABLE.c.id, _TABLE.c.run_id, _TABLE.c.job_key, _TABLE.c.attempts])
+                .where(
+                    or_(
+                        _TABLE.c.status == PENDING,
+                        and_(_TABLE.c.status == RUNNING, _TABLE.c.heartbeat_at < stale_heartbeat)
+                    )
+                )
+                .order_by(_TABLE.c.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            ).first()
+
+            if row is None:
+                return None
+
+            connection.execute(
+                _TABLE.update()
+                .where(_TABLE.c.id == row.id)
+                .values(status=RUNNING, worker=worker, attempts=row.attempts + 1, heartbeat_at=now, updated_at=now)
+            )
+
+        job = SimulationJob.from_key(row.job_key, run_id=row.run_id)
+        job.resume = row.attempts > 0
+
+        return row.id, job
+
+    def heartbeat(self, job_ids: List[int], worker: str):
+        """Method to signal that the worker is still running the jobs it claimed"""
+
+        if not bool(job_ids):
+            return
+
+        with self._engine.begin() as connection:
+            now = _now(connection)
+            connection.execute(
+                _TABLE.update()
+                .where(and_(_TABLE.c.id.in_(job_ids), _TABLE.c.worker == worker, _TABLE.c.status == RUNNING))
+                .values(heartbeat_at=now, updated_at=now)
+            )
+
+    def complete(self, job_id: int, worker: str, result: SimulationResult) -> Optional[str]:
+        """
+        Method to report the result of a claimed job, which finishes it or, if it failed, queues it again until it runs
+        out of attempts. Returns the job's new status, or None if the job was claimed by another worker meanwhile.
+        """
+
+        status = (
+            case([(_TABLE.c.attempts < self._max_attempts, PENDING)], else_=FAILED)
+            if result.error is not None
+            else FINISHED
+        )
+
+        with self._engine.begin() as connection:
+            updated = connection.execute(
+                _TABLE.update()
+                .where(and_(_TABLE.c.id == job_id, _TABLE.c.worker == worker, _TABLE.c.status == RUNNING))
+                .values(status=status, error=result.error, heartbeat_at=None, updated_at=_now(connection))
+            )
+
+            if updated.rowcount == 0:
+                return None
+
+            return connection.execute(select([_TABLE.c.status]).where(_TABLE.c.id == job_id)).scalar()
+
+    def retry_failed(self, run_id: Optional[str] = None) -> int:
+        """Method to queue the failed jobs again with all of their attempts, only the ones of a run if one is given"""
+
+        conditions = [_TABLE.c.status == FAILED] + ([_TABLE.c.run_id == run_id] if run_id is not None else [])
+
+        with self._engine.begin() as connection:
+            retried = connection.execute(
+                _TABLE.update()
+                .where(and_(*conditions))
+                .values(status=PENDING, attempts=0, worker=None, error=None, updated_at=_now(connection))
+            ).rowcount
+
+        logging.info(f'Queued {retried} failed jobs again.')
+
+        return retried
+
+    def progress(self, run_id: Optional[str] = None) -> pd.DataFrame:
+        """Method to count the jobs of each run in every status, only the ones of a run if one is given"""
+
+        query = select([_TABLE.c.run_id, _TABLE.c.status, func.count().label('jobs')])
+
+        if run_id is not None:
+            query = query.where(_TABLE.c.run_id == run_id)
+
+        with self._engine.connect() as connection:
+            jobs = pd.read_sql(sql=query.group_by(_TABLE.c.run_id, _TABLE.c.status), con=connection)
+
+        return (
+            jobs
+            .fillna({'run_id': ''})
+            .pivot(index='run_id', columns='status', values='jobs')
+            .reindex(columns=JOB_STATUSES)
+            .fillna(0)
+            .astype(int)
+        )
+
+    def close(self):
+        """Method to dispose the DDBB connection"""
+
+        self._engine.dispose()
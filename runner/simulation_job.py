@@ -0,0 +1,155 @@
+import json
+import logging
+import random
+import traceback
+from dataclasses import dataclass, field
+from datetime import time
+from hashlib import sha1
+from typing import Dict, Any, Optional
+
+import pandas as pd
+from simpy import Environment
+
+from actors.world import World
+from ddbb.load_instances import PROJECT_PATH
+from services.checkpoint_service import CHECKPOINT_SERVICE
+from services.metrics_service import MetricsService
+from settings import settings
+from utils.datetime_utils import time_to_sec, time_to_sim_sec
+
+BASE_SETTINGS = dict(settings.attributes)
+CHECKPOINTS_DIR_PATH = f'{PROJECT_PATH}/checkpoints'
+
+
+def parse_setting(key: str, value: Any) -> Any:
+    """Function to parse a setting read from a .json file or key, such as a time written as 'HH:MM:SS'"""
+
+    if key not in BASE_SETTINGS:
+        raise KeyError(f'Unknown setting {key}')
+
+    return time.fromisoformat(value) if isinstance(BASE_SETTINGS[key], time) else value
+
+
+@dataclass
+class SimulationJob:
+    """Class describing the simulation of an instance with a configuration of the settings"""
+
+    instance: int
+    seed: Optional[int] = None
+    settings: Dict[str, Any] = field(default_factory=lambda: dict())
+    run_id: Optional[str] = None
+    resume: bool = False
+
+    @classmethod
+    def from_key(cls, key: str, run_id: Optional[str] = None) -> 'SimulationJob':
+        """Method to rebuild the job identified by a key within its run, such as a job read from the job queue"""
+
+        configuration = json.loads(key)
+        instance = configuration.pop('INSTANCES')[0]
+        seed = configuration.pop('SEED', None)
+
+        return cls(
+            instance=instance,
+            seed=seed,
+            settings={setting: parse_setting(setting, value) for setting, value in configuration.items()},
+            run_id=run_id
+        )
+
+    @property
+    def configuration(self) -> Dict[str, Any]:
+        """Property with the settings the job overrides, including its instance and seed if it has one"""
+
+        seed = {'SEED': self.seed} if self.seed is not None else {}
+
+        return {**self.settings, 'INSTANCES': [self.instance], **seed}
+
+    @property
+    def key(self) -> str:
+        """Property with a str that identifies the job within its run, regardless of the order of its settings"""
+
+        return json.dumps(self.configuration, sort_keys=True, default=str)
+
+    @property
+    def journal_file_path(self) -> str:
+        """Property with the path of the journal the job checkpoints to, named after its run and settings"""
+
+        file_name = f'{self.run_id or "simulation"}-{sha1(self.key.encode()).hexdigest()[:16]}.journal'
+
+        return f'{CHECKPOINTS_DIR_PATH}/{file_name}'
+
+
+@dataclass
+class SimulationResult:
+    """Class describing the outcome of a simulation job: its metrics, or the error that stopped it"""
+
+    job: SimulationJob
+    metrics: Optional[Dict[str, pd.DataFrame]] = None
+    error: Optional[str] = None
+
+
+def configure_settings(configuration: Dict[str, Any]) -> Dict[str, Any]:
+    """Function to reset the settings to their base values with the configuration on top, returning the previous ones"""
+
+    previous_settings = dict(settings.attributes)
+    settings.attributes.clear()
+    settings.attributes.update({**BASE_SETTINGS, **configuration})
+
+    return previous_settings
+
+
+def restore_settings(previous_settings: Dict[str, Any]):
+    """Function to restore the settings as they were before configuring them"""
+
+    settings.attributes.clear()
+    settings.attributes.update(previous_settings)
+
+
+def simulation_end() -> int:
+    """Function to obtain the simulation second in which the configured simulation ends"""
+
+    return time_to_sim_sec(settings.SIMULATE_UNTIL, start_time=settings.SIMULATE_FROM)
+
+
+def finish_job(job: SimulationJob, world: World) -> SimulationResult:
+    """Function to post process the world once it was simulated until the end, and calculate the job's metrics"""
+
+    world.post_process()
+
+    return SimulationResult(
+        job=job,
+        metrics=MetricsService(instance=job.instance, run_id=job.run_id).calculate_metrics(world.dispatcher)
+    )
+
+
+def failed_job(job: SimulationJob) -> SimulationResult:
+    """Function to log the exception that stopped a job and return it as the job's error"""
+
+    logging.exception(f'Instance {job.instance} | Simulation failed with configuration {job.configuration}.')
+
+    return SimulationResult(job=job, error=traceback.format_exc())
+
+
+def run_job(job: SimulationJob) -> SimulationResult:
+    """Function to simulate the job's instance with its own settings and seed, and calculate the metrics"""
+
+    previous_settings = configure_settings(job.configuration)
+    random.seed(settings.SEED)
+
+    if settings.CHECKPOINT_INTERVAL is not None:
+        CHECKPOINT_SERVICE.open(file_path=job.journal_file_path, resume=job.resume)
+
+    try:
+        env = Environment(initial_time=time_to_sec(settings.SIMULATE_FROM))
+        world = World(env=env, instance=job.instance)
+        env.run(until=simulation_end())
+        result = finish_job(job, world)
+        CHECKPOINT_SERVICE.close(discard=True)
+
+        return result
+
+    except Exception:
+        return failed_job(job)
+
+    finally:
+        CHECKPOINT_SERVICE.close()
+        restore_settings(previous_settings)
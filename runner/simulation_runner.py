@@ -0,0 +1,206 @@
+import logging
+import time
+from multiprocessing import get_context
+from multiprocessing.process import BaseProcess
+from multiprocessing.sharedctypes import Synchronized
+from queue import Empty
+from typing import List, Callable, Dict, Tuple
+
+from sqlalchemy import create_engine
+
+from ddbb.config import get_db_url
+from runner.job_queue import JobQueue, worker_name, FAILED, PENDING
+from runner.simulation_job import SimulationJob, SimulationResult, run_job
+from runner.warm_up_fork import WarmUpJob, run_warm_up_job, acquire_slot, FORK_CONTEXT
+from runner.worker_processes import WorkerProcesses
+from services.metrics_service import MetricsService
+
+QUEUE_POLL_INTERVAL = 1
+
+
+class MetricsWriter:
+    """Class that saves the metrics of the finished jobs to the DDBB through a single connection"""
+
+    def __init__(self):
+        """Instantiates the writer by creating the DDBB connection"""
+
+        self._connection = create_engine(get_db_url(), pool_size=20, max_overflow=0, pool_pre_ping=True)
+
+    def __call__(self, result: SimulationResult):
+        """Method to save the metrics of a job that finished successfully"""
+
+        if result.metrics is not None:
+            MetricsService(instance=result.job.instance, connection=self._connection).save_metrics(result.metrics)
+
+    def close(self):
+        """Method to dispose the DDBB connection"""
+
+        self._connection.dispose()
+
+
+class SimulationRunner:
+    """Class that runs simulation jobs in worker processes, streaming their results back as they finish"""
+
+    def __init__(self, workers: int = 1):
+        """Instantiates the runner with the number of worker processes"""
+
+        self._workers = workers
+
+    def run(self, jobs: List[SimulationJob], on_result: Callable[[SimulationResult], None]) -> List[SimulationJob]:
+        """
+        Method to run the jobs, each one in a new worker process so that no state leaks between simulations.
+        Every result is handed to the callback in the parent process and the jobs that failed are returned.
+        """
+
+        failed_jobs = []
+
+        if not bool(jobs):
+            return failed_jobs
+
+        processes = WorkerProcesses(target=run_job, workers=self._workers)
+        pending_jobs = list(enumerate(jobs))
+
+        while bool(pending_jobs) or bool(processes.running):
+            while bool(pending_jobs) and processes.has_room:
+                processes.start(*pending_jobs.pop(0))
+
+            for _, result in processes.results(timeout=QUEUE_POLL_INTERVAL):
+                self._handle_result(result, failed_jobs, on_result)
+
+        return failed_jobs
+
+    def run_warm_up(
+            self,
+            jobs: List[WarmUpJob],
+            on_result: Callable[[SimulationResult], None]
+    ) -> List[SimulationJob]:
+        """
+        Method to run the warm-up jobs, each one in a new process that simulates the warm-up once and forks it into new
+        processes. The warm-ups and forks share a budget of worker slots, so that several warm-ups run at once and no
+        worker idles while a warm-up waits for its last forks. Every fork's result is handed to the callback and the
+        failed forks returned.
+        """
+
+        failed_jobs = []
+        context = get_context(FORK_CONTEXT)
+        slots = context.Semaphore(self._workers)
+        results = context.Queue()
+        pending_warm_ups = [(warm_up_ix, job) for warm_up_ix, job in enumerate(jobs) if bool(job.forks)]
+        running_warm_ups: Dict[int, Tuple[BaseProcess, Synchronized, Dict[str, SimulationJob]]] = {}
+        exited_warm_ups = set()
+
+        while bool(pending_warm_ups) or bool(running_warm_ups):
+            while bool(pending_warm_ups):
+                held_slots = context.Value('i', 0)
+
+                if not acquire_slot(slots, held_slots, block=False):
+                    break
+
+                warm_up_ix, job = pending_warm_ups.pop(0)
+                process = context.Process(
+                    target=run_warm_up_job,
+                    args=(warm_up_ix, job, slots, held_slots, results)
+                )
+                process.start()
+                running_warm_ups[warm_up_ix] = process, held_slots, {job.key: job for job in job.fork_jobs()}
+
+            try:
+                warm_up_ix, result = results.get(timeout=QUEUE_POLL_INTERVAL)
+
+                if warm_up_ix in running_warm_ups.keys():
+                    del running_warm_ups[warm_up_ix][2][result.job.key]
+                    self._handle_result(result, failed_jobs, on_result)
+
+                continue
+
+            except Empty:
+                pass
+
+            for warm_up_ix, (process, held_slots, pending_jobs) in list(running_warm_ups.items()):
+                if process.is_alive():
+                    continue
+
+                if process.exitcode == 0 and bool(pending_jobs) and warm_up_ix not in exited_warm_ups:
+                    # Its last results may still be on their way through the queue, so it is waited on once more
+                    exited_warm_ups.add(warm_up_ix)
+                    continue
+
+                process.join()
+                del running_warm_ups[warm_up_ix]
+
+                for _ in range(held_slots.value):
+                    slots.release()
+
+                for fork_job in pending_jobs.values():
+                    self._handle_result(
+                        SimulationResult(job=fork_job, error='The warm-up process exited before the job finished'),
+                        failed_jobs,
+                        on_result
+                    )
+
+        return failed_jobs
+
+    def run_queue(self, queue: JobQueue, on_result: Callable[[SimulationResult], None]) -> List[SimulationJob]:
+        """
+        Method to claim jobs from the queue while there are any left, running each one in a new worker process and
+        sending heartbeats for the running ones. Every result is reported to the queue and then handed to the callback,
+        such as saving its metrics, unless the job was claimed by another worker meanwhile. The jobs that ran out of
+        attempts are returned.
+        """
+
+        failed_jobs = []
+        worker = worker_name()
+        running_jobs: Dict[int, SimulationJob] = {}
+        processes = WorkerProcesses(target=run_job, workers=self._workers)
+        last_heartbeat = time.monotonic()
+
+        while True:
+            while processes.has_room:
+                claimed_job = queue.claim(worker)
+
+                if claimed_job is None:
+                    break
+
+                job_id, job = claimed_job
+                running_jobs[job_id] = job
+                processes.start(job_id, job)
+
+            if not bool(running_jobs):
+                break
+
+            for job_id, result in processes.results(timeout=QUEUE_POLL_INTERVAL):
+                job = running_jobs.pop(job_id)
+                status = queue.complete(job_id, worker, result)
+
+                if status is None:
+                    logging.warning(f'Instance {job.instance} | Job claimed by another worker: {job.configuration}.')
+                    continue
+
+                on_result(result)
+
+                if status == PENDING:
+                    logging.warning(f'Instance {job.instance} | Job failed, queued again: {job.configuration}.')
+
+                elif status == FAILED:
+                    logging.error(f'Instance {job.instance} | Job failed: {job.configuration}.')
+                    failed_jobs.append(job)
+
+            if time.monotonic() - last_heartbeat >= queue.heartbeat_interval:
+                queue.heartbeat(list(running_jobs.keys()), worker)
+                last_heartbeat = time.monotonic()
+
+        return failed_jobs
+
+    @staticmethod
+    def _handle_result(
+            result: SimulationResult,
+            failed_jobs: List[SimulationJob],
+            on_result: Callable[[SimulationResult], None]
+    ):
+        """Method to hand a result to the callback, keeping track of the job if it failed"""
+
+        if result.error is not None:
+            logging.error(f'Instance {result.job.instance} | Job failed: {result.job.configuration}.')
+            failed_jobs.append(result.job)
+
+        on_result(result)
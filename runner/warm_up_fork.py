@@ -0,0 +1,208 @@
+import json
+import logging
+import random
+import traceback
+from dataclasses import dataclass, field
+from multiprocessing.queues import Queue
+from multiprocessing.sharedctypes import Synchronized
+from multiprocessing.synchronize import Semaphore
+from typing import Dict, Any, List, Optional
+
+from simpy import Environment
+
+from actors.world import World
+from runner.simulation_job import SimulationJob, SimulationResult, configure_settings, restore_settings, \
+    simulation_end, finish_job, failed_job
+from runner.worker_processes import WorkerProcesses
+from services.optimization_service.model.solver_session import SOLVER_SESSION
+from settings import settings, SIMULATION_KEYS
+from utils.datetime_utils import time_to_sec
+
+FORK_CONTEXT = 'fork'
+
+# Settings that shape the warm-up itself, or the actors created during it, which the forks of a warm-up must share
+WARM_UP_KEYS = SIMULATION_KEYS + [
+    'INSTANCE_INGESTION',
+    'ARCHIVAL_MODE',
+    'COURIER_ACCEPTANCE_POLICY',
+    'COURIER_MOVEMENT_EVALUATION_POLICY',
+    'COURIER_MOVEMENT_POLICY',
+    'USER_CANCELLATION_POLICY'
+]
+
+# World simulated until the end of the warm-up, inherited by every process forked from the warm-up process
+_WARMED_UP_WORLD: Optional[World] = None
+
+
+@dataclass
+class WarmUpJob:
+    """
+    Class describing an instance simulated once until the warm-up ends, then forked to continue with each setting.
+    The warm-up simulates with the settings shared by every fork, plus the warm-up settings, such as the matching
+    policy, that only the warm-up simulates with.
+    """
+
+    instance: int
+    seed: Optional[int] = None
+    settings: Dict[str, Any] = field(default_factory=lambda: dict())
+    forks: List[Dict[str, Any]] = field(default_factory=lambda: list())
+    run_id: Optional[str] = None
+    warm_up_settings: Dict[str, Any] = field(default_factory=lambda: dict())
+
+    @property
+    def configuration(self) -> Dict[str, Any]:
+        """Property with the settings the warm-up simulates with, including the instance and seed"""
+
+        return SimulationJob(
+            instance=self.instance,
+            seed=self.seed,
+            settings={**self.settings, **self.warm_up_settings}
+        ).configuration
+
+    def fork_jobs(self) -> List[SimulationJob]:
+        """Method to obtain the job each fork completes, as if it were simulated from the start"""
+
+        return [
+            SimulationJob(
+                instance=self.instance,
+                seed=self.seed,
+                settings={**self.settings, **fork},
+                run_id=self.run_id
+            )
+            for fork in self.forks
+        ]
+
+
+def warm_up_jobs(
+        jobs: List[SimulationJob],
+        warm_up_settings: Optional[Dict[str, Any]] = None
+) -> List[WarmUpJob]:
+    """
+    Function to group the jobs that share a warm-up, keeping their order, so that each warm-up is simulated once.
+    Each warm-up simulates with the settings shared by all of its jobs, the dispatcher settings in which they differ
+    keeping their base value unless the warm-up settings, such as a warm-up matching policy, establish them.
+    """
+
+    warm_up_settings = warm_up_settings or {}
+    fork_keys = [key for key in warm_up_settings.keys() if key in WARM_UP_KEYS]
+
+    if bool(fork_keys):
+        raise ValueError(f'The settings {fork_keys} shape the warm-up and must be shared by its forks')
+
+    groups: Dict[str, List[SimulationJob]] = {}
+
+    for job in jobs:
+        shared_settings = {key: value for key, value in job.settings.items() if key in WARM_UP_KEYS}
+        group_key = json.dumps([job.instance, job.seed, job.run_id, shared_settings], sort_keys=True, default=str)
+        groups.setdefault(group_key, []).append(job)
+
+    return [
+        WarmUpJob(
+            instance=group[0].instance,
+            seed=group[0].seed,
+            settings={
+                key: value
+                for key, value in group[0].settings.items()
+                if all(key in job.settings and job.settings[key] == value for job in group)
+            },
+            forks=[job.settings for job in group],
+            run_id=group[0].run_id,
+            warm_up_settings=warm_up_settings
+        )
+        for group in groups.values()
+    ]
+
+
+def _run_fork(job: SimulationJob) -> SimulationResult:
+    """Function run by a process forked from the warm-up, continuing the warmed up world with the job's settings"""
+
+    configure_settings(job.configuration)
+
+    try:
+        _WARMED_UP_WORLD.switch_dispatcher_policies()
+        SOLVER_SESSION.open(optimizer=settings.OPTIMIZER)
+        _WARMED_UP_WORLD.env.run(until=simulation_end())
+
+        return finish_job(job, _WARMED_UP_WORLD)
+
+    except Exception:
+        return failed_job(job)
+
+
+def acquire_slot(slots: Semaphore, held_slots: Synchronized, block: bool = True) -> bool:
+    """Function to take one of the worker slots shared by every warm-up, counting it as held by the warm-up"""
+
+    if not slots.acquire(block=block):
+        return False
+
+    with held_slots.get_lock():
+        held_slots.value += 1
+
+    return True
+
+
+def release_slot(slots: Semaphore, held_slots: Synchronized):
+    """Function to give back a worker slot held by a warm-up"""
+
+    slots.release()
+
+    with held_slots.get_lock():
+        held_slots.value -= 1
+
+
+def run_warm_up_job(
+        warm_up_ix: int,
+        job: WarmUpJob,
+        slots: Semaphore,
+        held_slots: Synchronized,
+        results: Queue
+):
+    """
+    Function to simulate the job's instance until the warm-up ends and then fork the whole simulation, once per fork.
+    The warm-up holds a worker slot until it ends, and each fork continues in a new process once it takes a slot, so
+    that several warm-ups share the workers. Each fork's result is put in the queue along with the warm-up's index.
+    """
+
+    global _WARMED_UP_WORLD
+
+    configure_settings(job.configuration)
+    random.seed(settings.SEED)
+    fork_jobs = job.fork_jobs()
+
+    try:
+        env = Environment(initial_time=time_to_sec(settings.SIMULATE_FROM))
+        _WARMED_UP_WORLD = World(env=env, instance=job.instance)
+
+        if settings.WARM_UP_TIME > 0:
+            env.run(until=env.now + settings.WARM_UP_TIME)
+
+        SOLVER_SESSION.close()
+
+        if _WARMED_UP_WORLD.connection is not None:
+            # The forks must not share the DDBB connections of the pool, so each one opens its own
+            _WARMED_UP_WORLD.connection.dispose()
+
+        logging.info(f'Instance {job.instance} | Warm-up finished, forking {len(fork_jobs)} simulations.')
+
+    except Exception:
+        logging.exception(f'Instance {job.instance} | Warm-up failed with configuration {job.configuration}.')
+        error = traceback.format_exc()
+
+        for fork_job in fork_jobs:
+            results.put((warm_up_ix, SimulationResult(job=fork_job, error=error)))
+
+        return
+
+    finally:
+        release_slot(slots, held_slots)
+
+    processes = WorkerProcesses(target=_run_fork, workers=len(fork_jobs), context=FORK_CONTEXT)
+    pending_jobs = list(enumerate(fork_jobs))
+
+    while bool(pending_jobs) or bool(processes.running):
+        while bool(pending_jobs) and acquire_slot(slots, held_slots, block=False):
+            processes.start(*pending_jobs.pop(0))
+
+        for _, result in processes.results(timeout=1):
+            release_slot(slots, held_slots)
+            results.put((warm_up_ix, result))
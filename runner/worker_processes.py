@@ -0,0 +1,91 @@
+from multiprocessing import get_context
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from queue import Empty
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from runner.simulation_job import SimulationJob, SimulationResult
+
+
+def _run_target(target: Callable[[SimulationJob], SimulationResult], key: Hashable, job: SimulationJob, results: Queue):
+    """Function run by a worker process, putting the result of its job in the queue"""
+
+    results.put((key, target(job)))
+
+
+class WorkerProcesses:
+    """
+    Class that runs each job in a new process, handing back the results as they finish. A process that exits without
+    a result, for instance because it was killed by a signal, is handed back as a failed job instead of waited on.
+    """
+
+    def __init__(
+            self,
+            target: Callable[[SimulationJob], SimulationResult],
+            workers: int,
+            context: Optional[str] = None
+    ):
+        """Instantiates the worker processes with the function that runs a job and the number of concurrent ones"""
+
+        self._target = target
+        self._workers = workers
+        self._context = get_context(context)
+        self._results = self._context.Queue()
+        self._processes: Dict[Hashable, Tuple[SimulationJob, BaseProcess]] = {}
+        self._exited: Dict[Hashable, int] = {}
+
+    @property
+    def has_room(self) -> bool:
+        """Property indicating if another job can be started"""
+
+        return len(self._processes) < self._workers
+
+    @property
+    def running(self) -> List[Hashable]:
+        """Property with the keys of the jobs that haven't been handed back yet"""
+
+        return list(self._processes.keys())
+
+    def start(self, key: Hashable, job: SimulationJob):
+        """Method to run the job in a new process, identified by the key"""
+
+        process = self._context.Process(target=_run_target, args=(self._target, key, job, self._results))
+        process.start()
+        self._processes[key] = job, process
+
+    def results(self, timeout: float) -> List[Tuple[Hashable, SimulationResult]]:
+        """Method to wait up to the timeout for results, handing back the finished jobs and the exited processes"""
+
+        results = []
+
+        try:
+            results.append(self._results.get(timeout=timeout))
+
+            while True:
+                results.append(self._results.get_nowait())
+
+        except Empty:
+            pass
+
+        for key, _ in results:
+            self._processes.pop(key)[1].join()
+            self._exited.pop(key, None)
+
+        for key, (job, process) in list(self._processes.items()):
+            if process.is_alive():
+                continue
+
+            if process.exitcode == 0 and key not in self._exited:
+                # Its result may still be on its way through the queue, so it is waited on for one more round
+                self._exited[key] = process.exitcode
+                continue
+
+            del self._processes[key]
+            self._exited.pop(key, None)
+            process.join()
+            results.append((
+                key,
+                SimulationResult(job=job, error=f'The worker process exited with code {process.exitcode}')
+            ))
+
+        return results
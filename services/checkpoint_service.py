@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, Optional, TextIO, List
+
+from utils.datetime_utils import sec_to_time
+
+
+def _identity(value: Any) -> Any:
+    """Function that leaves a value as it is, for results that are journaled without encoding"""
+
+    return value
+
+
+class CheckpointService:
+    """
+    Class that journals to disk the results the simulation obtains from outside, such as routes and solver solutions,
+    marking checkpoints at regular simulated intervals. As the simulation is deterministic for a seed, a simulation is
+    resumed by replaying the journal, which is fast since no routes are requested nor models solved, up to the latest
+    checkpoint and beyond, continuing live afterwards.
+    """
+
+    def __init__(self):
+        """Instantiates a closed service"""
+
+        self._file_path: Optional[str] = None
+        self._file: Optional[TextIO] = None
+        self._replay: Dict[str, Deque[Any]] = defaultdict(deque)
+        self._checkpoints: Deque[Dict[str, Any]] = deque()
+
+    @property
+    def is_open(self) -> bool:
+        """Property that establishes if the simulation is being journaled"""
+
+        return self._file is not None
+
+    @property
+    def is_replaying(self) -> bool:
+        """Property that establishes if there are journaled results yet to be replayed"""
+
+        return bool(self._checkpoints) or any(bool(results) for results in self._replay.values())
+
+    def open(self, file_path: str, resume: bool = False):
+        """Method to start journaling to a file, replaying the results already journaled if the simulation resumes"""
+
+        self.close()
+        self._file_path = file_path
+        entries = self._read(file_path) if resume and os.path.exists(file_path) else []
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        self._file = open(file_path, 'w')
+
+        for entry in entries:
+            if entry['kind'] == 'checkpoint':
+                self._checkpoints.append(entry)
+
+            else:
+                self._replay[self._replay_key(entry['kind'], entry['key'])].append(entry['value'])
+
+            self._file.write(f'{json.dumps(entry)}\n')
+
+        if bool(self._checkpoints):
+            logging.info(f'Resuming from the checkpoint at sim time = {sec_to_time(self._checkpoints[-1]["time"])}.')
+
+    def close(self, discard: bool = False):
+        """Method to stop journaling, discarding the journal when the simulation no longer needs to be resumed"""
+
+        if self._file is not None:
+            self._file.close()
+
+            if discard:
+                os.remove(self._file_path)
+
+        self._file_path, self._file = None, None
+        self._replay.clear()
+        self._checkpoints.clear()
+
+    def fetch(
+            self,
+            kind: str,
+            key: str,
+            compute: Callable[[], Any],
+            encode: Callable[[Any], Any] = _identity,
+            decode: Callable[[Any], Any] = _identity
+    ) -> Any:
+        """
+        Method to obtain a result from the journal while replaying it, or to compute and journal it otherwise. A result
+        that was not journaled means the replay diverged, so the simulation continues live from then on.
+        """
+
+        if self._file is None:
+            return compute()
+
+        results = self._replay.get(self._replay_key(kind, key))
+
+        if bool(results):
+            return decode(results.popleft())
+
+        if self.is_replaying:
+            logging.warning(f'Replay diverged, the {kind} with key {key} was not journaled, continuing live.')
+            self._restart()
+
+        result = compute()
+        self._write({'kind': kind, 'key': key, 'value': encode(result)})
+
+        return result
+
+    def checkpoint(self, sim_time: float, state: str):
+        """Method to mark a checkpoint, verifying a replay reached the journaled state and flushing the journal"""
+
+        if self._file is None:
+            return
+
+        if bool(self._checkpoints) and self._checkpoints[0]['time'] <= sim_time:
+            expected_checkpoint = self._checkpoints.popleft()
+
+            if expected_checkpoint['time'] == sim_time and expected_checkpoint['state'] == state:
+                return
+
+            logging.warning(
+                f'Replay diverged from the checkpoint at sim time = {sec_to_time(sim_time)}, continuing live. '
+                f'Journaled state {expected_checkpoint["state"]}. Replayed state {state}.'
+            )
+            self._restart()
+
+        self._write({'kind': 'checkpoint', 'time': sim_time, 'state': state})
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _restart(self):
+        """Method to discard the journal of a replay that diverged, journaling the simulation from now on"""
+
+        self._file.close()
+        self._file = open(self._file_path, 'w')
+        self._replay.clear()
+        self._checkpoints.clear()
+
+    def _write(self, entry: Dict[str, Any]):
+        """Method to append an entry to the journal, which is flushed to disk on every checkpoint"""
+
+        self._file.write(f'{json.dumps(entry)}\n')
+
+    @staticmethod
+    def _read(file_path: str) -> List[Dict[str, Any]]:
+        """Method to read the entries of a journal, up to the last one written entirely"""
+
+        entries = []
+
+        with open(file_path) as file:
+            for line in file:
+                try:
+                    entries.append(json.loads(line))
+
+                except json.JSONDecodeError:
+                    break
+
+        return entries
+
+    @staticmethod
+    def _replay_key(kind: str, key: str) -> str:
+        """Method to obtain the key under which the results of a kind are replayed"""
+
+        return f'{kind}:{key}'
+
+
+CHECKPOINT_SERVICE = CheckpointService()
@@ -0,0 +1,97 @@
+import heapq
+import math
+from itertools import count
+from typing import Callable, Dict, List, Set
+from weakref import WeakKeyDictionary
+
+from simpy import Environment, Event
+from simpy.events import NORMAL
+
+
+class DeadlineService:
+    """Class that contains the Deadline Service, a timer wheel that fires callbacks once their integer second is due"""
+
+    _services: 'WeakKeyDictionary[Environment, DeadlineService]' = WeakKeyDictionary()
+
+    def __init__(self, env: Environment):
+        """Instantiates the service for an environment, without deadlines"""
+
+        self._env = env
+        self._seconds: List[int] = []
+        self._buckets: Dict[int, Dict[int, Callable[[], None]]] = {}
+        self._handles: Dict[int, int] = {}
+        self._wake_ups: Set[int] = set()
+        self._counter = count()
+
+    @classmethod
+    def of(cls, env: Environment) -> 'DeadlineService':
+        """Method to obtain the service shared by every actor of the environment"""
+
+        if env not in cls._services:
+            cls._services[env] = cls(env)
+
+        return cls._services[env]
+
+    def __len__(self) -> int:
+        """Method to obtain the number of pending deadlines"""
+
+        return len(self._handles)
+
+    def schedule(self, deadline: float, callback: Callable[[], None]) -> int:
+        """Method to schedule a callback at the deadline, rounded up to the second, returning a handle to cancel it"""
+
+        second = max(math.ceil(deadline), math.ceil(self._env.now))
+        handle = next(self._counter)
+
+        if second not in self._buckets:
+            self._buckets[second] = {}
+            heapq.heappush(self._seconds, second)
+
+        self._buckets[second][handle] = callback
+        self._handles[handle] = second
+        self._wake_up(second)
+
+        return handle
+
+    def cancel(self, handle: int):
+        """Method to cancel a pending deadline, removing it from the wheel"""
+
+        second = self._handles.pop(handle, None)
+
+        if second is not None and second in self._buckets:
+            del self._buckets[second][handle]
+
+            if not self._buckets[second]:
+                del self._buckets[second]
+
+    def _wake_up(self, second: int):
+        """Method to schedule a single environment event for the second, unless one is already scheduled"""
+
+        if second in self._wake_ups:
+            return
+
+        wake_up_event = Event(env=self._env)
+        wake_up_event.callbacks.append(self._release_callback)
+        self._env.schedule(event=wake_up_event, priority=NORMAL, delay=second - self._env.now)
+        self._wake_ups.add(second)
+
+    def _release_callback(self, event: Event):
+        """Callback to fire, in scheduling order, the callbacks of every second that is due"""
+
+        self._wake_ups.discard(math.ceil(self._env.now))
+
+        while self._seconds and self._seconds[0] <= self._env.now:
+            bucket = self._buckets.pop(heapq.heappop(self._seconds), {})
+
+            for handle, callback in bucket.items():
+                if self._handles.pop(handle, None) is not None:
+                    callback()
+
+        while self._seconds and self._seconds[0] not in self._buckets:
+            heapq.heappop(self._seconds)
+
+        if self._seconds:
+            self._wake_up(self._seconds[0])
+
+        event.succeed()
+        event.callbacks = []
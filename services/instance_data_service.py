@@ -0,0 +1,241 @@
+import os
+import shutil
+import tempfile
+from datetime import time
+from typing import List, Dict, Any
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+from ddbb.config import get_db_url
+from ddbb.load_instances import INSTANCES_SUB_DIR_PATH, ORDERS_CSV_FILE, COURIERS_CSV_FILE
+from ddbb.queries.couriers_instance_data_query import couriers_bulk_query
+from ddbb.queries.orders_instance_data_query import orders_bulk_query
+from settings import settings
+from utils.datetime_utils import time_to_query_format, time_to_sec, sec_to_time, window_to_query_format
+
+ORDERS_TIME_COLUMNS = ['placement_time', 'preparation_time', 'ready_time', 'expected_drop_off_time']
+COURIERS_TIME_COLUMNS = ['on_time', 'off_time']
+COLUMNS_SUB_DIR_PATH = INSTANCES_SUB_DIR_PATH + '/columns'
+
+
+class InstanceDataService:
+    """Class that contains the Instance Data Service to load all the orders and couriers of an instance at once"""
+
+    def __init__(self, instance: int, ingestion: str):
+        """
+        Instantiates the class with the desired ingestion: a single DDBB query, the instance .csv files or the instance
+        columns memory-mapped from .npy files, which every process simulating the instance shares
+        """
+
+        self._instance = instance
+        self._ingestion = ingestion
+
+    def get_orders_info(self) -> List[Dict[str, Any]]:
+        """Method that returns the orders placed while users are created, sorted by placement time"""
+
+        if self._ingestion == 'csv':
+            orders_df = self._read_csv(
+                file_name=ORDERS_CSV_FILE,
+                time_columns=ORDERS_TIME_COLUMNS,
+                arrival_column='placement_time',
+                id_column='order_id',
+                arrival_from=settings.CREATE_USERS_FROM,
+                arrival_until=settings.CREATE_USERS_UNTIL
+            )
+
+        elif self._ingestion == 'memmap':
+            return self._columns_to_records(self.get_orders_columns(), time_columns=ORDERS_TIME_COLUMNS)
+
+        else:
+            query = orders_bulk_query.format(
+                placement_window=window_to_query_format(
+                    'placement_time',
+                    window_from=settings.CREATE_USERS_FROM,
+                    window_until=settings.CREATE_USERS_UNTIL
+                ),
+                placement_from=time_to_query_format(settings.CREATE_USERS_FROM),
+                instance_id=self._instance
+            )
+            orders_df = self._read_sql(query)
+
+        return orders_df.to_dict('records')
+
+    def get_couriers_info(self) -> List[Dict[str, Any]]:
+        """Method that returns the couriers logging on while couriers are created, sorted by on time"""
+
+        if self._ingestion == 'csv':
+            couriers_df = self._read_csv(
+                file_name=COURIERS_CSV_FILE,
+                time_columns=COURIERS_TIME_COLUMNS,
+                arrival_column='on_time',
+                id_column='courier_id',
+                arrival_from=settings.CREATE_COURIERS_FROM,
+                arrival_until=settings.CREATE_COURIERS_UNTIL
+            )
+
+        elif self._ingestion == 'memmap':
+            return self._columns_to_records(self.get_couriers_columns(), time_columns=COURIERS_TIME_COLUMNS)
+
+        else:
+            query = couriers_bulk_query.format(
+                on_window=window_to_query_format(
+                    'on_time',
+                    window_from=settings.CREATE_COURIERS_FROM,
+                    window_until=settings.CREATE_COURIERS_UNTIL
+                ),
+                on_from=time_to_query_format(settings.CREATE_COURIERS_FROM),
+                instance_id=self._instance
+            )
+            couriers_df = self._read_sql(query)
+
+        return couriers_df.to_dict('records')
+
+    def get_orders_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Method that returns the columns of the orders placed while users are created, sorted by placement time, with
+        times as seconds of the day. Only available for the memory-mapped ingestion.
+        """
+
+        return self._read_columns(
+            file_name=ORDERS_CSV_FILE,
+            time_columns=ORDERS_TIME_COLUMNS,
+            arrival_column='placement_time',
+            id_column='order_id',
+            arrival_from=settings.CREATE_USERS_FROM,
+            arrival_until=settings.CREATE_USERS_UNTIL
+        )
+
+    def get_couriers_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Method that returns the columns of the couriers logging on while couriers are created, sorted by on time, with
+        times as seconds of the day. Only available for the memory-mapped ingestion.
+        """
+
+        return self._read_columns(
+            file_name=COURIERS_CSV_FILE,
+            time_columns=COURIERS_TIME_COLUMNS,
+            arrival_column='on_time',
+            id_column='courier_id',
+            arrival_from=settings.CREATE_COURIERS_FROM,
+            arrival_until=settings.CREATE_COURIERS_UNTIL
+        )
+
+    def _read_csv(
+            self,
+            file_name: str,
+            time_columns: List[str],
+            arrival_column: str,
+            id_column: str,
+            arrival_from: time,
+            arrival_until: time
+    ) -> pd.DataFrame:
+        """
+        Method to read an instance file, parsing times and keeping the rows that arrive in the window, sorted by arrival
+        and id. A window that crosses midnight keeps the rows arriving after it starts or before it ends.
+        """
+
+        df = pd.read_csv(f'{INSTANCES_SUB_DIR_PATH.format(instance_id=self._instance)}/{file_name}')
+
+        for column in time_columns:
+            df[column] = pd.to_datetime(df[column], format='%H:%M:%S').dt.time
+
+        after_from, before_until = df[arrival_column] >= arrival_from, df[arrival_column] <= arrival_until
+        df = df[after_from & before_until if arrival_from <= arrival_until else after_from | before_until]
+
+        return (
+            df
+            .assign(next_day=df[arrival_column] < arrival_from)
+            .sort_values(['next_day', arrival_column, id_column], kind='mergesort')
+            .drop(columns='next_day')
+        )
+
+    def _read_columns(
+            self,
+            file_name: str,
+            time_columns: List[str],
+            arrival_column: str,
+            id_column: str,
+            arrival_from: time,
+            arrival_until: time
+    ) -> Dict[str, np.ndarray]:
+        """
+        Method to read the columns of an instance file that arrive in the window from its memory-mapped columns, sorted
+        by arrival and id. Only the rows in the window are copied out of the mapped pages. A window that crosses
+        midnight keeps the rows arriving after it starts or before it ends.
+        """
+
+        if self._ingestion != 'memmap':
+            raise ValueError(f'The instance columns are only read with the memmap ingestion, not {self._ingestion}')
+
+        columns = self._load_columns(file_name, time_columns)
+        arrivals = columns[arrival_column]
+        from_sec, until_sec = time_to_sec(arrival_from), time_to_sec(arrival_until)
+        after_from, before_until = arrivals >= from_sec, arrivals <= until_sec
+        rows = np.flatnonzero(after_from & before_until if from_sec <= until_sec else after_from | before_until)
+        rows = rows[np.lexsort((columns[id_column][rows], arrivals[rows], arrivals[rows] < from_sec))]
+
+        return {name: column[rows] for name, column in columns.items()}
+
+    @staticmethod
+    def _columns_to_records(columns: Dict[str, np.ndarray], time_columns: List[str]) -> List[Dict[str, Any]]:
+        """Method to convert the columns of an instance file to one dict per row, with times as time objects"""
+
+        values = {
+            name: [sec_to_time(seconds) for seconds in column.tolist()] if name in time_columns else column.tolist()
+            for name, column in columns.items()
+        }
+
+        return [dict(zip(values.keys(), row)) for row in zip(*values.values())]
+
+    def _load_columns(self, file_name: str, time_columns: List[str]) -> Dict[str, np.ndarray]:
+        """Method to map the columns of an instance file read-only, writing them as .npy files the first time"""
+
+        columns_dir = f'{COLUMNS_SUB_DIR_PATH.format(instance_id=self._instance)}/{os.path.splitext(file_name)[0]}'
+
+        if not os.path.exists(columns_dir):
+            self._write_columns(file_name, time_columns, columns_dir)
+
+        return {
+            os.path.splitext(column_file)[0]: np.load(f'{columns_dir}/{column_file}', mmap_mode='r')
+            for column_file in sorted(os.listdir(columns_dir))
+        }
+
+    def _write_columns(self, file_name: str, time_columns: List[str], columns_dir: str):
+        """
+        Method to write each column of an instance file as a .npy file, with times as seconds of the day.
+        The columns are written to a temporary directory that is renamed at once, so processes never map half of them.
+        """
+
+        df = pd.read_csv(f'{INSTANCES_SUB_DIR_PATH.format(instance_id=self._instance)}/{file_name}')
+        os.makedirs(os.path.dirname(columns_dir), exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(columns_dir))
+
+        for column in df.columns:
+            if column in time_columns:
+                values = pd.to_timedelta(df[column]).dt.total_seconds().values.astype(np.int64)
+
+            elif df[column].dtype == object:
+                values = df[column].values.astype(str)
+
+            else:
+                values = df[column].values
+
+            np.save(f'{tmp_dir}/{column}.npy', values)
+
+        try:
+            os.rename(tmp_dir, columns_dir)
+
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _read_sql(query: str) -> pd.DataFrame:
+        """Method to run a single query against the DDBB, disposing of the connection afterwards"""
+
+        connection = create_engine(get_db_url(), pool_size=20, max_overflow=0, pool_pre_ping=True)
+        df = pd.read_sql(sql=query, con=connection)
+        connection.dispose()
+
+        return df
@@ -1,10 +1,12 @@
 import logging
 from datetime import time
-from typing import Dict
+from typing import Dict, Optional
 
 import pandas as pd
-from sqlalchemy import create_engine, DateTime, Integer, Float, JSON, Time, Boolean, BigInteger
+from sqlalchemy import create_engine, DateTime, Integer, Float, JSON, Time, Boolean, BigInteger, String
+from sqlalchemy.engine import Engine
 
+from actors.courier import Courier
 from actors.dispatcher import Dispatcher
 from ddbb.config import get_db_url
 from settings import settings, SIMULATION_KEYS, POLICIES_KEYS
@@ -14,20 +16,39 @@ from utils.datetime_utils import time_to_str
 class MetricsService:
     """Class that contains the Metrics Service to calculate the output of a simulation"""
 
-    def __init__(self, instance: int):
-        """Instantiates the class by creating the DDBB connection"""
+    def __init__(self, instance: int, connection: Optional[Engine] = None, run_id: Optional[str] = None):
+        """Instantiates the class, with the DDBB connection of a metrics writer or without one until saving"""
 
         self._instance = instance
-        self._connection = create_engine(get_db_url(), pool_size=20, max_overflow=0, pool_pre_ping=True)
+        self._connection = connection
+        self._run_id = run_id
 
     def calculate_and_save_metrics(self, dispatcher: Dispatcher):
         """Method for calculating and saving the simulation metrics"""
 
+        metrics = self.calculate_metrics(dispatcher)
+        self.save_metrics(metrics)
+
+    def calculate_metrics(self, dispatcher: Dispatcher) -> Dict[str, pd.DataFrame]:
+        """Method for calculating metrics based on the Dispatcher, after the simulation is finished"""
+
         metrics = self._calculate_metrics(dispatcher)
         logging.info(f'Instance {self._instance} | Successful metrics calculation.')
 
-        self._save_metrics(metrics)
-        self._connection.dispose()
+        return metrics
+
+    def save_metrics(self, metrics: Dict[str, pd.DataFrame]):
+        """Method for saving metrics to the DDBB, disposing the connection only if the service created it"""
+
+        if self._connection is not None:
+            self._save_metrics(metrics)
+
+        else:
+            self._connection = create_engine(get_db_url(), pool_size=20, max_overflow=0, pool_pre_ping=True)
+            self._save_metrics(metrics)
+            self._connection.dispose()
+            self._connection = None
+
         logging.info(f'Instance {self._instance} | Successfully saved metrics to DDBB.')
 
     def _calculate_metrics(self, dispatcher: Dispatcher) -> Dict[str, pd.DataFrame]:
@@ -35,6 +56,7 @@ class MetricsService:
 
         settings_dict = {
             'instance_id': self._instance,
+            'run_id': self._run_id,
             'simulation_settings': {
                 k: time_to_str(v) if isinstance(v, time) else v
                 for k, v in settings.attributes.items()
@@ -55,6 +77,13 @@ class MetricsService:
             {**settings_dict, **courier.calculate_metrics()}
             for courier in dispatcher.logged_off_couriers.values()
         ]
+
+        if dispatcher.metrics_archive is not None:
+            order_metrics += [{**settings_dict, **metrics} for metrics in dispatcher.metrics_archive.order_metrics()]
+            courier_metrics += [
+                {**settings_dict, **metrics}
+                for metrics in dispatcher.metrics_archive.courier_metrics(metrics=Courier.metrics)
+            ]
         matching_optimization_metrics = [
             {**settings_dict, **{'id': ix}, **metric.calculate_metrics()}
             for ix, metric in enumerate(dispatcher.matching_metrics)
@@ -80,6 +109,7 @@ class MetricsService:
             dtype={
                 'created_at': DateTime,
                 'instance_id': Integer,
+                'run_id': String,
                 'simulation_settings': JSON,
                 'simulation_policies': JSON,
                 'extra_settings': JSON,
@@ -111,6 +141,7 @@ class MetricsService:
             dtype={
                 'created_at': DateTime,
                 'instance_id': Integer,
+                'run_id': String,
                 'simulation_settings': JSON,
                 'simulation_policies': JSON,
                 'extra_settings': JSON,
@@ -137,6 +168,7 @@ class MetricsService:
             dtype={
                 'created_at': DateTime,
                 'instance_id': Integer,
+                'run_id': String,
                 'simulation_settings': JSON,
                 'simulation_policies': JSON,
                 'extra_settings': JSON,
@@ -149,5 +181,7 @@ class MetricsService:
                 'routing_time': Float,
                 'matching_time': Float,
                 'matches': Integer,
+                'iterations': Integer,
+                'relaxation_integral': Boolean,
             }
         )
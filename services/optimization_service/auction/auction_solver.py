@@ -0,0 +1,227 @@
+from collections import deque
+from typing import Dict, Tuple, List
+
+import numpy as np
+
+from objects.route import Route
+from services.optimization_service.problem.matching_problem import MatchingProblem
+from settings import settings
+
+UNASSIGNED = -1
+OUTSIDE_OPTION = -2
+MAX_REPAIR_ROUNDS = 10
+
+
+class AuctionSolver:
+    """Class that solves a matching problem with an epsilon-scaling auction, warm-started with previous prices"""
+
+    def __init__(self):
+        """Instantiates the solver without prices"""
+
+        self._route_prices: Dict[Tuple, float] = {}
+        self._courier_profits: Dict[int, float] = {}
+
+    def reset(self):
+        """Method to forget the prices carried over from previous epochs"""
+
+        self._route_prices = {}
+        self._courier_profits = {}
+
+    def solve(self, problem: MatchingProblem) -> Tuple[np.ndarray, int]:
+        """Main method to solve the matching problem, returning the solution per prospect and the bids placed"""
+
+        solution = np.zeros(len(problem.prospects))
+        if not problem.prospects.tolist():
+            return solution, 0
+
+        values = problem.costs
+        couriers_ix, routes_ix = problem.prospects[:, 0], problem.prospects[:, 1]
+        candidates = {
+            courier_ix: np.where((couriers_ix == courier_ix) & (values > 0))[0]
+            for courier_ix in np.unique(couriers_ix[values > 0])
+        }
+        if not candidates:
+            return solution, 0
+
+        signatures = [self.route_signature(route) for route in problem.routes]
+        prices = np.array([self._route_prices.get(signature, 0.) for signature in signatures])
+
+        max_value = values.max()
+        final_epsilon = settings.DISPATCHER_AUCTION_EPSILON * max_value / (len(candidates) + 1)
+        epsilon = self._initial_epsilon(problem, candidates, values, routes_ix, prices, max_value, final_epsilon)
+
+        iterations = 0
+        while True:
+            assignment, phase_iterations = self._run_phase(candidates, values, routes_ix, prices, epsilon)
+            iterations += phase_iterations
+
+            if epsilon <= final_epsilon:
+                break
+
+            epsilon = max(epsilon / settings.DISPATCHER_AUCTION_SCALING_FACTOR, final_epsilon)
+
+        self._save_prices(problem, candidates, values, routes_ix, prices, assignment, signatures)
+
+        for prospect_ix in assignment.values():
+            if prospect_ix >= 0:
+                solution[prospect_ix] = 1
+
+        return solution, iterations
+
+    @staticmethod
+    def route_signature(route: Route) -> Tuple:
+        """Method to obtain a key that identifies a route across epochs"""
+
+        return route.initial_prospect, tuple(sorted(route.orders.keys()))
+
+    def _initial_epsilon(
+            self,
+            problem: MatchingProblem,
+            candidates: Dict[int, np.ndarray],
+            values: np.ndarray,
+            routes_ix: np.ndarray,
+            prices: np.ndarray,
+            max_value: float,
+            final_epsilon: float
+    ) -> float:
+        """Method to establish the first epsilon, based on how far the warm-started prices are from equilibrium"""
+
+        cold_epsilon = max(max_value / settings.DISPATCHER_AUCTION_SCALING_FACTOR, final_epsilon)
+        gaps = [
+            abs(
+                self._courier_profits[problem.couriers[courier_ix].courier_id] -
+                max((values[prospects_ix] - prices[routes_ix[prospects_ix]]).max(), 0.)
+            )
+            for courier_ix, prospects_ix in candidates.items()
+            if problem.couriers[courier_ix].courier_id in self._courier_profits
+        ]
+
+        if not gaps:
+            return cold_epsilon
+
+        return min(max(max(gaps), final_epsilon), cold_epsilon)
+
+    def _run_phase(
+            self,
+            candidates: Dict[int, np.ndarray],
+            values: np.ndarray,
+            routes_ix: np.ndarray,
+            prices: np.ndarray,
+            epsilon: float
+    ) -> Tuple[Dict[int, int], int]:
+        """Method to run an auction phase for a fixed epsilon, repairing prices that were carried over"""
+
+        route_owners = np.full(len(prices), UNASSIGNED)
+        assignment = {courier_ix: UNASSIGNED for courier_ix in candidates.keys()}
+        iterations = self._bid(candidates, values, routes_ix, prices, epsilon, route_owners, assignment)
+
+        for _ in range(MAX_REPAIR_ROUNDS):
+            stale_routes = (route_owners == UNASSIGNED) & (prices > 0)
+            prices[stale_routes] = 0.
+            violators = self._find_violators(candidates, values, routes_ix, prices, epsilon, assignment)
+
+            if not violators:
+                return assignment, iterations
+
+            for courier_ix in violators:
+                if assignment[courier_ix] >= 0:
+                    route_owners[routes_ix[assignment[courier_ix]]] = UNASSIGNED
+
+                assignment[courier_ix] = UNASSIGNED
+
+            iterations += self._bid(candidates, values, routes_ix, prices, epsilon, route_owners, assignment)
+
+        prices[:] = 0.
+        route_owners[:] = UNASSIGNED
+        assignment = {courier_ix: UNASSIGNED for courier_ix in candidates.keys()}
+        iterations += self._bid(candidates, values, routes_ix, prices, epsilon, route_owners, assignment)
+
+        return assignment, iterations
+
+    @staticmethod
+    def _bid(
+            candidates: Dict[int, np.ndarray],
+            values: np.ndarray,
+            routes_ix: np.ndarray,
+            prices: np.ndarray,
+            epsilon: float,
+            route_owners: np.ndarray,
+            assignment: Dict[int, int]
+    ) -> int:
+        """Method to let unassigned couriers bid for routes until every courier is assigned or opts out"""
+
+        queue = deque(courier_ix for courier_ix, prospect_ix in assignment.items() if prospect_ix == UNASSIGNED)
+        iterations = 0
+
+        while queue:
+            courier_ix = queue.popleft()
+            iterations += 1
+            prospects_ix = candidates[courier_ix]
+            net_values = values[prospects_ix] - prices[routes_ix[prospects_ix]]
+            best_ix = int(np.argmax(net_values))
+            best_value = net_values[best_ix]
+
+            if best_value <= 0:
+                assignment[courier_ix] = OUTSIDE_OPTION
+                continue
+
+            second_value = np.delete(net_values, best_ix).max() if len(net_values) > 1 else 0.
+            route_ix = routes_ix[prospects_ix[best_ix]]
+            prices[route_ix] += best_value - max(second_value, 0.) + epsilon
+
+            previous_owner = route_owners[route_ix]
+            if previous_owner != UNASSIGNED:
+                assignment[previous_owner] = UNASSIGNED
+                queue.append(previous_owner)
+
+            route_owners[route_ix] = courier_ix
+            assignment[courier_ix] = prospects_ix[best_ix]
+
+        return iterations
+
+    @staticmethod
+    def _find_violators(
+            candidates: Dict[int, np.ndarray],
+            values: np.ndarray,
+            routes_ix: np.ndarray,
+            prices: np.ndarray,
+            epsilon: float,
+            assignment: Dict[int, int]
+    ) -> List[int]:
+        """Method to find the couriers that violate epsilon complementary slackness"""
+
+        violators = []
+        for courier_ix, prospects_ix in candidates.items():
+            best_value = max((values[prospects_ix] - prices[routes_ix[prospects_ix]]).max(), 0.)
+            prospect_ix = assignment[courier_ix]
+            profit = values[prospect_ix] - prices[routes_ix[prospect_ix]] if prospect_ix >= 0 else 0.
+
+            if profit < best_value - epsilon:
+                violators.append(courier_ix)
+
+        return violators
+
+    def _save_prices(
+            self,
+            problem: MatchingProblem,
+            candidates: Dict[int, np.ndarray],
+            values: np.ndarray,
+            routes_ix: np.ndarray,
+            prices: np.ndarray,
+            assignment: Dict[int, int],
+            signatures: List[Tuple]
+    ):
+        """Method to keep the route prices and courier profits to warm-start the next epoch"""
+
+        self._route_prices = {}
+        for signature, price in zip(signatures, prices):
+            self._route_prices[signature] = max(price, self._route_prices.get(signature, 0.))
+
+        self._courier_profits = {
+            problem.couriers[courier_ix].courier_id: (
+                values[assignment[courier_ix]] - prices[routes_ix[assignment[courier_ix]]]
+                if assignment[courier_ix] >= 0
+                else 0.
+            )
+            for courier_ix in candidates.keys()
+        }
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 import numpy as np
 from gurobipy import Var, Model, GRB
@@ -11,6 +11,12 @@ from services.optimization_service.model.model_builder import OptimizationModelB
 class GraphOptimizationModelBuilder(OptimizationModelBuilder):
     """Class that enables the construction of an optimization model for matching based on a network formulation"""
 
+    @staticmethod
+    def _problem_arrays(graph: Graph) -> List[np.ndarray]:
+        """Method to obtain the nodes, arcs and incidence matrix of the graph"""
+
+        return [graph.nodes, graph.arcs, graph.incidence_matrix]
+
     def _build_variables(self, graph: Graph, engine_model: Union[LpProblem, Model]) -> np.ndarray:
         """Method to build the model decision variables from the graph"""
 
@@ -32,7 +38,7 @@ class GraphOptimizationModelBuilder(OptimizationModelBuilder):
     ) -> Union[LpVariable, Var]:
         """Method to build a continuous boolean variable"""
 
-        if self._optimizer == 'pulp':
+        if self.optimizer == 'pulp':
             var = LpVariable(f'x({i}, {j})', 0, 1)
         else:
             var = engine_model.addVar(lb=0, ub=1, vtype=GRB.CONTINUOUS, name=f'x({i}, {j})')
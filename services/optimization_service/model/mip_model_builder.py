@@ -1,9 +1,10 @@
-from typing import Union
+from typing import Union, List, Optional
 
 import numpy as np
 from pulp import LpVariable, LpBinary, LpProblem
 from gurobipy import Model, Var, GRB
 
+from services.optimization_service.model.constraints.model_constraint import ModelConstraint
 from services.optimization_service.model.model_builder import OptimizationModelBuilder
 from services.optimization_service.problem.matching_problem import MatchingProblem
 
@@ -11,11 +12,35 @@ from services.optimization_service.problem.matching_problem import MatchingProbl
 class MIPOptimizationModelBuilder(OptimizationModelBuilder):
     """Class that enables the construction of an optimization model for matching"""
 
+    def __init__(
+            self,
+            sense: str,
+            model_constraints: List[ModelConstraint],
+            optimizer: Optional[str] = None,
+            relaxation: bool = False
+    ):
+        """Instantiates a builder using the desired sense and constraints, optionally relaxing integrality"""
+
+        super().__init__(sense, model_constraints, optimizer)
+        self._relaxation = relaxation
+
+    def _formulation(self) -> str:
+        """Method to describe the formulation the builder uses, which differs if it is relaxed"""
+
+        return f'{super()._formulation()}:{"relaxation" if self._relaxation else "integer"}'
+
+    @staticmethod
+    def _problem_arrays(problem: MatchingProblem) -> List[np.ndarray]:
+        """Method to obtain the prospects, establishing the variables and constraints, and their costs"""
+
+        return [problem.matching_prospects, problem.costs]
+
     def _build_variables(self, problem: MatchingProblem, engine_model: Union[LpProblem, Model]) -> np.ndarray:
-        """Method to build the model decision variables, which are integer variables"""
+        """Method to build the model decision variables, which are integer variables unless relaxed"""
 
+        build_var = self._build_cont_bool_var if self._relaxation else self._build_int_bool_var
         i, j = problem.matching_prospects['i'], problem.matching_prospects['j']
-        couriers_routes_vars = np.vectorize(self._build_int_bool_var, otypes=[np.object])(i, j, engine_model)
+        couriers_routes_vars = np.vectorize(build_var, otypes=[np.object])(i, j, engine_model)
 
         unique_routes = np.unique(j)
         supply_courier = np.array(['supply'])
@@ -23,7 +48,7 @@ class MIPOptimizationModelBuilder(OptimizationModelBuilder):
             np.array(np.meshgrid(supply_courier, unique_routes)).T.reshape(len(supply_courier) * len(unique_routes), 2),
             dtype='<U100'
         )
-        supply_routes_vars = np.vectorize(self._build_int_bool_var, otypes=[np.object])(
+        supply_routes_vars = np.vectorize(build_var, otypes=[np.object])(
             supply_routes_combinations[:, 0],
             supply_routes_combinations[:, 1],
             engine_model
@@ -50,9 +75,24 @@ class MIPOptimizationModelBuilder(OptimizationModelBuilder):
     ) -> Union[LpVariable, Var]:
         """Method to build an integer boolean variable"""
 
-        if self._optimizer == 'pulp':
+        if self.optimizer == 'pulp':
             var = LpVariable(f'x({i}, {j})', 0, 1, LpBinary)
         else:
             var = engine_model.addVar(lb=0, ub=1, vtype=GRB.BINARY, name=f'x({i}, {j})')
 
         return var
+
+    def _build_cont_bool_var(
+            self,
+            i: np.ndarray,
+            j: np.ndarray,
+            engine_model: Union[LpProblem, Model]
+    ) -> Union[LpVariable, Var]:
+        """Method to build a continuous boolean variable, used for the linear relaxation"""
+
+        if self.optimizer == 'pulp':
+            var = LpVariable(f'x({i}, {j})', 0, 1)
+        else:
+            var = engine_model.addVar(lb=0, ub=1, vtype=GRB.CONTINUOUS, name=f'x({i}, {j})')
+
+        return var
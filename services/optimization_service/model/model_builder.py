@@ -1,4 +1,5 @@
-from typing import List, Union
+from hashlib import sha1
+from typing import List, Union, Optional
 
 import numpy as np
 from gurobipy import Constr, GRB, Model, Env
@@ -6,25 +7,39 @@ from pulp import LpConstraint, LpMinimize, LpMaximize, LpProblem
 
 from services.optimization_service.model.constraints.model_constraint import ModelConstraint
 from services.optimization_service.model.optimization_model import OptimizationModel
+from services.optimization_service.model.solver_session import SolverSession
+from settings import settings
 
 
 class OptimizationModelBuilder:
     """Class that enables the construction of an optimization model for matching"""
 
-    def __init__(self, sense: str, model_constraints: List[ModelConstraint], optimizer: str):
-        """Instantiates a builder using the desired sense and constraints"""
+    def __init__(self, sense: str, model_constraints: List[ModelConstraint], optimizer: Optional[str] = None):
+        """Instantiates a builder using the desired sense, constraints and optimizer, or the one in the settings"""
 
         self._sense = sense
         self._model_constraints = model_constraints
         self._optimizer = optimizer
 
-    def build(self, *args) -> OptimizationModel:
-        """Main method for building an optimization model"""
+    @property
+    def optimizer(self) -> str:
+        """Property with the builder's optimizer, read from the settings when a model is built if it has none"""
 
-        if self._optimizer == 'pulp':
+        return self._optimizer if self._optimizer is not None else settings.OPTIMIZER
+
+    def build(self, *args, session: Optional[SolverSession] = None) -> OptimizationModel:
+        """Main method for building an optimization model, reusing the solver session if it is open"""
+
+        session = session if session is not None and session.optimizer == self.optimizer else None
+
+        if self.optimizer == 'pulp':
             sense = LpMinimize if self._sense == 'min' else LpMaximize
             engine_model = LpProblem('problem', sense)
 
+        elif session is not None:
+            sense = GRB.MINIMIZE if self._sense == 'min' else GRB.MAXIMIZE
+            engine_model = session.gurobi_model()
+
         else:
             sense = GRB.MINIMIZE if self._sense == 'min' else GRB.MAXIMIZE
             env = Env(empty=True)
@@ -40,11 +55,36 @@ class OptimizationModelBuilder:
             constraints=constraints,
             engine_model=engine_model,
             objective=objective,
-            optimizer=self._optimizer,
+            optimizer=self.optimizer,
             sense=sense,
             variable_set=variable_set,
+            session=session,
+            digest=self._digest(args[0])
         )
 
+    def _digest(self, *args) -> str:
+        """Method to obtain a digest of the model: its formulation and the ids, costs and structure of its problem"""
+
+        constraints = [type(model_constraint).__name__ for model_constraint in self._model_constraints]
+        digest = sha1(f'{self.optimizer}:{self._formulation()}:{constraints}'.encode())
+
+        for array in self._problem_arrays(*args):
+            array = np.ascontiguousarray(array)
+            digest.update(f'{array.dtype}:{array.shape}'.encode())
+            digest.update(array.tobytes())
+
+        return digest.hexdigest()
+
+    def _formulation(self) -> str:
+        """Method to describe the formulation the builder uses, beyond its constraints"""
+
+        return f'{type(self).__name__}:{self._sense}'
+
+    def _problem_arrays(self, *args, **kwargs) -> List[np.ndarray]:
+        """Method to obtain the arrays of the problem that establish the variables, costs and constraints"""
+
+        pass
+
     def _build_variables(self, *args, **kwargs) -> np.ndarray:
         """Method to build the model decision variables"""
 
@@ -5,7 +5,11 @@ import numpy as np
 from gurobipy import GRB, Model, Var, Constr
 from pulp import LpProblem, LpConstraint, LpVariable, value, PULP_CBC_CMD, LpStatusOptimal
 
+from services.checkpoint_service import CHECKPOINT_SERVICE
+from services.optimization_service.model.solver_session import SolverSession
+
 SOLUTION_VALUE = 0.99
+INTEGRALITY_TOLERANCE = 1e-6
 
 
 @dataclass
@@ -18,16 +22,30 @@ class OptimizationModel:
     optimizer: str
     sense: int
     variable_set: np.ndarray
+    session: Optional[SolverSession] = None
+    digest: str = ''
 
     def solve(self):
-        """Method for solving the optimization model"""
+        """Method for solving the optimization model, replaying the solution if the simulation resumes"""
+
+        return CHECKPOINT_SERVICE.fetch(
+            kind='solution',
+            key=self.digest,
+            compute=self._solve,
+            encode=lambda solution: solution.tolist(),
+            decode=np.array
+        )
+
+    def _solve(self) -> np.ndarray:
+        """Method for solving the optimization model with the optimizer's engine"""
 
         if self.optimizer == 'pulp':
             for constraint in self.constraints:
                 self.engine_model += constraint
 
             self.engine_model += self.objective
-            status = self.engine_model.solve(PULP_CBC_CMD(msg=False))
+            solver = self.session.pulp_solver() if self.session is not None else PULP_CBC_CMD(msg=False)
+            status = self.engine_model.solve(solver)
             solution = (
                 np.vectorize(self._var_sol)(self.variable_set)
                 if status == LpStatusOptimal
@@ -48,6 +66,12 @@ class OptimizationModel:
 
         return solution
 
+    @staticmethod
+    def is_integral(solution: np.ndarray) -> bool:
+        """Method to establish if a solution is integral, in which case the relaxation solved the integer model"""
+
+        return bool(solution.tolist()) and bool(np.all(np.abs(solution - np.round(solution)) <= INTEGRALITY_TOLERANCE))
+
     def _var_sol(self, var: Union[LpVariable, Var]) -> float:
         """Method to obtain the solution of a decision variable"""
 
@@ -0,0 +1,75 @@
+import shutil
+import tempfile
+from typing import Optional
+
+from gurobipy import Env, Model
+from pulp import PULP_CBC_CMD
+
+
+class SolverSession:
+    """Class that keeps the solver environment warm for the whole simulation run"""
+
+    def __init__(self):
+        """Instantiates a closed session"""
+
+        self._optimizer: Optional[str] = None
+        self._env: Optional[Env] = None
+        self._model: Optional[Model] = None
+        self._pulp_solver: Optional[PULP_CBC_CMD] = None
+        self._tmp_dir: Optional[str] = None
+
+    @property
+    def optimizer(self) -> Optional[str]:
+        """Property with the optimizer the session was opened for, if it is open"""
+
+        return self._optimizer
+
+    def open(self, optimizer: str):
+        """Method to start the solver environment, which is reused by every dispatch epoch"""
+
+        if self._optimizer is not None:
+            self.close()
+
+        self._optimizer = optimizer
+
+        if optimizer == 'pulp':
+            self._tmp_dir = tempfile.mkdtemp(prefix='mdrp_sim_')
+            self._pulp_solver = PULP_CBC_CMD(msg=False)
+            self._pulp_solver.tmpDir = self._tmp_dir
+
+        else:
+            self._env = Env(empty=True)
+            self._env.setParam('OutputFlag', 0)
+            self._env.start()
+            self._model = Model('problem', env=self._env)
+
+    def close(self):
+        """Method to release the solver environment and its scratch files"""
+
+        if self._model is not None:
+            self._model.dispose()
+
+        if self._env is not None:
+            self._env.dispose()
+
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+        self._optimizer, self._env, self._model, self._pulp_solver, self._tmp_dir = None, None, None, None, None
+
+    def pulp_solver(self) -> PULP_CBC_CMD:
+        """Method to obtain the CBC command, which writes its scratch files to the session directory"""
+
+        return self._pulp_solver
+
+    def gurobi_model(self) -> Model:
+        """Method to obtain the session model, emptied from the variables and constraints of the previous epoch"""
+
+        self._model.remove(self._model.getConstrs())
+        self._model.remove(self._model.getVars())
+        self._model.update()
+
+        return self._model
+
+
+SOLVER_SESSION = SolverSession()
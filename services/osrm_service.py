@@ -1,13 +1,13 @@
 import logging
-from typing import Tuple, Dict, Any
+from typing import Tuple, Optional, List
 
 import requests
 from haversine import haversine
 
 from objects.location import Location
 from objects.route import Route
-from objects.stop import Stop
-from objects.vehicle import Vehicle
+from objects.vehicle import Vehicle, VehicleTimes
+from services.checkpoint_service import CHECKPOINT_SERVICE
 
 
 class OSRMService:
@@ -17,7 +17,19 @@ class OSRMService:
 
     @classmethod
     def get_route(cls, origin: Location, destination: Location) -> Route:
-        """Method to obtain a movement route using docker-mounted OSRM"""
+        """Method to obtain a movement route using docker-mounted OSRM, replaying it if the simulation resumes"""
+
+        return CHECKPOINT_SERVICE.fetch(
+            kind='route',
+            key=f'{origin.coordinates};{destination.coordinates}',
+            compute=lambda: cls._request_route(origin, destination),
+            encode=cls._encode_route,
+            decode=cls._decode_route
+        )
+
+    @classmethod
+    def _request_route(cls, origin: Location, destination: Location) -> Route:
+        """Method to request a movement route from docker-mounted OSRM"""
 
         lat_0, lng_0 = origin.coordinates
         lat_1, lng_1 = destination.coordinates
@@ -31,53 +43,53 @@ class OSRMService:
                 response_data = response.json()
                 steps = response_data.get('routes', [])[0].get('legs', [])[0].get('steps', [])
 
-                stops = []
-                for ix, step in enumerate(steps):
+                locations = []
+                for step in steps:
                     lng, lat = step.get('maneuver', {}).get('location', [])
-                    stop = Stop(
-                        location=Location(lat=lat, lng=lng),
-                        position=ix
-                    )
-                    stops.append(stop)
+                    locations.append(Location(lat=lat, lng=lng))
 
-                return Route(stops=stops)
+                return Route.from_locations(locations)
 
         except:
             logging.exception('Exception captured in OSRMService.get_route. Check Docker.')
 
-            return Route(
-                stops=[
-                    Stop(
-                        location=origin,
-                        position=0
-                    ),
-                    Stop(
-                        location=destination,
-                        position=1
-                    )
-                ]
-            )
+            return Route.from_locations([origin, destination])
+
+    @staticmethod
+    def _encode_route(route: Optional[Route]) -> Optional[List[Optional[Tuple[float, float]]]]:
+        """Method to encode a route as the coordinates of its stops, to journal it"""
+
+        if route is None:
+            return None
+
+        locations = [route.stop_location(position) for position in range(route.num_stops)]
+
+        return [location.coordinates if location is not None else None for location in locations]
+
+    @staticmethod
+    def _decode_route(coordinates: Optional[List[Optional[List[float]]]]) -> Optional[Route]:
+        """Method to decode a journaled route from the coordinates of its stops"""
+
+        if coordinates is None:
+            return None
+
+        return Route.from_locations([Location(*location) if location is not None else None for location in coordinates])
 
     @classmethod
     def estimate_route_properties(cls, origin: Location, route: Route, vehicle: Vehicle) -> Tuple[float, float]:
         """Method to estimate the distance and time it would take to fulfill a route from an origin"""
 
-        complete_route = Route(
-            stops=[
-                      Stop(location=origin, position=0)
-                  ] + [
-                      Stop(location=stop.location, position=ix + 1)
-                      for ix, stop in enumerate(route.stops)
-                  ]
+        complete_route = Route.from_locations(
+            [origin] + [route.stop_location(position) for position in range(route.num_stops)]
         )
 
         route_distance, route_time = 0, 0
 
         try:
-            for ix in range(len(complete_route.stops) - 1):
+            for ix in range(complete_route.num_stops - 1):
                 distance, time = cls.estimate_travelling_properties(
-                    origin=complete_route.stops[ix].location,
-                    destination=complete_route.stops[ix + 1].location,
+                    origin=complete_route.stop_location(ix),
+                    destination=complete_route.stop_location(ix + 1),
                     vehicle=vehicle
                 )
                 route_distance += distance
@@ -104,24 +116,11 @@ class OSRMService:
 
         except:
             logging.exception('Exception captured in OSRMService.estimate_travelling_properties. Check Docker.')
-            travelling_route = Route(
-                stops=[
-                    Stop(
-                        location=origin,
-                        position=0
-                    ),
-                    Stop(
-                        location=destination,
-                        position=1
-                    )
-                ]
-            )
-
-        for travelling_ix in range(len(travelling_route.stops) - 1):
-            distance = haversine(
-                point1=travelling_route.stops[travelling_ix].location.coordinates,
-                point2=travelling_route.stops[travelling_ix + 1].location.coordinates
-            )
+            travelling_route = Route.from_locations([origin, destination])
+
+        coordinates = travelling_route.stop_coordinates.tolist()
+        for travelling_ix in range(len(coordinates) - 1):
+            distance = haversine(point1=coordinates[travelling_ix], point2=coordinates[travelling_ix + 1])
             time = int(distance / vehicle.average_velocity)
 
             route_distance += distance
@@ -134,12 +133,12 @@ class OSRMService:
             cls,
             origin: Location,
             destination: Location,
-            time: Dict[Any, float],
+            time: VehicleTimes,
             service_time: float
     ):
         """Method to estimate route times for vehicles"""
 
-        for v in time.keys():
+        for v in Vehicle:
             try:
                 _, time_estimation = cls.estimate_travelling_properties(
                     origin=origin,
@@ -55,11 +55,17 @@ settings = Settings({
     'SEED': 8795,
     # str = Optimizer to use. Options: ['pulp', 'gurobi']
     'OPTIMIZER': 'pulp',
+    # --- str = Query the instance data every second or load it at once. Options: ['polling', 'bulk', 'csv', 'memmap']
+    'INSTANCE_INGESTION': 'polling',
+    # --- bool = Archive the metric fields of finished orders and logged off couriers into columns, releasing them
+    'ARCHIVAL_MODE': False,
+    # --- Optional[float] = Sim time [sec] between checkpoints of the simulation journal, to resume it. None disables it
+    'CHECKPOINT_INTERVAL': None,
 
     # Simulation Constants
     # --- time =  Simulate from this time on
     'SIMULATE_FROM': time(0, 0, 0),
-    # --- time =  Simulate until this time
+    # --- time =  Simulate until this time, on the next day if it is earlier than SIMULATE_FROM
     'SIMULATE_UNTIL': time(10, 0, 0),
     # --- time =  Create new users to submit orders from this time
     'CREATE_USERS_FROM': time(9, 0, 0),
@@ -81,7 +87,9 @@ settings = Settings({
     'DISPATCHER_PREPOSITIONING_EVALUATION_POLICY': 'fixed',
     # --- str = Policy for executing prepositioning. Options: ['naive']
     'DISPATCHER_PREPOSITIONING_POLICY': 'naive',
-    # --- str = Policy for matching. Options: ['greedy', 'mdrp', 'mdrp_graph', 'mdrp_graph_prospects', 'modified_mdrp']
+    # --- str = Policy for matching. Options: ['greedy', 'mdrp', 'mdrp_graph', 'mdrp_graph_prospects', 'modified_mdrp',
+    # 'mdrp_incremental', 'modified_mdrp_incremental', 'mdrp_auction', 'modified_mdrp_auction',
+    # 'modified_mdrp_sweep']
     'DISPATCHER_MATCHING_POLICY': 'mdrp',
 
     # Simulation Policies - Courier
@@ -123,6 +131,14 @@ settings = Settings({
     'DISPATCHER_GEOHASH_PRECISION_GROUPING': 8,
     # float = Constant penalty for delays in the pick up of a bundle of orders
     'DISPATCHER_DELAY_PENALTY': 0.4,
+    # int = Time window [sec] to cluster orders by ready time when sweeping bundles
+    'DISPATCHER_SWEEP_READY_WINDOW': min_to_sec(5),
+    # bool = Solve the linear relaxation of the MIP matcher first, falling back to the MIP if it is not integral
+    'DISPATCHER_MIP_LP_RELAXATION': False,
+    # float = Final epsilon of the auction matcher, relative to the highest matching value
+    'DISPATCHER_AUCTION_EPSILON': 1e-4,
+    # float = Factor by which the epsilon of the auction matcher is reduced between phases
+    'DISPATCHER_AUCTION_SCALING_FACTOR': 4,
 
     # Simulation Policies Configuration - Courier - Acceptance Policy
     # --- float = Minimum acceptance rate for any courier
@@ -1,25 +1,144 @@
-import random
-
-from simpy import Environment
+import argparse
+import os
+import sys
+from typing import List
 
+from runner.experiment import Experiment, ExperimentState, EXPERIMENT_STATE_FILE
+from runner.job_queue import JobQueue
+from runner.simulation_job import SimulationJob, SimulationResult
+from runner.simulation_runner import SimulationRunner, MetricsWriter
+from runner.warm_up_fork import warm_up_jobs
 from settings import settings
-from actors.world import World
-from services.metrics_service import MetricsService
-from utils.datetime_utils import time_to_sec
 from utils.logging_utils import configure_logs
+from utils.random_utils import replication_seeds
+
+
+def parse_args() -> argparse.Namespace:
+    """Method to parse the command line arguments, which default to the values in the settings"""
+
+    parser = argparse.ArgumentParser(description='Simulate the Meal Delivery Routing Problem')
+    parser.add_argument('--instances', type=int, nargs='+', default=settings.INSTANCES, help='Instances to simulate')
+    parser.add_argument(
+        '--policies',
+        nargs='+',
+        default=[settings.DISPATCHER_MATCHING_POLICY],
+        help='Dispatcher matching policies to simulate each instance with'
+    )
+    parser.add_argument('--seeds', type=int, nargs='+', default=[settings.SEED], help='Seeds to repeat each run with')
+    parser.add_argument(
+        '--replications',
+        type=int,
+        help='Number of replications, run instead of the seeds. Policies share the seed of a replication'
+    )
+    parser.add_argument('--workers', type=int, default=1, help='Number of simulations to run in parallel')
+    parser.add_argument(
+        '--warm-up-fork',
+        action='store_true',
+        help='Simulate the warm-up once per instance and seed, forking it into the runs that differ only afterwards'
+    )
+    parser.add_argument(
+        '--warm-up-policy',
+        help='Dispatcher matching policy to simulate the warm-up with when forking it, instead of the base one, if the '
+             'runs differ in their policy'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Resume the simulations from the latest checkpoint of their journals, if CHECKPOINT_INTERVAL is set'
+    )
+    parser.add_argument(
+        '--experiment',
+        help='Path to a .json sweep specification, run instead of the instances, policies and seeds, resuming if needed'
+    )
+
+    parser.add_argument(
+        '--queue',
+        choices=['enqueue', 'work', 'progress', 'retry'],
+        help='Use the job queue shared by several nodes: enqueue the jobs, work on the queued jobs, show the progress '
+             'or queue the failed jobs again, of the experiment if one is given'
+    )
+    parser.add_argument('--queue-url', help='URL of the job queue, such as a SQLite file, instead of the DDBB')
+
+    return parser.parse_args()
+
+
+def command_line_jobs(args: argparse.Namespace) -> List[SimulationJob]:
+    """Method to obtain the jobs of the instances, policies and seeds given in the command line"""
+
+    seeds = replication_seeds(args.replications) if args.replications is not None else args.seeds
+
+    return [
+        SimulationJob(instance=instance, seed=seed, settings={'DISPATCHER_MATCHING_POLICY': policy})
+        for instance in args.instances
+        for policy in args.policies
+        for seed in seeds
+    ]
+
 
 if __name__ == '__main__':
     """Main method for running the mdrp-sim"""
 
     configure_logs()
+    args = parse_args()
+
+    if args.queue is not None:
+        queue = JobQueue(url=args.queue_url)
+        experiment = Experiment.from_file(args.experiment) if args.experiment is not None else None
+        run_id = experiment.run_id if experiment is not None else None
+        failed_jobs = []
+
+        if args.queue == 'enqueue':
+            queue.enqueue(experiment.jobs() if experiment is not None else command_line_jobs(args))
+
+        elif args.queue == 'work':
+            metrics_writer = MetricsWriter()
+            failed_jobs = SimulationRunner(workers=args.workers).run_queue(queue, on_result=metrics_writer)
+            metrics_writer.close()
+
+        elif args.queue == 'progress':
+            print(queue.progress(run_id=run_id))
+
+        else:
+            queue.retry_failed(run_id=run_id)
+
+        queue.close()
+        sys.exit(1 if bool(failed_jobs) else 0)
+
+    metrics_writer = MetricsWriter()
+
+    if args.experiment is not None:
+        experiment = Experiment.from_file(args.experiment)
+        state_file = EXPERIMENT_STATE_FILE.format(run_id=experiment.run_id)
+        state = ExperimentState(file_path=os.path.join(os.path.dirname(args.experiment), state_file))
+        jobs = state.pending(experiment.jobs())
+
+        def on_result(result: SimulationResult):
+            """Saves the metrics of a job before recording it as finished"""
+
+            metrics_writer(result)
+            state(result)
+
+    else:
+        jobs = command_line_jobs(args)
+        on_result = metrics_writer
 
-    for instance in settings.INSTANCES:
-        random.seed(settings.SEED)
+    for job in jobs:
+        job.resume = args.resume
 
-        env = Environment(initial_time=time_to_sec(settings.SIMULATE_FROM))
-        world = World(env=env, instance=instance)
-        env.run(until=time_to_sec(settings.SIMULATE_UNTIL))
-        world.post_process()
+    runner = SimulationRunner(workers=args.workers)
+    failed_jobs = (
+        runner.run_warm_up(
+            warm_up_jobs(
+                jobs,
+                warm_up_settings=(
+                    {'DISPATCHER_MATCHING_POLICY': args.warm_up_policy} if args.warm_up_policy is not None else None
+                )
+            ),
+            on_result=on_result
+        )
+        if args.warm_up_fork
+        else runner.run(jobs, on_result=on_result)
+    )
+    metrics_writer.close()
 
-        metrics_service = MetricsService(instance=instance)
-        metrics_service.calculate_and_save_metrics(world.dispatcher)
+    sys.exit(1 if bool(failed_jobs) else 0)
@@ -19,7 +19,7 @@ from policies.courier.acceptance.random_uniform import UniformAcceptancePolicy
 from policies.courier.movement.osrm import OSRMMovementPolicy
 from policies.courier.movement_evaluation.geohash_neighbors import NeighborsMoveEvalPolicy
 from tests.test_utils import DummyMatchingPolicy, mocked_get_route
-from utils.datetime_utils import min_to_sec, hour_to_sec, sec_to_hour, time_diff
+from utils.datetime_utils import min_to_sec, hour_to_sec, sec_to_hour, time_to_sec
 
 
 class TestsCourier(unittest.TestCase):
@@ -33,10 +33,10 @@ class TestsCourier(unittest.TestCase):
     order_id = 0
     pick_up_at = Location(lat=4.689697, lng=-74.055495)
     drop_off_at = Location(lat=4.690296, lng=-74.043929)
-    placement_time = time(12, 0, 0)
-    expected_drop_off_time = time(12, 40, 0)
-    preparation_time = time(12, 2, 0)
-    ready_time = time(12, 12, 0)
+    placement_time = time_to_sec(time(12, 0, 0))
+    expected_drop_off_time = time_to_sec(time(12, 40, 0))
+    preparation_time = time_to_sec(time(12, 2, 0))
+    ready_time = time_to_sec(time(12, 12, 0))
 
     # Services to be reused
     acceptance_policy = UniformAcceptancePolicy()
@@ -50,8 +50,8 @@ class TestsCourier(unittest.TestCase):
 
         # Constants
         random.seed(187)
-        on_time = time(0, 0, 0)
-        off_time = time(5, 0, 0)
+        on_time = time_to_sec(time(0, 0, 0))
+        off_time = time_to_sec(time(5, 0, 0))
 
         # Services
         env = Environment()
@@ -84,9 +84,9 @@ class TestsCourier(unittest.TestCase):
         """Test to evaluate how a courier moves with dummy movement"""
 
         # Constants
-        random.seed(365)
-        on_time = time(0, 0, 0)
-        off_time = time(5, 0, 0)
+        movement_evaluation_stream = random.Random(365)
+        on_time = time_to_sec(time(0, 0, 0))
+        off_time = time_to_sec(time(5, 0, 0))
 
         env = Environment()
         dispatcher = Dispatcher(env=env, matching_policy=DummyMatchingPolicy())
@@ -102,7 +102,8 @@ class TestsCourier(unittest.TestCase):
             vehicle=self.vehicle,
             location=self.start_location,
             on_time=on_time,
-            off_time=off_time
+            off_time=off_time,
+            movement_evaluation_stream=movement_evaluation_stream
         )
         env.run(until=hour_to_sec(4) + min_to_sec(5))
 
@@ -121,8 +122,8 @@ class TestsCourier(unittest.TestCase):
         random.seed(126)
         initial_time = hour_to_sec(12)
         time_delta = min_to_sec(40)
-        on_time = time(12, 0, 0)
-        off_time = time(13, 0, 0)
+        on_time = time_to_sec(time(12, 0, 0))
+        off_time = time_to_sec(time(13, 0, 0))
 
         # Services
         env = Environment(initial_time=initial_time)
@@ -201,8 +202,8 @@ class TestsCourier(unittest.TestCase):
 
         # Constants
         random.seed(122)
-        on_time = time(12, 0, 0)
-        off_time = time(15, 0, 0)
+        on_time = time_to_sec(time(12, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
 
         # Services
         env = Environment(initial_time=hour_to_sec(12))
@@ -281,8 +282,8 @@ class TestsCourier(unittest.TestCase):
 
         # Constants
         random.seed(184)
-        on_time = time(12, 0, 0)
-        off_time = time(15, 0, 0)
+        on_time = time_to_sec(time(12, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
 
         # Services
         env = Environment(initial_time=hour_to_sec(12) + min_to_sec(12))
@@ -397,8 +398,8 @@ class TestsCourier(unittest.TestCase):
 
         # Constants
         random.seed(4747474)
-        on_time = time(12, 0, 0)
-        off_time = time(15, 0, 0)
+        on_time = time_to_sec(time(12, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
 
         # Services
         env = Environment(initial_time=hour_to_sec(12) + min_to_sec(12))
@@ -510,8 +511,8 @@ class TestsCourier(unittest.TestCase):
 
         # Constants
         random.seed(888)
-        on_time = time(8, 0, 0)
-        off_time = time(14, 0, 0)
+        on_time = time_to_sec(time(8, 0, 0))
+        off_time = time_to_sec(time(14, 0, 0))
         initial_time = hour_to_sec(8)
 
         # Verifies for two test cases the scheduling of the courier logging off works correctly.
@@ -555,8 +556,8 @@ class TestsCourier(unittest.TestCase):
 
         # Constants
         random.seed(523)
-        on_time = time(0, 0, 0)
-        off_time = time(2, 0, 0)
+        on_time = time_to_sec(time(0, 0, 0))
+        off_time = time_to_sec(time(2, 0, 0))
 
         # Services
         env = Environment()
@@ -580,7 +581,7 @@ class TestsCourier(unittest.TestCase):
         courier.earnings = courier._calculate_earnings()
         self.assertEqual(
             courier.earnings,
-            sec_to_hour(time_diff(courier.off_time, courier.on_time)) * settings.COURIER_EARNINGS_PER_HOUR
+            sec_to_hour(courier.off_time - courier.on_time) * settings.COURIER_EARNINGS_PER_HOUR
         )
 
     @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
@@ -592,8 +593,8 @@ class TestsCourier(unittest.TestCase):
         random.seed(348)
         initial_time = hour_to_sec(17)
         time_delta = min_to_sec(10)
-        on_time = time(17, 0, 0)
-        off_time = time(17, 30, 0)
+        on_time = time_to_sec(time(17, 0, 0))
+        off_time = time_to_sec(time(17, 30, 0))
 
         # Services
         env = Environment(initial_time=initial_time)
@@ -645,8 +646,8 @@ class TestsCourier(unittest.TestCase):
 
         # Constants
         random.seed(672)
-        on_time = time(6, 0, 0)
-        off_time = time(8, 0, 0)
+        on_time = time_to_sec(time(6, 0, 0))
+        off_time = time_to_sec(time(8, 0, 0))
 
         # Services
         env = Environment(initial_time=hour_to_sec(6))
@@ -696,8 +697,8 @@ class TestsCourier(unittest.TestCase):
 
         # Constants
         random.seed(290)
-        on_time = time(6, 0, 0)
-        off_time = time(8, 0, 0)
+        on_time = time_to_sec(time(6, 0, 0))
+        off_time = time_to_sec(time(8, 0, 0))
 
         # Services
         env = Environment(initial_time=hour_to_sec(6))
@@ -717,14 +718,14 @@ class TestsCourier(unittest.TestCase):
             on_time=on_time,
             off_time=off_time
         )
-        order = Order(ready_time=time(6, 15, 0), order_id=23)
+        order = Order(ready_time=time_to_sec(time(6, 15, 0)), order_id=23)
         stop = Stop(orders={order.order_id: order}, type=StopType.PICK_UP)
         env.process(courier._execute_stop(stop))
         dispatcher.state.interrupt()
 
         # Run until there are no more events and assert the courier experienced waiting time.
         env.run(until=hour_to_sec(7))
-        self.assertTrue(order.pick_up_time >= time(6, int(order.ready_time.minute + order.pick_up_service_time / 60)))
+        self.assertTrue(order.pick_up_time >= order.ready_time + order.pick_up_service_time)
 
         # For another test, if the order's ready time has expired, the courier doesn't experience waiting time
         env = Environment(initial_time=hour_to_sec(6))
@@ -742,11 +743,9 @@ class TestsCourier(unittest.TestCase):
             on_time=on_time,
             off_time=off_time
         )
-        order = Order(ready_time=time(4, 0, 0), order_id=23)
+        order = Order(ready_time=time_to_sec(time(4, 0, 0)), order_id=23)
         stop = Stop(orders={order.order_id: order}, type=StopType.PICK_UP)
         env.process(courier._execute_stop(stop))
         dispatcher.state.interrupt()
         env.run(until=hour_to_sec(7))
-        self.assertTrue(
-            time(order.pick_up_time.hour, order.pick_up_time.minute) <= time(6, int(order.pick_up_service_time / 60))
-        )
+        self.assertTrue(order.pick_up_time <= hour_to_sec(6) + order.pick_up_service_time)
@@ -1,6 +1,6 @@
 import random
 import unittest
-from datetime import time, timedelta, datetime, date
+from datetime import time
 from unittest.mock import patch
 
 from simpy import Environment
@@ -10,15 +10,17 @@ from actors.courier import Courier
 from actors.dispatcher import Dispatcher
 from actors.user import User
 from objects.location import Location
+from objects.metrics_archive import MetricsArchive
 from objects.notification import Notification, NotificationType
 from objects.order import Order
+from objects.order_index import OrderState
 from objects.route import Route
 from objects.stop import Stop, StopType
 from policies.dispatcher.buffering.rolling_horizon import RollingBufferingPolicy
 from policies.dispatcher.cancellation.static import StaticCancellationPolicy
 from policies.user.cancellation.random import RandomCancellationPolicy
 from tests.test_utils import mocked_get_route, DummyMatchingPolicy
-from utils.datetime_utils import min_to_sec, sec_to_time, hour_to_sec
+from utils.datetime_utils import min_to_sec, hour_to_sec, time_to_sec
 
 
 class TestsDispatcher(unittest.TestCase):
@@ -28,10 +30,10 @@ class TestsDispatcher(unittest.TestCase):
     order_id = 0
     pick_up_at = Location(lat=4.689697, lng=-74.055495)
     drop_off_at = Location(lat=4.690296, lng=-74.043929)
-    placement_time = time(12, 0, 0)
-    expected_drop_off_time = time(12, 40, 0)
-    preparation_time = time(12, 1, 0)
-    ready_time = time(12, 11, 0)
+    placement_time = time_to_sec(time(12, 0, 0))
+    expected_drop_off_time = time_to_sec(time(12, 40, 0))
+    preparation_time = time_to_sec(time(12, 1, 0))
+    ready_time = time_to_sec(time(12, 11, 0))
 
     # Services to be reused
     cancellation_policy = RandomCancellationPolicy()
@@ -83,12 +85,11 @@ class TestsDispatcher(unittest.TestCase):
         self.assertIn(self.order_id, dispatcher.canceled_orders.keys())
         self.assertEqual(
             user.order.cancellation_time,
-            (
-                    datetime.combine(date.today(), self.preparation_time) +
-                    timedelta(seconds=settings.DISPATCHER_WAIT_TO_CANCEL)
-            ).time()
+            self.preparation_time + settings.DISPATCHER_WAIT_TO_CANCEL
         )
         self.assertEqual(user.condition, 'canceled')
+        self.assertEqual(dispatcher.scheduled_cancellation_evaluation_orders, {})
+        self.assertEqual(dispatcher.order_deadlines, {})
 
     @patch('settings.settings.USER_CANCELLATION_PROBABILITY', 0)
     @patch('settings.settings.USER_WAIT_TO_CANCEL', min_to_sec(44))
@@ -131,15 +132,17 @@ class TestsDispatcher(unittest.TestCase):
         self.assertEqual(dispatcher.assigned_orders, {self.order_id: user.order})
         self.assertEqual(dispatcher.unassigned_orders, {})
         self.assertEqual(user.condition, 'waiting')
+        self.assertEqual(dispatcher.scheduled_cancellation_evaluation_orders, {})
+        self.assertEqual(dispatcher.order_deadlines, {})
 
     def test_order_submitted_event(self):
         """Test to verify the mechanics of the order submitted event"""
 
         # Constants
         initial_time = hour_to_sec(15)
-        placement_time = time(15, 0, 0)
-        preparation_time = time(15, 1, 0)
-        ready_time = time(15, 15, 0)
+        placement_time = time_to_sec(time(15, 0, 0))
+        preparation_time = time_to_sec(time(15, 1, 0))
+        ready_time = time_to_sec(time(15, 15, 0))
 
         # Services
         env = Environment(initial_time=initial_time)
@@ -172,7 +175,7 @@ class TestsDispatcher(unittest.TestCase):
 
         # Verify order properties are modified
         self.assertEqual(order.state, 'picked_up')
-        self.assertEqual(order.pick_up_time, sec_to_time(initial_time))
+        self.assertEqual(order.pick_up_time, initial_time)
 
     @patch('settings.settings.COURIER_MOVEMENT_PROBABILITY', 0.01)
     def test_orders_dropped_off_event(self):
@@ -180,8 +183,8 @@ class TestsDispatcher(unittest.TestCase):
 
         # Constants
         initial_time = hour_to_sec(14)
-        on_time = time(14, 0, 0)
-        off_time = time(16, 0, 0)
+        on_time = time_to_sec(time(14, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
 
         # Services
         env = Environment(initial_time=initial_time)
@@ -196,18 +199,50 @@ class TestsDispatcher(unittest.TestCase):
 
         # Verify order properties are modified and it is allocated correctly
         self.assertEqual(order.state, 'dropped_off')
-        self.assertEqual(order.drop_off_time, sec_to_time(initial_time))
+        self.assertEqual(order.drop_off_time, initial_time)
         self.assertIn(order.order_id, dispatcher.fulfilled_orders.keys())
         self.assertEqual(dispatcher.assigned_orders, {})
         self.assertIn(order.order_id, courier.fulfilled_orders)
 
+    @patch('settings.settings.COURIER_MOVEMENT_PROBABILITY', 0.01)
+    def test_archival_mode(self):
+        """Test to verify the dispatcher archives finished orders and logged off couriers, releasing them"""
+
+        # Constants
+        initial_time = hour_to_sec(14)
+        on_time = time_to_sec(time(14, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
+
+        # Services
+        env = Environment(initial_time=initial_time)
+        dispatcher = Dispatcher(env=env, matching_policy=DummyMatchingPolicy(), metrics_archive=MetricsArchive())
+
+        # Test 1: a dropped off order is archived and released, but still counts as fulfilled and processed
+        order = Order(order_id=45, user=User(env=env))
+        dispatcher.assigned_orders[order.order_id] = order
+        courier = Courier(env=env, dispatcher=dispatcher, courier_id=8, on_time=on_time, off_time=off_time)
+        dispatcher.orders_dropped_off_event(orders={order.order_id: order}, courier=courier)
+        self.assertEqual(dispatcher.fulfilled_orders, {})
+        self.assertEqual(dispatcher.order_index.count(OrderState.FULFILLED), 1)
+        self.assertTrue(dispatcher.order_index.is_processed(order.order_id))
+        self.assertEqual(dispatcher.metrics_archive.num_orders, 1)
+
+        # Test 2: a logged off courier is archived and released, but still counts as logged off
+        env.run(until=initial_time + hour_to_sec(2))
+        self.assertEqual(dispatcher.logged_off_couriers, {})
+        self.assertEqual(dispatcher.courier_registry.count('logged_off'), 1)
+        self.assertEqual(
+            dispatcher.metrics_archive.courier_metrics(metrics=Courier.metrics),
+            [courier.calculate_metrics()]
+        )
+
     def test_notification_accepted_event(self):
         """Test to verify the mechanics of a notification being accepted by a courier"""
 
         # Constants
         initial_time = hour_to_sec(14)
-        on_time = time(14, 0, 0)
-        off_time = time(15, 0, 0)
+        on_time = time_to_sec(time(14, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
 
         # Services
         env = Environment(initial_time=initial_time)
@@ -234,7 +269,7 @@ class TestsDispatcher(unittest.TestCase):
 
         # Verify order and courier properties are modified and it is allocated correctly
         self.assertEqual(order.state, 'in_progress')
-        self.assertEqual(order.acceptance_time, sec_to_time(initial_time))
+        self.assertEqual(order.acceptance_time, initial_time)
         self.assertEqual(order.courier_id, courier.courier_id)
         self.assertIn(order.order_id, dispatcher.assigned_orders.keys())
         self.assertIsNotNone(courier.active_route)
@@ -247,8 +282,8 @@ class TestsDispatcher(unittest.TestCase):
 
         # Constants
         initial_time = hour_to_sec(14)
-        on_time = time(14, 0, 0)
-        off_time = time(15, 0, 0)
+        on_time = time_to_sec(time(14, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
 
         # Services
         env = Environment(initial_time=initial_time)
@@ -281,6 +316,19 @@ class TestsDispatcher(unittest.TestCase):
         self.assertIn(courier.courier_id, order.rejected_by)
         self.assertIn(order.order_id, courier.rejected_orders)
 
+        # Verify the stops added to the route of a picking up courier are rejected as well
+        stops_order = Order(order_id=46)
+        stops_notification = Notification(
+            courier=courier,
+            instruction=[
+                Stop(orders={stops_order.order_id: stops_order}, position=1),
+                Stop(orders={stops_order.order_id: stops_order}, position=2)
+            ]
+        )
+        dispatcher.notification_rejected_event(notification=stops_notification, courier=courier)
+        self.assertIn(courier.courier_id, stops_order.rejected_by)
+        self.assertIn(stops_order.order_id, courier.rejected_orders)
+
     @patch('settings.settings.COURIER_MOVEMENT_PROBABILITY', 0.01)
     def test_courier_idle_event(self, *args):
         """Test to verifiy the mechanics of how a courier is set to idle by the dispatcher"""
@@ -290,8 +338,8 @@ class TestsDispatcher(unittest.TestCase):
         courier_id = 85
         time_delta = min_to_sec(10)
         random.seed(26)
-        on_time = time(14, 0, 0)
-        off_time = time(15, 0, 0)
+        on_time = time_to_sec(time(14, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
 
         # Verifies 3 test cases: when the courier is busy, available or idle.
         # For each test case, assert the courier starts in a set and ends up in the idle set
@@ -300,7 +348,7 @@ class TestsDispatcher(unittest.TestCase):
         env = Environment(initial_time=initial_time)
         dispatcher = Dispatcher(env=env, matching_policy=DummyMatchingPolicy())
         courier = Courier(dispatcher=dispatcher, env=env, courier_id=courier_id, on_time=on_time, off_time=off_time)
-        dispatcher.moving_couriers = {courier.courier_id: courier}
+        dispatcher.courier_moving_event(courier)
         dispatcher.courier_idle_event(courier)
         env.run(until=initial_time + time_delta)
         self.assertIn(courier.courier_id, dispatcher.idle_couriers.keys())
@@ -311,7 +359,7 @@ class TestsDispatcher(unittest.TestCase):
         env = Environment(initial_time=initial_time)
         dispatcher = Dispatcher(env=env, matching_policy=DummyMatchingPolicy())
         courier = Courier(dispatcher=dispatcher, env=env, courier_id=courier_id, on_time=on_time, off_time=off_time)
-        dispatcher.picking_up_couriers = {courier.courier_id: courier}
+        dispatcher.courier_picking_up_event(courier)
         dispatcher.courier_idle_event(courier)
         env.run(until=initial_time + time_delta)
         self.assertIn(courier.courier_id, dispatcher.idle_couriers.keys())
@@ -322,7 +370,7 @@ class TestsDispatcher(unittest.TestCase):
         env = Environment(initial_time=initial_time)
         dispatcher = Dispatcher(env=env, matching_policy=DummyMatchingPolicy())
         courier = Courier(dispatcher=dispatcher, env=env, courier_id=courier_id, on_time=on_time, off_time=off_time)
-        dispatcher.idle_couriers = {courier.courier_id: courier}
+        dispatcher.courier_idle_event(courier)
         dispatcher.courier_idle_event(courier)
         env.run(until=initial_time + time_delta)
         self.assertIn(courier.courier_id, dispatcher.idle_couriers.keys())
@@ -334,8 +382,8 @@ class TestsDispatcher(unittest.TestCase):
 
         # Constants
         initial_time = hour_to_sec(14)
-        on_time = time(14, 0, 0)
-        off_time = time(15, 0, 0)
+        on_time = time_to_sec(time(14, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
         service_time = min_to_sec(6)
 
         # Services
@@ -344,10 +392,10 @@ class TestsDispatcher(unittest.TestCase):
 
         # Creates a courier and sets it to the picking state
         courier = Courier(dispatcher=dispatcher, env=env, courier_id=32, on_time=on_time, off_time=off_time)
-        dispatcher.idle_couriers = {courier.courier_id: courier}
+        dispatcher.courier_idle_event(courier)
         env.process(courier._picking_up_state(
             orders={
-                21: Order(drop_off_service_time=service_time, ready_time=time(14, 20, 0))
+                21: Order(drop_off_service_time=service_time, ready_time=time_to_sec(time(14, 20, 0)))
             }
         ))
         env.run(until=initial_time + min_to_sec(10))
@@ -365,8 +413,8 @@ class TestsDispatcher(unittest.TestCase):
         initial_time = hour_to_sec(14)
         courier_id = 14
         time_delta = min_to_sec(10)
-        on_time = time(14, 0, 0)
-        off_time = time(15, 0, 0)
+        on_time = time_to_sec(time(14, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
         service_time = min_to_sec(7)
 
         # Verifies 2 test cases for how the courier transitions to being busy
@@ -378,7 +426,7 @@ class TestsDispatcher(unittest.TestCase):
         courier = Courier(dispatcher=dispatcher, env=env, courier_id=courier_id, on_time=on_time, off_time=off_time)
         env.process(courier._dropping_off_state(
             orders={
-                21: Order(drop_off_service_time=service_time, ready_time=time(12, 20, 0))
+                21: Order(drop_off_service_time=service_time, ready_time=time_to_sec(time(12, 20, 0)))
             }
         ))
         env.run(until=initial_time + time_delta)
@@ -410,7 +458,7 @@ class TestsDispatcher(unittest.TestCase):
 
         # Constants
         initial_time = hour_to_sec(16)
-        placement_time = time(16, 0, 0)
+        placement_time = time_to_sec(time(16, 0, 0))
         time_delta = min_to_sec(10)
 
         # Verifies two test cases for how the dispatcher buffers orders
@@ -426,12 +474,29 @@ class TestsDispatcher(unittest.TestCase):
         order_1 = Order(order_id=1, placement_time=placement_time)
         order_2 = Order(order_id=2, placement_time=placement_time)
         order_3 = Order(order_id=3, placement_time=placement_time)
-        dispatcher.order_submitted_event(order_1, preparation_time=time(16, 0, 27), ready_time=time(16, 10, 0))
-        dispatcher.order_submitted_event(order_2, preparation_time=time(16, 0, 43), ready_time=time(16, 10, 0))
-        dispatcher.order_submitted_event(order_3, preparation_time=time(18, 0, 0), ready_time=time(18, 10, 0))
+        dispatcher.order_submitted_event(
+            order_1,
+            preparation_time=time_to_sec(time(16, 0, 27)),
+            ready_time=time_to_sec(time(16, 10, 0))
+        )
+        dispatcher.order_submitted_event(
+            order_2,
+            preparation_time=time_to_sec(time(16, 0, 43)),
+            ready_time=time_to_sec(time(16, 10, 0))
+        )
+        dispatcher.order_submitted_event(
+            order_3,
+            preparation_time=time_to_sec(time(18, 0, 0)),
+            ready_time=time_to_sec(time(18, 10, 0))
+        )
 
         env.run(until=initial_time + time_delta)
         self.assertEqual(len(dispatcher.unassigned_orders), 2)
+        self.assertEqual(list(dispatcher.placed_orders.keys()), [order_3.order_id])
+        self.assertEqual(
+            sorted(dispatcher.order_deadlines.keys()),
+            [order_1.order_id, order_2.order_id, order_3.order_id]
+        )
 
         # Test 2: schedules the submission of three orders and assert that all three orders are buffered
         env = Environment(initial_time=initial_time)
@@ -443,9 +508,21 @@ class TestsDispatcher(unittest.TestCase):
         order_1 = Order(order_id=1, placement_time=placement_time)
         order_2 = Order(order_id=2, placement_time=placement_time)
         order_3 = Order(order_id=3, placement_time=placement_time)
-        dispatcher.order_submitted_event(order_1, preparation_time=time(16, 0, 27), ready_time=time(16, 10, 0))
-        dispatcher.order_submitted_event(order_2, preparation_time=time(16, 0, 43), ready_time=time(16, 10, 0))
-        dispatcher.order_submitted_event(order_3, preparation_time=time(16, 4, 1), ready_time=time(16, 14, 0))
+        dispatcher.order_submitted_event(
+            order_1,
+            preparation_time=time_to_sec(time(16, 0, 27)),
+            ready_time=time_to_sec(time(16, 10, 0))
+        )
+        dispatcher.order_submitted_event(
+            order_2,
+            preparation_time=time_to_sec(time(16, 0, 43)),
+            ready_time=time_to_sec(time(16, 10, 0))
+        )
+        dispatcher.order_submitted_event(
+            order_3,
+            preparation_time=time_to_sec(time(16, 4, 1)),
+            ready_time=time_to_sec(time(16, 14, 0))
+        )
         env.run(until=initial_time + time_delta)
         self.assertEqual(len(dispatcher.unassigned_orders), 3)
 
@@ -469,8 +546,8 @@ class TestsDispatcher(unittest.TestCase):
             env=env,
             dispatcher=dispatcher,
             courier_id=69,
-            on_time=time(12, 0, 0),
-            off_time=time(13, 0, 0)
+            on_time=time_to_sec(time(12, 0, 0)),
+            off_time=time_to_sec(time(13, 0, 0))
         )
         env.run(until=initial_time + time_delta)
         self.assertEqual(dispatcher.idle_couriers, {})
@@ -486,8 +563,8 @@ class TestsDispatcher(unittest.TestCase):
             env=env,
             dispatcher=dispatcher,
             courier_id=69,
-            on_time=time(12, 0, 0),
-            off_time=time(13, 0, 0)
+            on_time=time_to_sec(time(12, 0, 0)),
+            off_time=time_to_sec(time(13, 0, 0))
         )
         courier.state.interrupt()
         env.process(courier._dropping_off_state(
@@ -507,13 +584,13 @@ class TestsDispatcher(unittest.TestCase):
             env=env,
             dispatcher=dispatcher,
             courier_id=69,
-            on_time=time(12, 0, 0),
-            off_time=time(13, 0, 0)
+            on_time=time_to_sec(time(12, 0, 0)),
+            off_time=time_to_sec(time(13, 0, 0))
         )
         courier.state.interrupt()
         env.process(courier._picking_up_state(
             orders={
-                21: Order(drop_off_service_time=service_time, ready_time=time(12, 20, 0))
+                21: Order(drop_off_service_time=service_time, ready_time=time_to_sec(time(12, 20, 0)))
             }
         ))
         env.run(until=initial_time + time_delta)
@@ -528,8 +605,8 @@ class TestsDispatcher(unittest.TestCase):
 
         # Constants
         initial_time = hour_to_sec(14)
-        on_time = time(14, 0, 0)
-        off_time = time(15, 0, 0)
+        on_time = time_to_sec(time(14, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
 
         # Services
         env = Environment(initial_time=initial_time)
@@ -557,8 +634,8 @@ class TestsDispatcher(unittest.TestCase):
 
         # Constants
         initial_time = hour_to_sec(14)
-        on_time = time(14, 0, 0)
-        off_time = time(15, 0, 0)
+        on_time = time_to_sec(time(14, 0, 0))
+        off_time = time_to_sec(time(15, 0, 0))
 
         # Services
         env = Environment(initial_time=initial_time)
@@ -578,3 +655,39 @@ class TestsDispatcher(unittest.TestCase):
 
         # Verify order and courier properties are modified and it is allocated correctly
         self.assertIsNone(courier.active_route)
+
+    @patch('settings.settings.DISPATCHER_ROLLING_HORIZON_TIME', min_to_sec(2))
+    @patch('settings.settings.DISPATCHER_PREPOSITIONING_TIME', min_to_sec(5))
+    def test_policies_evaluation_times(self):
+        """Test to verify that the dispatcher only wakes up when the buffering or prepositioning must be evaluated"""
+
+        # Constants
+        initial_time = hour_to_sec(14) + 30
+
+        # Services
+        env = Environment(initial_time=initial_time)
+        dispatcher = Dispatcher(env=env, matching_policy=DummyMatchingPolicy())
+        evaluation_times = []
+
+        # Records when the dispatcher evaluates the policies and runs the simulation for 10 minutes
+        with patch.object(
+                dispatcher,
+                '_evaluate_prepositioning_event',
+                side_effect=lambda: evaluation_times.append(env.now)
+        ), patch.object(dispatcher, '_dispatch_event') as dispatch_event:
+            env.run(until=initial_time + min_to_sec(10))
+
+        # Verify the wake ups follow the rolling horizon and the prepositioning times, and the dispatch is executed
+        self.assertEqual(
+            evaluation_times,
+            [
+                initial_time,
+                hour_to_sec(14) + min_to_sec(2),
+                hour_to_sec(14) + min_to_sec(4),
+                hour_to_sec(14) + min_to_sec(5),
+                hour_to_sec(14) + min_to_sec(6),
+                hour_to_sec(14) + min_to_sec(8),
+                hour_to_sec(14) + min_to_sec(10)
+            ]
+        )
+        self.assertEqual(dispatch_event.call_count, 5)
@@ -1,6 +1,6 @@
 import random
 import unittest
-from datetime import time, timedelta, datetime, date
+from datetime import time
 from unittest.mock import patch
 
 from simpy import Environment
@@ -11,7 +11,7 @@ from actors.user import User
 from objects.location import Location
 from policies.user.cancellation.random import RandomCancellationPolicy
 from tests.functional.actors.tests_dispatcher import TestsDispatcher, DummyMatchingPolicy
-from utils.datetime_utils import min_to_sec, hour_to_sec
+from utils.datetime_utils import min_to_sec, hour_to_sec, time_to_sec
 
 
 class TestsUser(unittest.TestCase):
@@ -21,10 +21,10 @@ class TestsUser(unittest.TestCase):
     order_id = 0
     pick_up_at = Location(lat=4.689697, lng=-74.055495)
     drop_off_at = Location(lat=4.690296, lng=-74.043929)
-    placement_time = time(12, 0, 0)
-    expected_drop_off_time = time(12, 40, 0)
-    preparation_time = time(12, 1, 0)
-    ready_time = time(12, 11, 0)
+    placement_time = time_to_sec(time(12, 0, 0))
+    expected_drop_off_time = time_to_sec(time(12, 40, 0))
+    preparation_time = time_to_sec(time(12, 1, 0))
+    ready_time = time_to_sec(time(12, 11, 0))
 
     # Services to be reused
     cancellation_policy = RandomCancellationPolicy()
@@ -65,12 +65,11 @@ class TestsUser(unittest.TestCase):
         self.assertIn(self.order_id, dispatcher.canceled_orders.keys())
         self.assertEqual(
             user.order.cancellation_time,
-            (
-                    datetime.combine(date.today(), self.placement_time) +
-                    timedelta(seconds=settings.USER_WAIT_TO_CANCEL)
-            ).time()
+            self.placement_time + settings.USER_WAIT_TO_CANCEL
         )
         self.assertEqual(user.condition, 'canceled')
+        self.assertTrue(user.order_submitted.processed)
+        self.assertTrue(user.order_completed.processed)
 
     @patch('settings.settings.USER_WAIT_TO_CANCEL', min_to_sec(40))
     @patch('settings.settings.DISPATCHER_WAIT_TO_CANCEL', min_to_sec(50))
@@ -137,3 +136,8 @@ class TestsUser(unittest.TestCase):
         self.assertIsNone(user.order.cancellation_time)
         self.assertEqual(dispatcher.unassigned_orders, {self.order_id: user.order})
         self.assertEqual(user.condition, 'waiting')
+
+        # Verify the waiting user is passive and doesn't schedule events of its own
+        self.assertFalse(user.order_completed.triggered)
+        self.assertTrue(user.state.is_alive)
+        self.assertEqual(user.state.target, user.order_completed)
@@ -0,0 +1,193 @@
+import tempfile
+import unittest
+from datetime import time
+from unittest.mock import patch
+
+import pandas as pd
+from simpy import Environment
+
+from actors.world import World
+from services.optimization_service.model.solver_session import SOLVER_SESSION
+from tests.test_utils import mocked_get_route
+from utils.datetime_utils import hour_to_sec, sec_to_time, time_to_sec, min_to_sec, SECONDS_PER_DAY
+
+
+class TestsWorld(unittest.TestCase):
+    """Tests for the World actor class"""
+
+    @patch('settings.settings.INSTANCE_INGESTION', 'csv')
+    @patch('services.instance_data_service.InstanceDataService.get_orders_info')
+    @patch('services.instance_data_service.InstanceDataService.get_couriers_info')
+    @patch('actors.world.World._new_users_procedure')
+    @patch('actors.world.World._new_couriers_procedure')
+    def test_simulate_arrivals(self, new_couriers, new_users, couriers_info, orders_info):
+        """Test to verify how the World schedules the arrivals of preloaded orders and couriers"""
+
+        # Constants
+        initial_time = hour_to_sec(9)
+        order_info = {
+            'pick_up_lat': 4.689697,
+            'pick_up_lng': -74.055495,
+            'drop_off_lat': 4.690296,
+            'drop_off_lng': -74.043929,
+            'preparation_time': time(9, 3, 0),
+            'ready_time': time(9, 10, 0),
+            'expected_drop_off_time': time(9, 40, 0)
+        }
+        orders_info.return_value = [
+            {'order_id': 1, 'placement_time': time(8, 59, 59), **order_info},
+            {'order_id': 2, 'placement_time': time(9, 0, 10), **order_info},
+            {'order_id': 3, 'placement_time': time(9, 0, 10), **order_info},
+            {'order_id': 4, 'placement_time': time(9, 2, 0), **order_info}
+        ]
+        couriers_info.return_value = [
+            {'courier_id': 1, 'on_time': time(9, 0, 0)},
+            {'courier_id': 2, 'on_time': time(9, 0, 10)}
+        ]
+        users_times, couriers_times = [], []
+        new_users.side_effect = lambda info: users_times.append((sec_to_time(env.now), info))
+        new_couriers.side_effect = lambda info: couriers_times.append((sec_to_time(env.now), info))
+
+        # Runs the World and asserts arrivals happen exactly at their second, grouped and without polling
+        env = Environment(initial_time=initial_time)
+        World(env=env, instance=3)
+        env.run(until=initial_time + 300)
+        SOLVER_SESSION.close()
+
+        self.assertEqual(
+            users_times,
+            [
+                (time(9, 0, 10), orders_info.return_value[1:3]),
+                (time(9, 2, 0), orders_info.return_value[3:])
+            ]
+        )
+        self.assertEqual(
+            couriers_times,
+            [
+                (time(9, 0, 0), couriers_info.return_value[0:1]),
+                (time(9, 0, 10), couriers_info.return_value[1:])
+            ]
+        )
+
+    @patch('settings.settings.INSTANCE_INGESTION', 'csv')
+    @patch('settings.settings.SIMULATE_FROM', time(23, 59, 0))
+    @patch('services.instance_data_service.InstanceDataService.get_orders_info')
+    @patch('services.instance_data_service.InstanceDataService.get_couriers_info')
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    def test_simulate_across_midnight(self, osrm, couriers_info, orders_info):
+        """Test to verify how the simulation clock keeps counting seconds after midnight"""
+
+        # Constants
+        initial_time = time_to_sec(time(23, 59, 0))
+        orders_info.return_value = [
+            {
+                'order_id': 1,
+                'pick_up_lat': 4.689697,
+                'pick_up_lng': -74.055495,
+                'drop_off_lat': 4.690296,
+                'drop_off_lng': -74.043929,
+                'placement_time': time(23, 59, 50),
+                'preparation_time': time(0, 0, 10),
+                'ready_time': time(0, 10, 0),
+                'expected_drop_off_time': time(0, 40, 0)
+            }
+        ]
+        couriers_info.return_value = [
+            {
+                'courier_id': 1,
+                'vehicle': 'motorcycle',
+                'on_lat': 4.689697,
+                'on_lng': -74.055495,
+                'on_time': time(0, 0, 5),
+                'off_time': time(2, 0, 0)
+            }
+        ]
+
+        # Runs the World past midnight
+        env = Environment(initial_time=initial_time)
+        world = World(env=env, instance=3)
+        env.run(until=initial_time + min_to_sec(5))
+        SOLVER_SESSION.close()
+
+        # Asserts arrivals and deadlines happen on the next day, while conversions keep the time of the day
+        order = world.users[0].order
+        courier = world.couriers[0]
+        self.assertEqual(order.placement_time, initial_time + 50)
+        self.assertEqual(order.preparation_time, SECONDS_PER_DAY + 10)
+        self.assertEqual(order.ready_time, SECONDS_PER_DAY + min_to_sec(10))
+        self.assertEqual(world.dispatcher.placed_orders, {})
+        self.assertIn(order.order_id, {**world.dispatcher.unassigned_orders, **world.dispatcher.assigned_orders})
+        self.assertEqual(courier.on_time, SECONDS_PER_DAY + 5)
+        self.assertEqual(courier.off_time, SECONDS_PER_DAY + hour_to_sec(2))
+        self.assertEqual(sec_to_time(order.placement_time), time(23, 59, 50))
+        self.assertEqual(sec_to_time(order.preparation_time), time(0, 0, 10))
+
+    @patch('settings.settings.SIMULATE_FROM', time(23, 25, 0))
+    @patch('settings.settings.CREATE_USERS_FROM', time(23, 25, 0))
+    @patch('settings.settings.CREATE_USERS_UNTIL', time(0, 25, 0))
+    @patch('settings.settings.CREATE_COURIERS_FROM', time(23, 25, 0))
+    @patch('settings.settings.CREATE_COURIERS_UNTIL', time(0, 5, 0))
+    @patch('actors.user.User.submit_order_event', autospec=True)
+    @patch('actors.world.World._new_courier', autospec=True)
+    def test_simulate_columns_arrivals(self, new_courier, submit_order_event):
+        """Test to verify the World creates the same users and couriers from the mapped columns as from the rows"""
+
+        # Constants
+        initial_time = time_to_sec(time(23, 25, 0))
+        arrivals = {}
+
+        # Runs the World with the .csv files and the memory-mapped columns
+        with tempfile.TemporaryDirectory() as directory:
+            with patch('services.instance_data_service.COLUMNS_SUB_DIR_PATH', directory + '/{instance_id}'):
+                for ingestion in ['csv', 'memmap']:
+                    submit_order_event.reset_mock()
+                    new_courier.reset_mock()
+
+                    with patch('settings.settings.INSTANCE_INGESTION', ingestion):
+                        env = Environment(initial_time=initial_time)
+                        World(env=env, instance=3)
+                        env.run(until=initial_time + hour_to_sec(1))
+                        SOLVER_SESSION.close()
+
+                    arrivals[ingestion] = (
+                        [(call.args[0].user_id, call.kwargs) for call in submit_order_event.call_args_list],
+                        [call.kwargs for call in new_courier.call_args_list]
+                    )
+
+        # Asserts orders and couriers of both days arrive and the columns create the same ones as the rows
+        users_info, couriers_info = arrivals['memmap']
+        self.assertTrue(any(info['placement_time'] > SECONDS_PER_DAY for _, info in users_info))
+        self.assertTrue(any(info['on_time'] > SECONDS_PER_DAY for info in couriers_info))
+        self.assertEqual(arrivals['memmap'], arrivals['csv'])
+
+    @patch('settings.settings.INSTANCE_INGESTION', 'polling')
+    @patch('settings.settings.SIMULATE_FROM', time(23, 0, 0))
+    @patch('settings.settings.CREATE_USERS_FROM', time(23, 0, 0))
+    @patch('settings.settings.CREATE_USERS_UNTIL', time(1, 0, 0))
+    @patch('settings.settings.CREATE_COURIERS_FROM', time(23, 30, 0))
+    @patch('settings.settings.CREATE_COURIERS_UNTIL', time(0, 30, 0))
+    @patch('actors.world.create_engine')
+    @patch('actors.world.pd.read_sql', return_value=pd.DataFrame())
+    def test_polling_across_midnight(self, read_sql, create_engine):
+        """Test to verify how the World polls the DDBB when the creation windows cross midnight"""
+
+        # Constants
+        env = Environment(initial_time=time_to_sec(time(23, 0, 0)))
+        world = World(env=env, instance=3)
+        SOLVER_SESSION.close()
+
+        # Asserts the DDBB is polled for new users and couriers before and after midnight, but not outside the windows
+        for current_time, orders_polls, couriers_polls in [
+            (time(23, 15, 0), 1, 0),
+            (time(23, 45, 0), 1, 1),
+            (time(0, 15, 0), 1, 1),
+            (time(0, 45, 0), 1, 0),
+            (time(12, 0, 0), 0, 0)
+        ]:
+            read_sql.reset_mock()
+            world._new_orders_info(current_time)
+            self.assertEqual(read_sql.call_count, orders_polls)
+
+            read_sql.reset_mock()
+            world._new_couriers_info(current_time)
+            self.assertEqual(read_sql.call_count, couriers_polls)
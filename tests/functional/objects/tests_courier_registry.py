@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import patch
+
+from actors.courier import Courier
+from objects.courier_registry import CourierRegistry
+from objects.location import Location
+from objects.order import Order
+from objects.route import Route
+
+
+class TestsCourierRegistry(unittest.TestCase):
+    """Tests for the Courier Registry object class"""
+
+    @patch('settings.settings.DISPATCHER_PROSPECTS_MAX_ORDERS', 2)
+    def test_transitions(self):
+        """Test to verify how couriers move between states and in and out of the dispatchable couriers"""
+
+        # Constants
+        courier_1 = Courier(courier_id=1, on_time=0, off_time=3600)
+        courier_2 = Courier(courier_id=2, on_time=0, off_time=3600)
+        courier_3 = Courier(courier_id=3, on_time=0, off_time=3600)
+        orders = {
+            order_id: Order(
+                order_id=order_id,
+                pick_up_at=Location(lat=4.567, lng=1.234),
+                drop_off_at=Location(lat=1.234, lng=4.567)
+            )
+            for order_id in range(2)
+        }
+
+        # Test 1: couriers are registered and transition between states, dispatchable in the order they became so
+        registry = CourierRegistry()
+        registry.transition(courier_1, 'idle')
+        registry.transition(courier_2, 'idle')
+        registry.transition(courier_3, 'moving')
+        self.assertEqual(registry.state(courier_1.courier_id), 'idle')
+        self.assertEqual(registry.count('idle'), 2)
+        self.assertEqual(registry.count('moving'), 1)
+        self.assertEqual(list(registry.dispatchable_couriers().keys()), [1, 2])
+
+        registry.transition(courier_1, 'picking_up')
+        registry.transition(courier_3, 'idle')
+        self.assertEqual(registry.couriers('idle'), {2: courier_2, 3: courier_3})
+        self.assertEqual(registry.couriers('picking_up'), {1: courier_1})
+        self.assertEqual(registry.count('moving'), 0)
+        self.assertEqual(list(registry.dispatchable_couriers().keys()), [2, 1, 3])
+
+        # Test 2: a courier with a full route is no longer dispatchable, until its route has room again
+        courier_1.active_route = Route(orders=dict(orders))
+        registry.refresh(courier_1)
+        self.assertNotIn(courier_1.courier_id, registry.dispatchable_couriers().keys())
+        self.assertIn(courier_1.courier_id, registry.couriers('picking_up').keys())
+
+        del courier_1.active_route.orders[0]
+        registry.transition(courier_1, 'picking_up')
+        self.assertIn(courier_1.courier_id, registry.dispatchable_couriers().keys())
+
+        # Test 3: moving and dropping off couriers are never dispatchable
+        courier_2.active_route = None
+        registry.transition(courier_2, 'dropping_off')
+        self.assertNotIn(courier_2.courier_id, registry.dispatchable_couriers().keys())
+        registry.refresh(courier_2)
+        self.assertNotIn(courier_2.courier_id, registry.dispatchable_couriers().keys())
+
+        # Test 4: a courier logs off and the views are read-only
+        registry.log_off(courier_3)
+        self.assertIsNone(registry.state(courier_3.courier_id))
+        self.assertEqual(registry.couriers('idle'), {})
+        self.assertEqual(registry.couriers('logged_off'), {3: courier_3})
+        self.assertEqual(list(registry.dispatchable_couriers().keys()), [1])
+
+        with self.assertRaises(TypeError):
+            registry.couriers('idle')[courier_3.courier_id] = courier_3
+
+        with self.assertRaises(TypeError):
+            registry.dispatchable_couriers()[courier_3.courier_id] = courier_3
+
+        self.assertIs(registry.dispatchable_couriers(), registry.dispatchable_couriers())
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from actors.courier import Courier
+from objects.fleet_store import FleetStore, FleetView
+from objects.location import Location
+from objects.order import Order
+from objects.route import Route
+from objects.vehicle import Vehicle
+
+
+class TestsFleetStore(unittest.TestCase):
+    """Tests for the Fleet Store object class"""
+
+    def test_update_and_view(self):
+        """Test to verify how the couriers' columns are written and how views follow the requested order"""
+
+        # Constants
+        couriers = [
+            Courier(
+                courier_id=courier_id,
+                on_time=0,
+                off_time=3600,
+                location=Location(lat=4.6 + courier_id / 100, lng=-74.1),
+                vehicle=Vehicle.BICYCLE if courier_id % 2 else Vehicle.CAR
+            )
+            for courier_id in range(5)
+        ]
+        order = Order(order_id=1, pick_up_at=Location(lat=4.567, lng=1.234), drop_off_at=Location(lat=1.234, lng=4.567))
+
+        # Test 1: the store grows beyond its capacity and keeps one row per courier
+        store = FleetStore(capacity=2)
+        for courier in couriers:
+            store.update(courier, state='idle')
+
+        store.update(couriers[0], state='idle')
+        self.assertEqual(len(store), 5)
+
+        # Test 2: state, position and load changes are reflected in the views, in the requested order
+        couriers[3].location = Location(lat=4.7, lng=-74.0)
+        couriers[3].active_route = Route(orders={order.order_id: order})
+        store.update(couriers[3], state='picking_up')
+        store.update(couriers[1], state='moving')
+
+        view = store.view([couriers[3], couriers[0], couriers[1]])
+        self.assertEqual(len(view), 3)
+        self.assertEqual(view.courier_ids.tolist(), [3, 0, 1])
+        self.assertEqual(view.coordinates[0].tolist(), [4.7, -74.0])
+        self.assertEqual(view.vehicles.tolist(), [Vehicle.BICYCLE, Vehicle.CAR, Vehicle.BICYCLE])
+        self.assertEqual(view.loads.tolist(), [1, 0, 0])
+        self.assertEqual(view.routed.tolist(), [True, False, False])
+        self.assertEqual(view.in_state('idle').tolist(), [False, True, False])
+        self.assertEqual(view.in_state('picking_up').tolist(), [True, False, False])
+
+        # Test 3: a view built from the couriers' attributes matches the one from the store
+        for courier, condition in zip(couriers, ['idle', 'moving', 'idle', 'picking_up', 'idle']):
+            courier.condition = condition
+
+        stored_view, built_view = store.view(couriers), FleetView.from_couriers(couriers)
+        for column in ['courier_ids', 'coordinates', 'vehicles', 'states', 'loads', 'routed']:
+            self.assertTrue(np.array_equal(getattr(stored_view, column), getattr(built_view, column)))
@@ -0,0 +1,75 @@
+import unittest
+
+from actors.courier import Courier
+from objects.location import Location
+from objects.metrics_archive import MetricsArchive
+from objects.order import Order
+from utils.datetime_utils import hour_to_sec, min_to_sec
+
+
+class TestsMetricsArchive(unittest.TestCase):
+    """Tests for the Metrics Archive object class"""
+
+    def test_metrics(self):
+        """Test to verify the archived orders and couriers yield the same metrics as the live objects"""
+
+        # Constants
+        fulfilled_order = Order(
+            order_id=1,
+            pick_up_at=Location(lat=4.678417, lng=-74.054725),
+            placement_time=hour_to_sec(12),
+            preparation_time=hour_to_sec(12) + min_to_sec(1),
+            acceptance_time=hour_to_sec(12) + min_to_sec(3),
+            in_store_time=hour_to_sec(12) + min_to_sec(9),
+            ready_time=hour_to_sec(12) + min_to_sec(10),
+            pick_up_time=hour_to_sec(12) + min_to_sec(12),
+            drop_off_time=hour_to_sec(12) + min_to_sec(30),
+            expected_drop_off_time=hour_to_sec(12) + min_to_sec(40)
+        )
+        canceled_order = Order(
+            order_id=2,
+            placement_time=hour_to_sec(12),
+            preparation_time=hour_to_sec(12) + min_to_sec(1),
+            ready_time=hour_to_sec(12) + min_to_sec(10),
+            expected_drop_off_time=hour_to_sec(12) + min_to_sec(40),
+            cancellation_time=hour_to_sec(13)
+        )
+        courier = Courier(
+            courier_id=7,
+            on_time=hour_to_sec(8),
+            off_time=hour_to_sec(14),
+            earnings=35.5,
+            fulfilled_orders=[1, 3, 4],
+            guaranteed_compensation=True,
+            utilization_time=hour_to_sec(2)
+        )
+
+        # Test 1: archived orders and couriers match the metrics calculated from the objects
+        archive = MetricsArchive(capacity=1)
+        archive.add_order(fulfilled_order)
+        archive.add_order(canceled_order)
+        archive.accept_notification(courier.courier_id)
+        archive.accept_notification(courier.courier_id)
+        archive.add_courier(courier)
+        self.assertEqual(archive.num_orders, 2)
+        self.assertEqual(
+            archive.order_metrics(),
+            [fulfilled_order.calculate_metrics(), canceled_order.calculate_metrics()]
+        )
+        self.assertEqual(
+            archive.courier_metrics(metrics=Courier.metrics),
+            [{**courier.calculate_metrics(), 'accepted_notifications': 2, 'courier_bundles_picked_per_hour': 2 / 6}]
+        )
+
+        # Test 2: archiving an object again overwrites its row
+        courier.utilization_time = hour_to_sec(3)
+        archive.add_courier(courier)
+        self.assertEqual(archive.num_couriers, 1)
+        self.assertEqual(archive.courier_metrics(metrics=Courier.metrics)[0]['utilization_time'], hour_to_sec(3))
+
+        # Test 3: orders finished before a time are discarded, whether they were dropped off or canceled
+        archive.discard_orders_finished_before(hour_to_sec(12) + min_to_sec(45))
+        self.assertEqual([metrics['order_id'] for metrics in archive.order_metrics()], [2])
+
+        archive.add_order(fulfilled_order)
+        self.assertEqual([metrics['order_id'] for metrics in archive.order_metrics()], [2, 1])
@@ -0,0 +1,60 @@
+import unittest
+
+from objects.location import Location
+from objects.order import Order
+from objects.order_index import OrderIndex, OrderState
+
+
+class TestsOrderIndex(unittest.TestCase):
+    """Tests for the Order Index object class"""
+
+    def test_transitions(self):
+        """Test to verify how orders move between states and how the views reflect the index"""
+
+        # Constants
+        orders = [
+            Order(
+                order_id=order_id,
+                pick_up_at=Location(lat=4.567, lng=1.234),
+                drop_off_at=Location(lat=1.234, lng=4.567)
+            )
+            for order_id in range(3)
+        ]
+
+        # Test 1: orders are placed and buffered
+        index = OrderIndex()
+        for order in orders:
+            index.transition(order, OrderState.PLACED)
+
+        index.transition(orders[0], OrderState.UNASSIGNED)
+        index.transition(orders[2], OrderState.UNASSIGNED)
+        self.assertEqual(index.state(orders[0].order_id), OrderState.UNASSIGNED)
+        self.assertEqual(index.count(OrderState.PLACED), 1)
+        self.assertEqual(list(index.orders(OrderState.UNASSIGNED).keys()), [0, 2])
+        self.assertFalse(index.is_processed(orders[0].order_id))
+
+        # Test 2: orders are assigned, fulfilled and canceled, becoming processed
+        index.transition(orders[0], OrderState.ASSIGNED)
+        index.transition(orders[0], OrderState.FULFILLED)
+        index.transition(orders[1], OrderState.CANCELED)
+        self.assertEqual(index.orders(OrderState.FULFILLED), {0: orders[0]})
+        self.assertEqual(index.orders(OrderState.CANCELED), {1: orders[1]})
+        self.assertEqual(index.orders(OrderState.PLACED), {})
+        self.assertTrue(index.is_processed(orders[0].order_id))
+        self.assertTrue(index.is_processed(orders[1].order_id))
+        self.assertFalse(index.is_processed(orders[2].order_id))
+        self.assertFalse(index.is_processed(order_id=99))
+
+        # Test 3: the views write through the index
+        unassigned_orders = index.orders(OrderState.UNASSIGNED)
+        assigned_orders = index.orders(OrderState.ASSIGNED)
+        del unassigned_orders[orders[2].order_id]
+        self.assertIsNone(index.state(orders[2].order_id))
+
+        assigned_orders[orders[2].order_id] = orders[2]
+        self.assertEqual(index.state(orders[2].order_id), OrderState.ASSIGNED)
+        self.assertEqual(assigned_orders.copy(), {2: orders[2]})
+        self.assertEqual(len(unassigned_orders), 0)
+
+        with self.assertRaises(KeyError):
+            del unassigned_orders[orders[2].order_id]
@@ -0,0 +1,109 @@
+import unittest
+from datetime import time
+from unittest.mock import patch
+
+import numpy as np
+from geohash import encode
+
+from objects.location import Location
+from objects.order import Order
+from objects.order_table import OrderTable, OrderTableView
+from settings import settings
+from utils.datetime_utils import time_to_sec, SECONDS_PER_DAY
+
+
+class TestsOrderTable(unittest.TestCase):
+    """Tests for the Order Table object class"""
+
+    @patch('settings.settings.DISPATCHER_GEOHASH_PRECISION_GROUPING', 7)
+    def test_columns(self):
+        """Test to verify how the instance's orders are converted to columns and back to submissions"""
+
+        # Constants
+        start_time = time(23, 0, 0)
+        orders_info = [
+            {
+                'order_id': order_id,
+                'pick_up_lat': 4.678417 + order_id / 100,
+                'pick_up_lng': -74.054725,
+                'drop_off_lat': 4.690296,
+                'drop_off_lng': -74.043929,
+                'placement_time': time(23, 50, 0),
+                'preparation_time': time(23, 55, 0),
+                'ready_time': time(0, order_id % 60, 0),
+                'expected_drop_off_time': time(0, 40, 0)
+            }
+            for order_id in range(1, 101)
+        ]
+
+        # Test 1: times are converted to the simulation clock and geohashes match the grouping precision
+        table = OrderTable.from_orders_info(orders_info, start_time=start_time, seed=10)
+        self.assertEqual(len(table), 100)
+        self.assertEqual(table.placement_times[0], time_to_sec(time(23, 50, 0)))
+        self.assertEqual(table.ready_times[0], time_to_sec(time(0, 1, 0)) + SECONDS_PER_DAY)
+        self.assertEqual(
+            table.geohashes.tolist(),
+            [encode(order_info['pick_up_lat'], order_info['pick_up_lng'], 7) for order_info in orders_info]
+        )
+
+        # Test 2: the table built from the columns, with times as seconds of the day, is the same
+        columns_table = OrderTable(
+            columns={
+                column: np.array([
+                    time_to_sec(order_info[column]) if isinstance(order_info[column], time) else order_info[column]
+                    for order_info in orders_info
+                ])
+                for column in orders_info[0].keys()
+            },
+            start_time=start_time,
+            seed=10
+        )
+        for column in ['order_ids', 'placement_times', 'ready_times', 'geohashes', 'pick_up_service_times']:
+            self.assertEqual(getattr(columns_table, column).tolist(), getattr(table, column).tolist())
+
+        self.assertEqual(columns_table.submission_info(order_id=5), table.submission_info(order_id=5))
+
+        # Test 3: service times are drawn within their bounds and are reproducible with the seed
+        self.assertTrue((table.pick_up_service_times >= settings.ORDER_MIN_SERVICE_TIME).all())
+        self.assertTrue((table.pick_up_service_times <= settings.ORDER_MAX_PICK_UP_SERVICE_TIME).all())
+        self.assertTrue((table.drop_off_service_times >= settings.ORDER_MIN_SERVICE_TIME).all())
+        self.assertTrue((table.drop_off_service_times <= settings.ORDER_MAX_DROP_OFF_SERVICE_TIME).all())
+        self.assertEqual(
+            table.pick_up_service_times.tolist(),
+            OrderTable.from_orders_info(orders_info, start_time=start_time, seed=10).pick_up_service_times.tolist()
+        )
+
+        # Test 4: each row draws the service times an Order with its id draws, whichever rows are in the table
+        window_table = OrderTable.from_orders_info(orders_info[50:], start_time=start_time, seed=10)
+        self.assertEqual(window_table.pick_up_service_times.tolist(), table.pick_up_service_times[50:].tolist())
+        self.assertEqual(window_table.drop_off_service_times.tolist(), table.drop_off_service_times[50:].tolist())
+
+        with patch('settings.settings.SEED', 10):
+            polled_order = Order(order_id=60)
+
+        self.assertEqual(polled_order.pick_up_service_time, window_table.pick_up_service_times[9])
+        self.assertEqual(polled_order.drop_off_service_time, window_table.drop_off_service_times[9])
+
+        # Test 5: a submitted order keeps the values of its row instead of drawing or encoding its own
+        order = Order(**{
+            key: value
+            for key, value in table.submission_info(order_id=5).items()
+            if key not in ['preparation_time', 'ready_time']
+        })
+        self.assertEqual(order.pick_up_at, Location(lat=orders_info[4]['pick_up_lat'], lng=-74.054725))
+        self.assertEqual(order.pick_up_service_time, table.pick_up_service_times[4])
+        self.assertEqual(order.drop_off_service_time, table.drop_off_service_times[4])
+        self.assertEqual(order.geohash, table.geohashes[4])
+
+        # Test 6: a view follows the requested order and matches the one built from the orders
+        orders = [
+            Order(order_id=order_id, pick_up_at=Location(lat=4.678417 + order_id / 100, lng=-74.054725))
+            for order_id in [7, 3]
+        ]
+        for order in orders:
+            order.ready_time = int(table.ready_times[order.order_id - 1])
+
+        view, built_view = table.view(orders), OrderTableView.from_orders(orders)
+        self.assertEqual(view.order_ids.tolist(), [7, 3])
+        self.assertEqual(view.ready_times.tolist(), built_view.ready_times.tolist())
+        self.assertEqual(view.geohashes.tolist(), built_view.geohashes.tolist())
@@ -5,6 +5,7 @@ from objects.location import Location
 from objects.order import Order
 from objects.route import Route
 from objects.stop import Stop, StopType
+from objects.vehicle import Vehicle, VehicleTimes
 from tests.test_utils import mocked_get_route
 
 
@@ -260,3 +261,85 @@ class TestsRoute(unittest.TestCase):
         self.assertEqual(route.stops[1].type, StopType.DROP_OFF)
         self.assertEqual(route.stops[2].type, StopType.DROP_OFF)
         self.assertTrue(route.time)
+
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    def test_compact_representation(self, osrm):
+        """Test to verify routes and stops are slotted, keep their times per vehicle and have increasing ids"""
+
+        # Constants
+        order = Order(
+            order_id=1,
+            pick_up_at=Location(lat=4.567, lng=1.234),
+            drop_off_at=Location(lat=1.234, lng=4.567)
+        )
+
+        # Test 1: the objects have no per-instance dict and their times are indexed by vehicle
+        route = Route.from_order(order)
+        for instance in [route, route.stops[0], order, order.pick_up_at]:
+            self.assertFalse(hasattr(instance, '__dict__'))
+
+        self.assertIsInstance(route.time, VehicleTimes)
+        self.assertEqual(len(route.time), len(Vehicle))
+        self.assertEqual(route.stops[1].arrive_at[Vehicle.CAR], route.time[Vehicle.CAR])
+        self.assertGreater(route.time[Vehicle.WALKER], route.time[Vehicle.CAR])
+
+        # Test 2: a stop's arrival times are a copy of the route's, not a reference
+        route.time[Vehicle.CAR] += 60
+        self.assertNotEqual(route.stops[1].arrive_at[Vehicle.CAR], route.time[Vehicle.CAR])
+
+        # Test 3: route ids are unique and increasing
+        next_route = Route.from_order(order)
+        self.assertGreater(int(next_route.route_id), int(route.route_id))
+
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    def test_stop_views(self, osrm):
+        """Test to verify stops are views of the route's columns and keep their values once the route moves them"""
+
+        # Constants
+        orders = [
+            Order(
+                order_id=order_id,
+                pick_up_at=Location(lat=4.567, lng=1.234),
+                drop_off_at=Location(lat=1.234 + order_id / 100, lng=4.567),
+                ready_time=order_id
+            )
+            for order_id in range(1, 4)
+        ]
+
+        # Test 1: views are the same objects while their stops exist and write through to the columns
+        route = Route(num_stops=2)
+        for order in orders:
+            route.add_order(order, route_position=1)
+
+        pick_up_stop = route.stops[0]
+        self.assertIs(route.stops[0], pick_up_stop)
+        self.assertEqual(set(pick_up_stop.orders.keys()), {1, 2, 3})
+        self.assertEqual(route.stops[3].arrive_at[Vehicle.CAR], route.stop_arrivals[3, Vehicle.CAR])
+        self.assertEqual(route.stop_coordinates[2].tolist(), list(orders[1].drop_off_at.coordinates))
+
+        pick_up_stop.visited = True
+        self.assertTrue(route.stop_visited(0))
+
+        # Test 2: updating the route compacts it in place and detaches the views of the previous stops
+        route.update(processed_order_ids=[2])
+        self.assertEqual(route.num_stops, 3)
+        self.assertEqual([stop.type for stop in route.stops], [StopType.PICK_UP, StopType.DROP_OFF, StopType.DROP_OFF])
+        self.assertEqual(set(route.stops[0].orders.keys()), {1, 3})
+        self.assertTrue(route.stops[0].visited)
+        self.assertIsNone(pick_up_stop.route)
+        self.assertEqual(set(pick_up_stop.orders.keys()), {1, 2, 3})
+
+        pick_up_stop.visited = False
+        self.assertTrue(route.stops[0].visited)
+
+        # Test 3: stops are added, inserted and removed through the route without losing their columns
+        route.add_stop(location=orders[1].drop_off_at, orders={2: orders[1]}, type=StopType.DROP_OFF)
+        route.stops.insert(1, Stop(location=Location(lat=0, lng=0), type=StopType.PREPOSITION))
+        self.assertEqual(route.num_stops, 5)
+        self.assertEqual(route.stops[1].type, StopType.PREPOSITION)
+        self.assertEqual(list(route.stops[4].orders.keys()), [2])
+        self.assertEqual([stop.position for stop in route.stops], list(range(5)))
+
+        del route.stops[1]
+        self.assertEqual(route.num_stops, 4)
+        self.assertEqual(route.stop_types.tolist(), [StopType.PICK_UP] + [StopType.DROP_OFF] * 3)
@@ -12,6 +12,7 @@ from objects.route import Route
 from objects.vehicle import Vehicle
 from policies.dispatcher.matching.greedy import GreedyMatchingPolicy
 from tests.test_utils import mocked_get_route
+from utils.datetime_utils import time_to_sec
 
 
 class TestsGreedyMatchingPolicy(unittest.TestCase):
@@ -22,8 +23,8 @@ class TestsGreedyMatchingPolicy(unittest.TestCase):
         """Test to verify how prospects are obtained"""
 
         # Constants
-        on_time = time(14, 0, 0)
-        off_time = time(16, 0, 0)
+        on_time = time_to_sec(time(14, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
 
         # Services
         policy = GreedyMatchingPolicy()
@@ -74,8 +75,8 @@ class TestsGreedyMatchingPolicy(unittest.TestCase):
         """Test to verify that estimations are correctly calculated"""
 
         # Constants
-        on_time = time(15, 0, 0)
-        off_time = time(16, 0, 0)
+        on_time = time_to_sec(time(15, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
 
         # Services
         policy = GreedyMatchingPolicy()
@@ -117,8 +118,8 @@ class TestsGreedyMatchingPolicy(unittest.TestCase):
         """Test the full functionality of the greedy matching policy"""
 
         # Constants
-        on_time = time(7, 0, 0)
-        off_time = time(9, 0, 0)
+        on_time = time_to_sec(time(7, 0, 0))
+        off_time = time_to_sec(time(9, 0, 0))
 
         # Services
         policy = GreedyMatchingPolicy()
@@ -3,6 +3,8 @@ import unittest
 from datetime import time
 from unittest.mock import patch
 
+import numpy as np
+
 from actors.courier import Courier
 from objects.location import Location
 from objects.order import Order
@@ -16,7 +18,7 @@ from services.optimization_service.model.constraints.route_assignment_constraint
 from services.optimization_service.model.graph_model_builder import GraphOptimizationModelBuilder
 from services.optimization_service.model.mip_model_builder import MIPOptimizationModelBuilder
 from services.optimization_service.problem.matching_problem_builder import MatchingProblemBuilder
-from tests.test_utils import mocked_get_route
+from tests.test_utils import mocked_get_route, build_random_matching_problem
 from utils.datetime_utils import time_to_sec, hour_to_sec, min_to_sec
 
 
@@ -45,9 +47,9 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
         """"Test to verify the target bundle size is correctly calculated"""
 
         # Constants
-        on_time = time(15, 0, 0)
-        off_time = time(16, 0, 0)
-        ready_time = time(15, 0, 0)
+        on_time = time_to_sec(time(15, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
+        ready_time = time_to_sec(time(15, 0, 0))
         env_time = time_to_sec(time(15, 20, 0))
 
         # Test case 1: create more couriers than orders
@@ -104,25 +106,25 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=1,
             pick_up_at=Location(lat=4.678417, lng=-74.054725),
             drop_off_at=Location(lat=4.717045, lng=-74.036359),
-            ready_time=time(12, 13, 0)
+            ready_time=time_to_sec(time(12, 13, 0))
         )
         order_2 = Order(
             order_id=2,
             pick_up_at=Location(lat=4.678417, lng=-74.054725),
             drop_off_at=Location(lat=4.723418, lng=-74.037067),
-            ready_time=time(12, 10, 0)
+            ready_time=time_to_sec(time(12, 10, 0))
         )
         order_3 = Order(
             order_id=3,
             pick_up_at=Location(lat=4.678417, lng=-74.054725),
             drop_off_at=Location(lat=4.723418, lng=-74.037067),
-            ready_time=time(12, 30, 0)
+            ready_time=time_to_sec(time(12, 30, 0))
         )
         old_order = Order(
             order_id=9898,
             pick_up_at=Location(lat=4.678417, lng=-74.054725),
             drop_off_at=Location(lat=4.727278, lng=-74.039299),
-            ready_time=time(11, 50, 0)
+            ready_time=time_to_sec(time(11, 50, 0))
         )
         target_size = 2
 
@@ -208,6 +210,74 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
         for order in [order_1, order_2, order_3]:
             self.assertIn(order.order_id, routed_orders)
 
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    @patch('settings.settings.DISPATCHER_SWEEP_READY_WINDOW', min_to_sec(10))
+    def test_generate_sweep_group_routes(self, osrm):
+        """Test to verify how the sweep on ready windows and drop off bearings generates routes"""
+
+        # Constants
+        pick_up_at = Location(lat=4.678417, lng=-74.054725)
+        order_1 = Order(
+            order_id=1,
+            pick_up_at=pick_up_at,
+            drop_off_at=Location(lat=4.717045, lng=-74.036359),
+            ready_time=time_to_sec(time(12, 13, 0))
+        )
+        order_2 = Order(
+            order_id=2,
+            pick_up_at=pick_up_at,
+            drop_off_at=Location(lat=4.640512, lng=-74.071182),
+            ready_time=time_to_sec(time(12, 11, 0))
+        )
+        order_3 = Order(
+            order_id=3,
+            pick_up_at=pick_up_at,
+            drop_off_at=Location(lat=4.690103, lng=-74.046223),
+            ready_time=time_to_sec(time(12, 14, 0))
+        )
+        order_4 = Order(
+            order_id=4,
+            pick_up_at=pick_up_at,
+            drop_off_at=Location(lat=4.651238, lng=-74.063010),
+            ready_time=time_to_sec(time(12, 12, 0))
+        )
+        order_5 = Order(
+            order_id=5,
+            pick_up_at=pick_up_at,
+            drop_off_at=Location(lat=4.723418, lng=-74.037067),
+            ready_time=time_to_sec(time(12, 45, 0))
+        )
+
+        # Case 1: orders in the same ready window are bundled by bearing and the late order is kept apart
+        routes = MyopicMatchingPolicy._generate_sweep_group_routes(
+            orders=[order_1, order_2, order_3, order_4, order_5],
+            target_size=2
+        )
+        self.assertEqual(len(routes), 3)
+        self.assertEqual(
+            sorted(sorted(route.orders.keys()) for route in routes),
+            [[1, 3], [2, 4], [5]]
+        )
+
+        # Case 2: stops start at the pick up and visit the nearest drop off first
+        route = next(route for route in routes if 1 in route.orders.keys())
+        self.assertEqual(route.stops[0].type, StopType.PICK_UP)
+        self.assertEqual(route.stops[0].location, pick_up_at)
+        self.assertEqual([stop.type for stop in route.stops[1:]], [StopType.DROP_OFF] * 2)
+        self.assertEqual([list(stop.orders.keys()) for stop in route.stops[1:]], [[3], [1]])
+        self.assertEqual([stop.position for stop in route.stops], [0, 1, 2])
+        self.assertTrue(route.time)
+
+        # Case 3: the bundle size is capped by the maximum orders
+        routes = MyopicMatchingPolicy._generate_sweep_group_routes(
+            orders=[order_1, order_2, order_3, order_4, order_5],
+            target_size=5,
+            max_orders=3
+        )
+        self.assertEqual(len(routes), 2)
+        self.assertTrue(all(len(route.orders) <= 3 for route in routes))
+        self.assertEqual(sum(len(route.orders) for route in routes), 5)
+
     @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
     @patch('settings.settings.DISPATCHER_MYOPIC_READY_TIME_SLACK', min_to_sec(20))
     def test_generate_routes_idle_couriers(self, osrm):
@@ -215,16 +285,16 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
 
         # Constants
         env_time = hour_to_sec(12) + min_to_sec(20)
-        on_time = time(8, 0, 0)
-        off_time = time(16, 0, 0)
+        on_time = time_to_sec(time(8, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
 
         # Orders
         order_1 = Order(
             order_id=1,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.681694, lng=-74.044811),
-            ready_time=time(12, 30, 0),
-            expected_drop_off_time=time(12, 40, 0),
+            ready_time=time_to_sec(time(12, 30, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 40, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -232,8 +302,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=2,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.695001, lng=-74.040737),
-            ready_time=time(12, 32, 0),
-            expected_drop_off_time=time(12, 42, 0),
+            ready_time=time_to_sec(time(12, 32, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 42, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -241,8 +311,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=3,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.668742, lng=-74.056684),
-            ready_time=time(12, 33, 0),
-            expected_drop_off_time=time(12, 43, 0),
+            ready_time=time_to_sec(time(12, 33, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 43, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -250,8 +320,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=4,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.661441, lng=-74.056955),
-            ready_time=time(12, 34, 0),
-            expected_drop_off_time=time(12, 44, 0),
+            ready_time=time_to_sec(time(12, 34, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 44, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -298,8 +368,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
 
         # Constants
         env_time = hour_to_sec(12) + min_to_sec(20)
-        on_time = time(8, 0, 0)
-        off_time = time(16, 0, 0)
+        on_time = time_to_sec(time(8, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
         random.seed(56)
 
         # Orders
@@ -307,8 +377,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=1,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.681694, lng=-74.044811),
-            ready_time=time(12, 30, 0),
-            expected_drop_off_time=time(12, 40, 0),
+            ready_time=time_to_sec(time(12, 30, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 40, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -316,8 +386,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=2,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.695001, lng=-74.040737),
-            ready_time=time(12, 32, 0),
-            expected_drop_off_time=time(12, 42, 0),
+            ready_time=time_to_sec(time(12, 32, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 42, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -325,8 +395,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=3,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.668742, lng=-74.056684),
-            ready_time=time(12, 33, 0),
-            expected_drop_off_time=time(12, 43, 0),
+            ready_time=time_to_sec(time(12, 33, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 43, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -381,22 +451,22 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
         self.assertIsNone(routes[1].initial_prospect)
 
     @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
-    @patch('settings.settings.DISPATCHER_PROSPECTS_MAX_STOP_OFFSET', min_to_sec(15))
+    @patch('settings.settings.DISPATCHER_PROSPECTS_MAX_STOP_OFFSET', min_to_sec(16))
     def test_generate_matching_prospects_all(self, osrm):
         """Test to verify how prospects are created"""
 
         # Constants
         env_time = hour_to_sec(12) + min_to_sec(20)
-        on_time = time(8, 0, 0)
-        off_time = time(16, 0, 0)
+        on_time = time_to_sec(time(8, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
 
         # Orders
         order_1 = Order(
             order_id=1,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.681694, lng=-74.044811),
-            ready_time=time(12, 30, 0),
-            expected_drop_off_time=time(12, 40, 0),
+            ready_time=time_to_sec(time(12, 30, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 40, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -404,8 +474,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=2,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.695001, lng=-74.040737),
-            ready_time=time(12, 32, 0),
-            expected_drop_off_time=time(12, 42, 0),
+            ready_time=time_to_sec(time(12, 32, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 42, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -413,8 +483,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=3,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.668742, lng=-74.056684),
-            ready_time=time(12, 33, 0),
-            expected_drop_off_time=time(12, 43, 0),
+            ready_time=time_to_sec(time(12, 33, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 43, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -422,8 +492,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=4,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.661441, lng=-74.056955),
-            ready_time=time(12, 34, 0),
-            expected_drop_off_time=time(12, 44, 0),
+            ready_time=time_to_sec(time(12, 34, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 44, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -473,16 +543,16 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
 
         # Constants
         env_time = hour_to_sec(12) + min_to_sec(20)
-        on_time = time(8, 0, 0)
-        off_time = time(16, 0, 0)
+        on_time = time_to_sec(time(8, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
 
         # Orders
         order_1 = Order(
             order_id=1,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.681694, lng=-74.044811),
-            ready_time=time(12, 30, 0),
-            expected_drop_off_time=time(12, 40, 0),
+            ready_time=time_to_sec(time(12, 30, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 40, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -490,8 +560,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=2,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.695001, lng=-74.040737),
-            ready_time=time(12, 32, 0),
-            expected_drop_off_time=time(12, 42, 0),
+            ready_time=time_to_sec(time(12, 32, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 42, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -499,8 +569,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=3,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.668742, lng=-74.056684),
-            ready_time=time(12, 33, 0),
-            expected_drop_off_time=time(12, 43, 0),
+            ready_time=time_to_sec(time(12, 33, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 43, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -558,6 +628,93 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
         )
         self.assertFalse(prospects.tolist())
 
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    def test_generate_matching_prospects_idle_couriers(self, osrm):
+        """Test to verify only idle couriers are prospects without prospects, wherever they are among the couriers"""
+
+        # Constants
+        env_time = hour_to_sec(12) + min_to_sec(20)
+        on_time = time_to_sec(time(8, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
+
+        # Orders
+        order_1 = Order(
+            order_id=1,
+            pick_up_at=Location(lat=4.678759, lng=-74.055729),
+            drop_off_at=Location(lat=4.681694, lng=-74.044811),
+            ready_time=time_to_sec(time(12, 30, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 40, 0)),
+            pick_up_service_time=0,
+            drop_off_service_time=0
+        )
+        order_2 = Order(
+            order_id=2,
+            pick_up_at=Location(lat=4.678759, lng=-74.055729),
+            drop_off_at=Location(lat=4.668742, lng=-74.056684),
+            ready_time=time_to_sec(time(12, 33, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 43, 0)),
+            pick_up_service_time=0,
+            drop_off_service_time=0
+        )
+
+        # Couriers, the picking up one registered before the idle one
+        courier_1 = Courier(
+            courier_id=1,
+            on_time=on_time,
+            off_time=off_time,
+            condition='picking_up',
+            location=order_2.pick_up_at,
+            active_route=Route(
+                orders={order_2.order_id: order_2},
+                stops=[
+                    Stop(
+                        location=order_2.pick_up_at,
+                        orders={order_2.order_id: order_2},
+                        position=0,
+                        type=StopType.PICK_UP
+                    ),
+                    Stop(
+                        location=order_2.drop_off_at,
+                        orders={order_2.order_id: order_2},
+                        position=1,
+                        type=StopType.DROP_OFF
+                    )
+                ]
+            ),
+            active_stop=Stop(
+                location=order_2.pick_up_at,
+                orders={order_2.order_id: order_2},
+                position=0,
+                type=StopType.PICK_UP
+            )
+        )
+        courier_2 = Courier(
+            courier_id=2,
+            on_time=on_time,
+            off_time=off_time,
+            condition='idle',
+            location=Location(lat=4.679408, lng=-74.052524)
+        )
+
+        # Generate prospects and assert only the idle courier is a prospect
+        policy = MyopicMatchingPolicy(
+            assignment_updates=False,
+            prospects=False,
+            notification_filtering=False,
+            mip_matcher=True
+        )
+        routes = policy._generate_routes(orders=[order_1], couriers=[courier_1, courier_2], env_time=env_time)
+        prospects = policy._generate_matching_prospects(
+            routes=routes,
+            couriers=[courier_1, courier_2],
+            env_time=env_time
+        )
+        self.assertEqual(prospects.tolist(), [[1, route_ix] for route_ix in range(len(routes))])
+
+        # Asserts the idle courier is notified of the order
+        notifications, _ = policy.execute(orders=[order_1], couriers=[courier_1, courier_2], env_time=env_time)
+        self.assertEqual([notification.courier.courier_id for notification in notifications], [2])
+
     @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
     @patch('settings.settings.DISPATCHER_PROSPECTS_MAX_STOP_OFFSET', min_to_sec(15))
     @patch('settings.settings.DISPATCHER_MYOPIC_READY_TIME_SLACK', min_to_sec(20))
@@ -566,8 +723,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
 
         # Constants
         env_time = hour_to_sec(12) + min_to_sec(20)
-        on_time = time(8, 0, 0)
-        off_time = time(16, 0, 0)
+        on_time = time_to_sec(time(8, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
         random.seed(45)
 
         # Orders
@@ -575,8 +732,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=1,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.681694, lng=-74.044811),
-            ready_time=time(12, 30, 0),
-            expected_drop_off_time=time(12, 40, 0),
+            ready_time=time_to_sec(time(12, 30, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 40, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -584,8 +741,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=2,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.695001, lng=-74.040737),
-            ready_time=time(12, 32, 0),
-            expected_drop_off_time=time(12, 42, 0),
+            ready_time=time_to_sec(time(12, 32, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 42, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -593,8 +750,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=3,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.668742, lng=-74.056684),
-            ready_time=time(12, 33, 0),
-            expected_drop_off_time=time(12, 43, 0),
+            ready_time=time_to_sec(time(12, 33, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 43, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -602,8 +759,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=4,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.661441, lng=-74.056955),
-            ready_time=time(12, 34, 0),
-            expected_drop_off_time=time(12, 44, 0),
+            ready_time=time_to_sec(time(12, 34, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 44, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -745,8 +902,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
 
         # Constants
         env_time = hour_to_sec(12) + min_to_sec(20)
-        on_time = time(8, 0, 0)
-        off_time = time(16, 0, 0)
+        on_time = time_to_sec(time(8, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
         random.seed(45)
 
         # Orders
@@ -754,8 +911,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=1,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.681694, lng=-74.044811),
-            ready_time=time(12, 30, 0),
-            expected_drop_off_time=time(12, 40, 0),
+            ready_time=time_to_sec(time(12, 30, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 40, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -763,8 +920,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=2,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.695001, lng=-74.040737),
-            ready_time=time(12, 32, 0),
-            expected_drop_off_time=time(12, 42, 0),
+            ready_time=time_to_sec(time(12, 32, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 42, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -772,8 +929,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=3,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.668742, lng=-74.056684),
-            ready_time=time(12, 33, 0),
-            expected_drop_off_time=time(12, 43, 0),
+            ready_time=time_to_sec(time(12, 33, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 43, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -781,8 +938,8 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
             order_id=4,
             pick_up_at=Location(lat=4.678759, lng=-74.055729),
             drop_off_at=Location(lat=4.661441, lng=-74.056955),
-            ready_time=time(12, 34, 0),
-            expected_drop_off_time=time(12, 44, 0),
+            ready_time=time_to_sec(time(12, 34, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 44, 0)),
             pick_up_service_time=0,
             drop_off_service_time=0
         )
@@ -908,3 +1065,182 @@ class TestsMyopicMatchingPolicy(unittest.TestCase):
         self.assertEqual(notifications[1].courier, courier_2)
         self.assertIn(order_1.order_id, notifications[1].instruction.orders.keys())
         self.assertIn(order_4.order_id, notifications[1].instruction.orders.keys())
+
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    @patch('settings.settings.DISPATCHER_PROSPECTS_MAX_STOP_OFFSET', min_to_sec(15))
+    @patch('settings.settings.DISPATCHER_MYOPIC_READY_TIME_SLACK', min_to_sec(20))
+    def test_incremental_epochs(self, osrm):
+        """Test to verify how routes and travelling properties are reused across epochs in incremental mode"""
+
+        # Constants
+        env_time = hour_to_sec(12) + min_to_sec(20)
+        on_time = time_to_sec(time(8, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
+
+        # Orders
+        order_1 = Order(
+            order_id=1,
+            pick_up_at=Location(lat=4.678759, lng=-74.055729),
+            drop_off_at=Location(lat=4.681694, lng=-74.044811),
+            ready_time=time_to_sec(time(12, 30, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 40, 0)),
+            pick_up_service_time=0,
+            drop_off_service_time=0
+        )
+        order_2 = Order(
+            order_id=2,
+            pick_up_at=Location(lat=4.678759, lng=-74.055729),
+            drop_off_at=Location(lat=4.695001, lng=-74.040737),
+            ready_time=time_to_sec(time(12, 32, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 42, 0)),
+            pick_up_service_time=0,
+            drop_off_service_time=0
+        )
+        order_3 = Order(
+            order_id=3,
+            pick_up_at=Location(lat=4.690296, lng=-74.043929),
+            drop_off_at=Location(lat=4.668742, lng=-74.056684),
+            ready_time=time_to_sec(time(12, 33, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 43, 0)),
+            pick_up_service_time=0,
+            drop_off_service_time=0
+        )
+        orders = [order_1, order_2, order_3]
+
+        # Couriers
+        courier_1 = Courier(
+            courier_id=1,
+            on_time=on_time,
+            off_time=off_time,
+            condition='idle',
+            location=Location(lat=4.676854, lng=-74.057498)
+        )
+        courier_2 = Courier(
+            courier_id=2,
+            on_time=on_time,
+            off_time=off_time,
+            condition='idle',
+            location=Location(lat=4.679408, lng=-74.052524)
+        )
+        couriers = [courier_1, courier_2]
+
+        # Test 1: the first epoch computes everything from scratch
+        policy = MyopicMatchingPolicy(
+            assignment_updates=True,
+            prospects=True,
+            notification_filtering=False,
+            mip_matcher=False,
+            incremental=True
+        )
+        policy._start_incremental_epoch(env_time)
+        routes = policy._generate_routes(orders, couriers, env_time)
+        policy._generate_matching_prospects(routes, couriers, env_time)
+        first_epoch_calls = osrm.call_count
+        self.assertTrue(first_epoch_calls)
+
+        # Test 2: a courier moves, so routes are reused and only its travelling properties are estimated again
+        courier_2.location = Location(lat=4.679508, lng=-74.052624)
+        policy._start_incremental_epoch(env_time + min_to_sec(6))
+        new_routes = policy._generate_routes(orders, couriers, env_time + min_to_sec(6))
+        self.assertEqual(len(new_routes), len(routes))
+        for new_route, route in zip(new_routes, routes):
+            self.assertIs(new_route, route)
+
+        osrm.reset_mock()
+        policy._generate_matching_prospects(new_routes, couriers, env_time + min_to_sec(6))
+        self.assertTrue(osrm.call_count)
+        self.assertLess(osrm.call_count, first_epoch_calls)
+
+        # Test 3: an order is removed, so only its group is routed again
+        policy._start_incremental_epoch(env_time + min_to_sec(8))
+        new_routes = policy._generate_routes([order_1, order_3], couriers, env_time + min_to_sec(8))
+        self.assertEqual(len(new_routes), 2)
+        self.assertIsNot(new_routes[0], routes[0])
+        self.assertIs(new_routes[1], routes[-1])
+
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    @patch('settings.settings.DISPATCHER_PROSPECTS_MAX_STOP_OFFSET', min_to_sec(15))
+    def test_incremental_epochs_over_time(self, osrm):
+        """Test to verify an incremental epoch matches as a full one when only the time advances past a threshold"""
+
+        # Constants
+        env_time = hour_to_sec(12)
+        on_time = time_to_sec(time(8, 0, 0))
+        off_time = time_to_sec(time(16, 0, 0))
+
+        # Orders
+        order_1 = Order(
+            order_id=1,
+            pick_up_at=Location(lat=4.678759, lng=-74.055729),
+            drop_off_at=Location(lat=4.681694, lng=-74.044811),
+            ready_time=time_to_sec(time(12, 30, 0)),
+            expected_drop_off_time=time_to_sec(time(12, 40, 0)),
+            pick_up_service_time=0,
+            drop_off_service_time=0
+        )
+
+        # Couriers
+        courier_1 = Courier(
+            courier_id=1,
+            on_time=on_time,
+            off_time=off_time,
+            condition='idle',
+            location=Location(lat=4.678859, lng=-74.055829)
+        )
+
+        # Policies
+        incremental_policy, policy = [
+            MyopicMatchingPolicy(
+                assignment_updates=False,
+                prospects=False,
+                notification_filtering=True,
+                mip_matcher=True,
+                incremental=incremental
+            )
+            for incremental in [True, False]
+        ]
+
+        # Test 1: the order isn't notified while its ready time is beyond the stop offset
+        notifications, _ = incremental_policy.execute([order_1], [courier_1], env_time)
+        self.assertEqual(notifications, [])
+
+        # Test 2: once the time reaches the stop offset, the same orders and couriers are notified, as in a full epoch
+        notifications, _ = incremental_policy.execute([order_1], [courier_1], env_time + min_to_sec(16))
+        full_notifications, _ = policy.execute([order_1], [courier_1], env_time + min_to_sec(16))
+        self.assertEqual(len(notifications), 1)
+        self.assertEqual(
+            [notification.courier.courier_id for notification in notifications],
+            [notification.courier.courier_id for notification in full_notifications]
+        )
+
+    def test_solve_mip_lp_relaxation(self):
+        """Test to verify how the linear relaxation replaces the MIP and how it falls back to it if not integral"""
+
+        # Constants
+        problem = build_random_matching_problem(num_couriers=10, num_routes=8, seed=5678)
+
+        # Test 1: without the relaxation, the MIP is solved directly
+        with patch('settings.settings.DISPATCHER_MIP_LP_RELAXATION', False):
+            mip_model, mip_solution, relaxation_integral = MyopicMatchingPolicy._solve_mip(problem)
+        self.assertIsNone(relaxation_integral)
+        self.assertTrue(all(var.cat == 'Integer' for var in mip_model.variable_set))
+
+        # Test 2: with the relaxation, the unimodular model yields the same integral solution
+        with patch('settings.settings.DISPATCHER_MIP_LP_RELAXATION', True):
+            model, solution, relaxation_integral = MyopicMatchingPolicy._solve_mip(problem)
+        self.assertTrue(relaxation_integral)
+        self.assertTrue(all(var.cat == 'Continuous' for var in model.variable_set))
+        self.assertAlmostEqual(
+            np.dot(solution[0:len(problem.costs)], problem.costs),
+            np.dot(mip_solution[0:len(problem.costs)], problem.costs)
+        )
+
+        # Test 3: if the relaxation is not integral, the MIP is solved
+        with patch('settings.settings.DISPATCHER_MIP_LP_RELAXATION', True), \
+                patch(
+                    'services.optimization_service.model.optimization_model.OptimizationModel.is_integral',
+                    return_value=False
+                ):
+            model, solution, relaxation_integral = MyopicMatchingPolicy._solve_mip(problem)
+        self.assertFalse(relaxation_integral)
+        self.assertTrue(all(var.cat == 'Integer' for var in model.variable_set))
@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import time
+
+from runner.experiment import Experiment, ExperimentState
+from runner.simulation_job import SimulationJob, SimulationResult
+
+
+class TestsExperiment(unittest.TestCase):
+    """Tests for the Experiment class"""
+
+    def test_jobs(self):
+        """Test to verify a sweep specification is expanded into jobs, sorted with the longest ones first"""
+
+        # Constants
+        specification = {
+            'instances': [3, 12],
+            'seeds': [1, 2],
+            'settings': {'SIMULATE_UNTIL': '09:30:00'},
+            'grid': {
+                'DISPATCHER_MATCHING_POLICY': ['greedy', 'mdrp'],
+                'DISPATCHER_DELAY_PENALTY': [0.2, 0.4, 0.6]
+            }
+        }
+
+        # Test 1: the experiment is named after its file and every combination becomes a job
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'penalties.json')
+
+            with open(file_path, 'w') as file:
+                json.dump(specification, file)
+
+            experiment = Experiment.from_file(file_path)
+
+        jobs = experiment.jobs()
+        self.assertEqual(experiment.run_id, 'penalties')
+        self.assertEqual(len(jobs), 2 * 2 * 2 * 3)
+        self.assertEqual(len({job.key for job in jobs}), len(jobs))
+        self.assertTrue(all(job.run_id == 'penalties' for job in jobs))
+        self.assertTrue(all(job.settings['SIMULATE_UNTIL'] == time(9, 30, 0) for job in jobs))
+
+        # Test 2: the jobs of the costliest policy run first, the ones of the largest instance first among them
+        self.assertEqual(
+            [(job.instance, job.settings['DISPATCHER_MATCHING_POLICY']) for job in jobs],
+            [(12, 'mdrp')] * 6 + [(3, 'mdrp')] * 6 + [(12, 'greedy')] * 6 + [(3, 'greedy')] * 6
+        )
+
+        # Test 3: a shorter window of order placements runs later
+        experiment.grid['CREATE_USERS_UNTIL'] = [time(9, 0, 0), time(23, 0, 0)]
+        jobs = experiment.jobs()
+        self.assertEqual(jobs[0].settings['CREATE_USERS_UNTIL'], time(23, 0, 0))
+        self.assertEqual(jobs[-1].settings['CREATE_USERS_UNTIL'], time(9, 0, 0))
+
+        # Test 4: an unknown setting is rejected
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'typo.json')
+
+            with open(file_path, 'w') as file:
+                json.dump({'instances': [3], 'grid': {'DISPATCHER_DELAY_PENALTI': [0.2]}}, file)
+
+            with self.assertRaises(KeyError):
+                Experiment.from_file(file_path)
+
+    def test_state(self):
+        """Test to verify an experiment resumes with the jobs that did not finish"""
+
+        # Constants
+        jobs = Experiment(run_id='resume', instances=[3], seeds=[1, 2, 3]).jobs()
+
+        # Test 1: finished jobs are recorded and skipped when resuming, failed jobs are not
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'resume.state')
+            state = ExperimentState(file_path)
+            self.assertEqual(state.pending(jobs), jobs)
+
+            state(SimulationResult(job=jobs[0], metrics={}))
+            state(SimulationResult(job=jobs[1], error='Traceback'))
+            self.assertEqual(state.pending(jobs), jobs[1:])
+
+            resumed_state = ExperimentState(file_path)
+            self.assertEqual(resumed_state.pending(jobs), jobs[1:])
+            self.assertEqual(resumed_state.pending([SimulationJob(instance=3, seed=1, run_id='resume')]), [])
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+from datetime import time
+from multiprocessing import get_context
+from unittest.mock import patch
+
+from runner.job_queue import JobQueue
+from runner.simulation_job import SimulationJob, SimulationResult
+from runner.simulation_runner import SimulationRunner
+from runner.warm_up_fork import FORK_CONTEXT
+from tests.test_utils import mocked_get_route
+
+
+def run_worker(url: str):
+    """Dummy method of a worker process claiming jobs from a queue until there are no jobs left"""
+
+    SimulationRunner(workers=1).run_queue(JobQueue(url, max_attempts=2), on_result=lambda result: None)
+
+
+class TestsJobQueue(unittest.TestCase):
+    """Tests for the Job Queue class"""
+
+    # Settings of a short simulation of the instance .csv files, to be reused
+    configuration = {
+        'INSTANCE_INGESTION': 'csv',
+        'SIMULATE_FROM': time(8, 55, 0),
+        'SIMULATE_UNTIL': time(9, 0, 0),
+        'CREATE_USERS_FROM': time(9, 0, 0),
+        'CREATE_USERS_UNTIL': time(9, 2, 0),
+        'CREATE_COURIERS_FROM': time(8, 55, 0),
+        'CREATE_COURIERS_UNTIL': time(9, 5, 0),
+        'WARM_UP_TIME': 0
+    }
+
+    def test_claim(self):
+        """Test to verify workers claim each queued job once, and claim it again if its worker stops heartbeating"""
+
+        # Constants
+        jobs = [
+            SimulationJob(instance=3, seed=seed, settings={**self.configuration, 'DISPATCHER_MATCHING_POLICY': 'mdrp'})
+            for seed in [1, 2]
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            url = f'sqlite:///{os.path.join(directory, "queue.db")}'
+            queue = JobQueue(url, max_attempts=2)
+
+            # Test 1: jobs already queued are skipped
+            self.assertEqual(queue.enqueue(jobs), 2)
+            self.assertEqual(queue.enqueue(jobs + [SimulationJob(instance=3, seed=1, run_id='other')]), 1)
+
+            # Test 2: each job is claimed by a single worker, in order, and rebuilt with the same settings
+            job_id, claimed_job = queue.claim('worker-1')
+            self.assertEqual(claimed_job, jobs[0])
+            self.assertEqual(claimed_job.settings['SIMULATE_UNTIL'], time(9, 0, 0))
+            other_queue = JobQueue(url)
+            self.assertEqual(other_queue.claim('worker-2')[1], jobs[1])
+
+            # Test 3: a job whose worker stopped heartbeating is claimed again, resuming if its journal is at hand
+            self.assertEqual(queue.claim('worker-3')[1].run_id, 'other')
+            self.assertIsNone(queue.claim('worker-3'))
+            queue.heartbeat([job_id], 'worker-1')
+            stale_queue = JobQueue(url, heartbeat_timeout=0, max_attempts=2)
+            reclaimed_id, reclaimed_job = stale_queue.claim('worker-3')
+            self.assertEqual((reclaimed_id, reclaimed_job.key), (job_id, jobs[0].key))
+            self.assertTrue(reclaimed_job.resume)
+
+            # Test 4: the worker that lost the job can't report it and a failed job is retried until out of attempts
+            self.assertIsNone(queue.complete(job_id, 'worker-1', SimulationResult(job=jobs[0], metrics={})))
+            failed_result = SimulationResult(job=jobs[0], error='Traceback')
+            self.assertEqual(queue.complete(job_id, 'worker-3', failed_result), 'failed')
+            self.assertEqual(queue.progress().loc['', ['running', 'failed']].tolist(), [1, 1])
+            self.assertEqual(queue.retry_failed(), 1)
+            self.assertEqual(queue.progress().loc['', 'pending'], 1)
+
+            for job_queue in [queue, other_queue, stale_queue]:
+                job_queue.close()
+
+    @patch('actors.world.system')
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    def test_run_queue(self, osrm, system):
+        """Test to verify several workers sharing a queue run every job once, retrying the failed ones"""
+
+        # Constants
+        jobs = [
+            SimulationJob(instance=3, seed=seed, settings=self.configuration, run_id='workers') for seed in [1, 2, 3]
+        ] + [SimulationJob(instance=999, settings=self.configuration, run_id='workers')]
+
+        with tempfile.TemporaryDirectory() as directory:
+            url = f'sqlite:///{os.path.join(directory, "queue.db")}'
+            queue = JobQueue(url, max_attempts=2)
+            queue.enqueue(jobs)
+
+            # Test 1: the workers finish the queue, failing the job that failed on every attempt
+            workers = [get_context(FORK_CONTEXT).Process(target=run_worker, args=(url,)) for _ in range(2)]
+
+            for worker in workers:
+                worker.start()
+
+            for worker in workers:
+                worker.join()
+
+            self.assertEqual(queue.progress('workers').loc['workers'].tolist(), [0, 0, 3, 1])
+
+            # Test 2: a worker reports the results it ran and the jobs that ran out of attempts
+            queue.retry_failed('workers')
+            results = []
+            failed_jobs = SimulationRunner(workers=1).run_queue(queue, on_result=results.append)
+            self.assertEqual([job.key for job in failed_jobs], [jobs[3].key])
+            self.assertEqual(len(results), 2)
+            self.assertTrue(all(result.error is not None for result in results))
+
+            # Test 3: the result of a job claimed by another worker meanwhile is not handed to the callback
+            results = []
+            queue.enqueue([SimulationJob(instance=3, seed=4, settings=self.configuration, run_id='workers')])
+
+            with patch.object(JobQueue, 'complete', return_value=None):
+                self.assertEqual(SimulationRunner(workers=1).run_queue(queue, on_result=results.append), [])
+
+            self.assertEqual(results, [])
+            queue.close()
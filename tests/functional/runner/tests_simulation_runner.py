@@ -0,0 +1,163 @@
+import dataclasses
+import os
+import signal
+import tempfile
+import unittest
+from datetime import time
+from unittest.mock import patch
+
+from runner.simulation_job import SimulationJob, SimulationResult, run_job
+from runner.simulation_runner import SimulationRunner
+from services.optimization_service.model.optimization_model import OptimizationModel
+from settings import settings
+from tests.test_utils import mocked_get_route
+from utils.datetime_utils import min_to_sec
+
+
+def mocked_run_job(job: SimulationJob) -> SimulationResult:
+    """Dummy method of a job that kills its worker process, except for the first seed"""
+
+    if job.seed != 1:
+        os.kill(os.getpid(), signal.SIGKILL)
+
+    return SimulationResult(job=job, metrics={})
+
+
+class TestsSimulationRunner(unittest.TestCase):
+    """Tests for the Simulation Runner class"""
+
+    # Settings of a short simulation of the instance .csv files, to be reused
+    configuration = {
+        'INSTANCE_INGESTION': 'csv',
+        'SIMULATE_FROM': time(8, 55, 0),
+        'SIMULATE_UNTIL': time(9, 30, 0),
+        'CREATE_USERS_FROM': time(9, 0, 0),
+        'CREATE_USERS_UNTIL': time(9, 2, 0),
+        'CREATE_COURIERS_FROM': time(8, 55, 0),
+        'CREATE_COURIERS_UNTIL': time(9, 5, 0),
+        'WARM_UP_TIME': 0
+    }
+
+    @patch('actors.world.system')
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    def test_run_job(self, osrm, system):
+        """Test to verify a job simulates with its own settings and seed, leaving the settings as they were"""
+
+        # Constants
+        matching_policy = settings.DISPATCHER_MATCHING_POLICY
+        job = SimulationJob(
+            instance=3,
+            seed=17,
+            settings={**self.configuration, 'DISPATCHER_MATCHING_POLICY': 'greedy'},
+            run_id='policies'
+        )
+
+        # Test 1: the metrics are tagged with the job's configuration and the settings are restored
+        result = run_job(job)
+        self.assertIsNone(result.error)
+        self.assertFalse(result.metrics['courier_metrics'].empty)
+        self.assertEqual(
+            result.metrics['courier_metrics']['simulation_policies'][0]['DISPATCHER_MATCHING_POLICY'],
+            'greedy'
+        )
+        self.assertEqual(result.metrics['courier_metrics']['extra_settings'][0]['SEED'], 17)
+        self.assertTrue((result.metrics['courier_metrics']['run_id'] == 'policies').all())
+        self.assertEqual(settings.DISPATCHER_MATCHING_POLICY, matching_policy)
+        self.assertEqual(settings.INSTANCE_INGESTION, 'polling')
+
+        # Test 2: the same job yields the same metrics
+        self.assertTrue(
+            run_job(job).metrics['courier_metrics'].drop(columns='created_at', errors='ignore').equals(
+                result.metrics['courier_metrics'].drop(columns='created_at', errors='ignore')
+            )
+        )
+
+        # Test 3: a job that fails returns its error instead of raising
+        failed_result = run_job(SimulationJob(instance=999, settings=self.configuration))
+        self.assertIsNone(failed_result.metrics)
+        self.assertIsNotNone(failed_result.error)
+        self.assertEqual(settings.INSTANCE_INGESTION, 'polling')
+
+    @patch('actors.world.system')
+    @patch('services.osrm_service.OSRMService._request_route', side_effect=mocked_get_route)
+    def test_resume_job(self, osrm, system):
+        """Test to verify a job that crashed resumes from its journal, replaying the routes and solutions obtained"""
+
+        # Constants
+        configuration = {
+            **self.configuration,
+            'SIMULATE_UNTIL': time(9, 45, 0),
+            'CREATE_USERS_UNTIL': time(9, 20, 0),
+            'DISPATCHER_MATCHING_POLICY': 'mdrp'
+        }
+        job = SimulationJob(instance=3, seed=1, settings={**configuration, 'CHECKPOINT_INTERVAL': min_to_sec(5)})
+        solve = OptimizationModel._solve
+        solved_models = []
+
+        def solve_until_exception(model: OptimizationModel):
+            """Dummy method to solve some models before the solver raises an exception"""
+
+            solved_models.append(model)
+
+            if len(solved_models) > 10:
+                raise RuntimeError('Solver exception')
+
+            return solve(model)
+
+        with tempfile.TemporaryDirectory() as directory, patch('runner.simulation_job.CHECKPOINTS_DIR_PATH', directory):
+            metrics = run_job(SimulationJob(instance=3, seed=1, settings=configuration)).metrics
+            routes = osrm.call_count
+
+            # Test 1: a solver exception stops the job, keeping its journal
+            osrm.reset_mock()
+            with patch.object(OptimizationModel, '_solve', solve_until_exception):
+                self.assertIsNotNone(run_job(job).error)
+
+            self.assertTrue(os.path.exists(job.journal_file_path))
+            crashed_routes = osrm.call_count
+
+            # Test 2: the resumed job only requests the routes it didn't obtain before and yields the same metrics
+            osrm.reset_mock()
+            resumed_result = run_job(dataclasses.replace(job, resume=True))
+            self.assertIsNone(resumed_result.error)
+            self.assertEqual(osrm.call_count, routes - crashed_routes)
+            self.assertFalse(os.path.exists(job.journal_file_path))
+
+            for name in ['order_metrics', 'courier_metrics']:
+                self.assertTrue(
+                    resumed_result.metrics[name].drop(columns='extra_settings').equals(
+                        metrics[name].drop(columns='extra_settings')
+                    )
+                )
+
+    def test_run(self):
+        """Test to verify the runner streams the results of the jobs run by its worker processes"""
+
+        # Constants
+        jobs = [
+            SimulationJob(instance=3, seed=seed, settings={**self.configuration, 'SIMULATE_UNTIL': time(9, 0, 0)})
+            for seed in [1, 2]
+        ] + [SimulationJob(instance=999, settings=self.configuration)]
+
+        # Test 1: every result is handed back and the failed jobs are returned
+        results = []
+        failed_jobs = SimulationRunner(workers=2).run(jobs, on_result=results.append)
+        self.assertEqual(sorted(result.job.seed or 0 for result in results), [0, 1, 2])
+        self.assertEqual(failed_jobs, [jobs[2]])
+        self.assertEqual(sum(result.metrics is not None for result in results), 2)
+
+        # Test 2: no jobs, no workers
+        self.assertEqual(SimulationRunner(workers=2).run([], on_result=results.append), [])
+
+    @patch('runner.simulation_runner.run_job', side_effect=mocked_run_job)
+    def test_run_killed_worker(self, job_runner):
+        """Test to verify a job whose worker process is killed is handed back as failed instead of waited on"""
+
+        # Constants
+        jobs = [SimulationJob(instance=3, seed=seed, settings=self.configuration) for seed in [1, 2]]
+
+        # Test 1: the killed job fails and the other one finishes
+        results = []
+        failed_jobs = SimulationRunner(workers=2).run(jobs, on_result=results.append)
+        self.assertEqual(failed_jobs, [jobs[1]])
+        self.assertEqual(sorted((result.job.seed, result.error is None) for result in results), [(1, True), (2, False)])
@@ -0,0 +1,139 @@
+import os
+import signal
+import unittest
+from datetime import time
+from unittest.mock import patch
+
+from actors.world import World
+from runner.simulation_job import SimulationJob, run_job
+from runner.simulation_runner import SimulationRunner
+from runner.warm_up_fork import warm_up_jobs
+from settings import settings
+from tests.test_utils import mocked_get_route
+from utils.datetime_utils import min_to_sec
+
+
+def mocked_world(**kwargs) -> World:
+    """Dummy method of a world whose warm-up process is killed for the first seed"""
+
+    if settings.SEED == 1:
+        os.kill(os.getpid(), signal.SIGKILL)
+
+    return World(**kwargs)
+
+
+class TestsWarmUpFork(unittest.TestCase):
+    """Tests for the warm-up fork of simulations"""
+
+    # Settings of a short simulation of the instance .csv files, to be reused
+    configuration = {
+        'INSTANCE_INGESTION': 'csv',
+        'SIMULATE_FROM': time(8, 55, 0),
+        'SIMULATE_UNTIL': time(9, 30, 0),
+        'CREATE_USERS_FROM': time(9, 0, 0),
+        'CREATE_USERS_UNTIL': time(9, 10, 0),
+        'CREATE_COURIERS_FROM': time(8, 55, 0),
+        'CREATE_COURIERS_UNTIL': time(9, 5, 0),
+        'WARM_UP_TIME': min_to_sec(10)
+    }
+
+    def test_warm_up_jobs(self):
+        """Test to verify the jobs are grouped by the warm-up they share"""
+
+        # Constants
+        jobs = [
+            SimulationJob(instance=3, seed=1, settings={**self.configuration, 'DISPATCHER_MATCHING_POLICY': policy})
+            for policy in ['greedy', 'mdrp']
+        ] + [
+            SimulationJob(instance=3, seed=2, settings={**self.configuration, 'DISPATCHER_MATCHING_POLICY': 'greedy'}),
+            SimulationJob(
+                instance=3,
+                seed=1,
+                settings={**self.configuration, 'DISPATCHER_MATCHING_POLICY': 'greedy', 'WARM_UP_TIME': 0}
+            )
+        ]
+
+        # Test 1: only jobs with the same instance, seed and warm-up settings are forked from the same warm-up
+        groups = warm_up_jobs(jobs)
+        self.assertEqual([len(group.forks) for group in groups], [2, 1, 1])
+        self.assertEqual(groups[0].fork_jobs(), jobs[:2])
+        self.assertEqual([group.fork_jobs() for group in groups[1:]], [[jobs[2]], [jobs[3]]])
+
+        # Test 2: the warm-up simulates with the shared settings only, plus the warm-up settings
+        self.assertNotIn('DISPATCHER_MATCHING_POLICY', groups[0].configuration)
+        self.assertEqual(groups[1].configuration['DISPATCHER_MATCHING_POLICY'], 'greedy')
+        groups = warm_up_jobs(jobs, warm_up_settings={'DISPATCHER_MATCHING_POLICY': 'greedy'})
+        self.assertEqual(groups[0].configuration['DISPATCHER_MATCHING_POLICY'], 'greedy')
+        self.assertEqual(groups[0].fork_jobs(), jobs[:2])
+
+        # Test 3: the warm-up settings can't change what the forks share
+        with self.assertRaises(ValueError):
+            warm_up_jobs(jobs, warm_up_settings={'WARM_UP_TIME': 0})
+
+    @patch('actors.world.system')
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    def test_run_warm_up(self, osrm, system):
+        """Test to verify a forked simulation yields the same metrics as a simulation from the start"""
+
+        # Constants
+        jobs = [
+            SimulationJob(instance=3, seed=1, settings={**self.configuration, 'DISPATCHER_MATCHING_POLICY': 'greedy'}),
+            SimulationJob(
+                instance=3,
+                seed=1,
+                settings={**self.configuration, 'DISPATCHER_MATCHING_POLICY': 'greedy', 'DISPATCHER_DELAY_PENALTY': 0}
+            )
+        ]
+
+        # Test 1: every fork finishes and the one with the warm-up's settings matches the simulation from the start
+        results = []
+        failed_jobs = SimulationRunner(workers=2).run_warm_up(warm_up_jobs(jobs), on_result=results.append)
+        self.assertEqual(failed_jobs, [])
+        self.assertEqual(sorted(result.job.key for result in results), sorted(job.key for job in jobs))
+
+        forked_metrics = next(result.metrics for result in results if result.job == jobs[0])
+        metrics = run_job(jobs[0]).metrics
+        self.assertFalse(metrics['order_metrics'].empty)
+        self.assertTrue(forked_metrics['order_metrics'].equals(metrics['order_metrics']))
+        self.assertTrue(forked_metrics['courier_metrics'].equals(metrics['courier_metrics']))
+
+        # Test 2: a warm-up that fails fails every fork
+        failed_jobs = SimulationRunner(workers=2).run_warm_up(
+            warm_up_jobs([SimulationJob(instance=999, settings=self.configuration)]),
+            on_result=results.append
+        )
+        self.assertEqual(len(failed_jobs), 1)
+        self.assertIsNotNone(results[-1].error)
+
+    @patch('actors.world.system')
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    def test_run_warm_ups_sharing_workers(self, osrm, system):
+        """Test to verify several warm-ups share the workers, which a killed warm-up gives back"""
+
+        # Constants
+        greedy_configuration = {**self.configuration, 'DISPATCHER_MATCHING_POLICY': 'greedy'}
+        jobs = [
+            SimulationJob(instance=3, seed=seed, settings={**greedy_configuration, 'DISPATCHER_DELAY_PENALTY': value})
+            for seed in [2, 3]
+            for value in [0, 0.4]
+        ]
+
+        # Test 1: the forks of every warm-up finish, with fewer workers than forks
+        results = []
+        failed_jobs = SimulationRunner(workers=3).run_warm_up(warm_up_jobs(jobs), on_result=results.append)
+        self.assertEqual(failed_jobs, [])
+        self.assertEqual(sorted(result.job.key for result in results), sorted(job.key for job in jobs))
+
+        # Test 2: a killed warm-up fails its forks and releases its worker, so the next warm-up runs
+        killed_job = SimulationJob(instance=3, seed=1, settings=greedy_configuration)
+
+        with patch('runner.warm_up_fork.World', side_effect=mocked_world):
+            results = []
+            failed_jobs = SimulationRunner(workers=1).run_warm_up(
+                warm_up_jobs([killed_job, jobs[0]]),
+                on_result=results.append
+            )
+
+        self.assertEqual(failed_jobs, [killed_job])
+        self.assertEqual(len(results), 2)
+        self.assertIsNotNone(next(result for result in results if result.job == jobs[0]).metrics)
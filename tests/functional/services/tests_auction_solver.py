@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from services.optimization_service.auction.auction_solver import AuctionSolver
+from services.optimization_service.model.constraints.courier_assignment_constraint import CourierAssignmentConstraint
+from services.optimization_service.model.constraints.route_assignment_constraint import RouteAssignmentConstraint
+from services.optimization_service.model.mip_model_builder import MIPOptimizationModelBuilder
+from services.optimization_service.model.optimization_model import SOLUTION_VALUE
+from tests.test_utils import build_random_matching_problem
+
+
+class TestsAuctionSolver(unittest.TestCase):
+    """Tests for the auction solver class"""
+
+    def test_solve(self):
+        """Test to verify the auction reaches the same value as the MIP and respects the assignment constraints"""
+
+        # Constants
+        num_couriers = 12
+        num_routes = 9
+        seed = 1234
+
+        # Solves the problem with the MIP and the auction
+        problem = build_random_matching_problem(num_couriers, num_routes, seed)
+        mip_model = MIPOptimizationModelBuilder(
+            sense='max',
+            model_constraints=[CourierAssignmentConstraint(), RouteAssignmentConstraint()],
+            optimizer='pulp'
+        ).build(problem)
+        mip_solution = mip_model.solve()[0:len(problem.prospects)]
+        auction_solution, iterations = AuctionSolver().solve(problem)
+
+        # Asserts the auction yields a feasible solution with the optimal value
+        matched_prospects = problem.prospects[auction_solution >= SOLUTION_VALUE]
+        self.assertEqual(len(np.unique(matched_prospects[:, 0])), len(matched_prospects))
+        self.assertEqual(len(np.unique(matched_prospects[:, 1])), len(matched_prospects))
+        self.assertAlmostEqual(
+            np.dot(auction_solution, problem.costs),
+            np.dot(mip_solution, problem.costs),
+            delta=1e-4 * problem.costs.max()
+        )
+        self.assertTrue(iterations)
+
+    def test_warm_start(self):
+        """Test to verify how prices carried over from a previous epoch shorten the auction"""
+
+        # Constants
+        num_couriers = 30
+        num_routes = 25
+        seed = 4321
+
+        # Solves the same problem twice with a warm solver and once with a cold solver
+        problem = build_random_matching_problem(num_couriers, num_routes, seed)
+        solver = AuctionSolver()
+        cold_solution, cold_iterations = solver.solve(problem)
+        warm_solution, warm_iterations = solver.solve(problem)
+
+        # Asserts the warm-started auction keeps the value while placing fewer bids
+        self.assertAlmostEqual(
+            np.dot(warm_solution, problem.costs),
+            np.dot(cold_solution, problem.costs),
+            delta=1e-4 * problem.costs.max()
+        )
+        self.assertLess(warm_iterations, cold_iterations)
+
+        # Asserts that resetting the solver discards the prices
+        solver.reset()
+        _, reset_iterations = solver.solve(problem)
+        self.assertEqual(reset_iterations, cold_iterations)
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from services.checkpoint_service import CheckpointService
+
+
+class TestsCheckpointService(unittest.TestCase):
+    """Tests for the Checkpoint Service class"""
+
+    def test_journal_and_replay(self):
+        """Test to verify the journaled results are replayed when resuming, instead of computing them again"""
+
+        # Constants
+        compute = Mock(side_effect=[[1, 2], [3, 4], [5, 6], [7, 8]])
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'checkpoints', 'simulation.journal')
+
+            # Test 1: a closed service computes the results without journaling them
+            service = CheckpointService()
+            self.assertEqual(service.fetch(kind='route', key='a', compute=compute), [1, 2])
+            self.assertFalse(service.is_open)
+
+            # Test 2: the results and checkpoints are journaled to the file
+            service.open(file_path)
+            self.assertEqual(service.fetch(kind='route', key='a', compute=compute), [3, 4])
+            self.assertEqual(service.fetch(kind='route', key='b', compute=compute, encode=tuple), [5, 6])
+            service.checkpoint(sim_time=3600, state='| 2 routes')
+            service.close()
+
+            with open(file_path, 'a') as file:
+                file.write('{"kind": "route", "key": "c", "val')
+
+            # Test 3: resuming replays the results of each key in order, ignoring an entry that was cut short
+            service.open(file_path, resume=True)
+            self.assertTrue(service.is_replaying)
+            self.assertEqual(service.fetch(kind='route', key='b', compute=compute, decode=list), [5, 6])
+            self.assertEqual(service.fetch(kind='route', key='a', compute=compute), [3, 4])
+            service.checkpoint(sim_time=3600, state='| 2 routes')
+            self.assertFalse(service.is_replaying)
+            self.assertEqual(compute.call_count, 3)
+
+            # Test 4: once replayed, the simulation continues live and finishing discards the journal
+            self.assertEqual(service.fetch(kind='route', key='a', compute=compute), [7, 8])
+            service.close(discard=True)
+            self.assertFalse(os.path.exists(file_path))
+
+    def test_diverged_replay(self):
+        """Test to verify a replay that reaches a different state than the journaled one continues live"""
+
+        # Constants
+        compute = Mock(side_effect=[[1], [2], [3]])
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'simulation.journal')
+            service = CheckpointService()
+            service.open(file_path)
+            service.fetch(kind='solution', key='x', compute=compute)
+            service.fetch(kind='solution', key='x', compute=compute)
+            service.checkpoint(sim_time=60, state='| 1 fulfilled')
+            service.close()
+
+            # Test 1: the replay is discarded after diverging and the journal starts over
+            service.open(file_path, resume=True)
+            self.assertEqual(service.fetch(kind='solution', key='x', compute=compute), [1])
+            service.checkpoint(sim_time=60, state='| 0 fulfilled')
+            self.assertFalse(service.is_replaying)
+            self.assertEqual(service.fetch(kind='solution', key='x', compute=compute), [3])
+            service.close()
+
+            with open(file_path) as file:
+                self.assertEqual(len(file.readlines()), 2)
+
+    def test_unjournaled_result(self):
+        """Test to verify a replay that obtains a result that was not journaled continues live"""
+
+        # Constants
+        compute = Mock(side_effect=[[1], [2], [3], [4]])
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'simulation.journal')
+            service = CheckpointService()
+            service.open(file_path)
+            service.fetch(kind='solution', key='x', compute=compute)
+            service.fetch(kind='solution', key='y', compute=compute)
+            service.checkpoint(sim_time=60, state='| 1 fulfilled')
+            service.close()
+
+            # Test 1: another problem is solved live instead of replaying a journaled solution, and the replay stops
+            service.open(file_path, resume=True)
+            self.assertEqual(service.fetch(kind='solution', key='z', compute=compute), [3])
+            self.assertFalse(service.is_replaying)
+            self.assertEqual(service.fetch(kind='solution', key='y', compute=compute), [4])
+            service.close()
+
+            with open(file_path) as file:
+                self.assertEqual(len(file.readlines()), 2)
@@ -0,0 +1,52 @@
+import unittest
+
+from simpy import Environment
+
+from services.deadline_service import DeadlineService
+from utils.datetime_utils import hour_to_sec
+
+
+class TestsDeadlineService(unittest.TestCase):
+    """Tests for the Deadline Service class"""
+
+    def test_schedule_and_cancel(self):
+        """Test to verify how deadlines are fired in order, once, and how they are canceled"""
+
+        # Constants
+        initial_time = hour_to_sec(12)
+
+        # Services
+        env = Environment(initial_time=initial_time)
+        service = DeadlineService.of(env)
+        fired = []
+
+        # Schedules deadlines in different seconds, some of them sharing a second, and cancels one
+        service.schedule(deadline=initial_time + 30, callback=lambda: fired.append(('b', env.now)))
+        service.schedule(deadline=initial_time + 10, callback=lambda: fired.append(('a', env.now)))
+        service.schedule(deadline=initial_time + 30, callback=lambda: fired.append(('c', env.now)))
+        handle = service.schedule(deadline=initial_time + 20, callback=lambda: fired.append(('x', env.now)))
+        service.schedule(deadline=initial_time + 39.2, callback=lambda: fired.append(('d', env.now)))
+        service.cancel(handle)
+        service.cancel(handle)
+        self.assertIs(DeadlineService.of(env), service)
+        self.assertEqual(len(service), 4)
+
+        # Asserts the deadlines are fired at their second, rounded up, and removed once handled
+        env.run(until=initial_time + 35)
+        self.assertEqual(fired, [('a', initial_time + 10), ('b', initial_time + 30), ('c', initial_time + 30)])
+        self.assertEqual(len(service), 1)
+        env.run(until=initial_time + 60)
+        self.assertEqual(fired[-1], ('d', initial_time + 40))
+        self.assertEqual(len(service), 0)
+
+        # Asserts that a deadline scheduled while firing another one, for the same second, is fired right away
+        service.schedule(
+            deadline=env.now + 5,
+            callback=lambda: service.schedule(deadline=env.now, callback=lambda: fired.append(('e', env.now)))
+        )
+        env.run(until=initial_time + 70)
+        self.assertEqual(fired[-1], ('e', initial_time + 65))
+        self.assertEqual(len(service), 0)
+
+        # Asserts that another environment has its own service
+        self.assertIsNot(DeadlineService.of(Environment(initial_time=initial_time)), service)
@@ -0,0 +1,139 @@
+import os
+import tempfile
+import unittest
+from datetime import time
+from unittest.mock import patch
+
+from objects.order_table import OrderTable
+from services.instance_data_service import InstanceDataService
+from utils.datetime_utils import SECONDS_PER_DAY
+
+
+class TestsInstanceDataService(unittest.TestCase):
+    """Tests for the Instance Data Service class"""
+
+    @patch('settings.settings.CREATE_USERS_FROM', time(9, 0, 0))
+    @patch('settings.settings.CREATE_USERS_UNTIL', time(9, 30, 0))
+    @patch('settings.settings.CREATE_COURIERS_FROM', time(0, 0, 0))
+    @patch('settings.settings.CREATE_COURIERS_UNTIL', time(0, 5, 0))
+    def test_csv_ingestion(self):
+        """Test to verify how the instance data is loaded at once from the .csv files"""
+
+        # Loads an instance's data
+        instance_data_service = InstanceDataService(instance=3, ingestion='csv')
+        orders_info = instance_data_service.get_orders_info()
+        couriers_info = instance_data_service.get_couriers_info()
+
+        # Asserts the orders are parsed, filtered and sorted by placement time
+        self.assertTrue(orders_info)
+        placement_times = [order_info['placement_time'] for order_info in orders_info]
+        self.assertEqual(placement_times, sorted(placement_times))
+        self.assertTrue(all(time(9, 0, 0) <= placement_time <= time(9, 30, 0) for placement_time in placement_times))
+        self.assertEqual(
+            set(orders_info[0].keys()),
+            {
+                'order_id', 'pick_up_lat', 'pick_up_lng', 'drop_off_lat', 'drop_off_lng', 'placement_time',
+                'preparation_time', 'ready_time', 'expected_drop_off_time'
+            }
+        )
+        self.assertIsInstance(orders_info[0]['ready_time'], time)
+
+        # Asserts the couriers are parsed, filtered and sorted by on time
+        self.assertTrue(couriers_info)
+        on_times = [courier_info['on_time'] for courier_info in couriers_info]
+        self.assertEqual(on_times, sorted(on_times))
+        self.assertTrue(all(time(0, 0, 0) <= on_time <= time(0, 5, 0) for on_time in on_times))
+        self.assertIsInstance(couriers_info[0]['off_time'], time)
+
+    @patch('settings.settings.CREATE_USERS_FROM', time(23, 0, 0))
+    @patch('settings.settings.CREATE_USERS_UNTIL', time(1, 0, 0))
+    @patch('settings.settings.CREATE_COURIERS_FROM', time(22, 0, 0))
+    @patch('settings.settings.CREATE_COURIERS_UNTIL', time(0, 5, 0))
+    def test_csv_ingestion_across_midnight(self):
+        """Test to verify how the instance data is loaded from the .csv files when the windows cross midnight"""
+
+        # Loads an instance's data
+        instance_data_service = InstanceDataService(instance=3, ingestion='csv')
+        orders_info = instance_data_service.get_orders_info()
+        couriers_info = instance_data_service.get_couriers_info()
+
+        # Asserts the orders of both days are kept, sorted with the ones placed before midnight first
+        placement_times = [order_info['placement_time'] for order_info in orders_info]
+        self.assertTrue(any(placement_time >= time(23, 0, 0) for placement_time in placement_times))
+        self.assertTrue(any(placement_time <= time(1, 0, 0) for placement_time in placement_times))
+        self.assertTrue(all(
+            placement_time >= time(23, 0, 0) or placement_time <= time(1, 0, 0)
+            for placement_time in placement_times
+        ))
+        self.assertEqual(
+            placement_times,
+            sorted(placement_times, key=lambda placement_time: (placement_time < time(23, 0, 0), placement_time))
+        )
+
+        # Asserts the couriers of both days are kept
+        on_times = [courier_info['on_time'] for courier_info in couriers_info]
+        self.assertTrue(any(on_time >= time(22, 0, 0) for on_time in on_times))
+        self.assertTrue(any(on_time <= time(0, 5, 0) for on_time in on_times))
+        self.assertTrue(all(on_time >= time(22, 0, 0) or on_time <= time(0, 5, 0) for on_time in on_times))
+
+    @patch('settings.settings.CREATE_USERS_FROM', time(9, 0, 0))
+    @patch('settings.settings.CREATE_USERS_UNTIL', time(9, 30, 0))
+    @patch('settings.settings.CREATE_COURIERS_FROM', time(0, 0, 0))
+    @patch('settings.settings.CREATE_COURIERS_UNTIL', time(0, 5, 0))
+    def test_memmap_ingestion(self):
+        """Test to verify the instance data memory-mapped from columns is the same as the data from the .csv files"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            with patch('services.instance_data_service.COLUMNS_SUB_DIR_PATH', directory + '/{instance_id}'):
+                # Loads an instance's data, writing the columns the first time and mapping them afterwards
+                for _ in range(2):
+                    instance_data_service = InstanceDataService(instance=3, ingestion='memmap')
+                    orders_info = instance_data_service.get_orders_info()
+                    couriers_info = instance_data_service.get_couriers_info()
+
+                    # Asserts the rows, values and types are the same as the ones parsed from the .csv files
+                    csv_instance_data_service = InstanceDataService(instance=3, ingestion='csv')
+                    self.assertTrue(orders_info)
+                    self.assertEqual(orders_info, csv_instance_data_service.get_orders_info())
+                    self.assertEqual(couriers_info, csv_instance_data_service.get_couriers_info())
+                    self.assertIsInstance(orders_info[0]['ready_time'], time)
+                    self.assertIsInstance(couriers_info[0]['vehicle'], str)
+
+                self.assertEqual(sorted(os.listdir(f'{directory}/3')), ['couriers', 'orders'])
+
+    @patch('settings.settings.CREATE_USERS_FROM', time(23, 0, 0))
+    @patch('settings.settings.CREATE_USERS_UNTIL', time(1, 0, 0))
+    @patch('settings.settings.CREATE_COURIERS_FROM', time(22, 0, 0))
+    @patch('settings.settings.CREATE_COURIERS_UNTIL', time(0, 5, 0))
+    def test_memmap_ingestion_across_midnight(self):
+        """Test to verify the memory-mapped data is the same as the .csv files data when the windows cross midnight"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            with patch('services.instance_data_service.COLUMNS_SUB_DIR_PATH', directory + '/{instance_id}'):
+                # Loads an instance's data
+                instance_data_service = InstanceDataService(instance=3, ingestion='memmap')
+                orders_info = instance_data_service.get_orders_info()
+                couriers_info = instance_data_service.get_couriers_info()
+
+                # Asserts the rows of both days are kept in the same order as the ones parsed from the .csv files
+                csv_instance_data_service = InstanceDataService(instance=3, ingestion='csv')
+                self.assertTrue(any(order_info['placement_time'] <= time(1, 0, 0) for order_info in orders_info))
+                self.assertEqual(orders_info, csv_instance_data_service.get_orders_info())
+                self.assertEqual(couriers_info, csv_instance_data_service.get_couriers_info())
+
+                # Asserts the order table built from the mapped columns is the same as the one built from the rows
+                columns_table = OrderTable(
+                    instance_data_service.get_orders_columns(),
+                    start_time=time(23, 0, 0),
+                    seed=10
+                )
+                rows_table = OrderTable.from_orders_info(orders_info, start_time=time(23, 0, 0), seed=10)
+                self.assertEqual(columns_table.order_ids.tolist(), rows_table.order_ids.tolist())
+                self.assertEqual(columns_table.placement_times.tolist(), rows_table.placement_times.tolist())
+                self.assertEqual(columns_table.ready_times.tolist(), rows_table.ready_times.tolist())
+                self.assertEqual(columns_table.pick_up_coordinates.tolist(), rows_table.pick_up_coordinates.tolist())
+                self.assertGreater(columns_table.placement_times.max(), SECONDS_PER_DAY)
+
+                # Asserts the columns are only read with the memory-mapped ingestion
+                with self.assertRaises(ValueError):
+                    csv_instance_data_service.get_couriers_columns()
@@ -0,0 +1,149 @@
+import dataclasses
+import os
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from gurobipy import Env, GurobiError
+
+from policies.dispatcher.matching.myopic import MIP_MODEL_BUILDER
+from services.optimization_service.model.constraints.courier_assignment_constraint import CourierAssignmentConstraint
+from services.optimization_service.model.constraints.route_assignment_constraint import RouteAssignmentConstraint
+from services.optimization_service.model.mip_model_builder import MIPOptimizationModelBuilder
+from services.optimization_service.model.solver_session import SolverSession
+from tests.test_utils import build_random_matching_problem
+
+
+def gurobi_available() -> bool:
+    """Method to establish if a Gurobi environment can be started with the installed license"""
+
+    try:
+        env = Env(empty=True)
+        env.setParam('OutputFlag', 0)
+        env.start()
+        env.dispose()
+
+        return True
+
+    except GurobiError:
+        return False
+
+
+class TestsSolverSession(unittest.TestCase):
+    """Tests for the solver session class"""
+
+    def test_builder_optimizer(self):
+        """Test to verify a builder without an optimizer uses the one in the settings when it builds a model"""
+
+        # Constants
+        session = SolverSession()
+        session.open(optimizer='pulp')
+        problem = build_random_matching_problem(num_couriers=3, num_routes=4, seed=5)
+
+        # Test 1: the optimizer follows the settings of the job being simulated
+        for optimizer in ['pulp', 'gurobi']:
+            with patch('settings.settings.OPTIMIZER', optimizer):
+                self.assertEqual(MIP_MODEL_BUILDER.optimizer, optimizer)
+
+        # Test 2: the model is built with the optimizer in the settings, reusing the session opened with it
+        with patch('settings.settings.OPTIMIZER', 'pulp'):
+            model = MIP_MODEL_BUILDER.build(problem, session=session)
+            self.assertIs(model.session, session)
+
+        session.close()
+
+    def test_model_digest(self):
+        """Test to verify models are identified by their formulation and problem, to replay their solutions"""
+
+        # Constants
+        builder = MIPOptimizationModelBuilder(
+            sense='max',
+            model_constraints=[CourierAssignmentConstraint(), RouteAssignmentConstraint()],
+            optimizer='pulp'
+        )
+        relaxation_builder = MIPOptimizationModelBuilder(
+            sense='max',
+            model_constraints=[CourierAssignmentConstraint(), RouteAssignmentConstraint()],
+            optimizer='pulp',
+            relaxation=True
+        )
+        problem = build_random_matching_problem(6, 5, 7)
+
+        # Test 1: the same problem yields the same digest, even when built again
+        digest = builder.build(problem).digest
+        self.assertEqual(builder.build(problem).digest, digest)
+
+        # Test 2: another formulation, other prospects of the same shape or other costs yield other digests
+        self.assertNotEqual(relaxation_builder.build(problem).digest, digest)
+        other_problem = dataclasses.replace(problem, matching_prospects=problem.matching_prospects[::-1])
+        self.assertNotEqual(builder.build(other_problem).digest, digest)
+        other_problem = dataclasses.replace(problem, costs=problem.costs + 1)
+        self.assertNotEqual(builder.build(other_problem).digest, digest)
+
+    def test_pulp_session(self):
+        """Test to verify how models are solved across epochs with a single session"""
+
+        # Constants
+        builder = MIPOptimizationModelBuilder(
+            sense='max',
+            model_constraints=[CourierAssignmentConstraint(), RouteAssignmentConstraint()],
+            optimizer='pulp'
+        )
+        problems = [build_random_matching_problem(6, 5, seed) for seed in range(3)]
+
+        # Opens the session and solves several epochs with and without it
+        session = SolverSession()
+        session.open(optimizer='pulp')
+        solver = session.pulp_solver()
+        tmp_dir = solver.tmpDir
+
+        for problem in problems:
+            session_model = builder.build(problem, session=session)
+            self.assertIs(session_model.session, session)
+            self.assertTrue(np.array_equal(session_model.solve(), builder.build(problem).solve()))
+            self.assertIs(session.pulp_solver(), solver)
+            self.assertFalse(os.listdir(tmp_dir))
+
+        # Closes the session and asserts it is no longer used
+        session.close()
+        self.assertIsNone(session.optimizer)
+        self.assertFalse(os.path.exists(tmp_dir))
+        self.assertIsNone(builder.build(problems[0], session=session).session)
+
+    @unittest.skipUnless(gurobi_available(), 'Gurobi license not available')
+    def test_gurobi_session(self):
+        """Test to verify how different models are solved in a row on the single Gurobi model of a session"""
+
+        # Constants
+        builder = MIPOptimizationModelBuilder(
+            sense='max',
+            model_constraints=[CourierAssignmentConstraint(), RouteAssignmentConstraint()],
+            optimizer='gurobi'
+        )
+        pulp_builder = MIPOptimizationModelBuilder(
+            sense='max',
+            model_constraints=[CourierAssignmentConstraint(), RouteAssignmentConstraint()],
+            optimizer='pulp'
+        )
+        problems = [build_random_matching_problem(6, 5, seed=7), build_random_matching_problem(4, 8, seed=11)]
+
+        # Solves problems of different sizes in a row, reusing the model emptied from the previous problem
+        session = SolverSession()
+        session.open(optimizer='gurobi')
+        engine_models = []
+
+        for problem in problems:
+            session_model = builder.build(problem, session=session)
+            solution = session_model.solve()
+            engine_models.append(session_model.engine_model)
+            self.assertIs(session_model.session, session)
+            self.assertEqual(session_model.engine_model.NumVars, session_model.variable_set.size)
+            self.assertEqual(solution.shape, session_model.variable_set.shape)
+            self.assertTrue(np.array_equal(np.round(solution), builder.build(problem).solve().round()))
+            self.assertTrue(np.array_equal(np.round(solution), pulp_builder.build(problem).solve().round()))
+
+        self.assertIs(engine_models[0], engine_models[1])
+
+        # Closes the session and asserts it is no longer used
+        session.close()
+        self.assertIsNone(builder.build(problems[0], session=session).session)
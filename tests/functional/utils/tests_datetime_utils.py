@@ -0,0 +1,29 @@
+import unittest
+from datetime import time
+
+from utils.datetime_utils import time_in_window, window_to_query_format
+
+
+class TestsDatetimeUtils(unittest.TestCase):
+    """Tests for the datetime utils"""
+
+    def test_window(self):
+        """Test to verify how times are found in a window, which may cross midnight"""
+
+        # Test 1: a window within the day keeps the times between its start and end
+        self.assertTrue(time_in_window(time(9, 0, 0), window_from=time(9, 0, 0), window_until=time(10, 0, 0)))
+        self.assertTrue(time_in_window(time(10, 0, 0), window_from=time(9, 0, 0), window_until=time(10, 0, 0)))
+        self.assertFalse(time_in_window(time(23, 0, 0), window_from=time(9, 0, 0), window_until=time(10, 0, 0)))
+        self.assertEqual(
+            window_to_query_format('on_time', window_from=time(9, 0, 0), window_until=time(10, 0, 0)),
+            '(on_time >= \'9:0:0\' AND on_time <= \'10:0:0\')'
+        )
+
+        # Test 2: a window crossing midnight keeps the times after its start or before its end
+        self.assertTrue(time_in_window(time(23, 30, 0), window_from=time(23, 0, 0), window_until=time(1, 0, 0)))
+        self.assertTrue(time_in_window(time(0, 30, 0), window_from=time(23, 0, 0), window_until=time(1, 0, 0)))
+        self.assertFalse(time_in_window(time(12, 0, 0), window_from=time(23, 0, 0), window_until=time(1, 0, 0)))
+        self.assertEqual(
+            window_to_query_format('on_time', window_from=time(23, 0, 0), window_until=time(1, 0, 0)),
+            '(on_time >= \'23:0:0\' OR on_time <= \'1:0:0\')'
+        )
@@ -0,0 +1,43 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from simpy import Environment
+
+from actors.courier import Courier
+from actors.user import User
+from utils.random_utils import random_stream, replication_seeds, stream_seed
+
+
+class TestsRandomUtils(unittest.TestCase):
+    """Tests for the random utils"""
+
+    @patch('settings.settings.SEED', 8795)
+    def test_random_stream(self):
+        """Test to verify random streams are derived from the seed and the keys, regardless of other draws"""
+
+        # Test 1: a stream yields the same draws for the same seed and keys, and other draws otherwise
+        draws = [random_stream('courier', 7, 'acceptance').random() for _ in range(2)]
+        self.assertEqual(draws[0], draws[1])
+        self.assertNotEqual(draws[0], random_stream('courier', 8, 'acceptance').random())
+        self.assertNotEqual(draws[0], random_stream('courier', 7, 'movement_evaluation').random())
+        self.assertNotEqual(stream_seed('courier', 7, 'acceptance'), stream_seed('courier', 7, 'acceptance', seed=1))
+
+        # Test 2: an actor draws the same numbers no matter which draws happened before it was created
+        env = Environment()
+        courier = Courier(env=env, courier_id=7, on_time=0, off_time=100)
+        user = User(env=env, user_id=3)
+        random.random()
+        Courier(env=env, courier_id=8, on_time=0, off_time=100).acceptance_stream.random()
+        same_courier = Courier(env=env, courier_id=7, on_time=0, off_time=100)
+        self.assertEqual(same_courier.acceptance_rate, courier.acceptance_rate)
+        self.assertEqual(User(env=env, user_id=3).cancellation_stream.random(), user.cancellation_stream.random())
+
+    def test_replication_seeds(self):
+        """Test to verify the seeds of the replications are reproducible and distinct"""
+
+        # Test 1: the same replications are derived from the same seed
+        seeds = replication_seeds(5, seed=8795)
+        self.assertEqual(seeds, replication_seeds(5, seed=8795))
+        self.assertEqual(len(set(seeds)), 5)
+        self.assertNotEqual(seeds, replication_seeds(5, seed=8796))
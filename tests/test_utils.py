@@ -1,13 +1,20 @@
-from typing import Iterable, List, Tuple
+import random
+from typing import Iterable, List, Tuple, Optional
+
+import numpy as np
 
 from actors.courier import Courier
+from objects.fleet_store import FleetView
 from objects.location import Location
 from objects.matching_metric import MatchingMetric
 from objects.notification import Notification
 from objects.order import Order
+from objects.order_table import OrderTableView
 from objects.route import Route
-from objects.stop import Stop
 from policies.dispatcher.matching.dispatcher_matching_policy import DispatcherMatchingPolicy
+from services.optimization_service.problem.matching_problem import MatchingProblem
+from services.optimization_service.problem.matching_problem_builder import MatchingProblemBuilder
+from utils.datetime_utils import hour_to_sec
 
 
 class DummyMatchingPolicy(DispatcherMatchingPolicy):
@@ -17,7 +24,9 @@ class DummyMatchingPolicy(DispatcherMatchingPolicy):
             self,
             orders: Iterable[Order],
             couriers: Iterable[Courier],
-            env_time: int
+            env_time: int,
+            fleet: Optional[FleetView] = None,
+            order_view: Optional[OrderTableView] = None
     ) -> Tuple[List[Notification], MatchingMetric]:
         """Implementation of the dummy policy"""
 
@@ -27,4 +36,26 @@ class DummyMatchingPolicy(DispatcherMatchingPolicy):
 def mocked_get_route(origin: Location, destination: Location) -> Route:
     """Method that mocks how a route is obtained going from an origin to a destination"""
 
-    return Route(stops=[Stop(location=origin, position=0), Stop(location=destination, position=1)])
+    return Route.from_locations([origin, destination])
+
+
+def build_random_matching_problem(num_couriers: int, num_routes: int, seed: int) -> MatchingProblem:
+    """Method to build a random matching problem with some unattractive prospects"""
+
+    random.seed(seed)
+    couriers = [
+        Courier(courier_id=courier_id, on_time=hour_to_sec(8), off_time=hour_to_sec(16))
+        for courier_id in range(num_couriers)
+    ]
+    routes = [Route(orders={route_id: Order(order_id=route_id)}) for route_id in range(num_routes)]
+    prospects = np.array(
+        [
+            [courier_ix, route_ix]
+            for courier_ix in range(num_couriers)
+            for route_ix in range(num_routes)
+            if random.random() <= 0.6
+        ]
+    )
+    costs = np.array([random.uniform(-0.002, 0.01) for _ in range(len(prospects))])
+
+    return MatchingProblemBuilder.build(routes, couriers, prospects, costs)
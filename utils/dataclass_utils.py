@@ -0,0 +1,17 @@
+from dataclasses import fields
+
+
+def add_slots(cls: type) -> type:
+    """Decorator to rebuild a dataclass with __slots__ for its fields, dropping the per-instance __dict__"""
+
+    field_names = tuple(field.name for field in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+
+    for name in field_names + ('__dict__', '__weakref__'):
+        cls_dict.pop(name, None)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    return slotted_cls
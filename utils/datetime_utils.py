@@ -1,7 +1,9 @@
-import math
-from datetime import time, datetime, date, timedelta
+from datetime import time
+from functools import lru_cache
 from typing import Union
 
+import numpy as np
+
 
 def min_to_sec(minutes: float) -> Union[float, int]:
     """Convert minutes to seconds"""
@@ -15,7 +17,7 @@ def hour_to_sec(hours: float) -> Union[float, int]:
     return hours * 3600
 
 
-MAX_SECONDS = hour_to_sec(23) + min_to_sec(59) + 59
+SECONDS_PER_DAY = hour_to_sec(24)
 
 
 def sec_to_hour(seconds: float) -> float:
@@ -24,27 +26,17 @@ def sec_to_hour(seconds: float) -> float:
     return seconds / 3600
 
 
-def sec_to_time(seconds: int) -> time:
-    """Convert seconds since the day started to a time object"""
-
-    def next_precision_frac(interval: float) -> float:
-        """Convert time interval to fractional next precision"""
+@lru_cache(maxsize=SECONDS_PER_DAY)
+def _day_sec_to_time(day_seconds: int) -> time:
+    """Convert seconds since the day started to a time object, caching the conversion"""
 
-        return round(math.modf(interval)[0] * 60, 4)
+    return time(hour=day_seconds // 3600, minute=day_seconds % 3600 // 60, second=day_seconds % 60)
 
-    def next_precision(interval: float) -> int:
-        """Convert fractional time interval to next precision"""
 
-        return min(round(next_precision_frac(interval)), 59)
+def sec_to_time(seconds: float) -> time:
+    """Convert simulation seconds to a time object, wrapping around midnight"""
 
-    mod_seconds = MAX_SECONDS if seconds >= MAX_SECONDS else seconds
-    raw_hours = mod_seconds / 3600
-
-    return time(
-        hour=math.floor(raw_hours),
-        minute=next_precision(raw_hours),
-        second=next_precision(next_precision_frac(raw_hours))
-    )
+    return _day_sec_to_time(int(seconds) % SECONDS_PER_DAY)
 
 
 def time_to_sec(raw_time: time) -> Union[float, int]:
@@ -53,24 +45,46 @@ def time_to_sec(raw_time: time) -> Union[float, int]:
     return hour_to_sec(raw_time.hour) + min_to_sec(raw_time.minute) + raw_time.second
 
 
+def time_to_sim_sec(raw_time: time, start_time: time) -> int:
+    """Convert time object to simulation seconds, placing times earlier than the start time on the next day"""
+
+    seconds = time_to_sec(raw_time)
+
+    return seconds + SECONDS_PER_DAY if raw_time < start_time else seconds
+
+
+def day_sec_to_sim_sec(day_seconds: np.ndarray, start_time: time) -> np.ndarray:
+    """Convert seconds of the day to simulation seconds, placing seconds earlier than the start time on the next day"""
+
+    day_seconds = np.asarray(day_seconds, dtype=np.int64)
+
+    return np.where(day_seconds < time_to_sec(start_time), day_seconds + SECONDS_PER_DAY, day_seconds)
+
+
 def time_to_query_format(query_time: time) -> str:
     """Parse a time object to a str available to use in a query"""
 
     return f'\'{query_time.hour}:{query_time.minute}:{query_time.second}\''
 
 
-def time_diff(time_1: time, time_2: time) -> float:
-    """Returns the difference in seconds of time_1 - time_2"""
+def time_in_window(raw_time: time, window_from: time, window_until: time) -> bool:
+    """Establish if a time is within a window, which crosses midnight if it starts later than it ends"""
+
+    if window_from <= window_until:
+        return window_from <= raw_time <= window_until
 
-    diff = datetime.combine(date.today(), time_1) - datetime.combine(date.today(), time_2)
+    return raw_time >= window_from or raw_time <= window_until
 
-    return diff.total_seconds()
 
+def window_to_query_format(column: str, window_from: time, window_until: time) -> str:
+    """Parse a window of times to a condition on a column available to use in a query, crossing midnight if needed"""
 
-def time_add(time_to_add: time, seconds: float) -> time:
-    """Adds the desired seconds to the time provided"""
+    operator = 'AND' if window_from <= window_until else 'OR'
 
-    return (datetime.combine(date.today(), time_to_add) + timedelta(seconds=seconds)).time()
+    return (
+        f'({column} >= {time_to_query_format(window_from)} {operator} '
+        f'{column} <= {time_to_query_format(window_until)})'
+    )
 
 
 def time_to_str(time_to_convert: time) -> str:
@@ -0,0 +1,35 @@
+import numpy as np
+
+BASE32 = np.array(list('0123456789bcdefghjkmnpqrstuvwxyz'))
+
+
+def encode_vector(lats: np.ndarray, lngs: np.ndarray, precision: int) -> np.ndarray:
+    """Encode arrays of coordinates to geohashes at once, matching geohash.encode for every coordinate"""
+
+    num_bits = 5 * precision
+    lat_bits, lng_bits = num_bits // 2, (num_bits + 1) // 2
+    lat_cells = np.clip(
+        np.floor((np.asarray(lats, dtype=np.float64) / 90 + 1) * (1 << (lat_bits - 1))).astype(np.int64),
+        0,
+        (1 << lat_bits) - 1
+    )
+    lng_cells = np.clip(
+        np.floor((np.asarray(lngs, dtype=np.float64) / 180 + 1) * (1 << (lng_bits - 1))).astype(np.int64),
+        0,
+        (1 << lng_bits) - 1
+    )
+
+    codes = np.zeros(len(lat_cells), dtype=np.int64)
+    lat_bit, lng_bit = lat_bits - 1, lng_bits - 1
+    for bit in range(num_bits):
+        if bit % 2 == 0:
+            codes = (codes << 1) | ((lng_cells >> lng_bit) & 1)
+            lng_bit -= 1
+
+        else:
+            codes = (codes << 1) | ((lat_cells >> lat_bit) & 1)
+            lat_bit -= 1
+
+    chars = BASE32[np.stack([(codes >> (5 * (precision - 1 - ix))) & 31 for ix in range(precision)], axis=-1)]
+
+    return np.ascontiguousarray(chars).view(f'<U{precision}').reshape(len(codes))
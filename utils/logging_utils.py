@@ -3,6 +3,7 @@ import sys
 
 from simpy import Environment
 
+from objects.order_index import OrderState
 from settings import settings
 from utils.datetime_utils import sec_to_time
 
@@ -32,14 +33,14 @@ def world_log(dispatcher) -> str:
     """Method to log the state of the world"""
 
     return f'| Couriers => ' \
-           f'{len(dispatcher.idle_couriers)} idle, ' \
-           f'{len(dispatcher.moving_couriers)} moving, ' \
-           f'{len(dispatcher.picking_up_couriers)} picking_up, ' \
-           f'{len(dispatcher.dropping_off_couriers)} dropping_off, ' \
-           f'{len(dispatcher.logged_off_couriers)} logged_off. ' \
+           f'{dispatcher.courier_registry.count("idle")} idle, ' \
+           f'{dispatcher.courier_registry.count("moving")} moving, ' \
+           f'{dispatcher.courier_registry.count("picking_up")} picking_up, ' \
+           f'{dispatcher.courier_registry.count("dropping_off")} dropping_off, ' \
+           f'{dispatcher.courier_registry.count("logged_off")} logged_off. ' \
            f'| Orders => ' \
-           f'{len(dispatcher.placed_orders)} placed, ' \
-           f'{len(dispatcher.unassigned_orders)} unassigned, ' \
-           f'{len(dispatcher.assigned_orders)} assigned, ' \
-           f'{len(dispatcher.fulfilled_orders)} fulfilled, ' \
-           f'{len(dispatcher.canceled_orders)} canceled. '
+           f'{dispatcher.order_index.count(OrderState.PLACED)} placed, ' \
+           f'{dispatcher.order_index.count(OrderState.UNASSIGNED)} unassigned, ' \
+           f'{dispatcher.order_index.count(OrderState.ASSIGNED)} assigned, ' \
+           f'{dispatcher.order_index.count(OrderState.FULFILLED)} fulfilled, ' \
+           f'{dispatcher.order_index.count(OrderState.CANCELED)} canceled. '
@@ -0,0 +1,36 @@
+import hashlib
+import random
+from typing import Any, Optional, List
+
+from settings import settings
+
+
+def stream_seed(*keys: Any, seed: Optional[int] = None) -> Optional[int]:
+    """
+    Derive the seed of a random stream from the run seed (the settings' seed by default) and the keys naming the stream.
+    The derivation doesn't depend on the process, so the same stream yields the same draws in any simulation.
+    """
+
+    seed = settings.SEED if seed is None else seed
+
+    if seed is None:
+        return None
+
+    digest = hashlib.sha256(':'.join(str(key) for key in (seed, *keys)).encode()).digest()
+
+    return int.from_bytes(digest[:8], byteorder='little')
+
+
+def random_stream(*keys: Any, seed: Optional[int] = None) -> random.Random:
+    """
+    Create an independent random stream for an entity and a purpose, e.g. ('courier', 7, 'acceptance').
+    Draws of a stream don't shift when other streams draw, keeping common random numbers across policies.
+    """
+
+    return random.Random(stream_seed(*keys, seed=seed))
+
+
+def replication_seeds(replications: int, seed: Optional[int] = None) -> List[Optional[int]]:
+    """Derive the seeds of the replications of a run, to be shared by every policy that is compared"""
+
+    return [stream_seed('replication', replication, seed=seed) for replication in range(replications)]